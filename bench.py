@@ -0,0 +1,1627 @@
+"""Micro-benchmarks for NullSplats backend hot paths."""
+
+from __future__ import annotations
+
+import argparse
+from dataclasses import replace
+import os
+from pathlib import Path
+import shutil
+import statistics
+import tempfile
+import textwrap
+import time
+import tracemalloc
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Callable
+
+if TYPE_CHECKING:
+    # Annotations only; the benchmarks import these lazily so --help stays fast.
+    import numpy as np
+    import torch
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Time backend hot paths against their reference implementations.",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=textwrap.dedent(
+            """\
+            Examples:
+              python bench.py extract --input assets/input.mp4 --candidate 200 --workers 8
+              python bench.py extract --input assets/input.mp4 --scale-px 1080
+              python bench.py score --count 200 --height 1080
+              python bench.py select --count 20000 --target 200
+              python bench.py codec --count 20 --height 1080
+              python bench.py colmap --images 300 --points 200000 --obs 4000
+              python bench.py poses --count 10000
+              python bench.py images --count 60 --height 1080 --downscale 2
+              python bench.py batches --count 100 --height 540 --batch 4 --steps 200 --device cuda
+              python bench.py prefetch --count 100 --height 540 --batch 4 --steps 200 --step-ms 10
+              python bench.py samplers --count 200 --batch 4 --steps 2000
+              python bench.py metrics --steps 500 --size 256 --device cuda
+              python bench.py checkpoints --gaussians 500000 --count 5 --device cuda
+              python bench.py export --gaussians 1000000 --sh-degree 3
+              python bench.py plyload --gaussians 3000000 --sh-degree 3
+              python bench.py plyparse --points 1000000
+              python bench.py compact --gaussians 1000000 --sh-degree 3
+              python bench.py lod --gaussians 1000000 --pixels 1.5
+              python bench.py cull --gaussians 1000000 --min-radius 0.5 --device cuda
+            """
+        ),
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    extract = sub.add_parser("extract", help="Full-decode vs seek-based video frame extraction.")
+    extract.add_argument("--input", default="assets/input.mp4", help="Video file to extract frames from.")
+    extract.add_argument("--candidate", type=int, default=200, help="Candidate frame count.")
+    extract.add_argument("--workers", type=int, default=0, help="Seek workers (0 = CPU count).")
+    extract.add_argument("--scale-px", type=int, default=0, help="Scale-at-decode small side (0 = source size).")
+
+    score = sub.add_parser("score", help="Per-frame vs batched frame quality scoring.")
+    score.add_argument("--count", type=int, default=200, help="Number of synthetic frames.")
+    score.add_argument("--height", type=int, default=1080, help="Frame height (width is 16:9).")
+
+    select = sub.add_parser("select", help="Legacy hex-string vs indexed diversity-aware auto-selection.")
+    select.add_argument("--count", type=int, default=20000, help="Number of synthetic candidate frames.")
+    select.add_argument("--target", type=int, default=200, help="Frames to select.")
+
+    codec = sub.add_parser("codec", help="Encode/decode time and size for each frame codec.")
+    codec.add_argument("--count", type=int, default=20, help="Number of synthetic frames.")
+    codec.add_argument("--height", type=int, default=1080, help="Frame height (width is 16:9).")
+
+    colmap = sub.add_parser("colmap", help="Text vs binary COLMAP model loading on a synthetic model.")
+    colmap.add_argument("--images", type=int, default=300, help="Registered images.")
+    colmap.add_argument("--points", type=int, default=200000, help="Sparse 3D points.")
+    colmap.add_argument("--obs", type=int, default=4000, help="2D keypoints per image.")
+
+    poses = sub.add_parser("poses", help="Per-pose vs batched quaternion to camera matrix conversion.")
+    poses.add_argument("--count", type=int, default=10000, help="Number of random poses.")
+
+    images = sub.add_parser("images", help="Sequential float32 vs pooled, cached uint8 training image loading.")
+    images.add_argument("--count", type=int, default=60, help="Number of synthetic PNG frames.")
+    images.add_argument("--height", type=int, default=1080, help="Frame height (width is 16:9).")
+    images.add_argument("--downscale", type=int, default=2, help="Training image downscale factor.")
+    images.add_argument("--workers", type=int, default=0, help="Decode threads (0 = CPU count).")
+
+    batches = sub.add_parser("batches", help="Per-record float32 stacking vs FrameStore batch gathering.")
+    batches.add_argument("--count", type=int, default=100, help="Number of synthetic frames.")
+    batches.add_argument("--height", type=int, default=540, help="Frame height (width is 16:9).")
+    batches.add_argument("--batch", type=int, default=4, help="Frames per training step.")
+    batches.add_argument("--steps", type=int, default=200, help="Batches to assemble per variant.")
+    batches.add_argument("--device", default="cpu", help="Training device (cpu, cuda, cuda:0, ...).")
+
+    prefetch = sub.add_parser("prefetch", help="Synchronous vs prefetched batch preparation around a simulated step.")
+    prefetch.add_argument("--count", type=int, default=100, help="Number of synthetic frames.")
+    prefetch.add_argument("--height", type=int, default=540, help="Frame height (width is 16:9).")
+    prefetch.add_argument("--batch", type=int, default=4, help="Frames per training step.")
+    prefetch.add_argument("--steps", type=int, default=200, help="Training steps.")
+    prefetch.add_argument("--step-ms", type=float, default=10.0, help="Simulated device time per step (ms).")
+    prefetch.add_argument("--device", default="cpu", help="Training device (cpu, cuda, cuda:0, ...).")
+
+    samplers = sub.add_parser("samplers", help="Coverage, balance and reproducibility of each frame sampler.")
+    samplers.add_argument("--count", type=int, default=200, help="Number of synthetic cameras on an orbit.")
+    samplers.add_argument("--batch", type=int, default=4, help="Frames per training step.")
+    samplers.add_argument("--steps", type=int, default=2000, help="Batches drawn per sampler.")
+
+    metrics = sub.add_parser("metrics", help="Per-step .item() reporting vs deferred on-device metrics in a toy loop.")
+    metrics.add_argument("--steps", type=int, default=500, help="Training steps.")
+    metrics.add_argument("--size", type=int, default=256, help="Synthetic image side (batch of 4 RGB images).")
+    metrics.add_argument("--device", default="cpu", help="Training device (cpu, cuda, cuda:0, ...).")
+    metrics.add_argument("--repeats", type=int, default=5, help="Timed runs per variant (alternating; median reported).")
+
+    checkpoints = sub.add_parser("checkpoints", help="Inline vs background checkpoint export, time blocked in training.")
+    checkpoints.add_argument("--gaussians", type=int, default=500000, help="Gaussians per checkpoint.")
+    checkpoints.add_argument("--count", type=int, default=5, help="Checkpoints written per variant.")
+    checkpoints.add_argument("--format", default="ply", choices=("ply", "splat"), help="Checkpoint format.")
+    checkpoints.add_argument("--device", default="cpu", help="Parameter device (cpu, cuda, cuda:0, ...).")
+
+    export = sub.add_parser("export", help="gsplat.export_splats vs native PLY/.splat writer (bytes, time, memory).")
+    export.add_argument("--gaussians", type=int, default=1000000, help="Gaussians to export.")
+    export.add_argument("--sh-degree", type=int, default=3, help="Spherical harmonics degree.")
+    export.add_argument("--chunk", type=int, default=1 << 18, help="Rows per chunk for the streaming writer.")
+
+    plyload = sub.add_parser("plyload", help="Whole-file PLY parse vs memory-mapped chunked viewer load.")
+    plyload.add_argument("--gaussians", type=int, default=1000000, help="Gaussians in the synthetic PLY.")
+    plyload.add_argument("--sh-degree", type=int, default=3, help="Spherical harmonics degree.")
+    plyload.add_argument("--chunk", type=int, default=1 << 18, help="Rows per chunk for the streamed loader.")
+    plyload.add_argument("--input", default="", help=argparse.SUPPRESS)
+    plyload.add_argument("--variant", default="", help=argparse.SUPPRESS)
+
+    plyparse = sub.add_parser("plyparse", help="Per-line vs shared vectorized PLY parsing (ASCII, LE, BE).")
+    plyparse.add_argument("--points", type=int, default=1000000, help="Vertices in each synthetic PLY.")
+
+    compact = sub.add_parser("compact", help="PLY vs quantized .nsplat: file size, load time and render PSNR.")
+    compact.add_argument("--gaussians", type=int, default=300000, help="Gaussians in the synthetic scene.")
+    compact.add_argument("--sh-degree", type=int, default=3, help="Spherical harmonics degree.")
+    compact.add_argument("--views", type=int, default=3, help="Orbit views rendered for PSNR.")
+    compact.add_argument("--size", type=int, default=128, help="Render width/height in pixels for PSNR.")
+    compact.add_argument("--psnr-gaussians", type=int, default=60000, help="Gaussians rendered for PSNR (CPU).")
+
+    lod = sub.add_parser("lod", help="Viewer LOD hierarchy: build time, per-frame cut size/time and render PSNR.")
+    lod.add_argument("--gaussians", type=int, default=1000000, help="Gaussians in the synthetic scene.")
+    lod.add_argument("--pixels", type=float, default=1.5, help="LOD pixel threshold.")
+    lod.add_argument("--height", type=int, default=1080, help="Viewport height used for the cut.")
+    lod.add_argument("--size", type=int, default=128, help="Render width/height in pixels for PSNR.")
+    lod.add_argument("--psnr-gaussians", type=int, default=60000, help="Gaussians rendered for PSNR (CPU).")
+
+    cull = sub.add_parser("cull", help="Viewer sort/upload of every splat vs frustum and screen-size culling first.")
+    cull.add_argument("--gaussians", type=int, default=1000000, help="Gaussians in the synthetic scene.")
+    cull.add_argument("--min-radius", type=float, default=0.5, help="Minimum projected 3-sigma radius in pixels.")
+    cull.add_argument("--height", type=int, default=1080, help="Viewport height (width is 16:9).")
+    cull.add_argument("--device", default="cpu", help="Torch device for culling and sorting.")
+    cull.add_argument("--size", type=int, default=128, help="Render width/height in pixels for PSNR.")
+    cull.add_argument("--psnr-gaussians", type=int, default=60000, help="Gaussians rendered for PSNR (CPU).")
+    return parser.parse_args()
+
+
+def _timed(label: str, func: Callable[[], object]) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.3f}s")
+    return elapsed, result
+
+
+def _bench_extract(args: argparse.Namespace) -> int:
+    from nullsplats.backend.video_frames import _extract_from_video
+
+    source = Path(args.input).expanduser()
+    if not source.exists():
+        raise FileNotFoundError(f"Input video not found: {source}")
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_"))
+    try:
+        outputs = {}
+        timings = {}
+        for mode in ("decode", "seek"):
+            out_dir = workdir / mode
+            out_dir.mkdir()
+            timings[mode], outputs[mode] = _timed(
+                f"extract mode={mode}",
+                lambda mode=mode, out_dir=out_dir: _extract_from_video(
+                    source, out_dir, args.candidate, mode=mode, workers=args.workers or None, scale_px=args.scale_px
+                ),
+            )
+        decode_names = [item.filename for item in outputs["decode"]]
+        seek_names = [item.filename for item in outputs["seek"]]
+        print(f"frames decode={len(decode_names)} seek={len(seek_names)} names_match={decode_names == seek_names}")
+        print(f"speedup {timings['decode'] / max(timings['seek'], 1e-9):.2f}x")
+        return 0 if decode_names == seek_names else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _synthetic_frames(count: int, height: int) -> "np.ndarray":
+    import numpy as np
+
+    width = height * 16 // 9
+    rng = np.random.default_rng(0)
+    yy, xx = np.mgrid[0:height, 0:width].astype(np.float32)
+    # Large-scale gradient (drives the perceptual hash) plus fine texture (drives sharpness).
+    ramp = 80.0 * (xx / width) + 60.0 * np.sin(yy / height * np.pi)
+    texture = 40.0 * np.sin(xx / 37.0) * np.cos(yy / 23.0)
+    base = (60.0 + ramp + texture)[..., None] * np.array([1.0, 0.8, 0.6])
+    base = np.clip(base + rng.normal(0.0, 12.0, size=base.shape), 0, 255).astype(np.uint8)
+    frames = np.empty((count, height, width, 3), dtype=np.uint8)
+    for idx in range(count):
+        frames[idx] = np.roll(base, shift=idx * 7, axis=1)
+    return frames
+
+
+def _to_grayscale(frame: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    if frame.ndim == 2:
+        return frame.astype(np.float32)
+    channels = frame[..., :3].astype(np.float32)
+    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return np.tensordot(channels, weights, axes=([2], [0]))
+
+
+def _sharpness_from_grayscale(grayscale: "np.ndarray") -> float:
+    """Per-frame reference for the batched sharpness: mean |wrap-around Laplacian|."""
+    import numpy as np
+
+    laplacian = (
+        -4 * grayscale
+        + np.roll(grayscale, 1, axis=0)
+        + np.roll(grayscale, -1, axis=0)
+        + np.roll(grayscale, 1, axis=1)
+        + np.roll(grayscale, -1, axis=1)
+    )
+    return float(np.mean(np.abs(laplacian)))
+
+
+def _variance_score(grayscale: "np.ndarray") -> float:
+    import numpy as np
+
+    return float(np.var(grayscale))
+
+
+def _fingerprint_from_grayscale(grayscale: "np.ndarray", hash_size: int = 8) -> str:
+    """Per-frame reference perceptual hash (PIL Lanczos resize, MSB-first bits)."""
+    import numpy as np
+    from PIL import Image
+
+    image = Image.fromarray(np.clip(grayscale, 0, 255).astype(np.uint8))
+    small = image.resize((hash_size, hash_size), Image.LANCZOS)
+    arr = np.array(small, dtype=np.float32)
+    mean_val = float(arr.mean()) if arr.size else 0.0
+    bits = (arr.flatten() > mean_val).astype(np.uint8)
+    value = 0
+    for bit in bits:
+        value = (value << 1) | int(bit)
+    # 64 bits -> 16 hex characters for the default hash_size.
+    width = max(1, hash_size * hash_size // 4)
+    return f"{value:0{width}x}"
+
+
+def _fingerprint_distance(a: str, b: str) -> int:
+    """Hamming distance between two perceptual hashes encoded as hex strings."""
+    try:
+        a_int = int(a, 16)
+        b_int = int(b, 16)
+    except Exception:
+        return 64
+    return int(bin(a_int ^ b_int).count("1"))
+
+
+def _bench_score(args: argparse.Namespace) -> int:
+    import numpy as np
+
+    from nullsplats.backend.video_frames import _batch_frame_quality_metrics
+
+    frames = _synthetic_frames(args.count, args.height)
+    print(f"frames={frames.shape[0]} size={frames.shape[2]}x{frames.shape[1]}")
+
+    def _per_frame() -> list[tuple[float, float, str]]:
+        results = []
+        for frame in frames:
+            gray = _to_grayscale(frame)
+            results.append((_sharpness_from_grayscale(gray), _variance_score(gray), _fingerprint_from_grayscale(gray)))
+        return results
+
+    reference_s, reference = _timed("per-frame (np.roll + PIL)", _per_frame)
+    batched_s, (sharpness, variance, fingerprints) = _timed("batched (vectorized)", lambda: _batch_frame_quality_metrics(frames))
+    ref_sharp = np.array([item[0] for item in reference])
+    ref_var = np.array([item[1] for item in reference])
+    hash_bits = [_fingerprint_distance(a[2], b) for a, b in zip(reference, fingerprints)]
+    print(
+        "max_rel_err sharpness={:.2e} variance={:.2e} hash_bits_mean={:.2f} max={}".format(
+            float(np.max(np.abs(sharpness - ref_sharp) / np.maximum(ref_sharp, 1e-9))),
+            float(np.max(np.abs(variance - ref_var) / np.maximum(ref_var, 1e-9))),
+            float(np.mean(hash_bits)),
+            max(hash_bits),
+        )
+    )
+    print(f"speedup {reference_s / max(batched_s, 1e-9):.2f}x")
+    return 0
+
+
+def _synthetic_frame_scores(count: int) -> list:
+    import numpy as np
+
+    from nullsplats.backend.video_frames import FrameScore
+
+    rng = np.random.default_rng(0)
+    # Long videos produce runs of near-identical frames: cluster fingerprints around a few
+    # hundred "shots" and flip a handful of bits per frame.
+    shots = rng.integers(0, 2**63, size=max(1, count // 50), dtype=np.int64).astype(np.uint64)
+    scores = []
+    for idx in range(count):
+        fingerprint = int(shots[idx * len(shots) // count])
+        for bit in rng.choice(64, size=int(rng.integers(0, 6)), replace=False):
+            fingerprint ^= 1 << int(bit)
+        scores.append(
+            FrameScore(
+                filename=f"frame_{idx:05d}.png",
+                score=0.0,
+                sharpness=float(rng.gamma(2.0, 10.0)),
+                variance=float(rng.gamma(3.0, 300.0)),
+                fingerprint=f"{fingerprint:016x}",
+            )
+        )
+    return scores
+
+
+def _legacy_auto_select(frame_scores: list, target_count: int) -> list[str]:
+    """Pre-index selection loop: hex parse + bin().count against every selected frame."""
+    from nullsplats.backend.video_frames import _score_with_quality
+
+    sorted_scores = sorted(_score_with_quality(frame_scores), key=lambda item: item.score, reverse=True)
+    selected: list[str] = []
+    selected_fingerprints: list[str] = []
+    for item in sorted_scores:
+        if item.fingerprint and selected_fingerprints:
+            if min(_fingerprint_distance(item.fingerprint, fp) for fp in selected_fingerprints) < 8:
+                continue
+        selected.append(item.filename)
+        if item.fingerprint:
+            selected_fingerprints.append(item.fingerprint)
+        if len(selected) >= target_count:
+            break
+    for item in sorted_scores:
+        if len(selected) >= target_count:
+            break
+        if item.filename not in selected:
+            selected.append(item.filename)
+    return selected
+
+
+def _bench_select(args: argparse.Namespace) -> int:
+    from nullsplats.backend.video_frames import auto_select_best
+
+    frame_scores = _synthetic_frame_scores(args.count)
+    print(f"candidates={len(frame_scores)} target={args.target}")
+    legacy_s, legacy = _timed("legacy (hex + bin().count)", lambda: _legacy_auto_select(frame_scores, args.target))
+    indexed_s, indexed = _timed("indexed (uint64 + MIH)", lambda: auto_select_best(frame_scores, args.target))
+    print(f"selected={len(indexed)} identical={legacy == indexed}")
+    print(f"speedup {legacy_s / max(indexed_s, 1e-9):.2f}x")
+    return 0 if legacy == indexed else 1
+
+
+def _bench_codec(args: argparse.Namespace) -> int:
+    import numpy as np
+
+    from nullsplats.backend.frame_codecs import get_codec, list_codecs, read_frame
+
+    frames = _synthetic_frames(args.count, args.height)
+    print(f"frames={frames.shape[0]} size={frames.shape[2]}x{frames.shape[1]}")
+    print(f"{'codec':<16}{'encode fps':>12}{'decode fps':>12}{'MB/frame':>10}{'max err':>9}")
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_"))
+    try:
+        for name in list_codecs():
+            codec = get_codec(name)
+            paths = [workdir / f"{name}_{idx:04d}{codec.extension}" for idx in range(len(frames))]
+            try:
+                start = time.perf_counter()
+                for frame, path in zip(frames, paths):
+                    codec.encode(frame, path)
+                encode_s = time.perf_counter() - start
+            except RuntimeError as exc:
+                print(f"{name:<16}skipped: {exc}")
+                continue
+            start = time.perf_counter()
+            decoded = [np.asarray(read_frame(path)) for path in paths]
+            decode_s = time.perf_counter() - start
+            size_mb = sum(path.stat().st_size for path in paths) / len(paths) / 1e6
+            max_err = max(int(np.abs(a.astype(np.int16) - b).max()) for a, b in zip(decoded, frames))
+            print(
+                f"{name:<16}{len(frames) / max(encode_s, 1e-9):>12.1f}{len(frames) / max(decode_s, 1e-9):>12.1f}"
+                f"{size_mb:>10.2f}{max_err:>9d}"
+            )
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _write_synthetic_colmap(model_root: Path, images: int, points: int, obs: int) -> None:
+    """Write the same random model as sparse/0/*.bin and sparse/text/*.txt."""
+    import struct
+
+    import numpy as np
+
+    from nullsplats.backend.colmap_io import _OBSERVATION_DTYPE, _POINT_HEADER_DTYPE, _TRACK_DTYPE
+
+    rng = np.random.default_rng(0)
+    bin_dir = model_root / "sparse" / "0"
+    txt_dir = model_root / "sparse" / "text"
+    bin_dir.mkdir(parents=True, exist_ok=True)
+    txt_dir.mkdir(parents=True, exist_ok=True)
+    params = (500.0, 510.0, 320.0, 240.0)
+    (bin_dir / "cameras.bin").write_bytes(struct.pack("<QiiQQ4d", 1, 1, 1, 640, 480, *params))
+    (txt_dir / "cameras.txt").write_text("# Camera list\n1 PINHOLE 640 480 500 510 320 240\n")
+
+    quats = rng.normal(size=(images, 4))
+    quats /= np.linalg.norm(quats, axis=1, keepdims=True)
+    trans = rng.normal(size=(images, 3))
+    observations = np.empty((images, obs), dtype=_OBSERVATION_DTYPE)
+    observations["xy"] = rng.random((images, obs, 2)) * 600.0
+    observations["point3D_id"] = np.where(rng.random((images, obs)) < 0.7, rng.integers(0, points, (images, obs)), -1)
+    image_bytes = [struct.pack("<Q", images)]
+    image_lines = ["# Image list"]
+    for row in range(images):
+        name = f"frame_{row:04d}.png"
+        image_bytes.append(struct.pack("<i7di", row + 1, *quats[row], *trans[row], 1))
+        image_bytes.append(name.encode() + b"\0" + struct.pack("<Q", obs) + observations[row].tobytes())
+        pose = " ".join(repr(float(value)) for value in (*quats[row], *trans[row]))
+        image_lines.append(f"{row + 1} {pose} 1 {name}")
+        flat = np.column_stack([observations[row]["xy"], observations[row]["point3D_id"]]).ravel()
+        image_lines.append(" ".join(f"{value:.6f}" if idx % 3 != 2 else str(int(value)) for idx, value in enumerate(flat)))
+    (bin_dir / "images.bin").write_bytes(b"".join(image_bytes))
+    (txt_dir / "images.txt").write_text("\n".join(image_lines) + "\n")
+
+    point_ids = observations["point3D_id"].ravel()
+    keep = point_ids >= 0
+    owners = np.repeat(np.arange(1, images + 1, dtype=np.int32), obs)[keep]
+    ranks = np.tile(np.arange(obs, dtype=np.int32), images)[keep]
+    order = np.argsort(point_ids[keep], kind="stable")
+    lengths = np.bincount(point_ids[keep], minlength=points)
+    track_offsets = np.concatenate([[0], np.cumsum(lengths)])
+    header = np.zeros(points, dtype=_POINT_HEADER_DTYPE)
+    header["point3D_id"] = np.arange(points)
+    header["xyz"] = rng.normal(size=(points, 3))
+    header["rgb"] = rng.integers(0, 256, (points, 3))
+    header["error"] = rng.random(points)
+    header["track_length"] = lengths
+    tracks = np.empty(int(track_offsets[-1]), dtype=_TRACK_DTYPE)
+    tracks["image_id"] = owners[order]
+    tracks["point2D_idx"] = ranks[order]
+    # Scatter headers and tracks into one buffer at their variable-length record offsets.
+    header_size = _POINT_HEADER_DTYPE.itemsize
+    starts = 8 + header_size * np.arange(points) + 8 * track_offsets[:-1]
+    buffer = np.zeros(8 + header_size * points + 8 * len(tracks), dtype=np.uint8)
+    buffer[:8] = np.frombuffer(struct.pack("<Q", points), dtype=np.uint8)
+    buffer[starts[:, None] + np.arange(header_size)] = header.view(np.uint8).reshape(points, header_size)
+    element_starts = np.repeat(starts + header_size - 8 * track_offsets[:-1], lengths) + 8 * np.arange(len(tracks))
+    buffer[element_starts[:, None] + np.arange(8)] = tracks.view(np.uint8).reshape(-1, 8)
+    (bin_dir / "points3D.bin").write_bytes(buffer.tobytes())
+    point_lines = ["# 3D point list"]
+    pairs = np.column_stack([tracks["image_id"], tracks["point2D_idx"]])
+    for idx in range(points):
+        xyz = " ".join(f"{value:.6f}" for value in header["xyz"][idx])
+        rgb = " ".join(str(int(value)) for value in header["rgb"][idx])
+        track = " ".join(map(str, pairs[track_offsets[idx] : track_offsets[idx + 1]].ravel().tolist()))
+        point_lines.append(f"{idx} {xyz} {rgb} {header['error'][idx]:.6f} {track}")
+    (txt_dir / "points3D.txt").write_text("\n".join(point_lines) + "\n")
+
+
+def _array_bytes(table: object) -> int:
+    import numpy as np
+
+    return sum(value.nbytes for value in vars(table).values() if isinstance(value, np.ndarray))
+
+
+def _bench_colmap(args: argparse.Namespace) -> int:
+    from nullsplats.backend import colmap_io
+    from nullsplats.backend.io_cache import ScenePaths
+
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_"))
+    try:
+        paths = ScenePaths("bench", cache_root=workdir)
+        _write_synthetic_colmap(paths.sfm_dir, args.images, args.points, args.obs)
+        print(f"images={args.images} points={args.points} observations={args.images * args.obs}")
+        binary_s, binary = _timed("binary (np.frombuffer)", lambda: colmap_io.read_colmap_data(paths))
+        cache = colmap_io.ColmapModelCache()
+        _timed("first load (parse + sidecar)", lambda: cache.load(paths))
+        _timed("cached load (memory)", lambda: cache.load(paths))
+        _timed("new process (sidecar)", lambda: colmap_io.ColmapModelCache().load(paths))
+        for path in (paths.sfm_dir / "sparse" / "0").glob("*.bin"):
+            path.unlink()
+        text_s, text = _timed("text (NumPy per line)", lambda: colmap_io.read_colmap_data(paths))
+        same = (
+            binary.model_format == "binary"
+            and text.model_format == "text"
+            and len(binary.images) == len(text.images)
+            and len(binary.points3D) == len(text.points3D)
+            and binary.images[1].name == text.images[1].name
+        )
+        print(f"formats={binary.model_format}/{text.model_format} consistent={same}")
+        print(f"speedup {text_s / max(binary_s, 1e-9):.2f}x")
+        columnar = _array_bytes(binary.image_table) + _array_bytes(binary.point_table)
+        tracemalloc.start()
+        objects = (list(binary.images.values()), list(binary.points3D.values()))
+        per_item, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del objects
+        print(f"memory columnar={columnar / 1e6:.1f} MB per-item dataclasses={per_item / 1e6:.1f} MB")
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _per_pose_camera_to_world(qvec: tuple, tvec: tuple, device: "torch.device") -> "torch.Tensor":
+    """Previous splat_train_io path: one camera at a time through torch.tensor([...])."""
+    import torch
+
+    qw, qx, qy, qz = torch.tensor(qvec, dtype=torch.float64, device=device)
+    R = torch.tensor(
+        [
+            [1 - 2 * qy * qy - 2 * qz * qz, 2 * qx * qy - 2 * qz * qw, 2 * qx * qz + 2 * qy * qw],
+            [2 * qx * qy + 2 * qz * qw, 1 - 2 * qx * qx - 2 * qz * qz, 2 * qy * qz - 2 * qx * qw],
+            [2 * qx * qz - 2 * qy * qw, 2 * qy * qz + 2 * qx * qw, 1 - 2 * qx * qx - 2 * qy * qy],
+        ],
+        dtype=torch.float64,
+        device=device,
+    )
+    t = torch.tensor(tvec, dtype=torch.float64, device=device)
+    c2w = torch.eye(4, dtype=torch.float64, device=device)
+    c2w[:3, :3] = R.T
+    c2w[:3, 3] = -R.T @ t
+    return c2w.float()
+
+
+def _bench_poses(args: argparse.Namespace) -> int:
+    import numpy as np
+    import torch
+
+    from nullsplats.backend.camera_poses import camera_to_world, world_to_camera
+
+    rng = np.random.default_rng(0)
+    qvecs = rng.normal(size=(args.count, 4))
+    qvecs /= np.linalg.norm(qvecs, axis=1, keepdims=True)
+    tvecs = rng.normal(size=(args.count, 3))
+    device = torch.device("cpu")
+    print(f"poses={args.count}")
+    reference_s, reference = _timed(
+        "per-pose torch",
+        lambda: torch.stack(
+            [_per_pose_camera_to_world(tuple(q), tuple(t), device) for q, t in zip(qvecs.tolist(), tvecs.tolist())]
+        ),
+    )
+    numpy_s, batched_np = _timed("batched numpy", lambda: camera_to_world(qvecs, tvecs))
+    torch_s, batched_torch = _timed(
+        "batched torch",
+        lambda: camera_to_world(torch.from_numpy(qvecs), torch.from_numpy(tvecs)).float(),
+    )
+    inverse = np.linalg.inv(world_to_camera(qvecs, tvecs))
+    same = (
+        torch.equal(reference, batched_torch)
+        and np.allclose(batched_np, batched_torch.double().numpy(), atol=1e-6)
+        and np.allclose(inverse, batched_np, atol=1e-9)
+    )
+    print(f"identical={same}")
+    print(f"speedup numpy {reference_s / max(numpy_s, 1e-9):.1f}x torch {reference_s / max(torch_s, 1e-9):.1f}x")
+    return 0 if same else 1
+
+
+def _bench_images(args: argparse.Namespace) -> int:
+    import numpy as np
+    from PIL import Image
+
+    from nullsplats.backend.frame_codecs import open_frame
+    from nullsplats.backend.training_images import load_training_images
+
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_"))
+    try:
+        frames = _synthetic_frames(args.count, args.height)
+        image_paths = []
+        for idx, frame in enumerate(frames):
+            path = workdir / f"frame_{idx:04d}.png"
+            Image.fromarray(frame).save(path, compress_level=1)
+            image_paths.append(path)
+        height, width = frames[0].shape[:2]
+        size = (width // args.downscale, height // args.downscale)
+        print(f"frames={args.count} source={width}x{height} train={size[0]}x{size[1]}")
+
+        def _sequential() -> list:
+            loaded = []
+            for path in image_paths:
+                image = open_frame(path)
+                if image.size != size:
+                    image = image.resize(size, resample=Image.BILINEAR)
+                loaded.append(np.array(image, dtype=np.float32) / 255.0)
+            return loaded
+
+        cache_dir = workdir / "train_cache"
+        reference_s, reference = _timed("sequential float32", _sequential)
+        pooled_s, pooled = _timed(
+            "pooled uint8 (no cache)",
+            lambda: load_training_images(image_paths, size, downscale=args.downscale, workers=args.workers),
+        )
+        _timed(
+            "pooled + cache write",
+            lambda: load_training_images(
+                image_paths, size, downscale=args.downscale, cache_dir=cache_dir, workers=args.workers
+            ),
+        )
+        cached_s, cached = _timed(
+            "cached (mmap)",
+            lambda: load_training_images(image_paths, size, downscale=args.downscale, cache_dir=cache_dir),
+        )
+        same = all(
+            np.array_equal(ref, pooled[idx] / np.float32(255.0)) and np.array_equal(pooled[idx], cached[idx])
+            for idx, ref in enumerate(reference)
+        )
+        float_bytes = sum(item.nbytes for item in reference)
+        print(f"identical={same} resident float32={float_bytes / 1e6:.1f} MB uint8={pooled.nbytes / 1e6:.1f} MB")
+        print(f"speedup pooled {reference_s / max(pooled_s, 1e-9):.2f}x cached {reference_s / max(cached_s, 1e-9):.1f}x")
+        del pooled, cached
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _bench_batches(args: argparse.Namespace) -> int:
+    import numpy as np
+    import torch
+
+    from nullsplats.backend.frame_store import RESIDENCY_MODES, FrameStore
+    from nullsplats.backend.splat_train_config import FrameRecord
+    from nullsplats.backend.splat_train_ops import sample_frame_indices
+
+    device = torch.device(args.device)
+    pixels = torch.from_numpy(_synthetic_frames(args.count, args.height))
+    records = [
+        FrameRecord(
+            index=idx,
+            name=f"frame_{idx:04d}.png",
+            image_path=Path(f"frame_{idx:04d}.png"),
+            camtoworld=torch.eye(4, device=device),
+            K=torch.eye(3, device=device),
+            width=int(pixels.shape[2]),
+            height=int(pixels.shape[1]),
+            image=pixels[idx].float() / 255.0,
+        )
+        for idx in range(args.count)
+    ]
+    np.random.seed(0)
+    schedule = [sample_frame_indices(args.count, args.batch) for _ in range(args.steps)]
+
+    def _synchronize() -> None:
+        if device.type == "cuda":
+            torch.cuda.synchronize(device)
+
+    def _stacked() -> torch.Tensor:
+        # Previous train_scene loop: Python lists of per-record float32 tensors every step.
+        for indices in schedule:
+            batch = [records[int(i)] for i in indices]
+            torch.tensor([f.index for f in batch], device=device, dtype=torch.long)
+            torch.stack([f.camtoworld for f in batch], dim=0)
+            torch.stack([f.K for f in batch], dim=0)
+            images = torch.stack([f.image for f in batch], dim=0).to(device=device)
+        _synchronize()
+        return images
+
+    float_bytes = sum(record.image.nbytes for record in records)
+    print(f"frames={args.count} size={pixels.shape[2]}x{pixels.shape[1]} batch={args.batch} device={device}")
+    # Setup: training records are uint8 views into the cached image array.
+    view_records = [replace(record, image=pixels[record.index]) for record in records]
+    for label, build in (
+        ("from_records (stack copy)", lambda: FrameStore.from_records(view_records, device, residency="host")),
+        ("from_pixels (shared array)", lambda: FrameStore.from_pixels(pixels, view_records, device, residency="host")),
+    ):
+        setup_s, setup_store = _timed(f"setup {label}", build)
+        copied = setup_store.pixels.data_ptr() != pixels.data_ptr()
+        print(f"  extra host MB at setup {setup_store.nbytes / 1e6 if copied else 0.0:.1f}")
+        del setup_store
+    reference_s, reference = _timed("float32 records + stack", _stacked)
+    print(f"  resident images {float_bytes / 1e6:.1f} MB, {reference_s / args.steps * 1e3:.3f} ms/step")
+    same = True
+    tried: set[str] = set()
+    for residency in RESIDENCY_MODES[1:]:
+        store = FrameStore(
+            pixels, torch.stack([r.camtoworld for r in records]), torch.stack([r.K for r in records]), device,
+            residency=residency,
+        )
+        if store.residency in tried:
+            continue
+        tried.add(store.residency)
+
+        def _gathered() -> torch.Tensor:
+            for indices in schedule:
+                images = store.gather(indices).images
+            _synchronize()
+            return images
+
+        store_s, gathered = _timed(f"FrameStore ({store.residency})", _gathered)
+        print(f"  resident images {store.nbytes / 1e6:.1f} MB, {store_s / args.steps * 1e3:.3f} ms/step")
+        same = same and torch.equal(gathered, reference)
+    print(f"identical={same}")
+    return 0 if same else 1
+
+
+def _bench_prefetch(args: argparse.Namespace) -> int:
+    import torch
+
+    from nullsplats.backend.batch_prefetch import BatchPrefetcher
+    from nullsplats.backend.frame_store import FrameStore
+    from nullsplats.backend.gs_utils import set_random_seed
+    from nullsplats.backend.splat_train_ops import sample_frame_indices
+
+    device = torch.device(args.device)
+    pixels = torch.from_numpy(_synthetic_frames(args.count, args.height))
+    store = FrameStore(
+        pixels, torch.eye(4).repeat(args.count, 1, 1), torch.eye(3).repeat(args.count, 1, 1), device
+    )
+    seed = 42
+
+    def _step() -> None:
+        # Stands in for rasterization + backward: the host waits while the device works.
+        time.sleep(args.step_ms / 1000.0)
+
+    def _synchronous() -> list:
+        set_random_seed(seed)
+        drawn = []
+        for _ in range(args.steps):
+            batch = store.gather(sample_frame_indices(len(store), args.batch))
+            drawn.append(batch.indices.tolist())
+            _step()
+        return drawn
+
+    def _prefetched() -> list:
+        drawn = []
+        with BatchPrefetcher(store, args.batch, seed=seed, steps=args.steps) as batches:
+            for batch in batches:
+                drawn.append(batch.indices.tolist())
+                _step()
+        return drawn
+
+    print(f"frames={args.count} batch={args.batch} steps={args.steps} step_ms={args.step_ms} device={device}")
+    sync_s, sync_order = _timed("synchronous", _synchronous)
+    prefetch_s, prefetch_order = _timed("prefetched", _prefetched)
+    floor_s = args.steps * args.step_ms / 1000.0
+    print(f"batch overhead per step: synchronous {(sync_s - floor_s) / args.steps * 1e3:.3f} ms, "
+          f"prefetched {(prefetch_s - floor_s) / args.steps * 1e3:.3f} ms")
+    same = sync_order == prefetch_order
+    print(f"same batch order={same}")
+    return 0 if same else 1
+
+
+def _bench_samplers(args: argparse.Namespace) -> int:
+    import numpy as np
+    import torch
+
+    from nullsplats.backend.batch_prefetch import BatchPrefetcher
+    from nullsplats.backend.frame_samplers import create_sampler, list_samplers, viewpoint_strata
+    from nullsplats.backend.frame_store import FrameStore
+
+    # Cameras on a tilted orbit, in capture order; tiny images so only sampling is measured.
+    angles = np.linspace(0.0, 2 * np.pi, args.count, endpoint=False)
+    centers = np.stack([np.cos(angles), np.sin(angles), 0.3 * np.sin(angles)], axis=1)
+    camtoworlds = torch.eye(4).repeat(args.count, 1, 1)
+    camtoworlds[:, :3, 3] = torch.from_numpy(centers).float()
+    store = FrameStore(
+        torch.zeros((args.count, 4, 4, 3), dtype=torch.uint8), camtoworlds, torch.eye(3).repeat(args.count, 1, 1),
+        torch.device("cpu"),
+    )
+    strata = viewpoint_strata(centers, 8)
+    hard = np.zeros(args.count, dtype=bool)
+    hard[: max(1, args.count // 10)] = True
+    view_losses = torch.from_numpy(np.where(hard, 1.0, 0.1)).float()
+    epoch_steps = -(-args.count // args.batch)
+
+    def _draw(name: str) -> np.ndarray:
+        sampler = create_sampler(name, args.count, seed=7, camera_centers=centers)
+        drawn = []
+        with BatchPrefetcher(store, args.batch, seed=7, steps=args.steps, sampler=sampler) as batches:
+            for batch in batches:
+                drawn.append(batch.indices.numpy())
+                if sampler.uses_losses:
+                    sampler.observe(batch.indices, view_losses[batch.indices])
+        return np.stack(drawn)
+
+    print(f"cameras={args.count} batch={args.batch} steps={args.steps} hard views={int(hard.sum())}")
+    print(f"{'sampler':<14} {'ms/batch':>9} {'epoch cover':>12} {'count spread':>13} {'strata/batch':>13} "
+          f"{'hard share':>11} {'repeatable':>11}")
+    ok = True
+    for name in list_samplers():
+        start = time.perf_counter()
+        first = _draw(name)
+        elapsed = time.perf_counter() - start
+        repeatable = np.array_equal(first, _draw(name))
+        counts = np.bincount(first.ravel(), minlength=args.count)
+        cover = np.unique(first[:epoch_steps]).size / args.count
+        strata_per_batch = np.mean([np.unique(strata[row]).size for row in first])
+        hard_share = hard[first].mean()
+        print(f"{name:<14} {elapsed / args.steps * 1e3:9.3f} {cover:12.2%} {counts.max() - counts.min():13d} "
+              f"{strata_per_batch:13.2f} {hard_share:11.2%} {str(repeatable):>11}")
+        ok = ok and repeatable
+    return 0 if ok else 1
+
+
+def _bench_metrics(args: argparse.Namespace) -> int:
+    import torch
+    import torch.nn.functional as F
+
+    from nullsplats.backend.train_metrics import DeferredMetrics
+
+    device = torch.device(args.device)
+    log_interval = 100
+    progress_seconds = 0.5
+    target = torch.rand((4, args.size, args.size, 3), device=device)
+
+    def _synchronize() -> None:
+        if device.type == "cuda":
+            torch.cuda.synchronize(device)
+
+    def _loop(deferred: bool, steps: int = args.steps) -> float:
+        # Toy "render": a learnable colour field pushed through a few kernels, so the device has queued work.
+        torch.manual_seed(0)
+        field = torch.rand((4, args.size, args.size, 3), device=device, requires_grad=True)
+        optimizer = torch.optim.Adam([field], lr=1e-2)
+        metrics = DeferredMetrics(device)
+        reported = []
+        last_progress = float("-inf")
+        _synchronize()
+        for step in range(1, steps + 1):
+            renders = torch.sigmoid(field * 2.0).clamp(0.0, 1.0)
+            loss = F.l1_loss(renders, target)
+            ssim_proxy = 1.0 - F.avg_pool2d((renders - target).permute(0, 3, 1, 2), 11, 1, 5).abs().mean()
+            optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            optimizer.step()
+            mse = F.mse_loss(renders.detach(), target)
+            if deferred:
+                metrics.add(loss, mse, ssim_proxy)
+                now = time.perf_counter()
+                if step % log_interval == 0 or step == steps:
+                    snapshot = metrics.flush()
+                    reported.append(snapshot.loss)
+                elif now - last_progress >= progress_seconds:
+                    last_progress = now
+                    reported.append(metrics.latest_loss())
+            else:
+                # Previous train_scene loop: three host reads every step.
+                float(-10.0 * torch.log10(mse + 1e-8))
+                float(ssim_proxy.item())
+                reported.append(float(loss.item()))
+        _synchronize()
+        return reported[-1]
+
+    print(f"steps={args.steps} images=4x{args.size}x{args.size} device={device} repeats={args.repeats}")
+    # Warm both variants so neither timed run pays for allocator growth or first kernel launches.
+    warmup_steps = min(args.steps, log_interval)
+    _loop(False, warmup_steps)
+    _loop(True, warmup_steps)
+    timings: dict[bool, list[float]] = {False: [], True: []}
+    losses: dict[bool, float] = {}
+    for repeat in range(max(1, args.repeats)):
+        # Alternate which variant runs first so drift (thermal, caches) does not favour one.
+        for deferred in ((False, True) if repeat % 2 == 0 else (True, False)):
+            start = time.perf_counter()
+            losses[deferred] = _loop(deferred)
+            timings[deferred].append(time.perf_counter() - start)
+    legacy_s = statistics.median(timings[False])
+    deferred_s = statistics.median(timings[True])
+    legacy_loss, deferred_loss = losses[False], losses[True]
+    print(f"{'per-step .item()':<28} {legacy_s:8.3f}s (median)")
+    print(f"{'deferred metrics':<28} {deferred_s:8.3f}s (median)")
+    print(f"per step: legacy {legacy_s / args.steps * 1e3:.3f} ms, deferred {deferred_s / args.steps * 1e3:.3f} ms, "
+          f"speedup {legacy_s / max(deferred_s, 1e-9):.2f}x")
+    if device.type != "cuda":
+        print("note: .item() forces no device sync on CPU; the speedup is only meaningful on CUDA.")
+    same = abs(legacy_loss - deferred_loss) <= 1e-6
+    print(f"final loss legacy={legacy_loss:.6f} deferred={deferred_loss:.6f} same={same}")
+    return 0 if same else 1
+
+
+def _bench_checkpoints(args: argparse.Namespace) -> int:
+    import hashlib
+
+    import torch
+
+    from nullsplats.backend.checkpoint_writer import CheckpointWriter
+    from nullsplats.backend.splat_train_ops import export_splats
+
+    device = torch.device(args.device)
+    generator = torch.Generator().manual_seed(0)
+    shapes = {"means": (3,), "scales": (3,), "quats": (4,), "opacities": (), "sh0": (1, 3), "shN": (15, 3)}
+    splats = torch.nn.ParameterDict(
+        {
+            key: torch.nn.Parameter(torch.randn((args.gaussians, *shape), generator=generator).to(device))
+            for key, shape in shapes.items()
+        }
+    )
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_ckpt_"))
+    try:
+        inline_dir = workdir / "inline"
+        async_dir = workdir / "async"
+        blocked = []
+
+        def _inline() -> None:
+            for idx in range(args.count):
+                export_splats(splats, inline_dir / f"iter_{idx:05d}", max_points=0, fmt=args.format)
+
+        def _background() -> None:
+            with CheckpointWriter(fmt=args.format, max_points=0) as writer:
+                for idx in range(args.count):
+                    start = time.perf_counter()
+                    writer.submit(idx, splats, async_dir / f"iter_{idx:05d}")
+                    blocked.append(time.perf_counter() - start)
+                    # Stands in for the training steps between snapshots.
+                    time.sleep(0.5)
+
+        print(f"gaussians={args.gaussians} checkpoints={args.count} format={args.format} device={device}")
+        inline_s, _ = _timed("inline export_splats", _inline)
+        _timed("background writer (total)", _background)
+        print(f"training thread blocked per checkpoint: inline {inline_s / args.count * 1e3:.1f} ms, "
+              f"background {sum(blocked) / args.count * 1e3:.1f} ms (max {max(blocked) * 1e3:.1f} ms)")
+
+        def _digest(path: Path) -> str:
+            return hashlib.md5(path.read_bytes()).hexdigest()
+
+        names = [f"iter_{idx:05d}.{args.format}" for idx in range(args.count)]
+        same = all(_digest(inline_dir / name) == _digest(async_dir / name) for name in names)
+        print(f"identical files={same}")
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _bench_export(args: argparse.Namespace) -> int:
+    import torch
+
+    from nullsplats.backend.splat_io import write_splat_file
+
+    generator = torch.Generator().manual_seed(0)
+    count = args.gaussians
+    rest = (args.sh_degree + 1) ** 2 - 1
+    tensors = {
+        "means": torch.randn((count, 3), generator=generator) * 5.0,
+        "scales": torch.randn((count, 3), generator=generator) - 3.0,
+        "quats": torch.randn((count, 4), generator=generator),
+        "opacities": torch.randn((count,), generator=generator) * 3.0,
+        "sh0": torch.randn((count, 1, 3), generator=generator),
+        "shN": torch.randn((count, rest, 3), generator=generator) * 0.1,
+    }
+    # Invalid rows must be dropped identically.
+    tensors["means"][7, 1] = float("nan")
+    tensors["scales"][11, 0] = float("inf")
+    arrays = {key: value.numpy() for key, value in tensors.items()}
+    try:
+        from gsplat import export_splats as gsplat_export
+    except Exception:  # noqa: BLE001
+        gsplat_export = None
+        print("gsplat not importable; comparing native writer variants only")
+
+    def _peak(func: Callable[[], object]) -> tuple[float, float]:
+        tracemalloc.start()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return elapsed, peak / 1e6
+
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_export_"))
+    same = True
+    try:
+        print(f"gaussians={count} sh_degree={args.sh_degree} chunk={args.chunk}")
+        print("peak traced = NumPy/Python allocations (tracemalloc); torch tensors inside gsplat are not traced")
+        for fmt in ("ply", "splat"):
+            outputs = {}
+            variants = []
+            if gsplat_export is not None:
+                variants.append(("gsplat.export_splats", lambda path: gsplat_export(
+                    *tensors.values(), format=fmt, save_to=str(path))))
+            for label, chunk in (("native (one chunk)", 0), ("native (streaming)", args.chunk)):
+                variants.append((label, lambda path, chunk=chunk: write_splat_file(
+                    path, fmt, *arrays.values(), chunk_size=chunk)))
+            for idx, (label, func) in enumerate(variants):
+                path = workdir / f"{idx}.{fmt}"
+                elapsed, peak_mb = _peak(lambda: func(path))
+                print(f"{fmt:<5} {label:<22} {elapsed:8.3f}s  peak traced {peak_mb:8.1f} MB  "
+                      f"size {path.stat().st_size / 1e6:.1f} MB")
+                outputs[label] = path.read_bytes()
+            reference = next(iter(outputs.values()))
+            identical = all(data == reference for data in outputs.values())
+            print(f"{fmt:<5} identical bytes={identical}")
+            same = same and identical
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _legacy_ply_viewer_arrays(path: Path) -> tuple:
+    """Previous gl_canvas path: read the whole body, frombuffer, astype+stack per column, torch copies."""
+    import numpy as np
+    import torch
+    import torch.nn.functional as F
+
+    with path.open("rb") as handle:
+        header = []
+        while True:
+            line = handle.readline().decode("ascii").strip()
+            header.append(line)
+            if line == "end_header":
+                break
+        body = handle.read()
+    count = int(next(line for line in header if line.startswith("element vertex")).split()[2])
+    names = [line.split()[2] for line in header if line.startswith("property")]
+    raw = np.frombuffer(body, dtype=np.dtype([(name, "<f4") for name in names]), count=count)
+
+    def _stack(columns) -> torch.Tensor:
+        return torch.from_numpy(np.stack([raw[name].astype(np.float32) for name in columns], axis=1))
+
+    rest = sorted((n for n in names if n.startswith("f_rest_")), key=lambda n: int(n.split("_")[-1]))
+    means = _stack(("x", "y", "z"))
+    dc = _stack(("f_dc_0", "f_dc_1", "f_dc_2")).reshape(-1, 1, 3)
+    sh_rest = _stack(rest).reshape(-1, len(rest) // 3, 3) if rest else torch.zeros((count, 0, 3))
+    scales = _stack(("scale_0", "scale_1", "scale_2"))
+    opacities = torch.tensor(raw["opacity"], dtype=torch.float32)
+    quats = F.normalize(_stack(("rot_0", "rot_1", "rot_2", "rot_3")), dim=1)
+    colors = torch.cat([dc, sh_rest], dim=1)
+    return (
+        means.cpu().numpy(),
+        scales.cpu().numpy(),
+        np.ascontiguousarray(quats.cpu().numpy()[:, [1, 2, 3, 0]]),
+        opacities.cpu().numpy(),
+        colors.cpu().numpy()[:, 0, :],
+    )
+
+
+def _proc_status_kb(field: str) -> int:
+    # VmHWM/VmRSS from /proc: ru_maxrss survives exec and would report the parent's peak.
+    for line in Path("/proc/self/status").read_text().splitlines():
+        if line.startswith(field + ":"):
+            return int(line.split()[1])
+    raise KeyError(field)
+
+
+def _bench_plyload_child(args: argparse.Namespace) -> int:
+    import json
+
+    from nullsplats.backend.splat_io import load_gaussian_buffers
+
+    path = Path(args.input)
+    baseline_kb = _proc_status_kb("VmRSS")
+    start = time.perf_counter()
+    if args.variant == "legacy":
+        arrays = _legacy_ply_viewer_arrays(path)
+    else:
+        buffers = load_gaussian_buffers(path, "cpu", chunk_rows=args.chunk)
+        arrays = (buffers.viewer_means, buffers.viewer_scales, buffers.viewer_rotations, buffers.opacities.numpy(),
+                  buffers.viewer_sh_dc)
+    elapsed = time.perf_counter() - start
+    peak_kb = _proc_status_kb("VmHWM")
+    checksum = float(sum(float(array.astype("float64").sum()) for array in arrays))
+    print(json.dumps({"seconds": elapsed, "peak_mb": peak_kb / 1024, "load_mb": (peak_kb - baseline_kb) / 1024,
+                      "checksum": checksum}))
+    return 0
+
+
+def _bench_plyload(args: argparse.Namespace) -> int:
+    import json
+    import subprocess
+    import sys
+
+    import torch
+
+    from nullsplats.backend.splat_io import write_ply
+
+    if args.variant:
+        return _bench_plyload_child(args)
+    if not Path("/proc/self/status").exists():
+        print("plyload reads peak RSS from /proc/self/status (Linux only)")
+        return 1
+    generator = torch.Generator().manual_seed(0)
+    count = args.gaussians
+    rest = (args.sh_degree + 1) ** 2 - 1
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_plyload_"))
+    try:
+        path = workdir / "scene.ply"
+        write_ply(
+            path,
+            torch.randn((count, 3), generator=generator),
+            torch.randn((count, 3), generator=generator) - 3.0,
+            torch.randn((count, 4), generator=generator),
+            torch.randn((count,), generator=generator),
+            torch.randn((count, 1, 3), generator=generator),
+            torch.randn((count, rest, 3), generator=generator),
+        )
+        size_mb = path.stat().st_size / 1e6
+        print(f"gaussians={count} sh_degree={args.sh_degree} file={size_mb:.1f} MB chunk={args.chunk}")
+        print("time = PLY on disk to viewer-ready arrays (time to first frame, minus GL upload); each variant runs in "
+              "a fresh process")
+        results = {}
+        for variant in ("legacy", "streamed"):
+            command = [sys.executable, __file__, "plyload", "--variant", variant, "--input", str(path),
+                       "--chunk", str(args.chunk)]
+            output = subprocess.run(command, check=True, capture_output=True, text=True).stdout
+            results[variant] = json.loads(output.strip().splitlines()[-1])
+            result = results[variant]
+            print(f"{variant:<10} {result['seconds']:8.3f}s  peak RSS {result['peak_mb']:8.1f} MB  "
+                  f"(+{result['load_mb']:.1f} MB for the load)")
+        same = results["legacy"]["checksum"] == results["streamed"]["checksum"]
+        print(f"same viewer arrays={same}")
+        return 0 if same else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _legacy_ply_points(path: Path):
+    """Previous splat_train_io parser: whole-file read, per-line tuples for ASCII.
+
+    The original wrapped floats as ``typ(type(typ)(...))``, which raises for any
+    float property; this keeps its per-line structure with that call fixed.
+    """
+    import numpy as np
+
+    type_map = {"float": np.float32, "double": np.float64, "uchar": np.uint8, "int": np.int32, "uint": np.uint32}
+    with path.open("rb") as handle:
+        header = []
+        while True:
+            line = handle.readline().decode("ascii").strip()
+            header.append(line)
+            if line == "end_header":
+                break
+        data = handle.read()
+    count = int(next(line for line in header if line.startswith("element vertex")).split()[-1])
+    properties = []
+    for line in header[header.index(next(h for h in header if h.startswith("element vertex"))) + 1 :]:
+        if line.startswith("element "):
+            break
+        if line.startswith("property"):
+            properties.append((line.split()[2], type_map[line.split()[1]]))
+    dtype = np.dtype(properties)
+    if "ascii" not in next(line for line in header if line.startswith("format ")):
+        return np.frombuffer(data, dtype=dtype, count=count)
+    rows = []
+    for line in data.decode("ascii").strip().splitlines()[:count]:
+        parts = line.split()
+        parsed = []
+        for value, (_, typ) in zip(parts, properties):
+            parsed.append(typ(float(value)) if np.issubdtype(typ, np.floating) else int(float(value)))
+        rows.append(tuple(parsed))
+    return np.array(rows, dtype=dtype)
+
+
+def _write_bench_ply(path: Path, fmt: str, columns: dict, types: dict, faces: int = 0) -> None:
+    """Vertex element (``columns``, PLY ``types``) plus an optional trailing face element."""
+    import numpy as np
+
+    codes = {"float": "f4", "double": "f8", "uchar": "u1", "int": "i4", "uint": "u4"}
+    count = len(next(iter(columns.values())))
+    lines = ["ply", f"format {fmt} 1.0", f"element vertex {count}"]
+    lines += [f"property {types[name]} {name}" for name in columns]
+    lines += [f"element face {faces}", "property list uchar int vertex_indices", "end_header"]
+    with path.open("wb") as handle:
+        handle.write(("\n".join(lines) + "\n").encode("ascii"))
+        if fmt == "ascii":
+            digits = {"float": ".9g", "double": ".17g"}
+            text = [format(value, digits.get(types[name], "d")) for name in columns for value in columns[name].tolist()]
+            table = np.array(text, dtype=object).reshape(len(columns), count).T
+            handle.write(("\n".join(" ".join(row) for row in table) + "\n").encode("ascii"))
+            handle.write(b"3 0 1 2\n" * faces)
+            return
+        order = "<" if fmt == "binary_little_endian" else ">"
+        record = np.empty(count, dtype=[(name, order + codes[types[name]]) for name in columns])
+        for name, values in columns.items():
+            record[name] = values
+        record.tofile(handle)
+        face = np.zeros(faces, dtype=[("n", "u1"), ("v", order + "i4", (3,))])
+        face["n"] = 3
+        face.tofile(handle)
+
+
+def _bench_plyparse(args: argparse.Namespace) -> int:
+    import numpy as np
+
+    from nullsplats.backend.splat_io import open_ply
+    from nullsplats.backend.splat_train_io import _load_ply_points
+
+    rng = np.random.default_rng(0)
+    count = args.points
+    types = {"x": "float", "y": "float", "z": "float", "w": "double", "red": "uchar", "green": "uchar",
+             "blue": "uchar", "track_length": "int", "id": "uint"}
+    columns = {name: rng.standard_normal(count).astype(np.float32) for name in ("x", "y", "z")}
+    columns["w"] = rng.standard_normal(count) * 1e3
+    columns.update({name: rng.integers(0, 256, count).astype(np.uint8) for name in ("red", "green", "blue")})
+    columns["track_length"] = rng.integers(-5, 50, count).astype(np.int32)
+    columns["id"] = rng.integers(0, 2**32 - 1, count, dtype=np.uint64).astype(np.uint32)
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_plyparse_"))
+    ok = True
+    try:
+        print(f"points={count} properties={len(columns)} (float, double, uchar, int, uint) + trailing face element")
+        labels = {"ascii": "ascii", "binary_little_endian": "binary LE", "binary_big_endian": "binary BE"}
+        for fmt, label in labels.items():
+            path = workdir / f"{fmt}.ply"
+            _write_bench_ply(path, fmt, columns, types, faces=16)
+            size_mb = path.stat().st_size / 1e6
+            if fmt != "binary_big_endian":  # the old parser had no big-endian support
+                legacy_s, legacy = _timed(f"{label} per-line", lambda: _legacy_ply_points(path))
+            shared_s, parsed = _timed(f"{label} shared columns", lambda: open_ply(path).columns())
+            exact = all(np.array_equal(parsed[name], values) for name, values in columns.items())
+            if fmt != "binary_big_endian":
+                exact = exact and all(np.array_equal(parsed[name], legacy[name]) for name in columns)
+            if fmt == "ascii":
+                print(f"  {size_mb:.1f} MB, speedup {legacy_s / max(shared_s, 1e-9):.1f}x")
+            means, colors, tracks = _load_ply_points(path)
+            exact = exact and np.array_equal(means.numpy()[:, 0], columns["x"])
+            exact = exact and np.array_equal(tracks.numpy(), columns["track_length"].astype(np.float32))
+            exact = exact and np.allclose(colors.numpy()[:, 0], columns["red"] / 255.0)
+            print(f"  columns match source={exact}")
+            ok = ok and exact
+        return 0 if ok else 1
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _render_reference(buffers, sh_degree: int, viewmat, K, size: int):
+    """CPU render with gsplat's PyTorch reference projection/SH and a dense front-to-back compositor."""
+    import torch
+
+    from gsplat.cuda._torch_impl import _fully_fused_projection, _quat_scale_to_covar_preci, _spherical_harmonics
+
+    means = buffers.means
+    covars, _ = _quat_scale_to_covar_preci(buffers.quats, torch.exp(buffers.scales_log), compute_preci=False)
+    radii, means2d, depths, conics, _ = _fully_fused_projection(means, covars, viewmat[None], K[None], size, size)
+    visible = (radii[0] > 0).all(dim=-1)
+    campos = torch.linalg.inv(viewmat)[:3, 3]
+    coeffs = buffers.colors[visible]
+    colors = torch.clamp_min(_spherical_harmonics(sh_degree, means[visible] - campos, coeffs) + 0.5, 0.0)
+    opacities = buffers.opacities[visible]
+    means2d, conics = means2d[0][visible], conics[0][visible]
+    order = torch.argsort(depths[0][visible])
+    ys, xs = torch.meshgrid(torch.arange(size) + 0.5, torch.arange(size) + 0.5, indexing="ij")
+    pixels = torch.stack([xs.reshape(-1), ys.reshape(-1)], dim=1)
+    transmittance = torch.ones(pixels.shape[0])
+    image = torch.zeros(pixels.shape[0], 3)
+    for batch in order.split(256):
+        delta = pixels[None] - means2d[batch, None]
+        a, b, c = conics[batch].unbind(-1)
+        dx, dy = delta[..., 0], delta[..., 1]
+        sigma = 0.5 * (a[:, None] * dx**2 + c[:, None] * dy**2) + b[:, None] * dx * dy
+        alpha = torch.clamp_max(opacities[batch, None] * torch.exp(-sigma), 0.999)
+        alpha = torch.where((sigma >= 0) & (alpha >= 1.0 / 255.0), alpha, torch.zeros_like(alpha))
+        through = torch.cumprod(torch.cat([torch.ones_like(alpha[:1]), 1.0 - alpha[:-1]]), dim=0)
+        weights = alpha * through * transmittance[None]
+        image += (weights[..., None] * colors[batch, None]).sum(dim=0)
+        transmittance = transmittance * torch.prod(1.0 - alpha, dim=0)
+    return image.reshape(size, size, 3).clamp(0.0, 1.0)
+
+
+def _bench_compact(args: argparse.Namespace) -> int:
+    import math
+
+    import torch
+
+    from nullsplats.backend.splat_compact import convert_ply_to_compact, load_compact_viewer_arrays
+    from nullsplats.backend.splat_io import SH_C0, load_gaussian_buffers, morton_order, write_ply
+
+    generator = torch.Generator().manual_seed(0)
+    count = args.gaussians
+    rest = (args.sh_degree + 1) ** 2 - 1
+    # Surface-like scene: gaussians on nested spheres with smooth colors, small scales and mostly opaque.
+    directions = torch.nn.functional.normalize(torch.randn((count, 3), generator=generator), dim=1)
+    shells = 1.0 + 0.5 * torch.randint(0, 3, (count, 1), generator=generator).float()
+    means = directions * shells + 0.01 * torch.randn((count, 3), generator=generator)
+    scales = math.log(0.03) + 0.3 * torch.randn((count, 3), generator=generator)
+    quats = torch.randn((count, 4), generator=generator)
+    opacities = torch.sigmoid(1.5 + torch.randn((count,), generator=generator))
+    base = 0.5 + 0.4 * torch.sin(3.0 * means + torch.tensor([0.0, 2.0, 4.0]))
+    sh0 = ((base - 0.5) / SH_C0).reshape(count, 1, 3)
+    shN = 0.05 * torch.randn((count, rest, 3), generator=generator)
+    workdir = Path(tempfile.mkdtemp(prefix="nullsplats_bench_compact_"))
+    try:
+        ply_path = workdir / "scene.ply"
+        write_ply(ply_path, means, scales, quats, opacities, sh0, shN)
+        convert_s, compact_path = _timed("convert PLY -> .nsplat", lambda: convert_ply_to_compact(ply_path))
+        ply_mb = ply_path.stat().st_size / 1e6
+        compact_mb = compact_path.stat().st_size / 1e6
+        print(f"gaussians={count} sh_degree={args.sh_degree}")
+        print(f"size PLY {ply_mb:.1f} MB  .nsplat {compact_mb:.1f} MB  ({ply_mb / compact_mb:.1f}x smaller)")
+
+        def _best(label: str, path: Path, func: Callable[[], object], *, cold: bool) -> tuple[float, object]:
+            timings = []
+            for _ in range(3):
+                if cold:
+                    # Drop the file's clean pages so the load reads from disk again.
+                    with path.open("rb") as handle:
+                        os.posix_fadvise(handle.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                start = time.perf_counter()
+                result = func()
+                timings.append(time.perf_counter() - start)
+            print(f"{label:<34} {min(timings):8.3f}s")
+            return min(timings), result
+
+        for cold in (False, True) if hasattr(os, "posix_fadvise") else (False,):
+            cache = "cold" if cold else "warm"
+            ply_s, ply_buffers = _best(
+                f"{cache} PLY buffers", ply_path, lambda: load_gaussian_buffers(ply_path), cold=cold
+            )
+            compact_s, compact_buffers = _best(
+                f"{cache} .nsplat buffers", compact_path, lambda: load_gaussian_buffers(compact_path), cold=cold
+            )
+            viewer_s, _ = _best(
+                f"{cache} .nsplat viewer arrays only",
+                compact_path,
+                lambda: load_compact_viewer_arrays(compact_path),
+                cold=cold,
+            )
+            print(f"{cache} load speedup buffers {ply_s / max(compact_s, 1e-9):.1f}x "
+                  f"viewer arrays {ply_s / max(viewer_s, 1e-9):.1f}x")
+
+        # .nsplat rows are the PLY rows in Morton order; render the same random subset from both files.
+        order = torch.from_numpy(morton_order(ply_buffers.viewer_means))
+        subset = torch.randperm(count, generator=generator)[: min(args.psnr_gaussians, count)]
+
+        def _rows(buffers, rows: torch.Tensor) -> SimpleNamespace:
+            fields = ("means", "scales_log", "quats", "opacities", "colors")
+            return SimpleNamespace(**{name: getattr(buffers, name)[rows] for name in fields})
+
+        ply_view = _rows(ply_buffers, order[subset])
+        compact_view = _rows(compact_buffers, subset)
+        focal = 1.2 * args.size
+        K = torch.tensor([[focal, 0.0, args.size / 2], [0.0, focal, args.size / 2], [0.0, 0.0, 1.0]])
+        psnrs = []
+        for view in range(args.views):
+            angle = 2.0 * math.pi * view / max(1, args.views)
+            eye = torch.tensor([4.0 * math.sin(angle), 0.8, -4.0 * math.cos(angle)])
+            forward = torch.nn.functional.normalize(-eye, dim=0)
+            right = torch.nn.functional.normalize(torch.linalg.cross(torch.tensor([0.0, -1.0, 0.0]), forward), dim=0)
+            down = torch.linalg.cross(forward, right)
+            viewmat = torch.eye(4)
+            viewmat[:3, :3] = torch.stack([right, down, forward])
+            viewmat[:3, 3] = -viewmat[:3, :3] @ eye
+            full = _render_reference(ply_view, args.sh_degree, viewmat, K, args.size)
+            quantized = _render_reference(compact_view, args.sh_degree, viewmat, K, args.size)
+            mse = float(((full - quantized) ** 2).mean())
+            psnrs.append(10.0 * math.log10(1.0 / max(mse, 1e-12)))
+            coverage = float((full.sum(-1) > 0).float().mean())
+            print(f"view {view}: PSNR .nsplat vs PLY {psnrs[-1]:.2f} dB (coverage {coverage:.2f})")
+        print(f"mean PSNR {sum(psnrs) / len(psnrs):.2f} dB over {args.views} views at {args.size}px, "
+              f"{subset.shape[0]} gaussians; convert {convert_s:.2f}s")
+        return 0
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def _synthetic_shells(count: int, generator) -> tuple:
+    """Viewer arrays for gaussians on nested spheres: log-scales, xyzw quaternions, linear opacities."""
+    import math
+
+    import torch
+
+    from nullsplats.backend.splat_io import SH_C0
+
+    directions = torch.nn.functional.normalize(torch.randn((count, 3), generator=generator), dim=1)
+    shells = 1.0 + 0.5 * torch.randint(0, 3, (count, 1), generator=generator).float()
+    means = directions * shells + 0.01 * torch.randn((count, 3), generator=generator)
+    scales = math.log(0.03) + 0.3 * torch.randn((count, 3), generator=generator)
+    quats = torch.nn.functional.normalize(torch.randn((count, 4), generator=generator), dim=1)
+    opacities = torch.sigmoid(1.5 + torch.randn((count,), generator=generator))
+    sh_dc = (0.4 * torch.sin(3.0 * means + torch.tensor([0.0, 2.0, 4.0]))) / SH_C0
+    return tuple(value.numpy() for value in (means, scales, quats, opacities, sh_dc))
+
+
+def _lod_cut_is_exact(lod, rows) -> bool:
+    """True when every original Gaussian sits under exactly one selected row."""
+    import numpy as np
+
+    picked = np.zeros(lod.proxy_count, dtype=bool)
+    picked[rows[rows >= lod.count] - lod.count] = True
+    covered = picked.copy()
+    for level in range(1, lod.depth + 1):
+        nodes = slice(lod.level_offsets[level], lod.level_offsets[level + 1])
+        if (picked[nodes] & covered[lod.proxy_parents[nodes]]).any():
+            return False
+        covered[nodes] |= covered[lod.proxy_parents[nodes]]
+    hits = np.empty(lod.count, dtype=np.int64)
+    hits[lod.order] = covered[lod.leaf_parents]
+    np.add.at(hits, rows[rows < lod.count], 1)
+    return bool((hits == 1).all())
+
+
+def _bench_lod(args: argparse.Namespace) -> int:
+    import math
+
+    import numpy as np
+    import torch
+
+    from nullsplats.backend.splat_lod import build_splat_lod
+
+    generator = torch.Generator().manual_seed(0)
+    arrays = _synthetic_shells(args.gaussians, generator)
+    tracemalloc.start()
+    build_s, lod = _timed("build hierarchy", lambda: build_splat_lod(*arrays))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    lod_bytes = sum(value.nbytes for value in vars(lod).values() if isinstance(value, np.ndarray))
+    print(f"gaussians={lod.count} depth={lod.depth} proxies={lod.proxy_count} "
+          f"({lod.proxy_count / lod.count:.1%}) peak_build_mb={peak / 1e6:.0f} "
+          f"lod_mb={lod_bytes / 1e6:.0f} scene_mb={sum(value.nbytes for value in arrays) / 1e6:.0f}")
+    focal = args.height / (2.0 * math.tan(math.radians(45.0) / 2.0))
+    for distance in (2.0, 4.0, 8.0, 16.0, 32.0, 64.0):
+        eye = np.array([0.0, 0.3 * distance, -distance], dtype=np.float32)
+        timings = []
+        for _ in range(5):
+            start = time.perf_counter()
+            rows = lod.select(eye, focal, pixel_threshold=args.pixels)
+            timings.append(time.perf_counter() - start)
+        print(f"distance {distance:5.1f}: drawn {rows.shape[0]:>9} ({rows.shape[0] / lod.count:6.1%}) "
+              f"cut {min(timings) * 1000:6.1f}ms exact={_lod_cut_is_exact(lod, rows)}")
+
+    # Fidelity: render a smaller scene in full and through its LOD cut at the same resolution.
+    count = min(args.psnr_gaussians, args.gaussians)
+    small_arrays = _synthetic_shells(count, generator)
+    small = build_splat_lod(*small_arrays)
+    focal = 1.2 * args.size
+    K = torch.tensor([[focal, 0.0, args.size / 2], [0.0, focal, args.size / 2], [0.0, 0.0, 1.0]])
+
+    def _buffers(rows: np.ndarray) -> SimpleNamespace:
+        means, scales, rotations, opacities, sh_dc = small.take(rows, *small_arrays)
+        return SimpleNamespace(
+            means=torch.from_numpy(means),
+            scales_log=torch.from_numpy(scales),
+            quats=torch.from_numpy(rotations[:, [3, 0, 1, 2]]),
+            opacities=torch.from_numpy(opacities.reshape(-1)),
+            colors=torch.from_numpy(sh_dc).unsqueeze(1),
+        )
+
+    full = _buffers(np.arange(small.count))
+    for distance in (4.0, 8.0, 16.0):
+        eye = torch.tensor([0.0, 0.3 * distance, -distance])
+        forward = torch.nn.functional.normalize(-eye, dim=0)
+        right = torch.nn.functional.normalize(torch.linalg.cross(torch.tensor([0.0, -1.0, 0.0]), forward), dim=0)
+        down = torch.linalg.cross(forward, right)
+        viewmat = torch.eye(4)
+        viewmat[:3, :3] = torch.stack([right, down, forward])
+        viewmat[:3, 3] = -viewmat[:3, :3] @ eye
+        rows = small.select(eye.numpy(), focal, pixel_threshold=args.pixels)
+        reference = _render_reference(full, 0, viewmat, K, args.size)
+        cut = _render_reference(_buffers(rows), 0, viewmat, K, args.size)
+        mse = float(((reference - cut) ** 2).mean())
+        print(f"distance {distance:5.1f}: PSNR LOD vs full {10.0 * math.log10(1.0 / max(mse, 1e-12)):6.2f} dB "
+              f"drawing {rows.shape[0]}/{small.count} at {args.size}px")
+    print(f"build {build_s:.2f}s for {lod.count} gaussians")
+    return 0
+
+
+def _gl_camera(eye, target, aspect: float, near: float = 0.02, far: float = 20.0) -> tuple:
+    """Look-at view and 45-degree perspective with the OpenGL viewer's conventions."""
+    import math
+
+    import numpy as np
+
+    eye = np.asarray(eye, dtype=np.float32)
+    forward = np.asarray(target, dtype=np.float32) - eye
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, np.array([0.0, 1.0, 0.0], dtype=np.float32))
+    right /= np.linalg.norm(right)
+    up = np.cross(right, forward)
+    view = np.eye(4, dtype=np.float32)
+    view[0, :3], view[1, :3], view[2, :3] = right, up, -forward
+    view[:3, 3] = -view[:3, :3] @ eye
+    focal = 1.0 / math.tan(math.radians(45.0) / 2.0)
+    projection = np.zeros((4, 4), dtype=np.float32)
+    projection[0, 0] = focal / aspect
+    projection[1, 1] = focal
+    projection[2, 2] = (far + near) / (near - far)
+    projection[2, 3] = 2.0 * far * near / (near - far)
+    projection[3, 2] = -1.0
+    return view, projection
+
+
+def _bench_cull(args: argparse.Namespace) -> int:
+    import math
+
+    import numpy as np
+    import torch
+
+    from nullsplats.backend.splat_cull import CULL_NDC_LIMIT, cull_splats
+
+    device = torch.device(args.device)
+    generator = torch.Generator().manual_seed(0)
+    means, scales, quats, opacities, sh_dc = _synthetic_shells(args.gaussians, generator)
+    count = means.shape[0]
+    aspect = 16.0 / 9.0
+    views = {
+        "overview": ((0.0, 1.0, -5.0), (0.0, 0.0, 0.0)),
+        "close-up": ((0.3, 0.2, -1.8), (1.2, 0.2, 0.0)),
+        "inside": ((0.0, 0.0, 0.0), (0.0, 0.0, 1.0)),
+        "distant": ((0.0, 3.0, -14.0), (0.0, 0.0, 0.0)),
+    }
+
+    def _upload_rows(rows: np.ndarray) -> np.ndarray:
+        data = np.empty((rows.shape[0], 14), dtype=np.float32)
+        data[:, 0:3] = means[rows]
+        data[:, 3:6] = scales[rows]
+        data[:, 6:10] = quats[rows]
+        data[:, 10] = opacities[rows]
+        data[:, 11:14] = sh_dc[rows]
+        return data
+
+    def _sync() -> None:
+        if device.type == "cuda":
+            torch.cuda.synchronize()
+
+    print(f"gaussians={count} viewport={int(args.height * aspect)}x{args.height} min_radius={args.min_radius}px")
+    for name, (eye, target) in views.items():
+        view, projection = _gl_camera(eye, target, aspect)
+        best = {"full": math.inf, "culled": math.inf}
+        for _ in range(3):
+            _sync()
+            start = time.perf_counter()
+            means_t = torch.from_numpy(means).to(device)
+            view_t = torch.from_numpy(view).to(device)
+            depths = (means_t @ view_t[:3, :3].T + view_t[:3, 3])[:, 2]
+            order = torch.argsort(depths, descending=True).cpu().numpy()
+            full = _upload_rows(order)
+            best["full"] = min(best["full"], time.perf_counter() - start)
+
+            _sync()
+            start = time.perf_counter()
+            visible, depths = cull_splats(
+                means, scales, view, projection, args.height, min_radius_px=args.min_radius, device=device
+            )
+            cull_s = time.perf_counter() - start
+            order = visible[torch.argsort(depths, descending=True)].cpu().numpy()
+            culled = _upload_rows(order)
+            best["culled"] = min(best["culled"], time.perf_counter() - start)
+
+        # Frustum-only culling must keep exactly the centers the vertex shader keeps (and drop those behind the camera).
+        frustum, _ = cull_splats(means, scales, view, projection, args.height, min_radius_px=0.0)
+        clip = np.c_[means, np.ones(count, dtype=np.float32)] @ (projection @ view).T
+        ndc = clip[:, :3] / clip[:, 3:4]
+        shader = (np.abs(ndc) <= CULL_NDC_LIMIT).all(axis=1)
+        behind = int(np.count_nonzero(shader & (clip[:, 3] <= 0)))
+        matches = np.array_equal(np.flatnonzero(shader & (clip[:, 3] > 0)), frustum.numpy())
+        print(f"{name:<9} visible {culled.shape[0]:>9} ({culled.shape[0] / count:6.1%}) "
+              f"in-frustum {frustum.shape[0]:>9} | sort+upload all {best['full'] * 1000:7.1f}ms "
+              f"culled {best['culled'] * 1000:7.1f}ms (cull {cull_s * 1000:.1f}ms) "
+              f"upload {full.nbytes / 1e6:.0f}->{culled.nbytes / 1e6:.0f} MB | shader-match={matches} "
+              f"behind-camera-drawn-by-shader={behind}")
+
+    # Quality. The frustum test drops only centers the vertex shader would discard, but the CPU renderer used
+    # here also draws large splats whose centers are off screen, so it is compared separately from the radius cutoff.
+    count = min(args.psnr_gaussians, args.gaussians)
+    small = _synthetic_shells(count, generator)
+    focal = 0.5 * args.size / math.tan(math.radians(45.0) / 2.0)
+    K = torch.tensor([[focal, 0.0, args.size / 2], [0.0, focal, args.size / 2], [0.0, 0.0, 1.0]])
+    # OpenGL camera (y up, looking down -z) to the renderer's OpenCV camera (y down, +z forward).
+    flip = torch.diag(torch.tensor([1.0, -1.0, -1.0, 1.0]))
+
+    def _buffers(rows: torch.Tensor) -> SimpleNamespace:
+        means_s, scales_s, quats_s, opacities_s, sh_dc_s = (torch.from_numpy(value)[rows] for value in small)
+        return SimpleNamespace(
+            means=means_s,
+            scales_log=scales_s,
+            quats=quats_s[:, [3, 0, 1, 2]],
+            opacities=opacities_s,
+            colors=sh_dc_s.unsqueeze(1),
+        )
+
+    def _psnr(reference, image) -> float:
+        mse = float(((reference - image) ** 2).mean())
+        return 10.0 * math.log10(1.0 / mse) if mse > 0 else math.inf
+
+    for name, (eye, target) in views.items():
+        view, projection = _gl_camera(eye, target, 1.0)
+        viewmat = flip @ torch.from_numpy(view)
+        unculled = _render_reference(_buffers(torch.arange(count)), 0, viewmat, K, args.size)
+        frustum, _ = cull_splats(small[0], small[1], view, projection, args.size, min_radius_px=0.0)
+        reference = _render_reference(_buffers(frustum), 0, viewmat, K, args.size)
+        results = [f"frustum {frustum.shape[0] / count:5.1%} {_psnr(unculled, reference):6.2f}dB vs none"]
+        for radius in (0.5, 1.0, 2.0):
+            visible, _ = cull_splats(small[0], small[1], view, projection, args.size, min_radius_px=radius)
+            image = _render_reference(_buffers(visible), 0, viewmat, K, args.size)
+            results.append(f"r>={radius:g}px {visible.shape[0] / count:5.1%} {_psnr(reference, image):6.2f}dB")
+        print(f"{name:<9} at {args.size}px: " + " | ".join(results) + " (radius rows vs frustum only)")
+    return 0
+
+
+def main() -> int:
+    args = _parse_args()
+    if args.command == "extract":
+        return _bench_extract(args)
+    if args.command == "score":
+        return _bench_score(args)
+    if args.command == "select":
+        return _bench_select(args)
+    if args.command == "codec":
+        return _bench_codec(args)
+    if args.command == "colmap":
+        return _bench_colmap(args)
+    if args.command == "poses":
+        return _bench_poses(args)
+    if args.command == "images":
+        return _bench_images(args)
+    if args.command == "batches":
+        return _bench_batches(args)
+    if args.command == "prefetch":
+        return _bench_prefetch(args)
+    if args.command == "samplers":
+        return _bench_samplers(args)
+    if args.command == "metrics":
+        return _bench_metrics(args)
+    if args.command == "checkpoints":
+        return _bench_checkpoints(args)
+    if args.command == "export":
+        return _bench_export(args)
+    if args.command == "plyload":
+        return _bench_plyload(args)
+    if args.command == "plyparse":
+        return _bench_plyparse(args)
+    if args.command == "compact":
+        return _bench_compact(args)
+    if args.command == "lod":
+        return _bench_lod(args)
+    if args.command == "cull":
+        return _bench_cull(args)
+    raise ValueError(f"Unknown command: {args.command}")
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
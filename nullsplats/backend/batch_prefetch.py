@@ -0,0 +1,131 @@
+"""Background batch preparation for the training loop.
+
+``BatchPrefetcher`` samples frame indices and gathers batch ``k + 1`` from a
+``FrameStore`` on a worker thread while step ``k`` runs. On CUDA the gather
+runs on a side stream, and the consumer's stream waits on an event before
+the batch is used. On CPU it is a plain thread, so the same code path can be
+exercised without a GPU.
+
+Seed contract: indices come from a ``frame_samplers`` sampler that owns its
+own ``np.random.RandomState(seed)``, the same generator
+``set_random_seed(seed)`` installs for NumPy's global RNG. The default
+``uniform`` sampler therefore yields exactly the batches the synchronous
+loop drew after ``set_random_seed(seed)``, however the threads are
+scheduled. Only the worker thread calls ``sampler.sample``.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from typing import Optional
+
+import torch
+
+from nullsplats.backend.frame_samplers import FrameSampler, UniformSampler
+from nullsplats.backend.frame_store import FrameBatch, FrameStore
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.batch_prefetch")
+_DONE = object()
+_PUT_POLL_SECONDS = 0.1
+
+
+class BatchPrefetcher:
+    """Iterator over ``steps`` training batches prepared ``depth`` steps ahead."""
+
+    def __init__(
+        self,
+        store: FrameStore,
+        batch_size: int,
+        *,
+        seed: int,
+        steps: int,
+        depth: int = 2,
+        sampler: Optional[FrameSampler] = None,
+    ) -> None:
+        self.store = store
+        self.batch_size = batch_size
+        self.steps = steps
+        self.sampler = sampler or UniformSampler(len(store), seed=seed)
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, depth))
+        self._stop = threading.Event()
+        self._stream = (
+            torch.cuda.Stream(device=store.device)
+            if store.device.type == "cuda" and torch.cuda.is_available()
+            else None
+        )
+        self._finished = False
+        self._thread = threading.Thread(target=self._run, name="batch_prefetch", daemon=True)
+        self._thread.start()
+
+    def __iter__(self) -> BatchPrefetcher:
+        return self
+
+    def __next__(self) -> FrameBatch:
+        if self._finished:
+            raise StopIteration
+        item = self._queue.get()
+        if item is _DONE:
+            self._finished = True
+            raise StopIteration
+        if isinstance(item, BaseException):
+            self._finished = True
+            raise item
+        batch, ready = item
+        if ready is not None:
+            consumer = torch.cuda.current_stream(self.store.device)
+            consumer.wait_event(ready)
+            # Tensors were allocated on the side stream; keep the allocator from reusing them early.
+            for tensor in (batch.indices, batch.camtoworlds, batch.Ks, batch.images):
+                tensor.record_stream(consumer)
+        return batch
+
+    def close(self) -> None:
+        """Stop the worker and drop queued batches."""
+        self._stop.set()
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._thread.join()
+        self._finished = True
+
+    def __enter__(self) -> BatchPrefetcher:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        try:
+            for _ in range(self.steps):
+                indices = self.sampler.sample(self.batch_size)
+                if self._stream is None:
+                    item = (self.store.gather(indices), None)
+                else:
+                    with torch.cuda.stream(self._stream):
+                        batch = self.store.gather(indices)
+                        ready = torch.cuda.Event()
+                        ready.record(self._stream)
+                    item = (batch, ready)
+                if not self._put(item):
+                    return
+            self._put(_DONE)
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the consumer thread
+            _LOGGER.exception("Batch prefetch failed")
+            self._put(exc)
+
+    def _put(self, item: object) -> bool:
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=_PUT_POLL_SECONDS)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+
+__all__ = ["BatchPrefetcher"]
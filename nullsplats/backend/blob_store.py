@@ -0,0 +1,270 @@
+"""Content-addressed file store shared by every scene under a cache root.
+
+Large inputs (source videos, extracted frames) are stored once under
+``<cache_root>/blobs/<aa>/<sha256>`` and materialized into scene directories
+as hardlinks, falling back to reflinks, symlinks, and finally plain copies.
+Scene files that are hardlinks share an inode with the blob, so consumers must
+replace them (unlink, then write) rather than rewrite them in place.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import os
+from pathlib import Path
+import shutil
+from typing import Dict, Iterable, Iterator, Optional
+import uuid
+
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.blob_store")
+_HASH_CHUNK = 1 << 20
+_FICLONE = 0x40049409  # Linux ioctl for copy-on-write clones (btrfs, XFS, bcachefs).
+LINK_METHODS = ("hardlink", "reflink", "symlink", "copy")
+
+
+@dataclass(frozen=True)
+class DedupReport:
+    """Bytes referenced by scenes versus bytes physically stored."""
+
+    logical_bytes: int
+    physical_bytes: int
+    blob_count: int
+    orphan_blobs: int
+    orphan_bytes: int
+    scene_bytes: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def saved_bytes(self) -> int:
+        return max(0, self.logical_bytes - self.physical_bytes)
+
+
+def file_digest(path: str | Path) -> str:
+    """Return the hex SHA-256 of a file, streamed in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with Path(path).open("rb") as handle:
+        for chunk in iter(lambda: handle.read(_HASH_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """Hash-keyed blob directory with link-based materialization."""
+
+    def __init__(self, cache_root: str | Path = "cache") -> None:
+        self.cache_root = Path(cache_root)
+        self.root = self.cache_root / "blobs"
+
+    def blob_path(self, digest: str) -> Path:
+        return self.root / digest[:2] / digest
+
+    def put(self, source: str | Path, *, allow_hardlink: bool = True, digest: Optional[str] = None) -> str:
+        """Add ``source`` to the store (no-op if its content is present) and return its digest.
+
+        Pass ``allow_hardlink=False`` for files outside the cache that the user
+        may edit in place; those are reflinked or copied instead.
+        """
+        source_path = Path(source)
+        digest = digest or file_digest(source_path)
+        blob = self.blob_path(digest)
+        if blob.exists():
+            return digest
+        blob.parent.mkdir(parents=True, exist_ok=True)
+        # Unique temp name keeps concurrent puts of the same content safe.
+        staging = blob.with_name(f".{digest}.{uuid.uuid4().hex}.tmp")
+        try:
+            if not (allow_hardlink and _try_hardlink(source_path, staging)) and not _try_reflink(
+                source_path, staging
+            ):
+                shutil.copy2(source_path, staging)
+            os.replace(staging, blob)
+        finally:
+            staging.unlink(missing_ok=True)
+        return digest
+
+    def materialize(self, digest: str, destination: str | Path) -> str:
+        """Make ``destination`` refer to the blob; return the link method used."""
+        blob = self.blob_path(digest)
+        if not blob.exists():
+            raise FileNotFoundError(f"Blob not found in store: {digest}")
+        dest = Path(destination)
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        if dest.is_symlink() or dest.exists():
+            dest.unlink()
+        if _try_hardlink(blob, dest):
+            return "hardlink"
+        if _try_reflink(blob, dest):
+            return "reflink"
+        try:
+            os.symlink(blob.resolve(), dest)
+            return "symlink"
+        except (OSError, NotImplementedError):
+            pass
+        shutil.copy2(blob, dest)
+        return "copy"
+
+    def link_file(self, source: str | Path, destination: str | Path, *, allow_hardlink: bool = True) -> str:
+        """Store ``source`` and materialize it at ``destination``; return the link method."""
+        digest = self.put(source, allow_hardlink=allow_hardlink)
+        return self.materialize(digest, destination)
+
+    def iter_blobs(self) -> Iterator[Path]:
+        if not self.root.exists():
+            return
+        for shard in sorted(self.root.iterdir()):
+            if not shard.is_dir():
+                continue
+            for blob in sorted(shard.iterdir()):
+                if blob.is_file() and not blob.name.startswith("."):
+                    yield blob
+
+    def dedup_report(self) -> DedupReport:
+        """Compare bytes referenced from scene inputs with bytes physically on disk.
+
+        Hardlinked and symlinked scene files resolve to the blob inode and are
+        counted once; reflinks look like independent files and are counted in
+        full, so the reported savings are a lower bound on CoW filesystems.
+        """
+        logical = 0
+        scene_bytes: Dict[str, int] = {}
+        physical_inodes: Dict[tuple[int, int], int] = {}
+        for scene, path in self._iter_scene_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            logical += stat.st_size
+            scene_bytes[scene] = scene_bytes.get(scene, 0) + stat.st_size
+            physical_inodes[(stat.st_dev, stat.st_ino)] = stat.st_size
+        blob_count = 0
+        orphan_blobs = 0
+        orphan_bytes = 0
+        for blob in self.iter_blobs():
+            stat = blob.stat()
+            key = (stat.st_dev, stat.st_ino)
+            blob_count += 1
+            if key not in physical_inodes:
+                orphan_blobs += 1
+                orphan_bytes += stat.st_size
+                physical_inodes[key] = stat.st_size
+        report = DedupReport(
+            logical_bytes=logical,
+            physical_bytes=sum(physical_inodes.values()),
+            blob_count=blob_count,
+            orphan_blobs=orphan_blobs,
+            orphan_bytes=orphan_bytes,
+            scene_bytes=scene_bytes,
+        )
+        _LOGGER.info(
+            "Blob store report root=%s blobs=%d logical=%d physical=%d saved=%d orphans=%d orphan_bytes=%d",
+            self.root,
+            report.blob_count,
+            report.logical_bytes,
+            report.physical_bytes,
+            report.saved_bytes,
+            report.orphan_blobs,
+            report.orphan_bytes,
+        )
+        return report
+
+    def collect_garbage(self) -> int:
+        """Delete blobs no scene file links to; return bytes freed."""
+        freed = self._remove_unreferenced(list(self.iter_blobs()))
+        if freed:
+            _LOGGER.info("Blob store garbage collected root=%s freed=%d", self.root, freed)
+        return freed
+
+    def blobs_linked_from(self, directory: str | Path) -> set[str]:
+        """Digests of the blobs that files under ``directory`` hardlink or symlink to."""
+        inodes: set[tuple[int, int]] = set()
+        root = Path(directory)
+        if root.exists():
+            for path in root.rglob("*"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                inodes.add((stat.st_dev, stat.st_ino))
+        linked: set[str] = set()
+        for blob in self.iter_blobs():
+            stat = blob.stat()
+            if (stat.st_dev, stat.st_ino) in inodes:
+                linked.add(blob.name)
+        return linked
+
+    def release(self, digests: Iterable[str]) -> int:
+        """Delete those of ``digests`` that no scene file links to any more; return bytes freed.
+
+        Callers pass the blobs a scene linked to before replacing its files, so
+        superseded frames and sources leave the store without a full collection.
+        """
+        blobs = [self.blob_path(digest) for digest in set(digests)]
+        blobs = [blob for blob in blobs if blob.is_file()]
+        if not blobs:
+            return 0
+        freed = self._remove_unreferenced(blobs)
+        if freed:
+            _LOGGER.info("Blob store released root=%s candidates=%d freed=%d", self.root, len(blobs), freed)
+        return freed
+
+    def _remove_unreferenced(self, blobs: Iterable[Path]) -> int:
+        referenced = self._referenced_inodes()
+        freed = 0
+        for blob in blobs:
+            stat = blob.stat()
+            if (stat.st_dev, stat.st_ino) in referenced:
+                continue
+            freed += stat.st_size
+            blob.unlink()
+        return freed
+
+    def _iter_scene_files(self) -> Iterable[tuple[str, Path]]:
+        inputs_root = self.cache_root / "inputs"
+        if not inputs_root.exists():
+            return
+        for scene_dir in sorted(inputs_root.iterdir()):
+            if not scene_dir.is_dir():
+                continue
+            for path in scene_dir.rglob("*"):
+                if path.is_file():
+                    yield scene_dir.name, path
+
+    def _referenced_inodes(self) -> set[tuple[int, int]]:
+        """Inodes of blobs reachable from scene inputs, via hardlinks or symlinks."""
+        referenced: set[tuple[int, int]] = set()
+        for _, path in self._iter_scene_files():
+            try:
+                stat = path.stat()  # follows symlinks into the store
+            except OSError:
+                continue
+            referenced.add((stat.st_dev, stat.st_ino))
+        return referenced
+
+
+def _try_hardlink(source: Path, destination: Path) -> bool:
+    try:
+        os.link(source, destination)
+        return True
+    except (OSError, NotImplementedError):
+        return False
+
+
+def _try_reflink(source: Path, destination: Path) -> bool:
+    try:
+        import fcntl
+    except ImportError:  # Windows
+        return False
+    try:
+        with source.open("rb") as src, destination.open("wb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+        shutil.copystat(source, destination)
+        return True
+    except OSError:
+        destination.unlink(missing_ok=True)
+        return False
+
+
+__all__ = ["BlobStore", "DedupReport", "LINK_METHODS", "file_digest"]
@@ -0,0 +1,94 @@
+"""Batched COLMAP pose conversion for NumPy arrays and torch tensors.
+
+COLMAP stores each image pose as a world-to-camera rotation quaternion
+``(qw, qx, qy, qz)`` plus translation. These helpers convert ``(N, 4)``
+quaternions and ``(N, 3)`` translations into ``(N, 3, 3)`` rotations or
+``(N, 4, 4)`` matrices in one vectorized pass. The output type follows the
+input: NumPy in, NumPy out; torch in, torch out (same dtype and device).
+Quaternions are used as stored, without renormalization, matching COLMAP's
+own conversion.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import numpy as np
+
+
+def _is_numpy(value: Any) -> bool:
+    return isinstance(value, np.ndarray)
+
+
+def _coerce(qvecs: Any, tvecs: Any = None) -> tuple[Any, Any]:
+    if not _is_numpy(qvecs) and not hasattr(qvecs, "device"):
+        qvecs = np.asarray(qvecs, dtype=np.float64)
+    if tvecs is None:
+        return qvecs, None
+    if _is_numpy(qvecs):
+        return qvecs, np.asarray(tvecs, dtype=qvecs.dtype)
+    import torch
+
+    return qvecs, torch.as_tensor(tvecs, dtype=qvecs.dtype, device=qvecs.device)
+
+
+def _stack_last(values: list[Any], like: Any) -> Any:
+    if _is_numpy(like):
+        return np.stack(values, axis=-1)
+    import torch
+
+    return torch.stack(values, dim=-1)
+
+
+def _homogeneous(like: Any) -> Any:
+    shape = tuple(like.shape[:-2]) + (4, 4)
+    if _is_numpy(like):
+        out = np.zeros(shape, dtype=like.dtype)
+    else:
+        import torch
+
+        out = torch.zeros(shape, dtype=like.dtype, device=like.device)
+    out[..., 3, 3] = 1
+    return out
+
+
+def qvec_to_rotmat(qvecs: Any) -> Any:
+    """``(..., 4)`` COLMAP quaternions -> ``(..., 3, 3)`` world-to-camera rotations."""
+    qvecs, _ = _coerce(qvecs)
+    qw, qx, qy, qz = (qvecs[..., i] for i in range(4))
+    entries = [
+        1 - 2 * qy * qy - 2 * qz * qz,
+        2 * qx * qy - 2 * qz * qw,
+        2 * qx * qz + 2 * qy * qw,
+        2 * qx * qy + 2 * qz * qw,
+        1 - 2 * qx * qx - 2 * qz * qz,
+        2 * qy * qz - 2 * qx * qw,
+        2 * qx * qz - 2 * qy * qw,
+        2 * qy * qz + 2 * qx * qw,
+        1 - 2 * qx * qx - 2 * qy * qy,
+    ]
+    stacked = _stack_last(entries, qvecs)
+    return stacked.reshape(tuple(qvecs.shape[:-1]) + (3, 3))
+
+
+def world_to_camera(qvecs: Any, tvecs: Any) -> Any:
+    """``(..., 4, 4)`` world-to-camera matrices (COLMAP's native pose)."""
+    qvecs, tvecs = _coerce(qvecs, tvecs)
+    rotations = qvec_to_rotmat(qvecs)
+    out = _homogeneous(rotations)
+    out[..., :3, :3] = rotations
+    out[..., :3, 3] = tvecs
+    return out
+
+
+def camera_to_world(qvecs: Any, tvecs: Any) -> Any:
+    """``(..., 4, 4)`` camera-to-world matrices; column 3 holds the camera centers."""
+    qvecs, tvecs = _coerce(qvecs, tvecs)
+    rotations_t = qvec_to_rotmat(qvecs).swapaxes(-1, -2)
+    out = _homogeneous(rotations_t)
+    out[..., :3, :3] = rotations_t
+    out[..., :3, 3] = -(rotations_t @ tvecs[..., None])[..., 0]
+    return out
+
+
+__all__ = ["camera_to_world", "qvec_to_rotmat", "world_to_camera"]
@@ -0,0 +1,136 @@
+"""Background checkpoint export for the training loop.
+
+``CheckpointWriter.submit`` snapshots the splat parameters into pinned host
+buffers with non-blocking copies and returns immediately; a worker thread
+waits for the copies, serializes the PLY/.splat file (atomic rename, plus an
+optional ``.nsplat`` preview sidecar next to PLY checkpoints), prunes
+older checkpoints and then calls the checkpoint callback. At most
+``max_pending`` snapshots wait in the queue; further submits block until
+the worker catches up, which bounds the host memory held by snapshots.
+
+A failed export is logged on the worker and re-raised from the next
+``submit`` or from ``close``, so training still stops on export errors.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import torch
+
+from nullsplats.backend.splat_train_ops import checkpoint_target, snapshot_splats, write_splats
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.checkpoint_writer")
+_STOP = object()
+
+
+@dataclass
+class _Job:
+    iteration: int
+    snapshot: dict[str, torch.Tensor]
+    copied: Optional[torch.cuda.Event]
+    path: Path
+
+
+class CheckpointWriter:
+    """Single worker thread that writes checkpoints in submission order."""
+
+    def __init__(
+        self,
+        *,
+        fmt: str,
+        max_points: int,
+        max_pending: int = 2,
+        on_written: Optional[Callable[[int, Path], None]] = None,
+        after_write: Optional[Callable[[Path], None]] = None,
+        compact_sidecar: bool = False,
+    ) -> None:
+        self.fmt = fmt
+        self.max_points = max_points
+        self.compact_sidecar = compact_sidecar
+        self._on_written = on_written
+        self._after_write = after_write
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_pending))
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self.written = 0
+        self._thread = threading.Thread(target=self._run, name="checkpoint_writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, iteration: int, splats_param: torch.nn.ParameterDict, export_path: Path) -> Path:
+        """Queue a checkpoint of the current parameters; returns the path it will be written to."""
+        self._raise_pending()
+        target, _ = checkpoint_target(export_path, self.fmt)
+        on_cuda = splats_param["means"].is_cuda
+        snapshot = snapshot_splats(splats_param, pin_memory=on_cuda)
+        copied = None
+        if on_cuda:
+            copied = torch.cuda.Event()
+            copied.record(torch.cuda.current_stream(splats_param["means"].device))
+        if self._queue.full():
+            _LOGGER.info("Checkpoint queue full; waiting for the writer before iteration %d", iteration)
+        self._queue.put(_Job(iteration, snapshot, copied, target))
+        return target
+
+    def close(self) -> None:
+        """Wait for queued checkpoints to finish, then stop the worker."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(_STOP)
+            self._thread.join()
+        self._raise_pending()
+
+    def __enter__(self) -> CheckpointWriter:
+        return self
+
+    def __exit__(self, exc_type: object, *_: object) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # Training already failed; finish queued writes but keep the original error.
+        try:
+            self.close()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Checkpoint writer error suppressed after training failure", exc_info=True)
+
+    def _raise_pending(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _run(self) -> None:
+        while True:
+            job = self._queue.get()
+            if job is _STOP:
+                return
+            if self._error is not None:
+                continue  # drop work queued behind a failure; the error surfaces on the caller
+            try:
+                if job.copied is not None:
+                    job.copied.synchronize()
+                path = write_splats(
+                    job.snapshot,
+                    job.path,
+                    max_points=self.max_points,
+                    fmt=self.fmt,
+                    compact_sidecar=self.compact_sidecar,
+                )
+                del job.snapshot
+                self.written += 1
+                _LOGGER.info("Wrote checkpoint %s", path)
+                if self._after_write is not None:
+                    self._after_write(path)
+                if self._on_written is not None:
+                    self._on_written(job.iteration, path)
+            except BaseException as exc:  # noqa: BLE001 - re-raised on the training thread
+                _LOGGER.exception("Checkpoint export failed for iteration %d", job.iteration)
+                self._error = exc
+
+
+__all__ = ["CheckpointWriter"]
@@ -1,12 +1,67 @@
-"""COLMAP parsing helpers and data structures."""
+"""COLMAP parsing helpers and data structures.
+
+Models are read from COLMAP's binary format (cameras.bin / images.bin /
+points3D.bin) when present, falling back to the text export. Either way the
+model is held as columnar tables: per-image poses and per-point xyz/rgb/error
+are arrays, and 2D observations and point tracks are flat arrays indexed by
+offsets (rows ``offsets[i]`` to ``offsets[i + 1]`` belong to item ``i``).
+Tables carry id/name -> row index maps, so consumers should work on rows and
+arrays. ``ColmapData.images`` and ``ColmapData.points3D`` remain as dict-like
+views that build the per-item dataclasses lazily for older callers.
+
+``load_colmap_data`` goes through a process-wide LRU keyed on the (path,
+mtime, size) of the model files, so the Training, COLMAP and Exports tabs and
+the trainers share one parse. Each parse also leaves an uncompressed ``.npz``
+sidecar next to the model that later processes load instead of re-parsing;
+it is ignored as soon as any model file changes. Cached tables are shared and
+therefore read-only.
+"""
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from functools import cached_property
+import json
+import os
 from pathlib import Path
-from typing import Optional
+import struct
+import threading
+from typing import Iterator, Mapping, Optional
+import uuid
+
+import numpy as np
 
 from nullsplats.backend.io_cache import ScenePaths
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.colmap_io")
+
+
+# COLMAP camera model id -> (name, parameter count); see colmap/src/colmap/sensor/models.h.
+CAMERA_MODELS: dict[int, tuple[str, int]] = {
+    0: ("SIMPLE_PINHOLE", 3),
+    1: ("PINHOLE", 4),
+    2: ("SIMPLE_RADIAL", 4),
+    3: ("RADIAL", 5),
+    4: ("OPENCV", 8),
+    5: ("OPENCV_FISHEYE", 8),
+    6: ("FULL_OPENCV", 12),
+    7: ("FOV", 5),
+    8: ("SIMPLE_RADIAL_FISHEYE", 4),
+    9: ("RADIAL_FISHEYE", 5),
+    10: ("THIN_PRISM_FISHEYE", 12),
+}
+SUPPORTED_CAMERA_MODELS = {"PINHOLE", "SIMPLE_PINHOLE", "SIMPLE_RADIAL", "RADIAL"}
+_OBSERVATION_DTYPE = np.dtype([("xy", "<f8", (2,)), ("point3D_id", "<i8")])
+_TRACK_DTYPE = np.dtype([("image_id", "<i4"), ("point2D_idx", "<i4")])
+# point3D_id u64, xyz 3*f64, rgb 3*u8, error f64, track_length u64 (packed, 51 bytes).
+_POINT_HEADER_DTYPE = np.dtype(
+    [("point3D_id", "<u8"), ("xyz", "<f8", (3,)), ("rgb", "u1", (3,)), ("error", "<f8"), ("track_length", "<u8")]
+)
+# Points per gather block in read_points3d_binary; bounds the temporary index arrays.
+_POINT_BLOCK = 1 << 16
 
 
 @dataclass(frozen=True)
@@ -37,45 +92,376 @@ class ColmapPoint3D:
     error: float
 
 
+@dataclass(frozen=True)
+class ColmapImageTable:
+    """Registered images as columns; observations of image ``i`` are rows ``offsets[i]:offsets[i + 1]``."""
+
+    image_ids: np.ndarray  # (N,) int64
+    camera_ids: np.ndarray  # (N,) int64
+    names: list[str]
+    qvecs: np.ndarray  # (N, 4) float64, (w, x, y, z)
+    tvecs: np.ndarray  # (N, 3) float64
+    offsets: np.ndarray  # (N + 1,) int64
+    xys: np.ndarray  # (M, 2) float64
+    point3D_ids: np.ndarray  # (M,) int64, -1 for unmatched keypoints
+
+    def __len__(self) -> int:
+        return int(self.image_ids.shape[0])
+
+    @cached_property
+    def row_by_id(self) -> dict[int, int]:
+        return {image_id: row for row, image_id in enumerate(self.image_ids.tolist())}
+
+    @cached_property
+    def row_by_name(self) -> dict[str, int]:
+        """Rows keyed by full name, then basename, then stem (first entry wins)."""
+        rows: dict[str, int] = {}
+        for key_of in (str, lambda name: Path(name).name, lambda name: Path(name).stem):
+            for row, name in enumerate(self.names):
+                rows.setdefault(key_of(name), row)
+        return rows
+
+    def find_row(self, name: str) -> Optional[int]:
+        """Row for an image file name; matches COLMAP names with a path prefix or another extension."""
+        rows = self.row_by_name
+        for key in (name, Path(name).name, Path(name).stem):
+            if key in rows:
+                return rows[key]
+        return None
+
+    def observations(self, row: int) -> tuple[np.ndarray, np.ndarray]:
+        """``(xys, point3D_ids)`` array views for one image."""
+        start, stop = int(self.offsets[row]), int(self.offsets[row + 1])
+        return self.xys[start:stop], self.point3D_ids[start:stop]
+
+    def row(self, row: int) -> ColmapImage:
+        xys, point3D_ids = self.observations(row)
+        return ColmapImage(
+            image_id=int(self.image_ids[row]),
+            camera_id=int(self.camera_ids[row]),
+            name=self.names[row],
+            qvec=self.qvecs[row].tolist(),
+            tvec=self.tvecs[row].tolist(),
+            xys=xys.tolist(),
+            point3D_ids=point3D_ids.tolist(),
+        )
+
+
+@dataclass(frozen=True)
+class ColmapPointTable:
+    """Sparse points as columns; the track of point ``i`` is rows ``track_offsets[i]:track_offsets[i + 1]``."""
+
+    point3D_ids: np.ndarray  # (P,) int64
+    xyz: np.ndarray  # (P, 3) float64
+    rgb: np.ndarray  # (P, 3) uint8
+    error: np.ndarray  # (P,) float64
+    track_offsets: np.ndarray  # (P + 1,) int64
+    track_image_ids: np.ndarray  # (T,) int32
+    track_point2D_idxs: np.ndarray  # (T,) int32
+
+    def __len__(self) -> int:
+        return int(self.point3D_ids.shape[0])
+
+    @classmethod
+    def empty(cls) -> ColmapPointTable:
+        return cls(
+            point3D_ids=np.empty(0, dtype=np.int64),
+            xyz=np.empty((0, 3), dtype=np.float64),
+            rgb=np.empty((0, 3), dtype=np.uint8),
+            error=np.empty(0, dtype=np.float64),
+            track_offsets=np.zeros(1, dtype=np.int64),
+            track_image_ids=np.empty(0, dtype=np.int32),
+            track_point2D_idxs=np.empty(0, dtype=np.int32),
+        )
+
+    @cached_property
+    def _sorted_ids(self) -> tuple[np.ndarray, np.ndarray]:
+        order = np.argsort(self.point3D_ids, kind="stable")
+        return self.point3D_ids[order], order
+
+    def rows_for_ids(self, point3D_ids: np.ndarray) -> np.ndarray:
+        """Vectorized id -> row lookup; -1 where an id is absent (including COLMAP's -1)."""
+        ids = np.asarray(point3D_ids, dtype=np.int64)
+        sorted_ids, order = self._sorted_ids
+        if sorted_ids.size == 0:
+            return np.full(ids.shape, -1, dtype=np.int64)
+        pos = np.clip(np.searchsorted(sorted_ids, ids), 0, sorted_ids.size - 1)
+        return np.where(sorted_ids[pos] == ids, order[pos], -1)
+
+    def row(self, row: int) -> ColmapPoint3D:
+        return ColmapPoint3D(
+            point3D_id=int(self.point3D_ids[row]),
+            xyz=self.xyz[row].tolist(),
+            rgb=self.rgb[row].tolist(),
+            error=float(self.error[row]),
+        )
+
+
+class _TableView(Mapping):
+    """Read-only id -> dataclass mapping over a columnar table, built lazily per item."""
+
+    def __init__(self, table: ColmapImageTable | ColmapPointTable, ids: np.ndarray) -> None:
+        self._table = table
+        self._ids = ids
+        self._rows: Optional[dict[int, int]] = None
+
+    def _row_of(self) -> dict[int, int]:
+        if self._rows is None:
+            self._rows = {int(item_id): row for row, item_id in enumerate(self._ids.tolist())}
+        return self._rows
+
+    def __getitem__(self, key: int):
+        return self._table.row(self._row_of()[int(key)])
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            return int(key) in self._row_of()  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return False
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids.tolist())
+
+    def __len__(self) -> int:
+        return int(self._ids.shape[0])
+
+
 @dataclass(frozen=True)
 class ColmapData:
     cameras: dict[int, ColmapCamera]
-    images: dict[int, ColmapImage]
-    points3D: dict[int, ColmapPoint3D]
+    image_table: ColmapImageTable
+    point_table: ColmapPointTable
     model_format: str
     source_dir: Path
 
+    @cached_property
+    def images(self) -> Mapping[int, ColmapImage]:
+        """Per-image dataclasses keyed by image id (lazy; prefer ``image_table``)."""
+        return _TableView(self.image_table, self.image_table.image_ids)
+
+    @cached_property
+    def points3D(self) -> Mapping[int, ColmapPoint3D]:
+        """Per-point dataclasses keyed by point id (lazy; prefer ``point_table``)."""
+        return _TableView(self.point_table, self.point_table.point3D_ids)
+
 
 def load_colmap_data(paths: ScenePaths) -> ColmapData:
-    cameras_txt, images_txt = find_text_model(paths)
-    cameras = parse_cameras(cameras_txt)
-    images = parse_images(images_txt)
-    points_path = find_points3d(paths, cameras_txt.parent)
-    points = parse_points3d(points_path) if points_path is not None else {}
+    """Load the scene's COLMAP model through the shared ``COLMAP_CACHE``."""
+    return COLMAP_CACHE.load(paths)
+
+
+def read_colmap_data(paths: ScenePaths) -> ColmapData:
+    """Parse the scene's COLMAP model from disk, bypassing every cache."""
+    cameras_path, images_path, points_path = _model_files(paths)
+    return _parse_model(cameras_path, images_path, points_path)
+
+
+def _model_files(paths: ScenePaths) -> tuple[Path, Path, Optional[Path]]:
+    cameras_path, images_path = find_text_model(paths)
+    return cameras_path, images_path, find_points3d(paths, cameras_path.parent)
+
+
+def _parse_model(cameras_path: Path, images_path: Path, points_path: Optional[Path]) -> ColmapData:
+    cameras = parse_cameras(cameras_path)
     return ColmapData(
         cameras={cid: to_colmap_camera(cid, data) for cid, data in cameras.items()},
-        images={img.image_id: img for img in images},
-        points3D=points,
-        model_format="text",
-        source_dir=cameras_txt.parent,
+        image_table=read_image_table(images_path),
+        point_table=read_point_table(points_path) if points_path is not None else ColmapPointTable.empty(),
+        model_format="binary" if images_path.suffix == ".bin" else "text",
+        source_dir=cameras_path.parent,
+    )
+
+
+SIDECAR_NAME = "nullsplats_model.npz"
+_SIDECAR_VERSION = 1
+ModelKey = tuple[tuple[str, int, int], ...]
+
+
+def model_key(files: tuple[Optional[Path], ...], *, relative_to: Optional[Path] = None) -> ModelKey:
+    """``(path, mtime_ns, size)`` for each existing model file; any edit changes the key."""
+    key = []
+    for path in files:
+        if path is None:
+            continue
+        stat = path.stat()
+        name = os.path.relpath(path, relative_to) if relative_to is not None else str(path.resolve())
+        key.append((name, stat.st_mtime_ns, stat.st_size))
+    return tuple(key)
+
+
+class ColmapModelCache:
+    """Process-wide LRU of parsed COLMAP models, backed by ``.npz`` sidecars."""
+
+    def __init__(self, max_entries: int = 4, *, write_sidecars: bool = True) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.write_sidecars = write_sidecars
+        self.hits = 0
+        self.sidecar_hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[ModelKey, ColmapData] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def load(self, paths: ScenePaths) -> ColmapData:
+        """Return the scene's model, parsing it only if no cache level holds the current files.
+
+        Raises:
+            FileNotFoundError: If the scene has no COLMAP model.
+        """
+        files = _model_files(paths)
+        key = model_key(files)
+        with self._lock:
+            data = self._entries.get(key)
+            if data is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return data
+        model_dir = files[0].parent
+        sidecar_key = model_key(files, relative_to=model_dir)
+        data = _read_sidecar(model_dir / SIDECAR_NAME, sidecar_key, files[1])
+        with self._lock:
+            if data is not None:
+                self.sidecar_hits += 1
+        if data is None:
+            data = _parse_model(*files)
+            with self._lock:
+                self.misses += 1
+            if self.write_sidecars:
+                _write_sidecar(model_dir / SIDECAR_NAME, sidecar_key, data)
+        _freeze(data)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return data
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+COLMAP_CACHE = ColmapModelCache()
+
+
+def _freeze(data: ColmapData) -> None:
+    for table in (data.image_table, data.point_table):
+        for item in fields(table):
+            value = getattr(table, item.name)
+            if isinstance(value, np.ndarray):
+                value.setflags(write=False)
+
+
+def _write_sidecar(path: Path, key: ModelKey, data: ColmapData) -> None:
+    camera_ids = sorted(data.cameras)
+    arrays: dict[str, np.ndarray] = {
+        "version": np.array(_SIDECAR_VERSION),
+        "key": np.array(json.dumps(key)),
+        "camera_ids": np.array(camera_ids, dtype=np.int64),
+        "camera_models": np.array([data.cameras[cid].model for cid in camera_ids], dtype=str),
+        "camera_sizes": np.array(
+            [(data.cameras[cid].width, data.cameras[cid].height) for cid in camera_ids], dtype=np.int64
+        ).reshape(-1, 2),
+        "camera_params": np.array([data.cameras[cid].params for cid in camera_ids], dtype=np.float64).reshape(-1, 4),
+    }
+    for prefix, table in (("image_", data.image_table), ("point_", data.point_table)):
+        for item in fields(table):
+            value = getattr(table, item.name)
+            arrays[prefix + item.name] = np.array(value, dtype=str) if item.name == "names" else value
+    # Unique temp name keeps concurrent writers (two tabs loading at once) from clobbering each other.
+    staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        with staging.open("wb") as handle:
+            np.savez(handle, **arrays)
+        os.replace(staging, path)
+    except OSError as exc:
+        _LOGGER.debug("Could not write COLMAP sidecar %s: %s", path, exc)
+    finally:
+        staging.unlink(missing_ok=True)
+
+
+def _read_sidecar(path: Path, key: ModelKey, images_path: Path) -> Optional[ColmapData]:
+    if not path.exists():
+        return None
+    try:
+        with np.load(path, allow_pickle=False) as archive:
+            if int(archive["version"]) != _SIDECAR_VERSION:
+                return None
+            if [list(item) for item in key] != json.loads(str(archive["key"])):
+                return None
+            arrays = {name: archive[name] for name in archive.files}
+    except (OSError, ValueError, KeyError) as exc:
+        _LOGGER.debug("Ignoring unreadable COLMAP sidecar %s: %s", path, exc)
+        return None
+    cameras = {}
+    for cid, model, (width, height), params in zip(
+        arrays["camera_ids"].tolist(),
+        arrays["camera_models"].tolist(),
+        arrays["camera_sizes"].tolist(),
+        arrays["camera_params"].tolist(),
+    ):
+        cameras[cid] = ColmapCamera(camera_id=cid, model=model, width=width, height=height, params=params)
+    image_columns = {item.name: arrays["image_" + item.name] for item in fields(ColmapImageTable)}
+    image_columns["names"] = image_columns["names"].tolist()
+    return ColmapData(
+        cameras=cameras,
+        image_table=ColmapImageTable(**image_columns),
+        point_table=ColmapPointTable(**{item.name: arrays["point_" + item.name] for item in fields(ColmapPointTable)}),
+        model_format="binary" if images_path.suffix == ".bin" else "text",
+        source_dir=path.parent,
     )
 
 
+def read_image_table(path: Path) -> ColmapImageTable:
+    """Load images.bin or images.txt as a ``ColmapImageTable``."""
+    return read_images_binary(path) if path.suffix == ".bin" else read_images_text(path)
+
+
+def read_point_table(path: Path) -> ColmapPointTable:
+    """Load points3D.bin or points3D.txt as a ``ColmapPointTable``."""
+    return read_points3d_binary(path) if path.suffix == ".bin" else read_points3d_text(path)
+
+
 def find_text_model(paths: ScenePaths) -> tuple[Path, Path]:
-    candidates = [
-        (paths.sfm_dir / "sparse" / "text" / "cameras.txt", paths.sfm_dir / "sparse" / "text" / "images.txt"),
-        (paths.sfm_dir / "sparse" / "0" / "cameras.txt", paths.sfm_dir / "sparse" / "0" / "images.txt"),
-        (paths.sfm_dir / "sparse" / "cameras.txt", paths.sfm_dir / "sparse" / "images.txt"),
+    """Return ``(cameras, images)`` model files, preferring binary over text.
+
+    The name predates binary support; the returned paths end in ``.bin`` when
+    COLMAP's binary model is present and ``parse_cameras``/``parse_images``
+    accept either format.
+    """
+    sparse = paths.sfm_dir / "sparse"
+    search = [
+        (".bin", [sparse / "0", sparse]),
+        (".txt", [sparse / "text", sparse / "0", sparse]),
     ]
-    for cams, imgs in candidates:
-        if cams.exists() and imgs.exists():
-            return cams, imgs
+    for suffix, model_dirs in search:
+        for model_dir in model_dirs:
+            cams = model_dir / f"cameras{suffix}"
+            imgs = model_dir / f"images{suffix}"
+            if cams.exists() and imgs.exists():
+                return cams, imgs
     raise FileNotFoundError(
-        f"cameras.txt/images.txt not found under {paths.sfm_dir}. Re-run COLMAP so text models are exported."
+        f"cameras/images model files (.bin or .txt) not found under {paths.sfm_dir}. Re-run COLMAP."
     )
 
 
+def _camera_entry(model: str, width: int, height: int, params: list[float]) -> dict:
+    if model not in SUPPORTED_CAMERA_MODELS:
+        raise ValueError(f"Unsupported COLMAP camera model: {model}")
+    if model == "PINHOLE":
+        fx, fy, cx, cy = params[:4]
+    else:
+        fx = fy = params[0]
+        cx = params[1]
+        cy = params[2] if len(params) > 2 else params[1]
+    return {"model": model, "width": width, "height": height, "params": (fx, fy, cx, cy)}
+
+
 def parse_cameras(path: Path) -> dict[int, dict]:
+    if path.suffix == ".bin":
+        return read_cameras_binary(path)
     cameras: dict[int, dict] = {}
     with path.open("r", encoding="utf-8") as handle:
         for line in handle:
@@ -89,20 +475,26 @@ def parse_cameras(path: Path) -> dict[int, dict]:
             width = int(parts[2])
             height = int(parts[3])
             params = list(map(float, parts[4:]))
-            if model not in {"PINHOLE", "SIMPLE_PINHOLE", "SIMPLE_RADIAL", "RADIAL"}:
-                raise ValueError(f"Unsupported COLMAP camera model: {model}")
-            if model == "PINHOLE":
-                fx, fy, cx, cy = params[:4]
-            else:
-                fx = fy = params[0]
-                cx = params[1]
-                cy = params[2] if len(params) > 2 else params[1]
-            cameras[cam_id] = {"model": model, "width": width, "height": height, "params": (fx, fy, cx, cy)}
+            cameras[cam_id] = _camera_entry(model, width, height, params)
     return cameras
 
 
 def parse_images(path: Path) -> list[ColmapImage]:
-    entries: list[ColmapImage] = []
+    table = read_image_table(path)
+    return [table.row(row) for row in range(len(table))]
+
+
+def read_images_text(path: Path) -> ColmapImageTable:
+    """Parse images.txt into a ``ColmapImageTable``.
+
+    Each observation line is converted with one NumPy call instead of
+    per-token ``float()``/``int()`` calls.
+    """
+    image_ids: list[int] = []
+    camera_ids: list[int] = []
+    names: list[str] = []
+    poses: list[list[float]] = []
+    blocks: list[np.ndarray] = []
     with path.open("r", encoding="utf-8") as handle:
         lines = iter(handle.readlines())
         for line in lines:
@@ -111,34 +503,28 @@ def parse_images(path: Path) -> list[ColmapImage]:
             parts = line.strip().split()
             if len(parts) < 10:
                 continue
-            image_id = int(parts[0])
-            qw, qx, qy, qz = map(float, parts[1:5])
-            tx, ty, tz = map(float, parts[5:8])
-            camera_id = int(parts[8])
-            name = parts[9]
-            xys: list[list[float]] = []
-            point3D_ids: list[int] = []
-            points_line = next(lines, "")
-            if points_line:
-                points = points_line.strip().split()
-                for idx in range(0, len(points) - 2, 3):
-                    x = float(points[idx])
-                    y = float(points[idx + 1])
-                    point_id = int(float(points[idx + 2]))
-                    xys.append([x, y])
-                    point3D_ids.append(point_id)
-            entries.append(
-                ColmapImage(
-                    image_id=image_id,
-                    camera_id=camera_id,
-                    name=name,
-                    qvec=[qw, qx, qy, qz],
-                    tvec=[tx, ty, tz],
-                    xys=xys,
-                    point3D_ids=point3D_ids,
-                )
-            )
-    return entries
+            image_ids.append(int(parts[0]))
+            poses.append([float(value) for value in parts[1:8]])
+            camera_ids.append(int(parts[8]))
+            names.append(parts[9])
+            tokens = next(lines, "").split()
+            usable = len(tokens) - len(tokens) % 3
+            blocks.append(np.array(tokens[:usable], dtype=np.float64).reshape(-1, 3))
+    counts = np.array([block.shape[0] for block in blocks], dtype=np.int64)
+    offsets = np.zeros(len(blocks) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    observations = np.concatenate(blocks) if blocks else np.empty((0, 3), dtype=np.float64)
+    pose_array = np.array(poses, dtype=np.float64).reshape(-1, 7)
+    return ColmapImageTable(
+        image_ids=np.array(image_ids, dtype=np.int64),
+        camera_ids=np.array(camera_ids, dtype=np.int64),
+        names=names,
+        qvecs=pose_array[:, :4].copy(),
+        tvecs=pose_array[:, 4:].copy(),
+        offsets=offsets,
+        xys=np.ascontiguousarray(observations[:, :2]),
+        point3D_ids=observations[:, 2].astype(np.int64),
+    )
 
 
 def to_colmap_camera(camera_id: int, data: dict) -> ColmapCamera:
@@ -154,7 +540,9 @@ def to_colmap_camera(camera_id: int, data: dict) -> ColmapCamera:
 
 def find_points3d(paths: ScenePaths, model_dir: Path) -> Optional[Path]:
     candidates = [
+        model_dir / "points3D.bin",
         model_dir / "points3D.txt",
+        paths.sfm_dir / "sparse" / "0" / "points3D.bin",
         paths.sfm_dir / "sparse" / "0" / "points3D.txt",
         paths.sfm_dir / "sparse" / "points3D.txt",
     ]
@@ -164,23 +552,192 @@ def find_points3d(paths: ScenePaths, model_dir: Path) -> Optional[Path]:
     return None
 
 
-def parse_points3d(path: Path) -> dict[int, ColmapPoint3D]:
-    points: dict[int, ColmapPoint3D] = {}
+def parse_points3d(path: Path) -> Mapping[int, ColmapPoint3D]:
+    table = read_point_table(path)
+    return _TableView(table, table.point3D_ids)
+
+
+def read_points3d_text(path: Path) -> ColmapPointTable:
+    """Parse points3D.txt into a ``ColmapPointTable``.
+
+    Tokens are collected per line and converted column-wise in a few NumPy
+    calls rather than building one object per point.
+    """
+    fixed: list[str] = []
+    track_tokens: list[str] = []
+    lengths: list[int] = []
     with path.open("r", encoding="utf-8") as handle:
         for line in handle:
             if not line or line.startswith("#"):
                 continue
-            parts = line.strip().split()
+            parts = line.split()
             if len(parts) < 8:
                 continue
-            point_id = int(parts[0])
-            xyz = list(map(float, parts[1:4]))
-            rgb = list(map(int, parts[4:7]))
-            error = float(parts[7])
-            points[point_id] = ColmapPoint3D(
-                point3D_id=point_id,
-                xyz=xyz,
-                rgb=rgb,
-                error=error,
-            )
-    return points
+            fixed.extend(parts[:8])
+            track = parts[8:]
+            usable = len(track) - len(track) % 2
+            track_tokens.extend(track[:usable])
+            lengths.append(usable // 2)
+    columns = np.array(fixed, dtype=np.float64).reshape(-1, 8)
+    tracks = np.array(track_tokens, dtype=np.int64).reshape(-1, 2)
+    track_offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(np.array(lengths, dtype=np.int64), out=track_offsets[1:])
+    return ColmapPointTable(
+        point3D_ids=columns[:, 0].astype(np.int64),
+        xyz=np.ascontiguousarray(columns[:, 1:4]),
+        rgb=columns[:, 4:7].astype(np.uint8),
+        error=np.ascontiguousarray(columns[:, 7]),
+        track_offsets=track_offsets,
+        track_image_ids=tracks[:, 0].astype(np.int32),
+        track_point2D_idxs=tracks[:, 1].astype(np.int32),
+    )
+
+
+def read_cameras_binary(path: Path) -> dict[int, dict]:
+    """Parse cameras.bin into the same dicts as ``parse_cameras``."""
+    data = path.read_bytes()
+    (count,) = struct.unpack_from("<Q", data, 0)
+    offset = 8
+    cameras: dict[int, dict] = {}
+    for _ in range(count):
+        camera_id, model_id, width, height = struct.unpack_from("<iiQQ", data, offset)
+        offset += 24
+        if model_id not in CAMERA_MODELS:
+            raise ValueError(f"Unknown COLMAP camera model id {model_id} in {path}")
+        model, num_params = CAMERA_MODELS[model_id]
+        params = list(struct.unpack_from(f"<{num_params}d", data, offset))
+        offset += 8 * num_params
+        cameras[camera_id] = _camera_entry(model, int(width), int(height), params)
+    return cameras
+
+
+def read_images_binary(path: Path) -> ColmapImageTable:
+    """Parse images.bin into a ``ColmapImageTable``.
+
+    The per-image header is walked with ``struct``; each image's observation
+    block is viewed in place with ``np.frombuffer`` and all blocks are joined
+    with a single concatenate.
+    """
+    data = path.read_bytes()
+    (count,) = struct.unpack_from("<Q", data, 0)
+    offset = 8
+    image_ids = np.empty(count, dtype=np.int64)
+    camera_ids = np.empty(count, dtype=np.int64)
+    poses = np.empty((count, 7), dtype=np.float64)
+    names: list[str] = []
+    counts = np.empty(count, dtype=np.int64)
+    blocks: list[np.ndarray] = []
+    header = struct.Struct("<i7di")
+    for row in range(count):
+        values = header.unpack_from(data, offset)
+        image_ids[row] = values[0]
+        poses[row] = values[1:8]
+        camera_ids[row] = values[8]
+        offset += header.size
+        name_end = data.index(b"\0", offset)
+        names.append(data[offset:name_end].decode("utf-8"))
+        offset = name_end + 1
+        (num_points,) = struct.unpack_from("<Q", data, offset)
+        offset += 8
+        blocks.append(np.frombuffer(data, dtype=_OBSERVATION_DTYPE, count=num_points, offset=offset))
+        counts[row] = num_points
+        offset += num_points * _OBSERVATION_DTYPE.itemsize
+    observations = np.concatenate(blocks) if blocks else np.empty(0, dtype=_OBSERVATION_DTYPE)
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return ColmapImageTable(
+        image_ids=image_ids,
+        camera_ids=camera_ids,
+        names=names,
+        qvecs=poses[:, :4].copy(),
+        tvecs=poses[:, 4:].copy(),
+        offsets=offsets,
+        xys=np.ascontiguousarray(observations["xy"]),
+        point3D_ids=np.ascontiguousarray(observations["point3D_id"]),
+    )
+
+
+def read_points3d_binary(path: Path) -> ColmapPointTable:
+    """Parse points3D.bin into a ``ColmapPointTable``.
+
+    Records are variable length (a 51-byte header plus 8 bytes per track
+    element), and each record's position depends on the previous track
+    length, so one lean pass reads only the track lengths; record offsets then
+    come from a cumulative sum. Headers and tracks are copied out in blocks of
+    ``_POINT_BLOCK`` points by indexing byte-strided structured views of the
+    file buffer, so each record or track element is gathered as one item.
+    """
+    data = path.read_bytes()
+    (count,) = struct.unpack_from("<Q", data, 0)
+    header_size = _POINT_HEADER_DTYPE.itemsize
+    length_at = struct.Struct("<Q").unpack_from
+    offset = 8 + header_size - 8
+    lengths_list: list[int] = []
+    for _ in range(count):
+        (track_length,) = length_at(data, offset)
+        lengths_list.append(track_length)
+        offset += header_size + 8 * track_length
+    lengths = np.array(lengths_list, dtype=np.int64)
+    track_offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(lengths, out=track_offsets[1:])
+    starts = 8 + header_size * np.arange(count, dtype=np.int64) + 8 * track_offsets[:-1]
+    # One item per byte offset: indexing these views copies whole records/elements.
+    header_view = _byte_strided_view(data, _POINT_HEADER_DTYPE)
+    track_view = _byte_strided_view(data, _TRACK_DTYPE)
+    headers = np.empty(count, dtype=_POINT_HEADER_DTYPE)
+    tracks = np.empty(int(track_offsets[-1]), dtype=_TRACK_DTYPE)
+    for first in range(0, count, _POINT_BLOCK):
+        last = min(count, first + _POINT_BLOCK)
+        block_starts = starts[first:last]
+        headers[first:last] = header_view[block_starts]
+        block_tracks = slice(int(track_offsets[first]), int(track_offsets[last]))
+        if block_tracks.stop > block_tracks.start:
+            # Byte position of each element: its point's track start plus 8 * rank within the block.
+            shift = block_starts + header_size - 8 * (track_offsets[first:last] - track_offsets[first])
+            ranks = np.arange(block_tracks.stop - block_tracks.start, dtype=np.int64)
+            tracks[block_tracks] = track_view[np.repeat(shift, lengths[first:last]) + 8 * ranks]
+    return ColmapPointTable(
+        point3D_ids=headers["point3D_id"].astype(np.int64),
+        xyz=np.ascontiguousarray(headers["xyz"]),
+        rgb=np.ascontiguousarray(headers["rgb"]),
+        error=np.ascontiguousarray(headers["error"]),
+        track_offsets=track_offsets,
+        track_image_ids=np.ascontiguousarray(tracks["image_id"]),
+        track_point2D_idxs=np.ascontiguousarray(tracks["point2D_idx"]),
+    )
+
+
+def _byte_strided_view(data: bytes, dtype: np.dtype) -> np.ndarray:
+    """Read-only view with one ``dtype`` item starting at every byte offset of ``data``."""
+    items = max(0, len(data) - dtype.itemsize + 1)
+    return np.ndarray(shape=(items,), dtype=dtype, buffer=data, offset=0, strides=(1,))
+
+
+__all__ = [
+    "CAMERA_MODELS",
+    "COLMAP_CACHE",
+    "SIDECAR_NAME",
+    "ColmapCamera",
+    "ColmapData",
+    "ColmapImage",
+    "ColmapImageTable",
+    "ColmapModelCache",
+    "ColmapPoint3D",
+    "ColmapPointTable",
+    "find_points3d",
+    "find_text_model",
+    "load_colmap_data",
+    "model_key",
+    "parse_cameras",
+    "parse_images",
+    "parse_points3d",
+    "read_cameras_binary",
+    "read_colmap_data",
+    "read_image_table",
+    "read_images_binary",
+    "read_images_text",
+    "read_point_table",
+    "read_points3d_binary",
+    "read_points3d_text",
+    "to_colmap_camera",
+]
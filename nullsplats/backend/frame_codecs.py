@@ -0,0 +1,230 @@
+"""Pluggable on-disk formats for frames_all and frames_selected.
+
+Extraction writes every frame through one codec, recorded as ``frame_codec``
+in metadata.json. Readers never assume a format: they go through
+``read_frame``/``open_frame`` (dispatching on the file extension) and
+``resolve_frame_path`` (which also matches the same stem under another
+extension, so a COLMAP model built from transcoded images still finds the
+cached frames).
+
+Codecs:
+
+- ``png``: PIL defaults (zlib level 6); the historical format.
+- ``png-fast``: PNG at zlib level 1, several times faster to encode and
+  still readable by every tool.
+- ``qoi``: Quite OK Image format, lossless and much faster than PNG at a
+  similar size. Uses the optional ``qoi`` package (C implementation) when
+  installed; Pillow's pure-Python QOI plugin is the slow fallback.
+- ``webp-lossless``: lossless WebP at the fastest method.
+- ``npy``: raw uint8 ``.npy`` arrays; no encode cost and memory-mappable,
+  but uncompressed.
+- ``jpeg``: lossy quality 95; meant for COLMAP-only scenes where the frames
+  are not used as training targets.
+
+COLMAP can only read some of these; ``colmap_readable`` tells the SfM stage
+whether it must transcode selected frames first.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+import numpy as np
+from PIL import Image
+
+
+DEFAULT_CODEC = "png"
+
+
+@dataclass(frozen=True)
+class FrameCodec:
+    """Encoder/decoder pair for one frame file format."""
+
+    name: str
+    extension: str
+    lossless: bool
+    colmap_readable: bool
+    encoder: Callable[[np.ndarray, Path], None]
+    decoder: Callable[[Path], np.ndarray]
+
+    def encode(self, frame: np.ndarray, destination: Path) -> None:
+        """Write an (H, W, 3) or (H, W) uint8 frame to ``destination``."""
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        self.encoder(np.ascontiguousarray(frame, dtype=np.uint8), destination)
+
+    def decode(self, path: Path) -> np.ndarray:
+        """Read a frame back as an (H, W, 3) uint8 array."""
+        return _as_rgb(self.decoder(path))
+
+
+def _as_rgb(array: np.ndarray) -> np.ndarray:
+    if array.ndim == 2:
+        return np.repeat(array[..., None], 3, axis=2)
+    if array.shape[-1] == 4:
+        return array[..., :3]
+    return array
+
+
+def _pil_encoder(format_name: str, **options: object) -> Callable[[np.ndarray, Path], None]:
+    def _encode(frame: np.ndarray, destination: Path) -> None:
+        try:
+            Image.fromarray(frame).save(destination, format=format_name, **options)
+        except KeyError as exc:  # Pillow raises KeyError for formats it has no writer for
+            raise RuntimeError(f"This Pillow build cannot write {format_name} files.") from exc
+
+    return _encode
+
+
+def _pil_decode(path: Path) -> np.ndarray:
+    with Image.open(path) as handle:
+        return np.asarray(handle.convert("RGB"))
+
+
+_pil_qoi_encode = _pil_encoder("QOI")
+
+
+def _qoi_encode(frame: np.ndarray, destination: Path) -> None:
+    try:
+        import qoi
+    except ImportError:
+        _pil_qoi_encode(frame, destination)
+        return
+    qoi.write(str(destination), np.ascontiguousarray(_as_rgb(frame)))
+
+
+def _qoi_decode(path: Path) -> np.ndarray:
+    try:
+        import qoi
+    except ImportError:
+        return _pil_decode(path)
+    return qoi.read(str(path))
+
+
+def _npy_encode(frame: np.ndarray, destination: Path) -> None:
+    with destination.open("wb") as handle:
+        np.save(handle, frame, allow_pickle=False)
+
+
+def _npy_decode(path: Path) -> np.ndarray:
+    return np.load(path, mmap_mode="r", allow_pickle=False)
+
+
+_CODECS: Dict[str, FrameCodec] = {
+    "png": FrameCodec("png", ".png", True, True, _pil_encoder("PNG"), _pil_decode),
+    "png-fast": FrameCodec("png-fast", ".png", True, True, _pil_encoder("PNG", compress_level=1), _pil_decode),
+    "qoi": FrameCodec("qoi", ".qoi", True, False, _qoi_encode, _qoi_decode),
+    "webp-lossless": FrameCodec(
+        "webp-lossless", ".webp", True, False, _pil_encoder("WEBP", lossless=True, method=0), _pil_decode
+    ),
+    "npy": FrameCodec("npy", ".npy", True, False, _npy_encode, _npy_decode),
+    "jpeg": FrameCodec("jpeg", ".jpg", False, True, _pil_encoder("JPEG", quality=95), _pil_decode),
+}
+
+# Extensions readable through PIL even though no codec writes them (user-supplied images).
+_PIL_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".webp", ".qoi", ".tif", ".tiff"}
+
+
+def get_codec(name: str) -> FrameCodec:
+    key = (name or DEFAULT_CODEC).strip().lower()
+    if key not in _CODECS:
+        raise KeyError(f"Unknown frame codec: {name}")
+    return _CODECS[key]
+
+
+def list_codecs() -> list[str]:
+    return list(_CODECS)
+
+
+def register_codec(codec: FrameCodec) -> None:
+    """Register a codec; its extension becomes readable by every frame reader."""
+    _CODECS[codec.name.strip().lower()] = codec
+
+
+def frame_extensions() -> set[str]:
+    """Every extension a frame reader accepts."""
+    return _PIL_EXTENSIONS | {codec.extension for codec in _CODECS.values()}
+
+
+def is_frame_file(path: Path) -> bool:
+    return path.suffix.lower() in frame_extensions() and not path.name.startswith(".")
+
+
+def codec_for_path(path: Path) -> Optional[FrameCodec]:
+    """First registered codec writing ``path``'s extension (``.png`` maps to ``png``)."""
+    suffix = path.suffix.lower()
+    for codec in _CODECS.values():
+        if codec.extension == suffix:
+            return codec
+    return None
+
+
+def read_frame(path: str | Path) -> np.ndarray:
+    """Decode any supported frame file to an (H, W, 3) uint8 array."""
+    frame_path = Path(path)
+    codec = codec_for_path(frame_path)
+    if codec is not None:
+        return codec.decode(frame_path)
+    return _pil_decode(frame_path)
+
+
+def open_frame(path: str | Path) -> Image.Image:
+    """Return any supported frame file as an RGB PIL image (loaded, file closed)."""
+    frame_path = Path(path)
+    codec = codec_for_path(frame_path)
+    if codec is not None and codec.decoder is not _pil_decode:
+        return Image.fromarray(np.asarray(codec.decode(frame_path)))
+    with Image.open(frame_path) as handle:
+        return handle.convert("RGB")
+
+
+def frame_size(path: str | Path) -> tuple[int, int]:
+    """Return ``(width, height)`` without decoding pixels where the format allows."""
+    frame_path = Path(path)
+    if frame_path.suffix.lower() == ".npy":
+        array = np.load(frame_path, mmap_mode="r", allow_pickle=False)
+        return int(array.shape[1]), int(array.shape[0])
+    with Image.open(frame_path) as handle:
+        return handle.size
+
+
+def list_frame_files(directory: Path) -> List[Path]:
+    """Sorted frame files in ``directory`` (any supported format)."""
+    if not directory.exists():
+        return []
+    return sorted(path for path in directory.iterdir() if path.is_file() and is_frame_file(path))
+
+
+def resolve_frame_path(directory: Path, name: str, *, candidates: Optional[Iterable[Path]] = None) -> Path:
+    """Find ``name`` under ``directory``, tolerating path prefixes and a different codec extension.
+
+    Raises:
+        FileNotFoundError: If no frame with that name or stem exists.
+    """
+    for option in (directory / name, directory / Path(name).name):
+        if option.exists():
+            return option
+    stem = Path(name).stem
+    pool = candidates if candidates is not None else list_frame_files(directory)
+    for path in pool:
+        if path.stem == stem:
+            return path
+    raise FileNotFoundError(f"Image {name} not found under {directory}")
+
+
+__all__ = [
+    "DEFAULT_CODEC",
+    "FrameCodec",
+    "codec_for_path",
+    "frame_extensions",
+    "frame_size",
+    "get_codec",
+    "is_frame_file",
+    "list_codecs",
+    "list_frame_files",
+    "open_frame",
+    "read_frame",
+    "register_codec",
+    "resolve_frame_path",
+]
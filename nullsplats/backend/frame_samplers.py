@@ -0,0 +1,273 @@
+"""Training-view samplers.
+
+A sampler hands out the frame indices for each training batch as a CPU
+``int64`` tensor, ready for ``FrameStore.gather``. Samplers are looked up
+by name (``SplatTrainingConfig.frame_sampler``), like the frame scorers and
+selection strategies in ``frame_selection``.
+
+- ``uniform``: independent draws without replacement per batch. Matches the
+  historical ``np.random.choice`` sequence for a seed.
+- ``epoch``: walks a fresh permutation each epoch, so every view is seen
+  once per epoch.
+- ``stratified``: bins cameras by viewpoint (azimuth of the camera centers
+  around their centroid, in their dominant plane) and draws each batch
+  across bins, so consecutive batches span the capture.
+- ``loss_weighted``: hard-view mining. Views are drawn in proportion to an
+  EMA of their recent photometric loss, with a uniform floor.
+
+Every sampler owns a ``np.random.RandomState(seed)``, so a seed fixes the
+index sequence (see ``batch_prefetch`` for the threading side of that
+contract).
+"""
+
+from __future__ import annotations
+
+from collections import deque
+import threading
+from typing import Callable, Dict, List, Optional, Protocol
+
+import numpy as np
+import torch
+
+
+class FrameSampler(Protocol):
+    """Produces batches of frame indices; ``observe`` is only called when ``uses_losses``."""
+
+    uses_losses: bool
+
+    def sample(self, batch_size: int) -> torch.Tensor: ...
+
+    def observe(self, indices: torch.Tensor, losses: torch.Tensor) -> None: ...
+
+
+SamplerFactory = Callable[..., FrameSampler]
+
+
+def _as_indices(values: np.ndarray) -> torch.Tensor:
+    return torch.from_numpy(np.ascontiguousarray(values, dtype=np.int64))
+
+
+class UniformSampler:
+    """Independent uniform batches (``choice`` without replacement)."""
+
+    uses_losses = False
+
+    def __init__(self, frame_count: int, *, seed: int, **_: object) -> None:
+        self.frame_count = frame_count
+        self._rng = np.random.RandomState(seed)
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        if batch_size >= self.frame_count:
+            return _as_indices(np.arange(self.frame_count))
+        return _as_indices(self._rng.choice(self.frame_count, size=batch_size, replace=False))
+
+    def observe(self, indices: torch.Tensor, losses: torch.Tensor) -> None:
+        return None
+
+
+class _Permutation:
+    """Endless stream of a set of ids, reshuffled each pass; no id repeats within one ``take``."""
+
+    def __init__(self, ids: np.ndarray, rng: np.random.RandomState) -> None:
+        self._ids = ids
+        self._rng = rng
+        self._order = rng.permutation(ids)
+        self._pos = 0
+
+    def take(self, count: int, exclude: Optional[np.ndarray] = None) -> np.ndarray:
+        taken = self._order[self._pos : self._pos + count]
+        self._pos += taken.shape[0]
+        if taken.shape[0] < count:
+            # New epoch: anything already in this batch moves to the back of the fresh order.
+            order = self._rng.permutation(self._ids)
+            seen = np.isin(order, taken) if exclude is None else np.isin(order, np.concatenate([taken, exclude]))
+            self._order = np.concatenate([order[~seen], order[seen]])
+            fill = self._order[: count - taken.shape[0]]
+            self._pos = fill.shape[0]
+            taken = np.concatenate([taken, fill])
+        return taken
+
+
+class EpochSampler:
+    """Every view exactly once per epoch, in a fresh random order each epoch."""
+
+    uses_losses = False
+
+    def __init__(self, frame_count: int, *, seed: int, **_: object) -> None:
+        self.frame_count = frame_count
+        self._stream = _Permutation(np.arange(frame_count), np.random.RandomState(seed))
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        if batch_size >= self.frame_count:
+            return _as_indices(np.arange(self.frame_count))
+        return _as_indices(self._stream.take(batch_size))
+
+    def observe(self, indices: torch.Tensor, losses: torch.Tensor) -> None:
+        return None
+
+
+def viewpoint_strata(camera_centers: np.ndarray, strata: int) -> np.ndarray:
+    """Bin cameras by azimuth around their centroid in the plane of largest spread."""
+    centers = np.asarray(camera_centers, dtype=np.float64)
+    if centers.shape[0] < 3 or strata <= 1:
+        return np.zeros(centers.shape[0], dtype=np.int64)
+    offsets = centers - centers.mean(axis=0)
+    _, _, axes = np.linalg.svd(offsets, full_matrices=False)
+    planar = offsets @ axes[:2].T
+    azimuth = np.arctan2(planar[:, 1], planar[:, 0])
+    return np.minimum(((azimuth + np.pi) / (2 * np.pi) * strata).astype(np.int64), strata - 1)
+
+
+class StratifiedSampler:
+    """Round-robin over viewpoint bins, epoch order within each bin.
+
+    Without camera centers the bins are contiguous runs of frame indices
+    (temporal order for video captures).
+    """
+
+    uses_losses = False
+
+    def __init__(
+        self,
+        frame_count: int,
+        *,
+        seed: int,
+        camera_centers: Optional[np.ndarray] = None,
+        strata: int = 8,
+        **_: object,
+    ) -> None:
+        self.frame_count = frame_count
+        rng = np.random.RandomState(seed)
+        if camera_centers is not None:
+            labels = viewpoint_strata(camera_centers, strata)
+        else:
+            labels = np.arange(frame_count) * max(1, strata) // max(1, frame_count)
+        groups = [np.flatnonzero(labels == label) for label in np.unique(labels)]
+        self._groups = [_Permutation(group, rng) for group in groups]
+        self._group_order = _Permutation(np.arange(len(groups)), rng)
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        if batch_size >= self.frame_count:
+            return _as_indices(np.arange(self.frame_count))
+        picks: List[int] = []
+        chosen: set[int] = set()
+        while len(picks) < batch_size:
+            group = int(self._group_order.take(1)[0])
+            index = int(self._groups[group].take(1)[0])
+            if index not in chosen:
+                chosen.add(index)
+                picks.append(index)
+        return _as_indices(np.array(picks))
+
+    def observe(self, indices: torch.Tensor, losses: torch.Tensor) -> None:
+        return None
+
+
+class LossWeightedSampler:
+    """Hard-view mining: draw views in proportion to an EMA of their loss.
+
+    ``observe`` only queues the (device) loss tensors; they are folded into
+    the weights every ``refresh_interval`` batches, costing one host sync per
+    refresh. New weights take effect ``refresh_interval`` samples after the
+    refresh, a fixed lag larger than any prefetch depth, so the sequence
+    stays reproducible when batches are sampled ahead on another thread.
+    """
+
+    uses_losses = True
+
+    def __init__(
+        self,
+        frame_count: int,
+        *,
+        seed: int,
+        alpha: float = 1.0,
+        floor: float = 0.2,
+        momentum: float = 0.9,
+        refresh_interval: int = 50,
+        **_: object,
+    ) -> None:
+        self.frame_count = frame_count
+        self.alpha = alpha
+        self.floor = min(max(floor, 0.0), 1.0)
+        self.momentum = momentum
+        self.refresh_interval = max(8, int(refresh_interval))
+        self._rng = np.random.RandomState(seed)
+        self._scores = np.ones(frame_count, dtype=np.float64)
+        self._probabilities = np.full(frame_count, 1.0 / max(1, frame_count))
+        self._scheduled: deque[tuple[int, np.ndarray]] = deque()
+        self._pending: List[tuple[torch.Tensor, torch.Tensor]] = []
+        self._observed = 0
+        self._sampled = 0
+        self._lock = threading.Lock()
+
+    def sample(self, batch_size: int) -> torch.Tensor:
+        with self._lock:
+            while self._scheduled and self._scheduled[0][0] <= self._sampled:
+                self._probabilities = self._scheduled.popleft()[1]
+            self._sampled += 1
+            probabilities = self._probabilities
+        if batch_size >= self.frame_count:
+            return _as_indices(np.arange(self.frame_count))
+        return _as_indices(self._rng.choice(self.frame_count, size=batch_size, replace=False, p=probabilities))
+
+    def observe(self, indices: torch.Tensor, losses: torch.Tensor) -> None:
+        with self._lock:
+            self._pending.append((indices.detach(), losses.detach()))
+            self._observed += 1
+            if self._observed % self.refresh_interval == 0:
+                self._refresh()
+
+    def _refresh(self) -> None:
+        ids = torch.cat([item[0].reshape(-1) for item in self._pending]).cpu().numpy()
+        values = torch.cat([item[1].reshape(-1).float() for item in self._pending]).cpu().numpy()
+        self._pending.clear()
+        for index, value in zip(ids.tolist(), values.tolist()):
+            self._scores[index] = self.momentum * self._scores[index] + (1.0 - self.momentum) * value
+        weights = np.power(np.maximum(self._scores, 1e-12), self.alpha)
+        probabilities = self.floor / self.frame_count + (1.0 - self.floor) * weights / weights.sum()
+        self._scheduled.append((self._observed + self.refresh_interval, probabilities / probabilities.sum()))
+
+
+_SAMPLERS: Dict[str, SamplerFactory] = {
+    "uniform": UniformSampler,
+    "epoch": EpochSampler,
+    "stratified": StratifiedSampler,
+    "loss_weighted": LossWeightedSampler,
+}
+
+
+def get_sampler(name: str) -> SamplerFactory:
+    key = name.strip().lower()
+    if key not in _SAMPLERS:
+        raise KeyError(f"Unknown frame sampler: {name}")
+    return _SAMPLERS[key]
+
+
+def list_samplers() -> list[str]:
+    return list(_SAMPLERS)
+
+
+def register_sampler(name: str, factory: SamplerFactory) -> None:
+    """Register a factory called as ``factory(frame_count, seed=..., camera_centers=...)``."""
+    _SAMPLERS[name.strip().lower()] = factory
+
+
+def create_sampler(
+    name: str, frame_count: int, *, seed: int, camera_centers: Optional[np.ndarray] = None
+) -> FrameSampler:
+    return get_sampler(name)(frame_count, seed=seed, camera_centers=camera_centers)
+
+
+__all__ = [
+    "EpochSampler",
+    "FrameSampler",
+    "LossWeightedSampler",
+    "SamplerFactory",
+    "StratifiedSampler",
+    "UniformSampler",
+    "create_sampler",
+    "get_sampler",
+    "list_samplers",
+    "register_sampler",
+    "viewpoint_strata",
+]
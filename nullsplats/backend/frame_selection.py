@@ -0,0 +1,296 @@
+"""Frame scorers, selection strategies, and fingerprint search for auto-selection.
+
+Perceptual fingerprints are persisted as 16-character hex strings in
+metadata.json. Selection parses them once into a ``uint64`` array and answers
+"is any already-selected frame within N bits?" through a multi-index hash, so
+diversity-aware selection stays fast for tens of thousands of candidates.
+
+Scorers turn candidate metrics into one quality value per frame; strategies
+pick candidate indices from those values. Candidates are expected in temporal
+order (frames_all order), which the ``temporal`` strategy relies on. Both are
+looked up by name so callers and the UI can switch them without code changes.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Optional, Protocol, Sequence
+
+import numpy as np
+
+
+FINGERPRINT_BITS = 64
+# Above this radius the chunks get too narrow to prune anything; scan linearly instead.
+_MAX_INDEXED_RADIUS = 16
+_BYTE_POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint8)
+
+
+def parse_fingerprints(values: Sequence[Optional[str]]) -> tuple[np.ndarray, np.ndarray]:
+    """Parse hex fingerprints into a ``uint64`` array plus a validity mask.
+
+    Missing, malformed, or wider-than-64-bit values are marked invalid; callers
+    treat those frames as unique, matching the previous string comparison.
+    """
+    fingerprints = np.zeros(len(values), dtype=np.uint64)
+    valid = np.zeros(len(values), dtype=bool)
+    for idx, value in enumerate(values):
+        if not value:
+            continue
+        try:
+            parsed = int(value, 16)
+        except (TypeError, ValueError):
+            continue
+        if parsed >> FINGERPRINT_BITS:
+            continue
+        fingerprints[idx] = parsed
+        valid[idx] = True
+    return fingerprints, valid
+
+
+def popcount64(values: np.ndarray) -> np.ndarray:
+    """Vectorized population count for a ``uint64`` array."""
+    values = np.asarray(values, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.int64)
+    as_bytes = values.reshape(-1, 1).view(np.uint8)
+    return _BYTE_POPCOUNT[as_bytes].sum(axis=1, dtype=np.int64).reshape(values.shape)
+
+
+def hamming_distances(fingerprint: int | np.uint64, others: np.ndarray) -> np.ndarray:
+    """Hamming distance between one fingerprint and every entry of ``others``."""
+    return popcount64(np.bitwise_xor(np.asarray(others, dtype=np.uint64), np.uint64(fingerprint)))
+
+
+class FingerprintIndex:
+    """Multi-index hash over 64-bit fingerprints for radius queries.
+
+    The 64 bits are split into ``radius`` contiguous chunks with one hash table
+    per chunk. By pigeonhole, two fingerprints less than ``radius`` bits apart
+    share at least one identical chunk, so only entries colliding on some chunk
+    need an exact popcount check. Inserts and queries are O(chunks) lookups
+    plus a vectorized check over the (small) candidate set.
+    """
+
+    def __init__(self, radius: int, *, capacity: int = 64) -> None:
+        self.radius = max(0, int(radius))
+        self._values = np.zeros(max(1, capacity), dtype=np.uint64)
+        self._size = 0
+        self._chunks: List[tuple[int, int]] = []
+        self._tables: List[Dict[int, List[int]]] = []
+        if 0 < self.radius <= _MAX_INDEXED_RADIUS:
+            edges = np.linspace(0, FINGERPRINT_BITS, self.radius + 1).astype(int)
+            self._chunks = [(int(lo), (1 << int(hi - lo)) - 1) for lo, hi in zip(edges[:-1], edges[1:])]
+            self._tables = [{} for _ in self._chunks]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, fingerprint: int | np.uint64) -> None:
+        """Insert a fingerprint."""
+        if self._size == self._values.shape[0]:
+            self._values = np.concatenate([self._values, np.zeros_like(self._values)])
+        self._values[self._size] = np.uint64(fingerprint)
+        value = int(fingerprint)
+        for (shift, mask), table in zip(self._chunks, self._tables):
+            table.setdefault((value >> shift) & mask, []).append(self._size)
+        self._size += 1
+
+    def has_neighbor(self, fingerprint: int | np.uint64) -> bool:
+        """Return True if any stored fingerprint is fewer than ``radius`` bits away."""
+        if self._size == 0 or self.radius <= 0:
+            return False
+        if not self._tables:
+            return bool(hamming_distances(fingerprint, self._values[: self._size]).min() < self.radius)
+        value = int(fingerprint)
+        candidates: set[int] = set()
+        for (shift, mask), table in zip(self._chunks, self._tables):
+            bucket = table.get((value >> shift) & mask)
+            if bucket:
+                candidates.update(bucket)
+        if not candidates:
+            return False
+        rows = np.fromiter(candidates, dtype=np.intp, count=len(candidates))
+        return bool(hamming_distances(fingerprint, self._values[rows]).min() < self.radius)
+
+
+class FrameMetrics(Protocol):
+    """Per-frame metrics consumed by scorers (satisfied by ``FrameScore``)."""
+
+    score: float
+    sharpness: Optional[float]
+    variance: Optional[float]
+
+
+FrameScorer = Callable[[Sequence[FrameMetrics]], np.ndarray]
+SelectionStrategy = Callable[[np.ndarray, np.ndarray, np.ndarray, int], List[int]]
+
+DIVERSITY_THRESHOLD = 8  # minimum Hamming distance to consider a frame unique enough
+
+
+def _normalized_metric(frame_scores: Sequence[FrameMetrics], attr: str) -> Optional[np.ndarray]:
+    """Min-max normalize one metric; frames missing it get 0. None if no frame has it."""
+    raw = [getattr(item, attr) for item in frame_scores]
+    present = np.array([value is not None for value in raw], dtype=bool)
+    if not present.any():
+        return None
+    values = np.array([value if value is not None else 0.0 for value in raw], dtype=np.float64)
+    low = values[present].min()
+    high = values[present].max()
+    span = high - low if high != low else 1e-6
+    return np.where(present, (values - low) / span, 0.0)
+
+
+def _existing_scores(frame_scores: Sequence[FrameMetrics]) -> np.ndarray:
+    return np.array([float(item.score) for item in frame_scores], dtype=np.float64)
+
+
+def quality_scorer(frame_scores: Sequence[FrameMetrics]) -> np.ndarray:
+    """0.7 * normalized sharpness + 0.3 * normalized variance (the default)."""
+    sharp = _normalized_metric(frame_scores, "sharpness")
+    var = _normalized_metric(frame_scores, "variance")
+    if sharp is None or var is None:
+        return _existing_scores(frame_scores)
+    return 0.7 * sharp + 0.3 * var
+
+
+def sharpness_scorer(frame_scores: Sequence[FrameMetrics]) -> np.ndarray:
+    """Normalized Laplacian sharpness only."""
+    sharp = _normalized_metric(frame_scores, "sharpness")
+    return sharp if sharp is not None else _existing_scores(frame_scores)
+
+
+def variance_scorer(frame_scores: Sequence[FrameMetrics]) -> np.ndarray:
+    """Normalized intensity variance only (favors high-contrast frames)."""
+    var = _normalized_metric(frame_scores, "variance")
+    return var if var is not None else _existing_scores(frame_scores)
+
+
+def select_diverse(quality: np.ndarray, fingerprints: np.ndarray, valid: np.ndarray, target_count: int) -> List[int]:
+    """Best-first selection skipping near-duplicates, topped up by score if needed."""
+    # Stable sort keeps the original order among equal scores.
+    order = np.argsort(-np.asarray(quality, dtype=np.float64), kind="stable").tolist()
+    index = FingerprintIndex(DIVERSITY_THRESHOLD)
+    selected: List[int] = []
+    taken: set[int] = set()
+    for idx in order:
+        if valid[idx] and index.has_neighbor(fingerprints[idx]):
+            continue
+        selected.append(idx)
+        taken.add(idx)
+        if valid[idx]:
+            index.add(fingerprints[idx])
+        if len(selected) >= target_count:
+            return selected
+    for idx in order:
+        if len(selected) >= target_count:
+            break
+        if idx not in taken:
+            selected.append(idx)
+    return selected
+
+
+def select_temporal(
+    quality: np.ndarray,
+    fingerprints: np.ndarray,
+    valid: np.ndarray,
+    target_count: int,
+    *,
+    max_probes: int = 4,
+) -> List[int]:
+    """Pick the best frame from each of ``target_count`` equal temporal segments.
+
+    Guarantees even coverage of the capture so SfM sees every part of the
+    trajectory. Within a segment the top-quality frame wins unless it is a
+    near-duplicate of an earlier pick, in which case up to ``max_probes``
+    next-best frames are tried before coverage takes priority. Each probe is a
+    linear argmax over the segment, so the whole pass is O(N).
+    """
+    count = len(quality)
+    if target_count >= count:
+        return list(range(count))
+    edges = (np.arange(target_count + 1) * count) // target_count
+    index = FingerprintIndex(DIVERSITY_THRESHOLD)
+    selected: List[int] = []
+    for start, stop in zip(edges[:-1], edges[1:]):
+        segment = np.array(quality[start:stop], dtype=np.float64)
+        choice = start + int(np.argmax(segment))
+        for _ in range(max(1, max_probes)):
+            local = int(np.argmax(segment))
+            if np.isneginf(segment[local]):
+                break
+            candidate = start + local
+            if not (valid[candidate] and index.has_neighbor(fingerprints[candidate])):
+                choice = candidate
+                break
+            segment[local] = -np.inf
+        selected.append(choice)
+        if valid[choice]:
+            index.add(fingerprints[choice])
+    return selected
+
+
+_SCORERS: dict[str, FrameScorer] = {
+    "quality": quality_scorer,
+    "sharpness": sharpness_scorer,
+    "variance": variance_scorer,
+}
+
+_STRATEGIES: dict[str, SelectionStrategy] = {
+    "diverse": select_diverse,
+    "temporal": select_temporal,
+}
+
+
+def get_scorer(name: str) -> FrameScorer:
+    key = name.strip().lower()
+    if key not in _SCORERS:
+        raise KeyError(f"Unknown frame scorer: {name}")
+    return _SCORERS[key]
+
+
+def list_scorers() -> list[str]:
+    return list(_SCORERS)
+
+
+def register_scorer(name: str, scorer: FrameScorer) -> None:
+    """Register a scorer returning one quality value per frame (higher is better)."""
+    _SCORERS[name.strip().lower()] = scorer
+
+
+def get_strategy(name: str) -> SelectionStrategy:
+    key = name.strip().lower()
+    if key not in _STRATEGIES:
+        raise KeyError(f"Unknown selection strategy: {name}")
+    return _STRATEGIES[key]
+
+
+def list_strategies() -> list[str]:
+    return list(_STRATEGIES)
+
+
+def register_strategy(name: str, strategy: SelectionStrategy) -> None:
+    """Register a strategy mapping (quality, fingerprints, valid, target_count) to indices."""
+    _STRATEGIES[name.strip().lower()] = strategy
+
+
+__all__ = [
+    "DIVERSITY_THRESHOLD",
+    "FINGERPRINT_BITS",
+    "FingerprintIndex",
+    "FrameMetrics",
+    "FrameScorer",
+    "SelectionStrategy",
+    "get_scorer",
+    "get_strategy",
+    "hamming_distances",
+    "list_scorers",
+    "list_strategies",
+    "parse_fingerprints",
+    "popcount64",
+    "quality_scorer",
+    "register_scorer",
+    "register_strategy",
+    "select_diverse",
+    "select_temporal",
+    "sharpness_scorer",
+    "variance_scorer",
+]
@@ -0,0 +1,189 @@
+"""Contiguous uint8 frame storage for the training loop.
+
+``FrameStore`` holds every training image as one ``(N, H, W, 3)`` uint8
+tensor plus stacked poses and intrinsics. ``gather`` selects a batch by
+index with ``index_select`` and converts to float on the training device,
+so the host never builds per-step Python lists or float copies.
+
+Residency:
+
+- ``device``: the whole image tensor lives on the GPU. Gathers are device
+  kernels with no host-to-device copy. ``auto`` picks this when the images
+  fit in ``device_fraction`` of the free GPU memory.
+- ``pinned``: images stay in page-locked host memory. Each batch is gathered
+  into a pinned buffer and copied asynchronously.
+- ``host``: plain pageable memory (CPU training or pinning unavailable).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Sequence
+
+import numpy as np
+import torch
+
+from nullsplats.backend.splat_train_config import FrameRecord
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.frame_store")
+RESIDENCY_MODES = ("auto", "device", "pinned", "host")
+
+
+@dataclass(frozen=True)
+class FrameBatch:
+    """One training batch, already on the training device."""
+
+    indices: torch.Tensor  # (B,) long, frame indices (embedding ids)
+    camtoworlds: torch.Tensor  # (B, 4, 4)
+    Ks: torch.Tensor  # (B, 3, 3)
+    images: torch.Tensor  # (B, H, W, 3) float32 in [0, 1]
+    width: int
+    height: int
+
+
+class FrameStore:
+    """All training frames as stacked tensors, gathered by index."""
+
+    def __init__(
+        self,
+        pixels: torch.Tensor,
+        camtoworlds: torch.Tensor,
+        Ks: torch.Tensor,
+        device: torch.device,
+        *,
+        residency: str = "auto",
+        device_fraction: float = 0.5,
+    ) -> None:
+        if pixels.dtype != torch.uint8 or pixels.dim() != 4:
+            raise ValueError("FrameStore pixels must be a (N, H, W, 3) uint8 tensor.")
+        mode = residency.strip().lower()
+        if mode not in RESIDENCY_MODES:
+            raise ValueError(f"Unknown frame residency: {residency}")
+        self.device = torch.device(device)
+        self.count, self.height, self.width = int(pixels.shape[0]), int(pixels.shape[1]), int(pixels.shape[2])
+        self.residency = _resolve_residency(mode, pixels.nbytes, self.device, device_fraction)
+        if self.residency == "device":
+            self.pixels = pixels.to(self.device)
+        elif self.residency == "pinned":
+            self.pixels = torch.empty(pixels.shape, dtype=torch.uint8, pin_memory=True)
+            self.pixels.copy_(pixels)
+        else:
+            self.pixels = pixels.contiguous()
+        self.camtoworlds = camtoworlds.to(self.device, dtype=torch.float32)
+        self.Ks = Ks.to(self.device, dtype=torch.float32)
+        _LOGGER.info(
+            "Frame store ready frames=%d size=%dx%d residency=%s bytes=%d",
+            self.count,
+            self.width,
+            self.height,
+            self.residency,
+            self.nbytes,
+        )
+
+    @classmethod
+    def from_pixels(
+        cls,
+        pixels: torch.Tensor,
+        frames: Sequence[FrameRecord],
+        device: torch.device,
+        *,
+        residency: str = "auto",
+        device_fraction: float = 0.5,
+    ) -> FrameStore:
+        """Wrap an existing ``(N, H, W, 3)`` uint8 image tensor; poses and intrinsics come from ``frames``.
+
+        ``pixels`` is typically ``torch.from_numpy`` of the training image
+        cache array. Host residency keeps it without a copy.
+        """
+        if not frames:
+            raise ValueError("FrameStore needs at least one frame.")
+        if pixels.shape[0] != len(frames):
+            raise ValueError(f"FrameStore got {pixels.shape[0]} images for {len(frames)} frames.")
+        return cls(
+            pixels,
+            torch.stack([frame.camtoworld for frame in frames], dim=0),
+            torch.stack([frame.K for frame in frames], dim=0),
+            device,
+            residency=residency,
+            device_fraction=device_fraction,
+        )
+
+    @classmethod
+    def from_records(
+        cls,
+        frames: Sequence[FrameRecord],
+        device: torch.device,
+        *,
+        residency: str = "auto",
+        device_fraction: float = 0.5,
+    ) -> FrameStore:
+        """Stack ``FrameRecord`` images, poses and intrinsics (records must be in index order).
+
+        Copies every image into a new tensor; for records that are views into
+        one shared array use ``from_pixels`` instead.
+        """
+        if not frames:
+            raise ValueError("FrameStore needs at least one frame.")
+        first = frames[0].image
+        pixels = torch.empty((len(frames), *first.shape), dtype=torch.uint8)
+        torch.stack([frame.image for frame in frames], dim=0, out=pixels)
+        return cls(
+            pixels,
+            torch.stack([frame.camtoworld for frame in frames], dim=0),
+            torch.stack([frame.K for frame in frames], dim=0),
+            device,
+            residency=residency,
+            device_fraction=device_fraction,
+        )
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def nbytes(self) -> int:
+        return int(self.pixels.nbytes)
+
+    def gather(self, indices: Sequence[int] | np.ndarray | torch.Tensor) -> FrameBatch:
+        """Return frames ``indices`` with images normalized to float32 on the training device."""
+        if isinstance(indices, torch.Tensor):
+            host_indices = indices.to(device="cpu", dtype=torch.int64)
+        else:
+            host_indices = torch.as_tensor(np.asarray(indices, dtype=np.int64))
+        device_indices = host_indices.to(self.device, non_blocking=True)
+        if self.residency == "device":
+            images = self.pixels.index_select(0, device_indices)
+        elif self.residency == "pinned":
+            # The caching host allocator keeps this buffer alive until the async copy finishes.
+            staging = torch.empty(
+                (host_indices.shape[0], self.height, self.width, 3), dtype=torch.uint8, pin_memory=True
+            )
+            torch.index_select(self.pixels, 0, host_indices, out=staging)
+            images = staging.to(self.device, non_blocking=True)
+        else:
+            images = self.pixels.index_select(0, host_indices).to(self.device)
+        return FrameBatch(
+            indices=device_indices,
+            camtoworlds=self.camtoworlds.index_select(0, device_indices),
+            Ks=self.Ks.index_select(0, device_indices),
+            images=images.float().div_(255.0),
+            width=self.width,
+            height=self.height,
+        )
+
+
+def _resolve_residency(mode: str, nbytes: int, device: torch.device, device_fraction: float) -> str:
+    on_cuda = device.type == "cuda" and torch.cuda.is_available()
+    if mode == "auto":
+        if not on_cuda:
+            return "host"
+        free, _total = torch.cuda.mem_get_info(device)
+        return "device" if nbytes <= device_fraction * free else "pinned"
+    if mode in ("device", "pinned") and not on_cuda:
+        _LOGGER.warning("Frame residency %s needs CUDA; using host memory on %s", mode, device)
+        return "host"
+    return mode
+
+
+__all__ = ["FrameBatch", "FrameStore", "RESIDENCY_MODES"]
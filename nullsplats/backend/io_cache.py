@@ -70,6 +70,11 @@ class ScenePaths:
     def renders_dir(self) -> Path:
         return self.outputs_root / "renders"
 
+    @property
+    def train_cache_dir(self) -> Path:
+        """Decoded training images (see ``training_images``); safe to delete."""
+        return self.outputs_root / "train_cache"
+
     def iter_required_dirs(self) -> Iterable[Path]:
         """Return directories that must exist for the scene."""
         return (
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import os
-import shutil
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 import io
@@ -11,8 +10,18 @@ import threading
 from pathlib import Path
 from typing import Iterable, Optional, Sequence, Tuple, List
 
+import numpy as np
 from PIL import Image
 
+from nullsplats.backend.blob_store import BlobStore, DedupReport
+from nullsplats.backend.frame_codecs import (
+    DEFAULT_CODEC,
+    codec_for_path,
+    frame_size,
+    get_codec,
+    list_frame_files,
+    open_frame,
+)
 from nullsplats.backend.io_cache import ScenePaths, delete_scene, ensure_scene_dirs
 from nullsplats.backend.video_frames import (
     ExtractionResult,
@@ -118,6 +127,7 @@ class SceneSelectionManager:
     def __init__(self, cache_root: str | Path = "cache", max_workers: int | None = None) -> None:
         self.cache_root = Path(cache_root)
         self.max_workers = max(1, max_workers or (os.cpu_count() or 4))
+        self.blob_store = BlobStore(self.cache_root)
 
     def save_selection(
         self,
@@ -177,6 +187,7 @@ class SceneSelectionManager:
             target_px_int,
             resample_mode,
         )
+        superseded = self.blob_store.blobs_linked_from(dest_dir)
         processed = self._process_tasks_parallel(tasks, target_px_int, resample_filter)
 
         for name in to_delete:
@@ -189,6 +200,10 @@ class SceneSelectionManager:
         metadata["selected_resolution_px"] = target_px_int
         metadata["selected_resample"] = resample_mode
         save_metadata(normalized, metadata, cache_root=self.cache_root)
+        try:
+            self.blob_store.release(superseded)
+        except OSError:
+            _LOGGER.debug("Blob store cleanup failed after saving selection scene=%s", normalized, exc_info=True)
 
         result = load_cached_frames(normalized, cache_root=self.cache_root)
         summary = SceneSaveSummary(
@@ -223,19 +238,23 @@ class SceneSelectionManager:
         return processed
 
     def _resize_or_copy(self, src: Path, dst: Path, target_px: int, resample_filter: int) -> None:
-        with Image.open(src) as img:
-            img = img.convert("RGB")
-            w, h = img.size
-            small_side = min(w, h)
-            if target_px <= 0 or small_side <= target_px:
-                shutil.copy2(src, dst)
-                return
-            scale = target_px / float(small_side)
-            new_w = max(1, int(round(w * scale)))
-            new_h = max(1, int(round(h * scale)))
-            if new_w != w or new_h != h:
-                img = img.resize((new_w, new_h), resample_filter)
-            img.save(dst, format="PNG")
+        w, h = frame_size(src)
+        small_side = min(w, h)
+        if target_px <= 0 or small_side <= target_px:
+            self.blob_store.link_file(src, dst)
+            return
+        img = open_frame(src)
+        scale = target_px / float(small_side)
+        new_w = max(1, int(round(w * scale)))
+        new_h = max(1, int(round(h * scale)))
+        if new_w != w or new_h != h:
+            img = img.resize((new_w, new_h), resample_filter)
+        # dst may be a hardlink into the blob store; never rewrite it in place.
+        if dst.is_symlink() or dst.exists():
+            dst.unlink()
+        # Keep the scene's frame codec so frames_selected matches frames_all.
+        codec = codec_for_path(dst) or get_codec(DEFAULT_CODEC)
+        codec.encode(np.asarray(img), dst)
 
     @staticmethod
     def _resample_filter(mode: str) -> int:
@@ -284,7 +303,7 @@ class ThumbnailCache:
         frames_dir = paths.frames_all_dir
         if not frames_dir.exists():
             return
-        files = [p for p in sorted(frames_dir.iterdir()) if p.is_file()]
+        files = list_frame_files(frames_dir)
         thumbs: dict[str, bytes] = {}
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
             futures = {executor.submit(self._make_thumb_bytes, path): path.name for path in files}
@@ -324,12 +343,11 @@ class ThumbnailCache:
 
     def _make_thumb_bytes(self, path: Path) -> Optional[bytes]:
         try:
-            with Image.open(path) as img:
-                img = img.convert("RGB")
-                img.thumbnail((self.size_px, self.size_px), Image.LANCZOS)
-                buf = io.BytesIO()
-                img.save(buf, format="PNG")
-                return buf.getvalue()
+            img = open_frame(path)
+            img.thumbnail((self.size_px, self.size_px), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, format="PNG")
+            return buf.getvalue()
         except Exception:
             return None
 
@@ -391,6 +409,7 @@ class SceneManager:
         self.registry = SceneRegistry(cache_root=self.cache_root)
         self.selection = SceneSelectionManager(cache_root=self.cache_root, max_workers=max_workers)
         self.thumbnails = ThumbnailCache(cache_root=self.cache_root, max_workers=max_workers)
+        self.blob_store = self.selection.blob_store
         self.current_scene: Optional[SceneId] = None
         # Begin warming thumbnails for existing scenes.
         try:
@@ -463,6 +482,10 @@ class SceneManager:
         if target is None:
             return False
         delete_scene(str(target), cache_root=self.cache_root)
+        try:
+            self.blob_store.collect_garbage()
+        except Exception:  # noqa: BLE001
+            _LOGGER.debug("Blob store cleanup failed after deleting scene=%s", target, exc_info=True)
         if self.current_scene == target:
             self.current_scene = None
         return True
@@ -493,6 +516,10 @@ class SceneManager:
             raise ValueError("No scene selected.")
         return load_cached_frames(target, cache_root=self.cache_root)
 
+    def dedup_report(self) -> DedupReport:
+        """Report bytes saved by the shared blob store across all scenes."""
+        return self.blob_store.dedup_report()
+
     def get_thumbnail_bytes(self, scene_id: str | SceneId, filename: str) -> Optional[bytes]:
         return self.thumbnails.get_or_build(str(scene_id), filename)
 
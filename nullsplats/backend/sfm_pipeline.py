@@ -19,6 +19,7 @@ import threading
 import time
 from typing import Iterable, List
 
+from nullsplats.backend.frame_codecs import codec_for_path, get_codec, list_frame_files, read_frame
 from nullsplats.backend.io_cache import ScenePaths, ensure_scene_dirs
 from nullsplats.util.logging import get_logger
 from nullsplats.util.scene_id import SceneId
@@ -53,6 +54,8 @@ class SfmConfig:
     colmap_path: str = ""
     matcher: str = "exhaustive"
     camera_model: str = "PINHOLE"
+    # Readers load the binary model directly; the sparse/text export is only for external tools.
+    export_text_model: bool = False
 
 
 @dataclass(frozen=True)
@@ -102,7 +105,7 @@ def run_sfm(
     sparse_model = sparse_path / "0"
     converted_model = sparse_path / "model.ply"
     _reset_previous_outputs(database_path, sparse_path, converted_model)
-    images_path = paths.frames_selected_dir.resolve()
+    images_path = _colmap_image_dir(paths.frames_selected_dir, sfm_dir).resolve()
     sparse_path.mkdir(parents=True, exist_ok=True)
 
     logger.info(
@@ -184,23 +187,24 @@ def run_sfm(
                 log_path,
                 "COLMAP model conversion",
             )
-            text_model_dir = sparse_path / "text"
-            text_model_dir.mkdir(parents=True, exist_ok=True)
-            _stream_command(
-                [
-                    colmap_exe,
-                    "model_converter",
-                    "--input_path",
-                    str(sparse_model),
-                    "--output_path",
-                    str(text_model_dir),
-                    "--output_type",
-                    "TXT",
-                ],
-                log_file,
-                log_path,
-                "COLMAP text model export",
-            )
+            if config.export_text_model:
+                text_model_dir = sparse_path / "text"
+                text_model_dir.mkdir(parents=True, exist_ok=True)
+                _stream_command(
+                    [
+                        colmap_exe,
+                        "model_converter",
+                        "--input_path",
+                        str(sparse_model),
+                        "--output_path",
+                        str(text_model_dir),
+                        "--output_type",
+                        "TXT",
+                    ],
+                    log_file,
+                    log_path,
+                    "COLMAP text model export",
+                )
     elapsed = time.perf_counter() - start_time
     logger.info(
         "SfM complete scene=%s elapsed=%.2fs log=%s database=%s sparse=%s ply=%s",
@@ -240,11 +244,29 @@ def _require_frames(frames_dir: Path) -> None:
 
 
 def _iter_images(frames_dir: Path) -> Iterable[Path]:
-    return (
-        path
-        for path in sorted(frames_dir.glob("*"))
-        if path.suffix.lower() in {".png", ".jpg", ".jpeg", ".bmp"}
-    )
+    return iter(list_frame_files(frames_dir))
+
+
+def _colmap_image_dir(frames_dir: Path, sfm_dir: Path) -> Path:
+    """Return an image folder COLMAP can read.
+
+    Frames stored with a codec COLMAP cannot decode (QOI, lossless WebP, .npy)
+    are transcoded to fast PNG under sfm/images with the same stems; training
+    readers resolve COLMAP image names back to frames_selected by stem.
+    """
+    frames = list(_iter_images(frames_dir))
+    unreadable = [path for path in frames if not getattr(codec_for_path(path), "colmap_readable", True)]
+    images_dir = sfm_dir / "images"
+    if images_dir.exists():
+        shutil.rmtree(images_dir)
+    if not unreadable:
+        return frames_dir
+    images_dir.mkdir(parents=True, exist_ok=True)
+    png = get_codec("png-fast")
+    for path in frames:
+        png.encode(read_frame(path), images_dir / f"{path.stem}{png.extension}")
+    logger.info("Transcoded %d frames to PNG for COLMAP into %s", len(frames), images_dir)
+    return images_dir
 
 
 def _assert_executable(path: str, label: str) -> None:
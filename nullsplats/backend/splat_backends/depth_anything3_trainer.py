@@ -10,7 +10,8 @@ from typing import Any, Iterable
 import numpy as np
 import torch
 
-from nullsplats.backend.colmap_io import ColmapCamera, ColmapImage
+from nullsplats.backend.camera_poses import world_to_camera
+from nullsplats.backend.colmap_io import ColmapCamera
 from nullsplats.backend.splat_backends.types import TrainerCapabilities, TrainingInput, TrainingOutput
 
 
@@ -383,10 +384,12 @@ def _build_camera_matrices(
 ) -> tuple[np.ndarray | None, np.ndarray | None]:
     if inputs.colmap is None:
         return None, None
-    ordered = _match_colmap_entries(inputs, images)
-    extrinsics = np.stack([_colmap_to_extrinsics(entry) for entry in ordered], axis=0).astype(np.float32)
+    table = inputs.colmap.image_table
+    rows = _match_colmap_rows(inputs, images)
+    extrinsics = world_to_camera(table.qvecs[rows], table.tvecs[rows]).astype(np.float32)
+    cameras = inputs.colmap.cameras
     intrinsics = np.stack(
-        [_colmap_camera_to_intrinsics(inputs.colmap.cameras[entry.camera_id]) for entry in ordered], axis=0
+        [_colmap_camera_to_intrinsics(cameras[camera_id]) for camera_id in table.camera_ids[rows].tolist()], axis=0
     ).astype(np.float32)
     return extrinsics, intrinsics
 
@@ -479,31 +482,28 @@ def _select_views_by_colmap(
     if inputs.colmap is None:
         return None
     try:
-        entries = _match_colmap_entries(inputs, [Path(image_paths[i]) for i in indices])
+        rows = _match_colmap_rows(inputs, [Path(image_paths[i]) for i in indices])
     except Exception:
         return None
 
-    points = inputs.colmap.points3D
-    scored: list[tuple[float, int, int]] = []
-    for local_idx, entry in enumerate(entries):
-        errors = []
-        for point_id in entry.point3D_ids:
-            if point_id < 0:
-                continue
-            point = points.get(point_id)
-            if point is not None:
-                errors.append(point.error)
-        if not errors:
-            continue
-        mean_err = float(sum(errors) / len(errors))
-        scored.append((mean_err, -len(errors), local_idx))
-
-    if not scored:
+    # Gather every observation of the candidate images in one pass, then reduce per image.
+    table = inputs.colmap.image_table
+    points = inputs.colmap.point_table
+    starts = table.offsets[rows]
+    counts = table.offsets[rows + 1] - starts
+    owner = np.repeat(np.arange(rows.shape[0]), counts)
+    observation = np.arange(int(counts.sum())) + np.repeat(starts - np.cumsum(counts) + counts, counts)
+    point_rows = points.rows_for_ids(table.point3D_ids[observation])
+    matched = point_rows >= 0
+    observed = np.bincount(owner[matched], minlength=rows.shape[0])
+    error_sum = np.bincount(owner[matched], weights=points.error[point_rows[matched]], minlength=rows.shape[0])
+
+    local = np.flatnonzero(observed > 0)
+    if local.size == 0:
         return None
-
-    scored.sort()
-    chosen_local = [idx for _err, _count, idx in scored[:max_views]]
-    chosen_local.sort()
+    mean_err = error_sum[local] / observed[local]
+    order = np.lexsort((local, -observed[local], mean_err))
+    chosen_local = sorted(local[order[:max_views]].tolist())
     return [indices[i] for i in chosen_local]
 
 
@@ -515,18 +515,19 @@ def _evenly_spaced(indices: list[int], max_views: int) -> list[int]:
     return sorted(set(chosen))
 
 
-def _match_colmap_entries(inputs: TrainingInput, images: Iterable[Path]) -> list[ColmapImage]:
+def _match_colmap_rows(inputs: TrainingInput, images: Iterable[Path]) -> np.ndarray:
+    """Image-table rows for ``images``, in order."""
     if inputs.colmap is None:
         raise ValueError("COLMAP data is required to match camera entries.")
-    images_by_name = {entry.name: entry for entry in inputs.colmap.images.values()}
-    images_by_basename = {Path(entry.name).name: entry for entry in inputs.colmap.images.values()}
-    ordered: list[ColmapImage] = []
+    table = inputs.colmap.image_table
+    rows: list[int] = []
     for path in images:
-        entry = images_by_name.get(path.name) or images_by_basename.get(path.name)
-        if entry is None:
+        # Stem matching covers COLMAP having seen a transcoded copy (frame_0001.png for frame_0001.qoi).
+        row = table.find_row(path.name)
+        if row is None:
             raise FileNotFoundError(f"COLMAP image entry not found for {path.name}")
-        ordered.append(entry)
-    return ordered
+        rows.append(row)
+    return np.asarray(rows, dtype=np.int64)
 
 
 def _colmap_camera_to_intrinsics(camera: ColmapCamera) -> np.ndarray:
@@ -539,20 +540,3 @@ def _colmap_camera_to_intrinsics(camera: ColmapCamera) -> np.ndarray:
         ],
         dtype=np.float32,
     )
-
-
-def _colmap_to_extrinsics(image: ColmapImage) -> np.ndarray:
-    qw, qx, qy, qz = image.qvec
-    R = np.array(
-        [
-            [1 - 2 * qy * qy - 2 * qz * qz, 2 * qx * qy - 2 * qz * qw, 2 * qx * qz + 2 * qy * qw],
-            [2 * qx * qy + 2 * qz * qw, 1 - 2 * qx * qx - 2 * qz * qz, 2 * qy * qz - 2 * qx * qw],
-            [2 * qx * qz - 2 * qy * qw, 2 * qy * qz + 2 * qx * qw, 1 - 2 * qx * qx - 2 * qy * qy],
-        ],
-        dtype=np.float32,
-    )
-    t = np.array(image.tvec, dtype=np.float32)
-    extrinsics = np.eye(4, dtype=np.float32)
-    extrinsics[:3, :3] = R
-    extrinsics[:3, 3] = t
-    return extrinsics
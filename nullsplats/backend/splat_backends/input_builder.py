@@ -5,8 +5,11 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Any
 
+import numpy as np
+
 from nullsplats.backend.io_cache import ScenePaths, ensure_scene_dirs, load_metadata
 from nullsplats.backend.colmap_io import ColmapData, load_colmap_data
+from nullsplats.backend.frame_codecs import list_frame_files, resolve_frame_path
 from nullsplats.backend.splat_backends.types import TrainingInput
 from nullsplats.util.scene_id import SceneId
 
@@ -46,16 +49,12 @@ def build_training_input(
 def _resolve_frame_paths(frames_dir: Path, colmap: ColmapData | None) -> list[Path]:
     if colmap is None:
         return _resolve_frames_from_dir(frames_dir)
-    ordered_ids = sorted(colmap.images.keys())
-    images = []
-    for image_id in ordered_ids:
-        entry = colmap.images[image_id]
-        image_path = frames_dir / entry.name
-        if not image_path.exists():
-            image_path = frames_dir / Path(entry.name).name
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image {entry.name} not found under {frames_dir}")
-        images.append(image_path)
+    table = colmap.image_table
+    candidates = list_frame_files(frames_dir)
+    images = [
+        resolve_frame_path(frames_dir, table.names[row], candidates=candidates)
+        for row in np.argsort(table.image_ids, kind="stable").tolist()
+    ]
     if not images:
         raise FileNotFoundError(f"No frames found under {frames_dir}")
     return images
@@ -64,9 +63,7 @@ def _resolve_frame_paths(frames_dir: Path, colmap: ColmapData | None) -> list[Pa
 def _resolve_frames_from_dir(frames_dir: Path) -> list[Path]:
     if not frames_dir.exists():
         raise FileNotFoundError(f"Frames directory not found: {frames_dir}")
-    images = sorted(
-        [path for path in frames_dir.iterdir() if path.suffix.lower() in {".png", ".jpg", ".jpeg", ".bmp"}]
-    )
+    images = list_frame_files(frames_dir)
     if not images:
         raise FileNotFoundError(f"No frames found under {frames_dir}")
     return images
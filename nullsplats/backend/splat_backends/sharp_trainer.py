@@ -12,7 +12,6 @@ from typing import Any
 import torch
 import torch.nn.functional as F
 
-from nullsplats.backend.colmap_io import ColmapImage
 from nullsplats.backend.splat_backends.types import TrainerCapabilities, TrainingInput, TrainingOutput
 from nullsplats.util.tooling_paths import app_root
 
@@ -192,19 +191,18 @@ def _resolve_colmap_focal(inputs: TrainingInput, image_path: Path, config: dict[
     focal_px = config.get("focal_px_override")
     if focal_px:
         return float(focal_px)
-    entry = _match_colmap_entry(inputs, image_path)
-    camera = inputs.colmap.cameras[entry.camera_id]
+    row = _match_colmap_row(inputs, image_path)
+    camera = inputs.colmap.cameras[int(inputs.colmap.image_table.camera_ids[row])]
     fx, fy, _cx, _cy = camera.params
     return float((fx + fy) * 0.5)
 
 
-def _match_colmap_entry(inputs: TrainingInput, image_path: Path) -> ColmapImage:
-    images_by_name = {entry.name: entry for entry in inputs.colmap.images.values()}
-    images_by_basename = {Path(entry.name).name: entry for entry in inputs.colmap.images.values()}
-    entry = images_by_name.get(image_path.name) or images_by_basename.get(image_path.name)
-    if entry is None:
+def _match_colmap_row(inputs: TrainingInput, image_path: Path) -> int:
+    # Stem matching covers COLMAP having seen a transcoded copy (frame_0001.png for frame_0001.qoi).
+    row = inputs.colmap.image_table.find_row(image_path.name)
+    if row is None:
         raise FileNotFoundError(f"COLMAP image entry not found for {image_path.name}")
-    return entry
+    return row
 
 
 def _load_predictor(config: dict[str, Any], device: torch.device) -> Any:
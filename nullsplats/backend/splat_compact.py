@@ -0,0 +1,500 @@
+"""Compact NullSplats splat format (``.nsplat``).
+
+A quantized, memory-mappable layout for fast viewer loads and checkpoint
+previews. Gaussians are stored in Morton order and split into fixed-size
+chunks (256 rows by default). A chunk table holds each chunk's row range
+and the min/max of its positions, log-scales and DC colors. The rows are
+quantized against those ranges:
+
+- positions: 3 x uint16 per axis
+- log-scales: one uint32, 11/10/11 bits
+- rotations: one uint32, "smallest three" (2-bit index of the largest
+  component, 3 x 10 bits for the others)
+- DC color and linear opacity: 4 x uint8
+- higher SH bands: optional float16 ``(N, K, 3)``
+
+That is 18 bytes per Gaussian plus 6 bytes per SH coefficient, against
+``4 * (14 + 3K)`` bytes in a float32 PLY. Sections are stored column by
+column, 64-byte aligned, so ``open_compact`` maps each one as a zero-copy
+NumPy view and chunks can be decoded independently (``CompactSplats.decode``).
+
+Layout: a 128-byte header (magic, version, flags, counts, section offsets),
+then the chunk table, positions, scales, rotations, colors and SH sections.
+All values are little-endian.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import mmap
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import torch
+
+from nullsplats.backend.splat_io import (
+    DEFAULT_READ_CHUNK_ROWS,
+    GaussianBuffers,
+    finite_rows,
+    morton_order,
+    open_ply,
+)
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.splat_compact")
+COMPACT_SUFFIX = ".nsplat"
+COMPACT_MAGIC = b"NSPLAT\x00\x01"
+COMPACT_VERSION = 1
+DEFAULT_COMPACT_CHUNK_ROWS = 256
+_FLAG_SH_HALF = 1
+_ALIGN = 64
+_SECTIONS = ("chunks", "positions", "scales", "rotations", "colors", "sh")
+COMPACT_HEADER_DTYPE = np.dtype(
+    [
+        ("magic", "S8"),
+        ("version", "<u4"),
+        ("flags", "<u4"),
+        ("count", "<u8"),
+        ("chunk_rows", "<u4"),
+        ("chunk_count", "<u4"),
+        ("sh_rest", "<u4"),
+        ("reserved", "<u4"),
+        ("offsets", "<u8", (len(_SECTIONS),)),
+        ("padding", "u1", (40,)),
+    ]
+)
+COMPACT_CHUNK_DTYPE = np.dtype(
+    [
+        ("start", "<u8"),
+        ("count", "<u4"),
+        ("reserved", "<u4"),
+        ("means_min", "<f4", (3,)),
+        ("means_max", "<f4", (3,)),
+        ("scales_min", "<f4", (3,)),
+        ("scales_max", "<f4", (3,)),
+        ("colors_min", "<f4", (3,)),
+        ("colors_max", "<f4", (3,)),
+    ]
+)
+_SCALE_BITS = (11, 10, 11)
+_SCALE_LEVELS = np.array([(1 << bits) - 1 for bits in _SCALE_BITS], dtype=np.float32)
+_ROTATION_LEVELS = 1023
+_SQRT1_2 = np.float32(np.sqrt(0.5))
+_ROTATION_VALUES = np.linspace(-_SQRT1_2, _SQRT1_2, _ROTATION_LEVELS + 1, dtype=np.float32)
+# Components other than the largest, in packed order, for each largest-component index ...
+_QUAT_OTHERS = np.array([[1, 2, 3], [0, 2, 3], [0, 1, 3], [0, 1, 2]])
+# ... and, per index, where each output component comes from in (largest, packed0, packed1, packed2).
+_QUAT_SOURCES = np.array([[0, 1, 2, 3], [1, 0, 2, 3], [1, 2, 0, 3], [1, 2, 3, 0]])
+
+
+def _f32(values: object) -> np.ndarray:
+    if isinstance(values, torch.Tensor):
+        values = values.detach().cpu().numpy()
+    return np.asarray(values, dtype=np.float32)
+
+
+def linear_opacities(opacities: np.ndarray) -> np.ndarray:
+    """Opacities in [0, 1]; values outside that range are treated as logits (as the viewer does)."""
+    values = _f32(opacities).reshape(-1)
+    finite = values[np.isfinite(values)]
+    if finite.size and (finite.min() < 0.0 or finite.max() > 1.0):
+        values = torch.sigmoid(torch.from_numpy(values)).numpy()
+    return np.clip(values, 0.0, 1.0)
+
+
+def _quantize(values: np.ndarray, lo: np.ndarray, hi: np.ndarray, levels: np.ndarray | int) -> np.ndarray:
+    span = hi - lo
+    scaled = np.divide(values - lo, span, out=np.zeros_like(values), where=span > 0)
+    return np.clip(np.rint(scaled * levels), 0, levels).astype(np.uint32)
+
+
+def _dequantize_chunks(
+    codes: np.ndarray, lo: np.ndarray, hi: np.ndarray, levels: np.ndarray | int, chunk_rows: int
+) -> np.ndarray:
+    """``lo + codes * step`` with per-chunk ``lo``/``hi``; every chunk but the last holds ``chunk_rows`` rows."""
+    step = ((hi - lo) / np.asarray(levels, dtype=np.float32)).astype(np.float32)
+    out = codes.astype(np.float32)
+    full = min(lo.shape[0], codes.shape[0] // chunk_rows)
+    head = out[: full * chunk_rows].reshape((full, chunk_rows) + out.shape[1:])
+    np.multiply(head, step[:full, None], out=head)
+    np.add(head, lo[:full, None], out=head)
+    if full < lo.shape[0]:
+        tail = out[full * chunk_rows :]
+        np.multiply(tail, step[full:], out=tail)
+        np.add(tail, lo[full:], out=tail)
+    return out
+
+
+def pack_scales(codes: np.ndarray) -> np.ndarray:
+    """``(N, 3)`` 11/10/11-bit codes into one uint32 per row."""
+    return ((codes[:, 0] << 21) | (codes[:, 1] << 11) | codes[:, 2]).astype(np.uint32)
+
+
+def unpack_scales(packed: np.ndarray) -> np.ndarray:
+    packed = packed.astype(np.uint32)
+    return np.stack([packed >> 21, (packed >> 11) & 0x3FF, packed & 0x7FF], axis=1)
+
+
+def pack_quaternions(quats: np.ndarray) -> np.ndarray:
+    """Smallest-three encoding of ``(N, 4)`` quaternions (any order, sign-agnostic)."""
+    quats = _f32(quats)
+    norms = np.linalg.norm(quats, axis=1, keepdims=True)
+    quats = np.divide(quats, norms, out=np.tile(np.float32([1, 0, 0, 0]), (quats.shape[0], 1)), where=norms > 0)
+    largest = np.argmax(np.abs(quats), axis=1)
+    rows = np.arange(quats.shape[0])
+    quats = quats * np.where(quats[rows, largest] < 0, -1.0, 1.0).astype(np.float32)[:, None]
+    rest = np.take_along_axis(quats, _QUAT_OTHERS[largest], axis=1)
+    codes = _quantize(rest, -_SQRT1_2, _SQRT1_2, _ROTATION_LEVELS)
+    packed = (largest.astype(np.uint32) << 30) | (codes[:, 0] << 20) | (codes[:, 1] << 10) | codes[:, 2]
+    return packed.astype(np.uint32)
+
+
+def unpack_quaternions(packed: np.ndarray) -> np.ndarray:
+    """Inverse of ``pack_quaternions``; unit quaternions in the packed component order."""
+    packed = packed.astype(np.uint32)
+    components = np.empty((packed.shape[0], 4), dtype=np.float32)
+    for slot, shift in ((1, 20), (2, 10), (3, 0)):
+        components[:, slot] = _ROTATION_VALUES[(packed >> shift) & 0x3FF]
+    # The others' squares sum to at most 3/4, so the largest component is well defined and |q| = 1.
+    rest = components[:, 1:]
+    components[:, 0] = np.sqrt(np.maximum(0.0, 1.0 - np.einsum("ij,ij->i", rest, rest)))
+    return np.take_along_axis(components, _QUAT_SOURCES[packed >> 30], axis=1)
+
+
+def _section_layout(count: int, chunk_count: int, sh_rest: int) -> tuple[list[int], int]:
+    sizes = [
+        chunk_count * COMPACT_CHUNK_DTYPE.itemsize,
+        count * 3 * 2,
+        count * 4,
+        count * 4,
+        count * 4,
+        count * sh_rest * 3 * 2,
+    ]
+    offsets = []
+    cursor = COMPACT_HEADER_DTYPE.itemsize
+    for size in sizes:
+        cursor = -(-cursor // _ALIGN) * _ALIGN
+        offsets.append(cursor)
+        cursor += size
+    return offsets, cursor
+
+
+@dataclass(frozen=True)
+class CompactRows:
+    """Decoded rows of a compact file (float32, renderer conventions)."""
+
+    rows: slice
+    means: np.ndarray  # (n, 3)
+    scales: np.ndarray  # (n, 3) log-scales
+    quats: np.ndarray  # (n, 4) wxyz, unit length
+    opacities: np.ndarray  # (n,) linear
+    sh_dc: np.ndarray  # (n, 3)
+    sh_rest: Optional[np.ndarray]  # (n, K, 3) or None
+
+
+@dataclass(frozen=True)
+class CompactSplats:
+    """A memory-mapped ``.nsplat`` file; every section is a zero-copy view."""
+
+    path: Path
+    count: int
+    chunk_rows: int
+    chunks: np.ndarray  # COMPACT_CHUNK_DTYPE (chunk_count,)
+    positions: np.ndarray  # (N, 3) uint16
+    scales: np.ndarray  # (N,) uint32
+    rotations: np.ndarray  # (N,) uint32
+    colors: np.ndarray  # (N, 4) uint8, RGB DC codes + opacity
+    sh: Optional[np.ndarray]  # (N, K, 3) float16
+    _mapping: Optional[mmap.mmap] = field(default=None, repr=False, compare=False)
+
+    @property
+    def chunk_count(self) -> int:
+        return int(self.chunks.shape[0])
+
+    @property
+    def sh_rest(self) -> int:
+        return 0 if self.sh is None else int(self.sh.shape[1])
+
+    def chunk_bounds(self) -> tuple[np.ndarray, np.ndarray]:
+        """Per-chunk position AABBs, ``(chunk_count, 3)`` min and max."""
+        return self.chunks["means_min"], self.chunks["means_max"]
+
+    def decode(self, chunks: slice = slice(None), *, with_sh: bool = True) -> CompactRows:
+        """Dequantize a contiguous run of chunks."""
+        table = self.chunks[chunks]
+        if table.shape[0] == 0:
+            rows = slice(0, 0)
+        else:
+            rows = slice(int(table["start"][0]), int(table["start"][-1] + table["count"][-1]))
+
+        def _decode(codes: np.ndarray, name: str, levels: np.ndarray | int) -> np.ndarray:
+            return _dequantize_chunks(codes, table[f"{name}_min"], table[f"{name}_max"], levels, self.chunk_rows)
+
+        means = _decode(self.positions[rows], "means", 65535)
+        scales = _decode(unpack_scales(self.scales[rows]), "scales", _SCALE_LEVELS)
+        colors = self.colors[rows]
+        sh_dc = _decode(colors[:, :3], "colors", 255)
+        opacities = colors[:, 3].astype(np.float32) / np.float32(255.0)
+        sh_rest = None
+        if with_sh and self.sh is not None:
+            sh_rest = self.sh[rows].astype(np.float32)
+        return CompactRows(rows, means, scales, unpack_quaternions(self.rotations[rows]), opacities, sh_dc, sh_rest)
+
+
+def write_compact(
+    path: Path,
+    means,
+    scales,
+    quats,
+    opacities,
+    sh0,
+    shN=None,
+    *,
+    chunk_rows: int = DEFAULT_COMPACT_CHUNK_ROWS,
+    keep_sh: bool = True,
+) -> int:
+    """Write a ``.nsplat`` file; returns the number of Gaussians written.
+
+    Inputs follow ``splat_io.write_splat_file`` (``quats`` wxyz). Opacities may
+    be linear or logits (see ``linear_opacities``). Rows with a NaN or Inf are
+    dropped and the rest are stored in Morton order.
+    """
+    means = _f32(means).reshape(-1, 3)
+    scales = _f32(scales).reshape(-1, 3)
+    quats = _f32(quats).reshape(-1, 4)
+    sh_dc = _f32(sh0).reshape(-1, 3)
+    rest = _f32(shN) if shN is not None and keep_sh else np.zeros((means.shape[0], 0, 3), dtype=np.float32)
+    # An explicit coefficient count keeps empty inputs (and all-dropped rows) reshapeable.
+    if rest.ndim == 3:
+        coefficients = rest.shape[1]
+    else:
+        coefficients = rest.size // (3 * means.shape[0]) if means.shape[0] else 0
+    rest = rest.reshape(means.shape[0], coefficients, 3)
+    raw_opacities = _f32(opacities).reshape(-1)
+    valid = np.flatnonzero(finite_rows(means, scales, quats, raw_opacities, sh_dc, rest if rest.shape[1] else None))
+    alphas = linear_opacities(raw_opacities)
+    order = valid[morton_order(means[valid])]
+    count = int(order.shape[0])
+    chunk_rows = max(1, int(chunk_rows))
+    chunk_count = -(-count // chunk_rows)
+    sh_rest = int(rest.shape[1])
+    offsets, total = _section_layout(count, chunk_count, sh_rest)
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    out = np.memmap(path, dtype=np.uint8, mode="w+", shape=(total,))
+    header = np.zeros((), dtype=COMPACT_HEADER_DTYPE)
+    header["magic"] = COMPACT_MAGIC
+    header["version"] = COMPACT_VERSION
+    header["flags"] = _FLAG_SH_HALF if sh_rest else 0
+    header["count"] = count
+    header["chunk_rows"] = chunk_rows
+    header["chunk_count"] = chunk_count
+    header["sh_rest"] = sh_rest
+    header["offsets"] = offsets
+    out[: COMPACT_HEADER_DTYPE.itemsize] = np.frombuffer(header.tobytes(), dtype=np.uint8)
+
+    def _section(index: int, dtype: str, shape: tuple[int, ...]) -> np.ndarray:
+        size = int(np.prod(shape)) * np.dtype(dtype).itemsize
+        return out[offsets[index] : offsets[index] + size].view(dtype).reshape(shape)
+
+    table = _section(0, COMPACT_CHUNK_DTYPE, (chunk_count,))
+    positions = _section(1, "<u2", (count, 3))
+    packed_scales = _section(2, "<u4", (count,))
+    rotations = _section(3, "<u4", (count,))
+    colors = _section(4, "u1", (count, 4))
+    sh = _section(5, "<f2", (count, sh_rest, 3)) if sh_rest else None
+
+    # Encode a group of whole chunks at a time to bound the temporaries.
+    group = max(1, DEFAULT_READ_CHUNK_ROWS // chunk_rows)
+    for first in range(0, chunk_count, group):
+        last = min(first + group, chunk_count)
+        rows = slice(first * chunk_rows, min(last * chunk_rows, count))
+        picked = order[rows]
+        starts = np.arange(0, rows.stop - rows.start, chunk_rows)
+        counts = np.diff(np.append(starts, rows.stop - rows.start))
+        block = table[first:last]
+        block["start"] = rows.start + starts
+        block["count"] = counts
+        block["reserved"] = 0
+        for name, values, levels in (
+            ("means", means[picked], 65535),
+            ("scales", scales[picked], _SCALE_LEVELS),
+            ("colors", sh_dc[picked], 255),
+        ):
+            lo = np.minimum.reduceat(values, starts, axis=0)
+            hi = np.maximum.reduceat(values, starts, axis=0)
+            block[f"{name}_min"] = lo
+            block[f"{name}_max"] = hi
+            codes = _quantize(values, np.repeat(lo, counts, axis=0), np.repeat(hi, counts, axis=0), levels)
+            if name == "means":
+                positions[rows] = codes
+            elif name == "scales":
+                packed_scales[rows] = pack_scales(codes)
+            else:
+                colors[rows, :3] = codes
+        colors[rows, 3] = np.rint(alphas[picked] * 255.0).astype(np.uint8)
+        rotations[rows] = pack_quaternions(quats[picked])
+        if sh is not None:
+            sh[rows] = rest[picked].astype(np.float16)
+    out.flush()
+    return count
+
+
+def open_compact(path: Path) -> CompactSplats:
+    """Map a ``.nsplat`` file and validate its header."""
+    path = Path(path)
+    with path.open("rb") as handle:
+        mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(mapping) < COMPACT_HEADER_DTYPE.itemsize:
+        raise ValueError(f"Not a compact splat file (too short): {path}")
+    header = np.frombuffer(mapping, dtype=COMPACT_HEADER_DTYPE, count=1)[0]
+    if bytes(header["magic"]) != COMPACT_MAGIC:
+        raise ValueError(f"Not a compact splat file (bad magic): {path}")
+    if int(header["version"]) != COMPACT_VERSION:
+        raise ValueError(f"Unsupported compact splat version {int(header['version'])}: {path}")
+    count = int(header["count"])
+    chunk_count = int(header["chunk_count"])
+    sh_rest = int(header["sh_rest"])
+    offsets = [int(value) for value in header["offsets"]]
+    expected, total = _section_layout(count, chunk_count, sh_rest)
+    if offsets != expected or len(mapping) < total:
+        raise ValueError(f"Truncated or corrupt compact splat file: {path}")
+
+    def _section(index: int, dtype: object, shape: tuple[int, ...]) -> np.ndarray:
+        items = int(np.prod(shape))
+        return np.frombuffer(mapping, dtype=dtype, count=items, offset=offsets[index]).reshape(shape)
+
+    return CompactSplats(
+        path=path,
+        count=count,
+        chunk_rows=int(header["chunk_rows"]),
+        chunks=_section(0, COMPACT_CHUNK_DTYPE, (chunk_count,)),
+        positions=_section(1, "<u2", (count, 3)),
+        scales=_section(2, "<u4", (count,)),
+        rotations=_section(3, "<u4", (count,)),
+        colors=_section(4, "u1", (count, 4)),
+        sh=_section(5, "<f2", (count, sh_rest, 3)) if sh_rest else None,
+        _mapping=mapping,
+    )
+
+
+def load_compact_viewer_arrays(path: Path) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """``(means, scales, rotations xyzw, opacities, sh_dc)`` for ``GaussianSplatViewer.set_gaussians``."""
+    decoded = open_compact(path).decode(with_sh=False)
+    rotations = np.ascontiguousarray(decoded.quats[:, [1, 2, 3, 0]])
+    return decoded.means, decoded.scales, rotations, decoded.opacities, decoded.sh_dc
+
+
+def load_compact_buffers(
+    path: Path,
+    device: torch.device | str = "cpu",
+    *,
+    chunk_rows: int = DEFAULT_READ_CHUNK_ROWS,
+) -> GaussianBuffers:
+    """Decode a ``.nsplat`` file into renderer tensors and viewer arrays (see ``load_gaussian_buffers``)."""
+    splats = open_compact(path)
+    if splats.count == 0:
+        raise ValueError("No Gaussians found in compact splat file.")
+    device = torch.device(device)
+    count = splats.count
+    coeffs = 1 + splats.sh_rest
+    means = torch.empty((count, 3), dtype=torch.float32, device=device)
+    scales = torch.empty((count, 3), dtype=torch.float32, device=device)
+    quats = torch.empty((count, 4), dtype=torch.float32, device=device)
+    opacities = torch.empty((count,), dtype=torch.float32, device=device)
+    colors = torch.zeros((count, coeffs, 3), dtype=torch.float32, device=device)
+    viewer_means = np.empty((count, 3), dtype=np.float32)
+    viewer_scales = np.empty((count, 3), dtype=np.float32)
+    viewer_rotations = np.empty((count, 4), dtype=np.float32)
+    viewer_sh_dc = np.empty((count, 3), dtype=np.float32)
+
+    group = max(1, int(chunk_rows) // max(1, splats.chunk_rows))
+    for first in range(0, splats.chunk_count, group):
+        decoded = splats.decode(slice(first, first + group))
+        rows = decoded.rows
+        means[rows].copy_(torch.from_numpy(decoded.means))
+        scales[rows].copy_(torch.from_numpy(decoded.scales))
+        quats[rows].copy_(torch.from_numpy(decoded.quats))
+        opacities[rows].copy_(torch.from_numpy(decoded.opacities))
+        colors[rows, 0].copy_(torch.from_numpy(decoded.sh_dc))
+        if decoded.sh_rest is not None:
+            colors[rows, 1:].copy_(torch.from_numpy(decoded.sh_rest))
+        viewer_means[rows] = decoded.means
+        viewer_scales[rows] = decoded.scales
+        viewer_rotations[rows] = decoded.quats[:, [1, 2, 3, 0]]
+        viewer_sh_dc[rows] = decoded.sh_dc
+    return GaussianBuffers(
+        means,
+        scales,
+        quats,
+        opacities,
+        colors,
+        viewer_means,
+        viewer_scales,
+        viewer_rotations,
+        viewer_sh_dc,
+    )
+
+
+def convert_ply_to_compact(
+    source: Path,
+    target: Optional[Path] = None,
+    *,
+    chunk_rows: int = DEFAULT_COMPACT_CHUNK_ROWS,
+    keep_sh: bool = True,
+) -> Path:
+    """Convert a 3DGS PLY to ``.nsplat`` (next to the source unless ``target`` is given)."""
+    source = Path(source)
+    target = Path(target) if target is not None else source.with_suffix(COMPACT_SUFFIX)
+    vertices = open_ply(source)
+    rest = vertices.rest_names() if keep_sh else []
+    if len(rest) % 3 != 0:
+        raise ValueError("f_rest properties must be divisible by 3 for SH coefficients.")
+    names = ["x", "y", "z", "scale_0", "scale_1", "scale_2", "rot_0", "rot_1", "rot_2", "rot_3", "opacity"]
+    names += ["f_dc_0", "f_dc_1", "f_dc_2", *rest]
+    block = vertices.read(names, slice(0, vertices.count))
+    # PLY stores f_rest channel-major; the renderer reads it row-major as (K, 3) (see load_gaussian_buffers).
+    sh_rest = block[:, 14:].reshape(-1, len(rest) // 3, 3) if rest else None
+    staging = target.with_name(f".{target.name}.tmp")
+    try:
+        written = write_compact(
+            staging,
+            block[:, 0:3],
+            block[:, 3:6],
+            block[:, 6:10],
+            block[:, 10],
+            block[:, 11:14],
+            sh_rest,
+            chunk_rows=chunk_rows,
+            keep_sh=keep_sh,
+        )
+        staging.replace(target)
+    finally:
+        staging.unlink(missing_ok=True)
+    _LOGGER.info("Converted %s to %s gaussians=%d bytes=%d", source, target, written, target.stat().st_size)
+    return target
+
+
+__all__ = [
+    "COMPACT_CHUNK_DTYPE",
+    "COMPACT_HEADER_DTYPE",
+    "COMPACT_MAGIC",
+    "COMPACT_SUFFIX",
+    "COMPACT_VERSION",
+    "CompactRows",
+    "CompactSplats",
+    "DEFAULT_COMPACT_CHUNK_ROWS",
+    "convert_ply_to_compact",
+    "linear_opacities",
+    "load_compact_buffers",
+    "load_compact_viewer_arrays",
+    "open_compact",
+    "pack_quaternions",
+    "pack_scales",
+    "unpack_quaternions",
+    "unpack_scales",
+    "write_compact",
+]
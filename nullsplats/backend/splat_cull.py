@@ -0,0 +1,71 @@
+"""View-dependent culling for the OpenGL splat viewer.
+
+``cull_splats`` runs before the viewer's depth sort, so only the splats that
+can reach the screen are sorted, interleaved and uploaded. A splat is kept
+when its center is in front of the camera, its normalized device coordinates
+lie within ``ndc_limit`` on every axis (the vertex shader discards centers
+beyond ``CULL_NDC_LIMIT``, so that value drops nothing the shader would
+draw), and its largest 3-sigma axis projects to at least ``min_radius_px``
+pixels. Scales see the shader's multiplier and (at most) its ``scale_bias``.
+
+Matrices use the viewer's conventions: an OpenGL look-at ``view`` (camera
+looking down -z) and a perspective ``projection``, both row-major. The work is
+a handful of torch ops on ``device``, so the view-space depths come back
+ready for the sort.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+import torch
+
+
+# Matches CULL_THRESHOLD in ui/shaders/gaussian_splat.vert.
+CULL_NDC_LIMIT = 1.3
+# Splats whose 3-sigma radius is below this many pixels are dropped before upload.
+DEFAULT_MIN_RADIUS_PX = 0.5
+
+
+def _tensor(values: object, device: torch.device) -> torch.Tensor:
+    if isinstance(values, torch.Tensor):
+        return values.to(device=device, dtype=torch.float32)
+    return torch.from_numpy(np.ascontiguousarray(values, dtype=np.float32)).to(device)
+
+
+def cull_splats(
+    means: np.ndarray | torch.Tensor,
+    scales: np.ndarray | torch.Tensor,
+    view: np.ndarray,
+    projection: np.ndarray,
+    viewport_height: float,
+    *,
+    ndc_limit: float = CULL_NDC_LIMIT,
+    min_radius_px: float = DEFAULT_MIN_RADIUS_PX,
+    scale_bias: Optional[np.ndarray] = None,
+    scale_multiplier: float = 1.0,
+    device: Optional[torch.device] = None,
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """Indices of the splats that survive culling and their view-space z, both on ``device``."""
+    device = device or torch.device("cpu")
+    means_t = _tensor(means, device).reshape(-1, 3)
+    view_t = _tensor(view, device)
+    # One affine map gives clip coordinates (rows 0-3) and view-space z (row 4).
+    transform = torch.cat([_tensor(projection, device) @ view_t, view_t[2:3]], dim=0)
+    projected = torch.addmm(transform[:, 3], means_t, transform[:, :3].T)
+    w = projected[:, 3]
+    keep = (projected[:, :3].abs() <= (float(ndc_limit) * w)[:, None]).all(dim=1) & (w > 0)
+    if min_radius_px > 0:
+        focal = float(viewport_height) * 0.5 * float(projection[1, 1])
+        # The largest per-axis bias bounds max(scale + bias) from above, so this never drops a splat the
+        # exact test would keep; 3 * sigma * focal / depth >= min_radius is rearranged to avoid dividing by w.
+        bias = float(np.max(scale_bias)) if scale_bias is not None else 0.0
+        scale = 3.0 * float(scale_multiplier) * focal * float(np.exp(bias))
+        sigma = torch.exp(torch.amax(_tensor(scales, device).reshape(-1, 3), dim=1))
+        keep &= sigma * scale >= float(min_radius_px) * w
+    visible = torch.nonzero(keep).squeeze(1)
+    return visible, projected[visible, 4]
+
+
+__all__ = ["CULL_NDC_LIMIT", "DEFAULT_MIN_RADIUS_PX", "cull_splats"]
@@ -0,0 +1,553 @@
+"""Gaussian splat file I/O.
+
+Writers: binary PLY (the 3DGS / INRIA layout) and antimatter15 ``.splat`` written
+straight from NumPy arrays, without importing gsplat or its CUDA extension,
+so checkpoints can be exported and converted on CPU-only hosts. Output is
+byte-for-byte what ``gsplat.export_splats`` produces for the same inputs;
+the ``.splat`` exp/sigmoid and Morton sort run through torch's CPU kernels
+so last-ulp rounding and tie order match.
+
+Each chunk of rows is packed into one structured array and written with a
+single ``tofile`` call. ``chunk_size`` bounds the working memory, so tens of
+millions of Gaussians (or memory-mapped inputs) stream through a fixed-size
+buffer.
+
+Inputs follow ``gsplat.export_splats``: ``means``/``scales`` ``(N, 3)``,
+``quats`` ``(N, 4)`` wxyz, ``opacities`` ``(N,)``, ``sh0`` ``(N, 1, 3)`` and
+``shN`` ``(N, K, 3)``. Values are written as given; callers decide whether
+scales are log-space or opacities are logits. Rows with a NaN or Inf in any
+input are dropped.
+
+Reader: ``open_ply`` is the one PLY parser for the backend and the viewer. It
+memory-maps a binary body (little- or big-endian) as a structured array, so
+``PlyVertices.column`` is a zero-copy view, and parses ASCII bodies in one
+vectorized ``np.loadtxt`` pass. ``PlyVertices.columns`` hands out native-endian
+columnar arrays. ``load_gaussian_buffers`` walks the vertices in fixed-size
+row chunks and fills device tensors for the renderer plus the host arrays
+the OpenGL viewer uploads. Pages already consumed are dropped from the
+process with ``madvise`` where available, so peak memory is the output
+buffers plus one chunk rather than several copies of the file.
+
+The quantized ``.nsplat`` format lives in ``splat_compact``; ``write_splat_file``
+and ``load_gaussian_buffers`` dispatch to it. It is lossy, so it is only
+written as a preview sidecar next to PLY checkpoints and is not one of the
+``SPLAT_FORMATS`` offered for checkpoints and exports.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import io
+import mmap
+from pathlib import Path
+from typing import Iterable, Optional
+
+import numpy as np
+import torch
+
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.splat_io")
+SH_C0 = 0.28209479177387814
+DEFAULT_CHUNK_ROWS = 1 << 20
+DEFAULT_READ_CHUNK_ROWS = 1 << 18
+_PLY_TYPES = {
+    "char": "i1",
+    "int8": "i1",
+    "uchar": "u1",
+    "uint8": "u1",
+    "short": "i2",
+    "int16": "i2",
+    "ushort": "u2",
+    "uint16": "u2",
+    "int": "i4",
+    "int32": "i4",
+    "uint": "u4",
+    "uint32": "u4",
+    "float": "f4",
+    "float32": "f4",
+    "double": "f8",
+    "float64": "f8",
+}
+_PLY_BYTE_ORDERS = {"ascii": "=", "binary_little_endian": "<", "binary_big_endian": ">"}
+SPLAT_FORMATS = ("ply", "splat")
+SPLAT_RECORD_DTYPE = np.dtype(
+    [("position", "<f4", (3,)), ("scale", "<f4", (3,)), ("color", "u1", (4,)), ("rotation", "u1", (4,))]
+)
+
+
+def ply_property_names(rest_count: int) -> list[str]:
+    """Vertex property order of a 3DGS PLY with ``rest_count`` ``f_rest_*`` values."""
+    return [
+        "x",
+        "y",
+        "z",
+        "f_dc_0",
+        "f_dc_1",
+        "f_dc_2",
+        *(f"f_rest_{idx}" for idx in range(rest_count)),
+        "opacity",
+        "scale_0",
+        "scale_1",
+        "scale_2",
+        "rot_0",
+        "rot_1",
+        "rot_2",
+        "rot_3",
+    ]
+
+
+def ply_vertex_dtype(rest_count: int) -> np.dtype:
+    return np.dtype([(name, "<f4") for name in ply_property_names(rest_count)])
+
+
+def ply_header(count: int, rest_count: int) -> bytes:
+    lines = ["ply", "format binary_little_endian 1.0", f"element vertex {count}"]
+    lines.extend(f"property float {name}" for name in ply_property_names(rest_count))
+    lines.append("end_header")
+    return ("\n".join(lines) + "\n").encode("ascii")
+
+
+def _f32(values: object) -> np.ndarray:
+    if hasattr(values, "detach"):
+        values = values.detach().cpu().numpy()
+    return np.asarray(values, dtype=np.float32)
+
+
+def _check_shapes(means, scales, quats, opacities, sh0, shN) -> int:
+    count = means.shape[0]
+    expected = {
+        "means": (means, (count, 3)),
+        "scales": (scales, (count, 3)),
+        "quats": (quats, (count, 4)),
+        "opacities": (opacities, (count,)),
+        "sh0": (sh0, (count, 1, 3)),
+    }
+    for name, (array, shape) in expected.items():
+        if tuple(array.shape) != shape:
+            raise ValueError(f"{name} must have shape {shape}, got {tuple(array.shape)}")
+    if shN is not None and (len(shN.shape) != 3 or shN.shape[0] != count or shN.shape[2] != 3):
+        raise ValueError(f"shN must have shape (N, K, 3), got {tuple(shN.shape)}")
+    return count
+
+
+def _chunks(count: int, chunk_size: Optional[int]):
+    step = chunk_size if chunk_size and chunk_size > 0 else max(count, 1)
+    for start in range(0, count, step):
+        yield slice(start, min(start + step, count))
+
+
+def finite_rows(
+    means, scales, quats, opacities, sh0, shN=None, *, chunk_size: Optional[int] = DEFAULT_CHUNK_ROWS
+) -> np.ndarray:
+    """Boolean mask of rows whose inputs are all finite."""
+    count = means.shape[0]
+    mask = np.empty(count, dtype=bool)
+    for rows in _chunks(count, chunk_size):
+        ok = np.isfinite(_f32(opacities[rows]))
+        for array in (means, scales, quats, sh0, shN):
+            if array is None:
+                continue
+            block = _f32(array[rows])
+            ok &= np.isfinite(block.reshape(block.shape[0], -1)).all(axis=1)
+        mask[rows] = ok
+    return mask
+
+
+def pack_ply_rows(means, scales, quats, opacities, sh0, shN) -> np.ndarray:
+    """One structured PLY vertex record per row."""
+    means, scales, quats, opacities, sh0 = (_f32(a) for a in (means, scales, quats, opacities, sh0))
+    shN = _f32(shN)
+    count = means.shape[0]
+    rest_count = shN.shape[1] * 3
+    records = np.empty(count, dtype=ply_vertex_dtype(rest_count))
+    flat = records.view(np.float32).reshape(count, -1)
+    flat[:, 0:3] = means
+    flat[:, 3:6] = sh0.reshape(count, 3)
+    # f_rest is channel-major: all R coefficients, then G, then B.
+    flat[:, 6 : 6 + rest_count] = shN.transpose(0, 2, 1).reshape(count, rest_count)
+    column = 6 + rest_count
+    flat[:, column] = opacities
+    flat[:, column + 1 : column + 4] = scales
+    flat[:, column + 4 : column + 8] = quats
+    return records
+
+
+def _spread_bits(values: np.ndarray) -> np.ndarray:
+    """Interleave the low 10 bits of ``values`` with two zero bits each (one Morton axis)."""
+    values = values & 0x000003FF
+    values = (values ^ (values << 16)) & 0xFF0000FF
+    values = (values ^ (values << 8)) & 0x0300F00F
+    values = (values ^ (values << 4)) & 0x030C30C3
+    return (values ^ (values << 2)) & 0x09249249
+
+
+def morton_order(means: np.ndarray) -> np.ndarray:
+    """Permutation sorting points along a 10-bit-per-axis Morton curve (gsplat ``sort_centers``)."""
+    centers = _f32(means)
+    if centers.shape[0] == 0:
+        return np.zeros(0, dtype=np.int64)
+    low = centers.min(axis=0)
+    extent = centers.max(axis=0) - low
+    extent[extent == 0] = 1
+    cells = np.floor((centers - low) / extent * np.float32(1024)).astype(np.int64)
+    codes = (_spread_bits(cells[:, 2]) << 2) + (_spread_bits(cells[:, 1]) << 1) + _spread_bits(cells[:, 0])
+    # Equal codes are common; torch's sort breaks ties the way gsplat's files do.
+    return torch.argsort(torch.from_numpy(codes.astype(np.int32))).numpy()
+
+
+def pack_splat_rows(means, scales, quats, opacities, sh0) -> np.ndarray:
+    """One 32-byte ``.splat`` record per row: position, exp(scale), RGBA8, quaternion8."""
+    means, scales, quats, opacities, sh0 = (_f32(a) for a in (means, scales, quats, opacities, sh0))
+    count = means.shape[0]
+    records = np.empty(count, dtype=SPLAT_RECORD_DTYPE)
+    records["position"] = means
+    # exp/sigmoid go through torch's CPU kernels: NumPy's float32 exp rounds differently in the last ulp.
+    records["scale"] = torch.from_numpy(np.ascontiguousarray(scales)).exp().numpy()
+    rgba = np.empty((count, 4), dtype=np.float32)
+    rgba[:, :3] = sh0.reshape(count, 3) * np.float32(SH_C0) + np.float32(0.5)
+    rgba[:, 3] = torch.from_numpy(np.ascontiguousarray(opacities)).sigmoid().numpy()
+    records["color"] = np.clip(rgba * np.float32(255), 0, 255).astype(np.uint8)
+    norms = np.sqrt(np.square(quats).sum(axis=1, keepdims=True))
+    records["rotation"] = np.clip(quats / norms * np.float32(128) + np.float32(128), 0, 255).astype(np.uint8)
+    return records
+
+
+def write_ply(
+    path: Path,
+    means,
+    scales,
+    quats,
+    opacities,
+    sh0,
+    shN,
+    *,
+    chunk_size: Optional[int] = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Write a binary little-endian 3DGS PLY; returns the number of vertices written."""
+    _check_shapes(means, scales, quats, opacities, sh0, shN)
+    valid = finite_rows(means, scales, quats, opacities, sh0, shN, chunk_size=chunk_size)
+    written = int(valid.sum())
+    with Path(path).open("wb") as handle:
+        handle.write(ply_header(written, shN.shape[1] * 3))
+        for rows in _chunks(means.shape[0], chunk_size):
+            keep = valid[rows]
+            if not keep.any():
+                continue
+            block = [array[rows] for array in (means, scales, quats, opacities, sh0, shN)]
+            if not keep.all():
+                block = [_f32(array)[keep] for array in block]
+            pack_ply_rows(*block).tofile(handle)
+    return written
+
+
+def write_splat(
+    path: Path,
+    means,
+    scales,
+    quats,
+    opacities,
+    sh0,
+    *,
+    chunk_size: Optional[int] = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Write an antimatter15 ``.splat`` file in Morton order; returns the number of records."""
+    _check_shapes(means, scales, quats, opacities, sh0, None)
+    valid_index = np.flatnonzero(finite_rows(means, scales, quats, opacities, sh0, chunk_size=chunk_size))
+    order = valid_index[morton_order(_f32(means)[valid_index])]
+    with Path(path).open("wb") as handle:
+        for rows in _chunks(order.shape[0], chunk_size):
+            picked = order[rows]
+            pack_splat_rows(*(_f32(array)[picked] for array in (means, scales, quats, opacities, sh0))).tofile(handle)
+    return int(order.shape[0])
+
+
+def write_splat_file(
+    path: Path,
+    fmt: str,
+    means,
+    scales,
+    quats,
+    opacities,
+    sh0,
+    shN,
+    *,
+    chunk_size: Optional[int] = DEFAULT_CHUNK_ROWS,
+) -> int:
+    """Write ``fmt`` (a ``SPLAT_FORMATS`` entry or the ``"nsplat"`` sidecar); the ``export_splats`` equivalent."""
+    if fmt == "ply":
+        return write_ply(path, means, scales, quats, opacities, sh0, shN, chunk_size=chunk_size)
+    if fmt == "splat":
+        return write_splat(path, means, scales, quats, opacities, sh0, chunk_size=chunk_size)
+    if fmt == "nsplat":
+        from nullsplats.backend.splat_compact import write_compact
+
+        return write_compact(path, means, scales, quats, opacities, sh0, shN)
+    raise ValueError(f"Unsupported splat format: {fmt}")
+
+
+@dataclass(frozen=True)
+class PlyVertices:
+    """The vertex element of a PLY file; binary bodies stay memory-mapped."""
+
+    path: Path
+    count: int
+    binary: bool
+    data: np.ndarray  # structured (count,) array, in the file's byte order
+    body_offset: int
+    _mapping: Optional[mmap.mmap] = field(default=None, repr=False, compare=False)
+
+    @property
+    def names(self) -> tuple[str, ...]:
+        return tuple(self.data.dtype.names or ())
+
+    def column(self, name: str) -> np.ndarray:
+        """Zero-copy (strided) view of one property, in the file's byte order."""
+        if name not in self.names:
+            raise KeyError(f"Property {name} missing from splat file.")
+        return self.data[name]
+
+    def columns(self, names: Optional[Iterable[str]] = None) -> dict[str, np.ndarray]:
+        """Properties as contiguous native-endian arrays (all of them by default)."""
+        selected = self.names if names is None else tuple(names)
+        result: dict[str, np.ndarray] = {}
+        for name in selected:
+            values = self.column(name)
+            result[name] = np.ascontiguousarray(values, dtype=values.dtype.newbyteorder("="))
+        return result
+
+    def rest_names(self) -> list[str]:
+        """``f_rest_*`` properties in coefficient order."""
+        rest = [name for name in self.names if name.startswith("f_rest_")]
+        return sorted(rest, key=lambda name: int(name.split("_")[-1]))
+
+    def read(self, names: Iterable[str], rows: slice, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Copy ``names`` for ``rows`` into a float32 ``(rows, len(names))`` block."""
+        names = list(names)
+        for name in names:
+            if name not in self.names:
+                raise KeyError(f"Property {name} missing from splat file.")
+        block = self.data[rows]
+        if out is None:
+            out = np.empty((block.shape[0], len(names)), dtype=np.float32)
+        fields = self.data.dtype.fields
+        base = fields[self.names[0]][0]
+        if all(fields[name][0] == base for name in self.names):
+            # Uniform records (the 3DGS layout): one gather over a (rows, properties) view.
+            columns = [self.names.index(name) for name in names]
+            matrix = block.view(base).reshape(block.shape[0], len(self.names))
+            if base == np.dtype(np.float32):
+                np.take(matrix, columns, axis=1, out=out)
+            else:
+                out[:] = matrix[:, columns]
+        else:
+            for idx, name in enumerate(names):
+                out[:, idx] = block[name]
+        return out
+
+    def release(self, rows: slice) -> None:
+        """Let the OS drop mapped pages for ``rows`` (already consumed) from this process."""
+        if self._mapping is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        itemsize = self.data.dtype.itemsize
+        start = self.body_offset + rows.start * itemsize
+        stop = self.body_offset + rows.stop * itemsize
+        page_start = start - start % mmap.PAGESIZE
+        page_stop = stop - stop % mmap.PAGESIZE
+        if page_stop > page_start:
+            try:
+                self._mapping.madvise(mmap.MADV_DONTNEED, page_start, page_stop - page_start)
+            except (OSError, ValueError):
+                pass
+
+
+def _read_ply_header(path: Path) -> tuple[list[str], int]:
+    with path.open("rb") as handle:
+        header_lines: list[str] = []
+        while True:
+            line_bytes = handle.readline()
+            if not line_bytes:
+                raise ValueError("Invalid PLY: missing end_header.")
+            line = line_bytes.decode("ascii", errors="ignore").strip()
+            header_lines.append(line)
+            if line == "end_header":
+                return header_lines, handle.tell()
+
+
+def _parse_ascii_vertices(body: bytes, dtype: np.dtype, count: int) -> np.ndarray:
+    """Parse ``count`` whitespace-separated rows in one pass, then cast each column to its type."""
+    data = np.empty(count, dtype=dtype)
+    if count == 0:
+        return data
+    try:
+        # Later elements (faces) follow the vertices; max_rows stops before them and usecols
+        # drops trailing list properties. Blank lines are skipped.
+        values = np.loadtxt(
+            io.BytesIO(body), dtype=np.float64, usecols=range(len(dtype.names)), max_rows=count, ndmin=2
+        )
+    except ValueError as exc:
+        raise ValueError(f"Invalid ASCII PLY vertex data: {exc}") from exc
+    if values.shape[0] != count:
+        raise ValueError(f"Expected {count} vertices, parsed {values.shape[0]}.")
+    for idx, name in enumerate(dtype.names):
+        # astype truncates toward zero for integer properties, like int(float(token)).
+        data[name] = values[:, idx].astype(dtype.fields[name][0])
+    return data
+
+
+def open_ply(path: Path) -> PlyVertices:
+    """Parse the header and map the vertex element (vertex must be the first element).
+
+    Binary bodies of either byte order are mapped in place; ASCII bodies are
+    parsed into memory.
+    """
+    path = Path(path)
+    header_lines, body_offset = _read_ply_header(path)
+    fmt = next((line.split() for line in header_lines if line.startswith("format ")), [])
+    byte_order = _PLY_BYTE_ORDERS.get(fmt[1]) if len(fmt) > 1 else None
+    if byte_order is None:
+        raise ValueError(f"Unsupported PLY format: {' '.join(fmt[1:]) or '<missing>'}")
+    binary_format = fmt[1] != "ascii"
+
+    vertex_count = 0
+    props: list[tuple[str, str]] = []
+    current_element = None
+    for line in header_lines:
+        parts = line.split()
+        if line.startswith("element"):
+            current_element = parts[1] if len(parts) > 1 else None
+            if current_element == "vertex" and len(parts) > 2:
+                vertex_count = int(parts[2])
+            continue
+        if line.startswith("property") and current_element == "vertex" and len(parts) >= 3:
+            mapped = _PLY_TYPES.get(parts[1])
+            if mapped:
+                props.append((parts[2], byte_order + mapped))
+    if not props:
+        raise ValueError("No vertex properties found in PLY header.")
+    dtype = np.dtype(props)
+
+    mapping = None
+    if binary_format:
+        with path.open("rb") as handle:
+            if vertex_count and path.stat().st_size > body_offset:
+                mapping = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        available = (len(mapping) - body_offset) // dtype.itemsize if mapping is not None else 0
+        if available < vertex_count:
+            raise ValueError(f"Expected {vertex_count} vertices, parsed {available}.")
+        if mapping is None:
+            data = np.empty(0, dtype=dtype)
+        else:
+            data = np.frombuffer(mapping, dtype=dtype, count=vertex_count, offset=body_offset)
+    else:
+        with path.open("rb") as handle:
+            handle.seek(body_offset)
+            data = _parse_ascii_vertices(handle.read(), dtype, vertex_count)
+    return PlyVertices(path, vertex_count, binary_format, data, body_offset, mapping)
+
+
+@dataclass(frozen=True)
+class GaussianBuffers:
+    """Splat parameters on the render device plus host arrays for the OpenGL viewer."""
+
+    means: torch.Tensor  # (N, 3)
+    scales_log: torch.Tensor  # (N, 3)
+    quats: torch.Tensor  # (N, 4) wxyz, unit length
+    opacities: torch.Tensor  # (N,) as stored in the file
+    colors: torch.Tensor  # (N, 1 + K, 3) SH coefficients, band 0 first
+    viewer_means: np.ndarray  # (N, 3) float32
+    viewer_scales: np.ndarray  # (N, 3)
+    viewer_rotations: np.ndarray  # (N, 4) xyzw
+    viewer_sh_dc: np.ndarray  # (N, 3)
+
+
+def load_gaussian_buffers(
+    path: Path,
+    device: torch.device | str = "cpu",
+    *,
+    chunk_rows: int = DEFAULT_READ_CHUNK_ROWS,
+) -> GaussianBuffers:
+    """Fill renderer tensors and viewer arrays from a 3DGS PLY, ``chunk_rows`` vertices at a time.
+
+    ``.nsplat`` files are decoded by ``splat_compact.load_compact_buffers``.
+    """
+    if Path(path).suffix.lower() == ".nsplat":
+        from nullsplats.backend.splat_compact import load_compact_buffers
+
+        return load_compact_buffers(path, device, chunk_rows=chunk_rows)
+    vertices = open_ply(path)
+    if vertices.count == 0:
+        raise ValueError("No vertices found in PLY header.")
+    device = torch.device(device)
+    count = vertices.count
+    rest = vertices.rest_names()
+    if len(rest) % 3 != 0:
+        raise ValueError("f_rest properties must be divisible by 3 for SH coefficients.")
+    coeffs = 1 + len(rest) // 3
+    names = ["x", "y", "z", "scale_0", "scale_1", "scale_2", "rot_0", "rot_1", "rot_2", "rot_3", "opacity"]
+    names += ["f_dc_0", "f_dc_1", "f_dc_2", *rest]
+
+    means = torch.empty((count, 3), dtype=torch.float32, device=device)
+    scales = torch.empty((count, 3), dtype=torch.float32, device=device)
+    quats = torch.empty((count, 4), dtype=torch.float32, device=device)
+    opacities = torch.empty((count,), dtype=torch.float32, device=device)
+    colors = torch.empty((count, coeffs, 3), dtype=torch.float32, device=device)
+    viewer_means = np.empty((count, 3), dtype=np.float32)
+    viewer_scales = np.empty((count, 3), dtype=np.float32)
+    viewer_rotations = np.empty((count, 4), dtype=np.float32)
+    viewer_sh_dc = np.empty((count, 3), dtype=np.float32)
+
+    step = max(1, int(chunk_rows))
+    staging = np.empty((min(step, count), len(names)), dtype=np.float32)
+    for start in range(0, count, step):
+        rows = slice(start, min(start + step, count))
+        block = vertices.read(names, rows, out=staging[: rows.stop - rows.start])
+        host = torch.from_numpy(block)
+        unit_quats = torch.nn.functional.normalize(host[:, 6:10], dim=1)
+        means[rows].copy_(host[:, 0:3])
+        scales[rows].copy_(host[:, 3:6])
+        quats[rows].copy_(unit_quats)
+        opacities[rows].copy_(host[:, 10])
+        colors[rows, 0].copy_(host[:, 11:14])
+        if rest:
+            colors[rows, 1:].copy_(host[:, 14:].reshape(-1, coeffs - 1, 3))
+        viewer_means[rows] = block[:, 0:3]
+        viewer_scales[rows] = block[:, 3:6]
+        viewer_rotations[rows] = unit_quats.numpy()[:, [1, 2, 3, 0]]
+        viewer_sh_dc[rows] = block[:, 11:14]
+        vertices.release(rows)
+    return GaussianBuffers(
+        means,
+        scales,
+        quats,
+        opacities,
+        colors,
+        viewer_means,
+        viewer_scales,
+        viewer_rotations,
+        viewer_sh_dc,
+    )
+
+
+__all__ = [
+    "DEFAULT_CHUNK_ROWS",
+    "DEFAULT_READ_CHUNK_ROWS",
+    "GaussianBuffers",
+    "PlyVertices",
+    "SH_C0",
+    "SPLAT_FORMATS",
+    "SPLAT_RECORD_DTYPE",
+    "finite_rows",
+    "load_gaussian_buffers",
+    "morton_order",
+    "open_ply",
+    "pack_ply_rows",
+    "pack_splat_rows",
+    "ply_header",
+    "ply_property_names",
+    "ply_vertex_dtype",
+    "write_ply",
+    "write_splat",
+    "write_splat_file",
+]
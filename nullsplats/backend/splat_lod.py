@@ -0,0 +1,350 @@
+"""Level-of-detail hierarchy for the OpenGL splat viewer.
+
+``build_splat_lod`` sorts the Gaussians along a Morton curve over the scene's
+bounding cube, which lays out an implicit octree: the Gaussians of every cell
+at every level are one contiguous run. Starting from the deepest level whose
+cells average ``leaf_size`` Gaussians, each occupied cell is merged into one
+proxy Gaussian, and parent cells merge their children's sums. Merging is
+moment matching weighted by opacity times footprint area (``alpha * s_mid *
+s_max``): the proxy keeps the weighted mean, the covariance of the mixture
+(eigen-decomposed back into log-scales and a quaternion), the weighted DC
+color and an opacity that spreads the children's coverage over its own area.
+
+The hierarchy keeps only the Morton permutation and the proxy rows; the
+original Gaussians stay in the caller's arrays, and ``SplatLod.take`` gathers
+a cut from both.
+
+``SplatLod.select`` cuts the tree for one camera. A node is fine enough when
+the diagonal of its points' bounding box projects to at most
+``pixel_threshold`` pixels; the cut takes every fine node whose parent is not,
+plus the original Gaussians under leaf cells that are still too coarse. A
+child's box lies inside its parent's, so its projected size is never larger
+and every Gaussian is covered exactly once. ``max_splats`` doubles the
+threshold until the cut fits a budget.
+
+Arrays follow ``GaussianSplatViewer.set_gaussians``: log-scales, xyzw
+quaternions, linear opacities. Everything runs in NumPy on the host without
+an OpenGL context, so the hierarchy is built on the loader thread and can be
+checked headless (``bench.py lod``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import time
+from typing import Optional
+
+import numpy as np
+
+from nullsplats.backend.splat_io import _f32, _spread_bits
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.splat_lod")
+DEFAULT_LOD_LEAF_SIZE = 8
+DEFAULT_LOD_PIXEL_THRESHOLD = 1.5
+LOD_MAX_DEPTH = 10
+# Below this many Gaussians the viewer draws everything; the hierarchy is not worth its memory.
+LOD_MIN_GAUSSIANS = 250_000
+_STATS_CHUNK_ROWS = 1 << 18
+# Per-node sums: weight, coverage, weighted mean (3), weighted second moment (9), weighted color (3).
+_STATS_WIDTH = 17
+
+
+def quaternion_matrices(quats: np.ndarray) -> np.ndarray:
+    """``(N, 3, 3)`` float64 rotation matrices for xyzw quaternions (normalized first)."""
+    q = np.asarray(quats, dtype=np.float64).reshape(-1, 4)
+    norms = np.linalg.norm(q, axis=1, keepdims=True)
+    q = q / np.where(norms > 0, norms, 1.0)
+    x, y, z, w = q.T
+    matrices = np.empty((q.shape[0], 3, 3), dtype=np.float64)
+    matrices[:, 0, 0] = 1 - 2 * (y * y + z * z)
+    matrices[:, 0, 1] = 2 * (x * y - w * z)
+    matrices[:, 0, 2] = 2 * (x * z + w * y)
+    matrices[:, 1, 0] = 2 * (x * y + w * z)
+    matrices[:, 1, 1] = 1 - 2 * (x * x + z * z)
+    matrices[:, 1, 2] = 2 * (y * z - w * x)
+    matrices[:, 2, 0] = 2 * (x * z - w * y)
+    matrices[:, 2, 1] = 2 * (y * z + w * x)
+    matrices[:, 2, 2] = 1 - 2 * (x * x + y * y)
+    return matrices
+
+
+def matrix_quaternions(matrices: np.ndarray) -> np.ndarray:
+    """xyzw quaternions for ``(N, 3, 3)`` rotation matrices (Shepperd's method, w >= 0)."""
+    m = np.asarray(matrices, dtype=np.float64).reshape(-1, 3, 3)
+    m00, m11, m22 = m[:, 0, 0], m[:, 1, 1], m[:, 2, 2]
+    # Build from the largest of 4w^2, 4x^2, 4y^2, 4z^2 to keep the division well conditioned.
+    squares = np.stack([1 + m00 + m11 + m22, 1 + m00 - m11 - m22, 1 - m00 + m11 - m22, 1 - m00 - m11 + m22], axis=1)
+    pick = squares.argmax(axis=1)
+    root = np.sqrt(np.maximum(squares[np.arange(m.shape[0]), pick], 1e-12))
+    half = 0.5 / root
+    quats = np.empty((m.shape[0], 4), dtype=np.float64)
+    w_case = pick == 0
+    x_case = pick == 1
+    y_case = pick == 2
+    z_case = pick == 3
+    quats[w_case, 3] = 0.5 * root[w_case]
+    quats[w_case, 0] = (m[w_case, 2, 1] - m[w_case, 1, 2]) * half[w_case]
+    quats[w_case, 1] = (m[w_case, 0, 2] - m[w_case, 2, 0]) * half[w_case]
+    quats[w_case, 2] = (m[w_case, 1, 0] - m[w_case, 0, 1]) * half[w_case]
+    quats[x_case, 3] = (m[x_case, 2, 1] - m[x_case, 1, 2]) * half[x_case]
+    quats[x_case, 0] = 0.5 * root[x_case]
+    quats[x_case, 1] = (m[x_case, 0, 1] + m[x_case, 1, 0]) * half[x_case]
+    quats[x_case, 2] = (m[x_case, 0, 2] + m[x_case, 2, 0]) * half[x_case]
+    quats[y_case, 3] = (m[y_case, 0, 2] - m[y_case, 2, 0]) * half[y_case]
+    quats[y_case, 0] = (m[y_case, 0, 1] + m[y_case, 1, 0]) * half[y_case]
+    quats[y_case, 1] = 0.5 * root[y_case]
+    quats[y_case, 2] = (m[y_case, 1, 2] + m[y_case, 2, 1]) * half[y_case]
+    quats[z_case, 3] = (m[z_case, 1, 0] - m[z_case, 0, 1]) * half[z_case]
+    quats[z_case, 0] = (m[z_case, 0, 2] + m[z_case, 2, 0]) * half[z_case]
+    quats[z_case, 1] = (m[z_case, 1, 2] + m[z_case, 2, 1]) * half[z_case]
+    quats[z_case, 2] = 0.5 * root[z_case]
+    quats *= np.where(quats[:, 3:4] < 0, -1.0, 1.0)
+    return quats.astype(np.float32)
+
+
+@dataclass(frozen=True)
+class SplatLod:
+    """Proxy Gaussians of levels ``0..depth`` over ``count`` original Gaussians.
+
+    ``order`` is the Morton permutation of the originals; the ``i``-th original
+    in that order lies in the leaf cell of proxy ``leaf_parents[i]``. Proxy
+    ``p`` has parent ``proxy_parents[p]`` (-1 at the root), and the proxies of
+    level ``l`` are ``level_offsets[l]:level_offsets[l + 1]``. ``select``
+    returns rows in a combined index space: ``i < count`` is original row
+    ``i`` of the caller's arrays, ``count + p`` is proxy ``p``.
+    """
+
+    count: int
+    order: np.ndarray  # (count,) int64 Morton permutation of the originals
+    means: np.ndarray  # (proxies, 3)
+    scales: np.ndarray  # (proxies, 3) log-scales
+    rotations: np.ndarray  # (proxies, 4) xyzw
+    opacities: np.ndarray  # (proxies, 1) linear
+    sh_dc: np.ndarray  # (proxies, 3)
+    leaf_parents: np.ndarray  # (count,) int32, in Morton order
+    proxy_parents: np.ndarray  # (proxies,) int32
+    level_offsets: np.ndarray  # (depth + 2,) int64
+    box_min: np.ndarray  # (proxies, 3) bounds of the Gaussian centers under each proxy
+    box_max: np.ndarray  # (proxies, 3)
+
+    @property
+    def depth(self) -> int:
+        return int(self.level_offsets.shape[0]) - 2
+
+    @property
+    def proxy_count(self) -> int:
+        return int(self.proxy_parents.shape[0])
+
+    def fine_nodes(self, camera_position: np.ndarray, focal_px: float, pixel_threshold: float) -> np.ndarray:
+        """Per proxy: whether its bounding-box diagonal projects to at most ``pixel_threshold`` pixels."""
+        eye = np.asarray(camera_position, dtype=np.float32).reshape(1, 3)
+        gap = np.maximum(self.box_min - eye, 0) + np.maximum(eye - self.box_max, 0)
+        distance = np.sqrt(np.einsum("ij,ij->i", gap, gap))
+        diagonal = self.box_max - self.box_min
+        size = np.sqrt(np.einsum("ij,ij->i", diagonal, diagonal))
+        return size * np.float32(focal_px) <= np.float32(pixel_threshold) * distance
+
+    def select(
+        self,
+        camera_position: np.ndarray,
+        focal_px: float,
+        *,
+        pixel_threshold: float = DEFAULT_LOD_PIXEL_THRESHOLD,
+        max_splats: Optional[int] = None,
+    ) -> np.ndarray:
+        """Row indices of the cut for a camera at ``camera_position`` with focal length ``focal_px``."""
+        threshold = float(pixel_threshold)
+        # Each doubling moves the cut at least one level up; depth + 1 of them reach the root.
+        for _ in range(self.depth + 2):
+            coarse = ~self.fine_nodes(camera_position, focal_px, threshold)
+            # Index -1 (the root's parent) reads the appended True: the root is taken whenever it is fine.
+            parent_coarse = np.append(coarse, True)
+            picked_proxies = ~coarse & parent_coarse[self.proxy_parents]
+            picked_originals = coarse[self.leaf_parents]
+            total = int(np.count_nonzero(picked_proxies)) + int(np.count_nonzero(picked_originals))
+            if max_splats is None or total <= max_splats:
+                break
+            threshold *= 2.0
+        return np.concatenate([self.order[picked_originals], self.count + np.flatnonzero(picked_proxies)])
+
+    def take(self, rows: np.ndarray, *originals: np.ndarray) -> tuple[np.ndarray, ...]:
+        """Gather ``rows`` (as returned by ``select``) from the caller's arrays and the proxies.
+
+        ``originals`` are any prefix of (means, scales, rotations, opacities,
+        sh_dc) over the ``count`` original Gaussians; each result has the
+        trailing shape of its original array.
+        """
+        rows = np.asarray(rows)
+        is_original = rows < self.count
+        original_rows = rows[is_original]
+        proxy_rows = rows[~is_original] - self.count
+        gathered = []
+        for source, proxies in zip(originals, (self.means, self.scales, self.rotations, self.opacities, self.sh_dc)):
+            out = np.empty((rows.shape[0],) + source.shape[1:], dtype=np.float32)
+            out[is_original] = source[original_rows]
+            out[~is_original] = proxies[proxy_rows].reshape((-1,) + source.shape[1:])
+            gathered.append(out)
+        return tuple(gathered)
+
+
+def _leaf_stats(
+    means: np.ndarray, scales: np.ndarray, rotations: np.ndarray, opacities: np.ndarray, sh_dc: np.ndarray
+) -> np.ndarray:
+    std = np.exp(scales.astype(np.float64))
+    rot = quaternion_matrices(rotations)
+    centers = means.astype(np.float64)
+    second = (rot * (std * std)[:, None, :]) @ rot.transpose(0, 2, 1) + centers[:, :, None] * centers[:, None, :]
+    ordered = np.sort(std, axis=1)
+    area = ordered[:, 1] * ordered[:, 2]
+    alpha = np.clip(opacities.astype(np.float64).reshape(-1), 0.0, 1.0)
+    # A floor on alpha keeps fully transparent cells well defined (their proxy stays transparent).
+    weight = np.maximum(alpha, 1e-6) * area
+    stats = np.empty((means.shape[0], _STATS_WIDTH), dtype=np.float64)
+    stats[:, 0] = weight
+    stats[:, 1] = alpha * area
+    stats[:, 2:5] = weight[:, None] * centers
+    stats[:, 5:14] = weight[:, None] * second.reshape(-1, 9)
+    stats[:, 14:17] = weight[:, None] * sh_dc.astype(np.float64)
+    return stats
+
+
+def _merge_proxies(stats: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    weight = stats[:, 0:1]
+    mean = stats[:, 2:5] / weight
+    cov = stats[:, 5:14].reshape(-1, 3, 3) / weight[:, :, None] - mean[:, :, None] * mean[:, None, :]
+    cov = 0.5 * (cov + cov.transpose(0, 2, 1))
+    variances, axes = np.linalg.eigh(cov)
+    variances = np.maximum(variances, 1e-20)
+    # eigh may return a reflection; flip one axis so the columns form a rotation.
+    axes[np.linalg.det(axes) < 0, :, 0] *= -1.0
+    area = np.sqrt(variances[:, 1] * variances[:, 2])
+    opacities = np.clip(stats[:, 1] / area, 0.0, 1.0)
+    return (
+        mean.astype(np.float32),
+        (0.5 * np.log(variances)).astype(np.float32),
+        matrix_quaternions(axes),
+        opacities.astype(np.float32).reshape(-1, 1),
+        (stats[:, 14:17] / weight).astype(np.float32),
+    )
+
+
+def build_splat_lod(
+    means: np.ndarray,
+    scales: np.ndarray,
+    rotations: np.ndarray,
+    opacities: np.ndarray,
+    sh_dc: np.ndarray,
+    *,
+    leaf_size: int = DEFAULT_LOD_LEAF_SIZE,
+    max_depth: int = LOD_MAX_DEPTH,
+) -> SplatLod:
+    """Build the proxy hierarchy for viewer arrays (log-scales, xyzw quaternions, linear opacities)."""
+    started = time.perf_counter()
+    means = _f32(means).reshape(-1, 3)
+    count = means.shape[0]
+    if count == 0:
+        raise ValueError("Cannot build a level-of-detail hierarchy without Gaussians.")
+    if not 1 <= max_depth <= LOD_MAX_DEPTH:
+        raise ValueError(f"max_depth must be between 1 and {LOD_MAX_DEPTH}.")
+    low = means.min(axis=0)
+    extent = float((means.max(axis=0) - low).max()) or 1.0
+    cells = np.floor((means - low) * np.float32((1 << max_depth) / extent)).astype(np.int64)
+    cells = np.clip(cells, 0, (1 << max_depth) - 1) << (LOD_MAX_DEPTH - max_depth)
+    codes = (_spread_bits(cells[:, 2]) << 2) | (_spread_bits(cells[:, 1]) << 1) | _spread_bits(cells[:, 0])
+    order = np.argsort(codes, kind="stable")
+    codes = codes[order]
+    scales = _f32(scales).reshape(-1, 3)
+    rotations = _f32(rotations).reshape(-1, 4)
+    opacities = _f32(opacities).reshape(-1, 1)
+    sh_dc = _f32(sh_dc).reshape(-1, 3)
+
+    # Shallowest level whose occupied cells hold leaf_size Gaussians on average.
+    depth = max_depth
+    for level in range(1, max_depth + 1):
+        keys = codes >> (3 * (LOD_MAX_DEPTH - level))
+        if (1 + int(np.count_nonzero(keys[1:] != keys[:-1]))) * leaf_size >= count:
+            depth = level
+            break
+
+    keys = codes >> (3 * (LOD_MAX_DEPTH - depth))
+    first = np.empty(count, dtype=bool)
+    first[0] = True
+    np.not_equal(keys[1:], keys[:-1], out=first[1:])
+    starts = np.flatnonzero(first)
+    leaf_parents = (np.cumsum(first) - 1).astype(np.int32)
+    # Gather and reduce Morton-sorted rows in chunks that end on cell boundaries, so neither
+    # sorted copies of the inputs nor the float64 working set exceed one chunk.
+    chunk_starts = np.unique(starts[np.searchsorted(starts, np.arange(0, count, _STATS_CHUNK_ROWS))])
+    chunk_ends = np.append(chunk_starts[1:], count)
+    stats, box_min, box_max = [], [], []
+    for lo, hi in zip(chunk_starts, chunk_ends):
+        rows = order[lo:hi]
+        local = starts[(starts >= lo) & (starts < hi)] - lo
+        chunk_means = means[rows]
+        chunk = _leaf_stats(chunk_means, scales[rows], rotations[rows], opacities[rows], sh_dc[rows])
+        stats.append(np.add.reduceat(chunk, local, axis=0))
+        box_min.append(np.minimum.reduceat(chunk_means, local, axis=0))
+        box_max.append(np.maximum.reduceat(chunk_means, local, axis=0))
+    levels = [(keys[starts], np.concatenate(stats), np.concatenate(box_min), np.concatenate(box_max))]
+    parents = []
+    for _ in range(depth):
+        child_keys, child_stats, child_min, child_max = levels[-1]
+        keys = child_keys >> 3
+        first = np.empty(keys.shape[0], dtype=bool)
+        first[0] = True
+        np.not_equal(keys[1:], keys[:-1], out=first[1:])
+        starts = np.flatnonzero(first)
+        parents.append(np.cumsum(first) - 1)
+        levels.append(
+            (
+                keys[starts],
+                np.add.reduceat(child_stats, starts, axis=0),
+                np.minimum.reduceat(child_min, starts, axis=0),
+                np.maximum.reduceat(child_max, starts, axis=0),
+            )
+        )
+    levels.reverse()
+    parents.reverse()
+    sizes = [entry[0].shape[0] for entry in levels]
+    level_offsets = np.concatenate([[0], np.cumsum(sizes)]).astype(np.int64)
+    proxy_parents = np.concatenate(
+        [np.full(1, -1)] + [level_offsets[level] + parents[level] for level in range(depth)]
+    ).astype(np.int32)
+    leaf_parents += np.int32(level_offsets[depth])
+    proxies = _merge_proxies(np.concatenate([entry[1] for entry in levels]))
+    lod = SplatLod(
+        count=count,
+        order=order,
+        means=proxies[0],
+        scales=proxies[1],
+        rotations=proxies[2],
+        opacities=proxies[3],
+        sh_dc=proxies[4],
+        leaf_parents=leaf_parents,
+        proxy_parents=proxy_parents,
+        level_offsets=level_offsets,
+        box_min=np.concatenate([entry[2] for entry in levels]),
+        box_max=np.concatenate([entry[3] for entry in levels]),
+    )
+    _LOGGER.info(
+        "Built splat LOD gaussians=%d depth=%d proxies=%d elapsed_ms=%.1f",
+        count,
+        depth,
+        lod.proxy_count,
+        (time.perf_counter() - started) * 1000.0,
+    )
+    return lod
+
+
+__all__ = [
+    "DEFAULT_LOD_LEAF_SIZE",
+    "DEFAULT_LOD_PIXEL_THRESHOLD",
+    "LOD_MAX_DEPTH",
+    "LOD_MIN_GAUSSIANS",
+    "SplatLod",
+    "build_splat_lod",
+    "matrix_quaternions",
+    "quaternion_matrices",
+]
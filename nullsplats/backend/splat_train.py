@@ -19,6 +19,10 @@ from pathlib import Path
 import torch
 import torch.nn.functional as F
 
+from nullsplats.backend.batch_prefetch import BatchPrefetcher
+from nullsplats.backend.checkpoint_writer import CheckpointWriter
+from nullsplats.backend.frame_samplers import create_sampler
+from nullsplats.backend.frame_store import FrameStore
 from nullsplats.backend.io_cache import ensure_scene_dirs
 from nullsplats.backend.gs_utils import AppearanceOptModule, CameraOptModule, rgb_to_sh, set_random_seed
 from nullsplats.backend.splat_train_config import (
@@ -29,7 +33,9 @@ from nullsplats.backend.splat_train_config import (
     SplatTrainingConfig,
     TrainingResult,
 )
-from nullsplats.backend.splat_train_io import load_colmap_frames, load_sparse_points
+from nullsplats.backend.splat_compact import COMPACT_SUFFIX
+from nullsplats.backend.splat_io import SPLAT_FORMATS
+from nullsplats.backend.splat_train_io import load_colmap_frame_pixels, load_sparse_points
 from nullsplats.backend.splat_train_ops import (
     append_log,
     build_splat_optimizers,
@@ -38,10 +44,10 @@ from nullsplats.backend.splat_train_ops import (
     export_splats,
     get_rasterization,
     initialize_parameters,
-    sample_frames,
     ssim_available,
     ssim_loss,
 )
+from nullsplats.backend.train_metrics import DeferredMetrics
 from nullsplats.util.logging import get_logger
 from nullsplats.util.scene_id import SceneId
 from gsplat.strategy import DefaultStrategy
@@ -83,10 +89,19 @@ def train_scene(
 
     normalized_scene = SceneId(str(scene_id))
     paths = ensure_scene_dirs(normalized_scene, cache_root=cache_root)
-    frames = load_colmap_frames(paths, device, image_downscale=config.image_downscale)
+    frames, pixels = load_colmap_frame_pixels(paths, device, image_downscale=config.image_downscale)
     if not frames:
         raise FileNotFoundError("No COLMAP frames with poses found; ensure images.txt and cameras.txt exist.")
 
+    # The records view into the cached image array; wrap it rather than stacking a second copy.
+    frame_store = FrameStore.from_pixels(pixels, frames, device, residency=config.frame_residency)
+    sampler = create_sampler(
+        config.frame_sampler,
+        len(frame_store),
+        seed=config.seed,
+        camera_centers=frame_store.camtoworlds[:, :3, 3].cpu().numpy(),
+    )
+
     means, colors = load_sparse_points(paths)
     if means.numel() == 0:
         raise FileNotFoundError(f"No sparse points found under {paths.sfm_dir}; run COLMAP first.")
@@ -168,7 +183,8 @@ def train_scene(
     log_path = splat_dir / "training_log.jsonl"
     config_path.write_text(json.dumps(asdict(config), indent=2) + "\n", encoding="utf-8")
     export_format = config.export_format.lower().strip()
-    export_format = "splat" if export_format == "splat" else "ply"
+    export_format = export_format if export_format in SPLAT_FORMATS else "ply"
+    compact_sidecar = config.preview_sidecar and export_format == "ply"
 
     def _checkpoint_path(iteration: int) -> Path:
         return splat_dir / f"iter_{iteration:05d}.{export_format}"
@@ -179,6 +195,9 @@ def train_scene(
             "event": "start",
             "scene_id": str(normalized_scene),
             "frames": len(frames),
+            "frame_residency": frame_store.residency,
+            "frame_bytes": frame_store.nbytes,
+            "frame_sampler": config.frame_sampler,
             "iterations": config.iterations,
             "snapshot_interval": config.snapshot_interval,
             "device": config.device,
@@ -201,6 +220,7 @@ def train_scene(
         last_checkpoint,
         max_points=config.max_points,
         fmt=export_format,
+        compact_sidecar=compact_sidecar,
     )
     logger.info("Initial checkpoint written: %s", last_checkpoint)
     if checkpoint_callback is not None:
@@ -208,185 +228,212 @@ def train_scene(
 
     last_preview_time = time.perf_counter()
     last_preview_iter = 0
-    for iteration in range(1, config.iterations + 1):
-        batch = sample_frames(frames, config.batch_size)
-        embed_ids = torch.tensor([f.index for f in batch], device=device, dtype=torch.long)
-        batch_c2w = torch.stack([f.camtoworld for f in batch], dim=0)
-        batch_K = torch.stack([f.K for f in batch], dim=0)
-        height = batch[0].height
-        width = batch[0].width
-        batch_images = torch.stack([f.image for f in batch], dim=0).to(device=device)
-        if pose_perturb is not None:
-            batch_c2w = pose_perturb(batch_c2w, embed_ids)
-        if pose_adjust is not None:
-            batch_c2w = pose_adjust(batch_c2w, embed_ids)
-
-        active_degree = (
-            min(config.sh_degree, iteration // config.sh_degree_interval)
-            if config.sh_degree_interval > 0
-            else config.sh_degree
-        )
-        active_channels = (active_degree + 1) ** 2
-        colors_full = torch.cat([splats_param["sh0"], splats_param["shN"]], dim=1)
-        if appearance_module is not None:
-            dirs = splats_param["means"][None, :, :] - batch_c2w[:, None, :3, 3]
-            app_rgb = torch.sigmoid(appearance_module(splats_param["features"], embed_ids, dirs, active_degree))
-            app_rgb = app_rgb.mean(dim=0)
-            band0 = rgb_to_sh(app_rgb).unsqueeze(1)
-            colors_full = torch.cat([band0, splats_param["shN"]], dim=1)
-        colors = colors_full[:, :active_channels, :]
-        scales = torch.exp(splats_param["scales"])
-        opacities = torch.sigmoid(splats_param["opacities"])
-        quats = F.normalize(splats_param["quats"], dim=1)
-
-        renders, alphas, info = rasterization(
-            means=splats_param["means"],
-            quats=quats,
-            scales=scales,
-            opacities=opacities,
-            colors=colors,
-            viewmats=torch.linalg.inv(batch_c2w),
-            Ks=batch_K,
-            width=width,
-            height=height,
-            sh_degree=active_degree,
-            render_mode="RGB",
-            absgrad=strategy.absgrad if isinstance(strategy, DefaultStrategy) else False,
-        )
-        if config.random_background:
-            bkgd = torch.rand((1, 1, 1, 3), device=device)
-            renders = renders + bkgd * (1.0 - alphas)
-        renders = torch.clamp(renders, 0.0, 1.0)
-
-        packed_mode = info.get("packed", False) or (
-            strategy.key_for_gradient in info and info[strategy.key_for_gradient].dim() == 2
-        )
-        if not packed_mode:
-            info["n_cameras"] = info.get("n_cameras", info["radii"].shape[0])
-            info["width"] = info.get("width", width)
-            info["height"] = info.get("height", height)
-
-        loss = config.loss_l1_weight * F.l1_loss(renders, batch_images)
-        ssim_metric = None
-        if config.ssim_weight > 0.0:
-            ssim_val = ssim_loss(renders, batch_images)
-            ssim_metric = float(ssim_val.item())
-            loss = (1.0 - config.ssim_weight) * loss + config.ssim_weight * (1.0 - ssim_val)
-        if config.opacity_reg > 0.0:
-            loss = loss + config.opacity_reg * opacities.mean()
-
-        strategy.step_pre_backward(
-            params=splats_param,
-            optimizers=splat_optimizers,
-            state=strategy_state,
-            step=iteration,
-            info=info,
-        )
-        loss.backward()
-        for opt in splat_optimizers.values():
-            opt.step()
-            opt.zero_grad(set_to_none=True)
-        if means_scheduler is not None:
-            means_scheduler.step()
-        if pose_optimizer is not None:
-            pose_optimizer.step()
-            pose_optimizer.zero_grad(set_to_none=True)
-        if appearance_optimizer is not None:
-            appearance_optimizer.step()
-            appearance_optimizer.zero_grad(set_to_none=True)
-        with torch.no_grad():
-            splats_param["quats"].data = F.normalize(splats_param["quats"].data, dim=1)
-        strategy.step_post_backward(
-            params=splats_param,
-            optimizers=splat_optimizers,
-            state=strategy_state,
-            step=iteration,
-            info=info,
-            packed=packed_mode,
-        )
-
-        mse = F.mse_loss(renders, batch_images)
-        psnr = float(-10.0 * torch.log10(mse + 1e-8))
-        if progress_callback is not None:
-            progress_callback(iteration, config.iterations, float(loss.item()))
-
-        if iteration == 1 or iteration == config.iterations or iteration % LOG_PROGRESS_INTERVAL == 0:
-            append_log(
-                log_path,
-                {
-                    "event": "iteration",
-                    "iteration": iteration,
-                    "loss_l1": float(loss.item()),
-                    "psnr": psnr,
-                    "mean_scale": float(scales.mean().item()),
-                    "min_scale": float(scales.min().item()),
-                    "max_scale": float(scales.max().item()),
-                    "mean_opacity": float(opacities.mean().item()),
-                    "mean_quat_norm": float(torch.linalg.norm(splats_param["quats"], dim=1).mean().item()),
-                    "ssim": ssim_metric,
-                    "timestamp": datetime.utcnow().isoformat() + "Z",
-                },
+    last_progress_time = float("-inf")
+    metrics = DeferredMetrics(device)
+    # Batches are sampled from a generator seeded like set_random_seed, one step ahead of the loop.
+    # Checkpoints are snapshotted here and written, pruned and announced on the writer thread.
+    checkpoint_writer = CheckpointWriter(
+        fmt=export_format,
+        max_points=config.max_points,
+        max_pending=config.checkpoint_max_pending,
+        on_written=checkpoint_callback,
+        after_write=lambda path: _prune_checkpoints(splat_dir, path, export_format),
+        compact_sidecar=compact_sidecar,
+    )
+    with checkpoint_writer, BatchPrefetcher(
+        frame_store, config.batch_size, seed=config.seed, steps=config.iterations, sampler=sampler
+    ) as prefetcher:
+        for iteration, batch in enumerate(prefetcher, start=1):
+            host_synced = False
+            embed_ids = batch.indices
+            batch_c2w = batch.camtoworlds
+            batch_K = batch.Ks
+            height = batch.height
+            width = batch.width
+            batch_images = batch.images
+            if pose_perturb is not None:
+                batch_c2w = pose_perturb(batch_c2w, embed_ids)
+            if pose_adjust is not None:
+                batch_c2w = pose_adjust(batch_c2w, embed_ids)
+
+            active_degree = (
+                min(config.sh_degree, iteration // config.sh_degree_interval)
+                if config.sh_degree_interval > 0
+                else config.sh_degree
             )
-            logger.info(
-                "Iteration %d/%d loss=%.4f psnr=%.2f mean_scale=%.6f mean_opacity=%.4f",
-                iteration,
-                config.iterations,
-                float(loss.item()),
-                psnr,
-                float(scales.mean().item()),
-                float(opacities.mean().item()),
+            active_channels = (active_degree + 1) ** 2
+            colors_full = torch.cat([splats_param["sh0"], splats_param["shN"]], dim=1)
+            if appearance_module is not None:
+                dirs = splats_param["means"][None, :, :] - batch_c2w[:, None, :3, 3]
+                app_rgb = torch.sigmoid(appearance_module(splats_param["features"], embed_ids, dirs, active_degree))
+                app_rgb = app_rgb.mean(dim=0)
+                band0 = rgb_to_sh(app_rgb).unsqueeze(1)
+                colors_full = torch.cat([band0, splats_param["shN"]], dim=1)
+            colors = colors_full[:, :active_channels, :]
+            scales = torch.exp(splats_param["scales"])
+            opacities = torch.sigmoid(splats_param["opacities"])
+            quats = F.normalize(splats_param["quats"], dim=1)
+
+            renders, alphas, info = rasterization(
+                means=splats_param["means"],
+                quats=quats,
+                scales=scales,
+                opacities=opacities,
+                colors=colors,
+                viewmats=torch.linalg.inv(batch_c2w),
+                Ks=batch_K,
+                width=width,
+                height=height,
+                sh_degree=active_degree,
+                render_mode="RGB",
+                absgrad=strategy.absgrad if isinstance(strategy, DefaultStrategy) else False,
             )
+            if config.random_background:
+                bkgd = torch.rand((1, 1, 1, 3), device=device)
+                renders = renders + bkgd * (1.0 - alphas)
+            renders = torch.clamp(renders, 0.0, 1.0)
 
-        if preview_callback is not None and config.preview_interval_seconds > 0.0:
-            now = time.perf_counter()
-            is_forced = iteration in (1, config.iterations)
-            ready_by_time = (now - last_preview_time) >= config.preview_interval_seconds
-            ready_by_iters = (
-                config.preview_min_iters <= 0 or (iteration - last_preview_iter) >= config.preview_min_iters
+            packed_mode = info.get("packed", False) or (
+                strategy.key_for_gradient in info and info[strategy.key_for_gradient].dim() == 2
             )
-            if is_forced or (ready_by_time and ready_by_iters):
-                last_preview_time = now
-                last_preview_iter = iteration
+            if not packed_mode:
+                info["n_cameras"] = info.get("n_cameras", info["radii"].shape[0])
+                info["width"] = info.get("width", width)
+                info["height"] = info.get("height", height)
+
+            loss = config.loss_l1_weight * F.l1_loss(renders, batch_images)
+            ssim_val = None
+            if config.ssim_weight > 0.0:
+                ssim_val = ssim_loss(renders, batch_images)
+                loss = (1.0 - config.ssim_weight) * loss + config.ssim_weight * (1.0 - ssim_val)
+            if config.opacity_reg > 0.0:
+                loss = loss + config.opacity_reg * opacities.mean()
+            if sampler.uses_losses:
                 with torch.no_grad():
-                    means_preview = splats_param["means"].detach()
-                    scales_log_preview = splats_param["scales"].detach()
-                    quats_preview = F.normalize(splats_param["quats"].detach(), dim=1)
-                    opacities_preview = torch.sigmoid(splats_param["opacities"].detach())
-                    sh_dc_preview = splats_param["sh0"].detach()[:, 0, :]
-
-                    if config.max_preview_points > 0 and means_preview.shape[0] > config.max_preview_points:
-                        keep = torch.topk(opacities_preview, config.max_preview_points).indices
-                        means_preview = means_preview[keep]
-                        scales_log_preview = scales_log_preview[keep]
-                        quats_preview = quats_preview[keep]
-                        opacities_preview = opacities_preview[keep]
-                        sh_dc_preview = sh_dc_preview[keep]
-
-                    payload = PreviewPayload(
-                        iteration=iteration,
-                        means=means_preview.detach().cpu(),
-                        scales_log=scales_log_preview.detach().cpu(),
-                        quats_wxyz=quats_preview.detach().cpu(),
-                        opacities=opacities_preview.detach().cpu(),
-                        sh_dc=sh_dc_preview.detach().cpu(),
-                    )
-                try:
-                    preview_callback(payload)
-                except Exception:  # noqa: BLE001
-                    logger.exception("Preview callback failed at iteration %d", iteration)
-
-        if iteration % config.snapshot_interval == 0 or iteration == config.iterations:
-            last_checkpoint = _checkpoint_path(iteration)
-            last_checkpoint = export_splats(
-                splats_param,
-                last_checkpoint,
-                max_points=config.max_points,
-                fmt=export_format,
+                    sampler.observe(embed_ids, (renders - batch_images).abs().mean(dim=(1, 2, 3)))
+
+            strategy.step_pre_backward(
+                params=splats_param,
+                optimizers=splat_optimizers,
+                state=strategy_state,
+                step=iteration,
+                info=info,
+            )
+            loss.backward()
+            for opt in splat_optimizers.values():
+                opt.step()
+                opt.zero_grad(set_to_none=True)
+            if means_scheduler is not None:
+                means_scheduler.step()
+            if pose_optimizer is not None:
+                pose_optimizer.step()
+                pose_optimizer.zero_grad(set_to_none=True)
+            if appearance_optimizer is not None:
+                appearance_optimizer.step()
+                appearance_optimizer.zero_grad(set_to_none=True)
+            with torch.no_grad():
+                splats_param["quats"].data = F.normalize(splats_param["quats"].data, dim=1)
+            strategy.step_post_backward(
+                params=splats_param,
+                optimizers=splat_optimizers,
+                state=strategy_state,
+                step=iteration,
+                info=info,
+                packed=packed_mode,
             )
-            logger.info("Wrote checkpoint %s", last_checkpoint)
-            _prune_checkpoints(splat_dir, last_checkpoint, export_format)
-            if checkpoint_callback is not None:
-                checkpoint_callback(iteration, last_checkpoint)
+
+            with torch.no_grad():
+                metrics.add(loss, F.mse_loss(renders, batch_images), ssim_val)
+
+            if preview_callback is not None and config.preview_interval_seconds > 0.0:
+                now = time.perf_counter()
+                is_forced = iteration in (1, config.iterations)
+                ready_by_time = (now - last_preview_time) >= config.preview_interval_seconds
+                ready_by_iters = (
+                    config.preview_min_iters <= 0 or (iteration - last_preview_iter) >= config.preview_min_iters
+                )
+                if is_forced or (ready_by_time and ready_by_iters):
+                    host_synced = True
+                    last_preview_time = now
+                    last_preview_iter = iteration
+                    with torch.no_grad():
+                        means_preview = splats_param["means"].detach()
+                        scales_log_preview = splats_param["scales"].detach()
+                        quats_preview = F.normalize(splats_param["quats"].detach(), dim=1)
+                        opacities_preview = torch.sigmoid(splats_param["opacities"].detach())
+                        sh_dc_preview = splats_param["sh0"].detach()[:, 0, :]
+
+                        if config.max_preview_points > 0 and means_preview.shape[0] > config.max_preview_points:
+                            keep = torch.topk(opacities_preview, config.max_preview_points).indices
+                            means_preview = means_preview[keep]
+                            scales_log_preview = scales_log_preview[keep]
+                            quats_preview = quats_preview[keep]
+                            opacities_preview = opacities_preview[keep]
+                            sh_dc_preview = sh_dc_preview[keep]
+
+                        payload = PreviewPayload(
+                            iteration=iteration,
+                            means=means_preview.detach().cpu(),
+                            scales_log=scales_log_preview.detach().cpu(),
+                            quats_wxyz=quats_preview.detach().cpu(),
+                            opacities=opacities_preview.detach().cpu(),
+                            sh_dc=sh_dc_preview.detach().cpu(),
+                        )
+                    try:
+                        preview_callback(payload)
+                    except Exception:  # noqa: BLE001
+                        logger.exception("Preview callback failed at iteration %d", iteration)
+
+            if iteration % config.snapshot_interval == 0 or iteration == config.iterations:
+                last_checkpoint = checkpoint_writer.submit(iteration, splats_param, _checkpoint_path(iteration))
+
+            # Metrics stay on the device; read them back only where the host reports something.
+            snapshot = None
+            if iteration == 1 or iteration == config.iterations or iteration % LOG_PROGRESS_INTERVAL == 0:
+                snapshot = metrics.flush(
+                    {
+                        "mean_scale": scales.mean(),
+                        "min_scale": scales.min(),
+                        "max_scale": scales.max(),
+                        "mean_opacity": opacities.mean(),
+                        "mean_quat_norm": torch.linalg.norm(splats_param["quats"], dim=1).mean(),
+                    }
+                )
+                append_log(
+                    log_path,
+                    {
+                        "event": "iteration",
+                        "iteration": iteration,
+                        "loss_l1": snapshot.loss,
+                        "loss_mean": snapshot.loss_mean,
+                        "psnr": snapshot.psnr,
+                        "psnr_mean": snapshot.psnr_mean,
+                        **snapshot.extras,
+                        "ssim": snapshot.ssim,
+                        "window_steps": snapshot.steps,
+                        "timestamp": datetime.utcnow().isoformat() + "Z",
+                    },
+                )
+                logger.info(
+                    "Iteration %d/%d loss=%.4f psnr=%.2f mean_scale=%.6f mean_opacity=%.4f",
+                    iteration,
+                    config.iterations,
+                    snapshot.loss,
+                    snapshot.psnr,
+                    snapshot.extras["mean_scale"],
+                    snapshot.extras["mean_opacity"],
+                )
+
+            if progress_callback is not None:
+                now = time.perf_counter()
+                if (
+                    snapshot is not None
+                    or host_synced
+                    or (now - last_progress_time) >= config.progress_interval_seconds
+                ):
+                    last_progress_time = now
+                    loss_value = snapshot.loss if snapshot is not None else metrics.latest_loss()
+                    progress_callback(iteration, config.iterations, loss_value)
 
     append_log(
         log_path,
@@ -416,11 +463,11 @@ def train_scene(
 
 
 def _prune_checkpoints(splats_dir: Path, latest: Path, export_format: str) -> None:
-    """Keep iter_00000 plus the latest checkpoint, remove older ones."""
-    initial_name = f"iter_{0:05d}.{export_format}"
-    keep = {initial_name, latest.name}
-    for path in splats_dir.glob(f"iter_*.{export_format}"):
-        if path.name in keep:
+    """Keep iter_00000 plus the latest checkpoint (and their preview sidecars), remove older ones."""
+    keep = {f"iter_{0:05d}", latest.stem}
+    stale = [*splats_dir.glob(f"iter_*.{export_format}"), *splats_dir.glob(f"iter_*{COMPACT_SUFFIX}")]
+    for path in stale:
+        if path.stem in keep:
             continue
         try:
             path.unlink()
@@ -23,10 +23,14 @@ class SplatTrainingConfig:
     cuda_toolkit_path: str = ""
     iterations: int = 3000
     snapshot_interval: int = 7000
+    checkpoint_max_pending: int = 2  # queued background checkpoint exports before training waits
     device: str = "cuda:0"
-    export_format: str = "ply"
+    export_format: str = "ply"  # ply | splat; PLY checkpoints also get a .nsplat preview sidecar
+    preview_sidecar: bool = True
     max_points: int = 0
     image_downscale: int = 4
+    frame_residency: str = "auto"  # auto | device | pinned | host, see frame_store
+    frame_sampler: str = "uniform"  # uniform | epoch | stratified | loss_weighted, see frame_samplers
     batch_size: int = 1
     sh_degree: int = 3
     sh_degree_interval: int = 1000
@@ -64,6 +68,7 @@ class SplatTrainingConfig:
     loss_l1_weight: float = 1.0
     seed: int = 42
     preview_interval_seconds: float = 1.0
+    progress_interval_seconds: float = 0.5  # wall-clock throttle for progress_callback
     preview_min_iters: int = 100
     max_preview_points: int = 0
 
@@ -104,4 +109,4 @@ class FrameRecord:
     K: torch.Tensor  # (3, 3)
     width: int
     height: int
-    image: torch.Tensor  # (H, W, 3) on CPU
+    image: torch.Tensor  # (H, W, 3) uint8 on CPU, a view into the shared training image array
@@ -6,32 +6,60 @@ from pathlib import Path
 from typing import List, Optional, Tuple
 
 import numpy as np
-from PIL import Image
 import torch
 
-from nullsplats.backend.colmap_io import find_text_model, parse_cameras, parse_images
+from nullsplats.backend.camera_poses import camera_to_world
+from nullsplats.backend.colmap_io import load_colmap_data
+from nullsplats.backend.frame_codecs import list_frame_files, resolve_frame_path
 from nullsplats.backend.io_cache import ScenePaths
+from nullsplats.backend.splat_io import open_ply
 from nullsplats.backend.splat_train_config import FrameRecord
-
-
-def load_colmap_frames(paths: ScenePaths, device: torch.device, *, image_downscale: int) -> List[FrameRecord]:
-    cameras_txt, images_txt = find_text_model(paths)
-    cameras = parse_cameras(cameras_txt)
-    images = parse_images(images_txt)
-    records: List[FrameRecord] = []
+from nullsplats.backend.training_images import load_training_images
+
+
+def load_colmap_frames(
+    paths: ScenePaths,
+    device: torch.device,
+    *,
+    image_downscale: int,
+    use_image_cache: bool = True,
+    workers: int = 0,
+) -> List[FrameRecord]:
+    """Build one ``FrameRecord`` per registered image.
+
+    Pixels are decoded once by ``load_training_images`` (thread pool plus the
+    per-scene uint8 cache) and each record's ``image`` is a uint8 view into
+    that shared array.
+    """
+    frames, _ = load_colmap_frame_pixels(
+        paths, device, image_downscale=image_downscale, use_image_cache=use_image_cache, workers=workers
+    )
+    return frames
+
+
+def load_colmap_frame_pixels(
+    paths: ScenePaths,
+    device: torch.device,
+    *,
+    image_downscale: int,
+    use_image_cache: bool = True,
+    workers: int = 0,
+) -> Tuple[List[FrameRecord], torch.Tensor]:
+    """``load_colmap_frames`` plus the shared ``(N, H, W, 3)`` uint8 tensor the records view into."""
+    colmap = load_colmap_data(paths)
+    table = colmap.image_table
     frames_dir = paths.frames_selected_dir
-    for idx, image_entry in enumerate(images):
-        camera = cameras.get(image_entry.camera_id)
+    candidates = list_frame_files(frames_dir)
+    image_paths: List[Path] = []
+    layouts: List[Tuple[int, int, torch.Tensor]] = []
+    for idx in range(len(table)):
+        camera = colmap.cameras.get(int(table.camera_ids[idx]))
         if camera is None:
-            raise RuntimeError(f"Camera id {image_entry.camera_id} missing in cameras.txt")
-        image_path = frames_dir / image_entry.name
-        if not image_path.exists():
-            image_path = frames_dir / Path(image_entry.name).name
-        if not image_path.exists():
-            raise FileNotFoundError(f"Image {image_entry.name} not found under {frames_dir}")
-        width = camera["width"]
-        height = camera["height"]
-        fx, fy, cx, cy = camera["params"]
+            raise RuntimeError(f"Camera id {int(table.camera_ids[idx])} missing in the COLMAP cameras file")
+        image_paths.append(resolve_frame_path(frames_dir, table.names[idx], candidates=candidates))
+        width = camera.width
+        height = camera.height
+        fx, fy, cx, cy = camera.params
         if image_downscale > 1:
             width = max(1, width // image_downscale)
             height = max(1, height // image_downscale)
@@ -40,25 +68,39 @@ def load_colmap_frames(paths: ScenePaths, device: torch.device, *, image_downsca
             cx = cx / image_downscale
             cy = cy / image_downscale
         K = torch.tensor([[fx, 0.0, cx], [0.0, fy, cy], [0.0, 0.0, 1.0]], dtype=torch.float32, device=device)
-        camtoworld = _cam_to_world_matrix(tuple(image_entry.qvec), tuple(image_entry.tvec), device=device)
-        image_tensor = _load_image_tensor(image_path, height, width)
-        records.append(
-            FrameRecord(
-                index=idx,
-                name=image_entry.name,
-                image_path=image_path,
-                camtoworld=camtoworld,
-                K=K,
-                width=width,
-                height=height,
-                image=image_tensor,
-            )
+        layouts.append((width, height, K))
+    if not layouts:
+        return [], torch.empty((0, 0, 0, 3), dtype=torch.uint8)
+    width, height, _ = layouts[0]
+    if any((w, h) != (width, height) for w, h, _ in layouts):
+        raise RuntimeError("All frames must share the same resolution after downscale.")
+    camtoworlds = camera_to_world(
+        torch.tensor(table.qvecs, dtype=torch.float64, device=device),
+        torch.tensor(table.tvecs, dtype=torch.float64, device=device),
+    ).float()
+    pixels = torch.from_numpy(
+        load_training_images(
+            image_paths,
+            (width, height),
+            downscale=image_downscale,
+            cache_dir=paths.train_cache_dir if use_image_cache else None,
+            workers=workers,
+        )
+    )
+    frames = [
+        FrameRecord(
+            index=idx,
+            name=table.names[idx],
+            image_path=image_paths[idx],
+            camtoworld=camtoworlds[idx],
+            K=K,
+            width=width,
+            height=height,
+            image=pixels[idx],
         )
-    first_size = (records[0].height, records[0].width) if records else None
-    for rec in records:
-        if (rec.height, rec.width) != first_size:
-            raise RuntimeError("All frames must share the same resolution after downscale.")
-    return records
+        for idx, (_, _, K) in enumerate(layouts)
+    ]
+    return frames, pixels
 
 
 def load_sparse_points(paths: ScenePaths) -> Tuple[torch.Tensor, torch.Tensor]:
@@ -78,98 +120,15 @@ def load_sparse_points(paths: ScenePaths) -> Tuple[torch.Tensor, torch.Tensor]:
 
 
 
-def _cam_to_world_matrix(qvec: Tuple[float, float, float, float], tvec: Tuple[float, float, float], device: torch.device) -> torch.Tensor:
-    qw, qx, qy, qz = qvec
-    q = torch.tensor([qw, qx, qy, qz], dtype=torch.float64, device=device)
-    R = _qvec_to_rotmat(q)
-    t = torch.tensor(tvec, dtype=torch.float64, device=device)
-    c2w = torch.eye(4, dtype=torch.float64, device=device)
-    c2w[:3, :3] = R.T
-    c2w[:3, 3] = -R.T @ t
-    return c2w.float()
-
-
-def _qvec_to_rotmat(qvec: torch.Tensor) -> torch.Tensor:
-    qw, qx, qy, qz = qvec
-    return torch.tensor(
-        [
-            [1 - 2 * qy * qy - 2 * qz * qz, 2 * qx * qy - 2 * qz * qw, 2 * qx * qz + 2 * qy * qw],
-            [2 * qx * qy + 2 * qz * qw, 1 - 2 * qx * qx - 2 * qz * qz, 2 * qy * qz - 2 * qx * qw],
-            [2 * qx * qz - 2 * qy * qw, 2 * qy * qz + 2 * qx * qw, 1 - 2 * qx * qx - 2 * qy * qy],
-        ],
-        dtype=torch.float64,
-        device=qvec.device,
-    )
-
-
 def _load_ply_points(path: Path) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
-    type_map = {
-        "float": np.float32,
-        "float32": np.float32,
-        "double": np.float64,
-        "uchar": np.uint8,
-        "uint8": np.uint8,
-        "uint": np.uint32,
-        "int": np.int32,
-    }
-    with path.open("rb") as handle:
-        header: list[str] = []
-        while True:
-            line_bytes = handle.readline()
-            if not line_bytes:
-                raise ValueError("Invalid PLY: no end_header")
-            line = line_bytes.decode("ascii", errors="ignore").strip()
-            header.append(line)
-            if line == "end_header":
-                break
-        data = handle.read()
-
-    format_line = next((line for line in header if line.startswith("format ")), "format ascii 1.0")
-    ascii_format = "ascii" in format_line
-    vertex_count = 0
-    properties: list[tuple[str, type]] = []
-    collecting_vertex = False
-    for line in header:
-        if line.startswith("element vertex"):
-            parts = line.split()
-            vertex_count = int(parts[-1])
-            collecting_vertex = True
-            continue
-        if line.startswith("element ") and not line.startswith("element vertex"):
-            collecting_vertex = False
-        if collecting_vertex and line.startswith("property"):
-            _, typ, name = line.split()[:3]
-            if typ not in type_map:
-                continue
-            properties.append((name, type_map[typ]))
-
-    def _extract_structured_array() -> np.ndarray:
-        dtype = np.dtype([(name, typ) for name, typ in properties])
-        return np.frombuffer(data, dtype=dtype, count=vertex_count)
-
-    def _extract_from_ascii() -> np.ndarray:
-        rows = []
-        text = data.decode("ascii", errors="ignore").strip().splitlines()
-        for line in text[: vertex_count or None]:
-            if not line.strip():
-                continue
-            parts = line.strip().split()
-            if len(parts) < len(properties):
-                continue
-            parsed = []
-            for value, (_, typ) in zip(parts, properties):
-                parsed.append(typ(type(typ)(float(value)) if np.issubdtype(typ, np.floating) else int(float(value))))
-            rows.append(tuple(parsed))
-        dtype = np.dtype([(name, typ) for name, typ in properties])
-        return np.array(rows, dtype=dtype)
-
-    arr = _extract_from_ascii() if ascii_format else _extract_structured_array()
-    if arr.size == 0 or vertex_count == 0:
+    vertices = open_ply(path)
+    if vertices.count == 0:
         return torch.empty((0, 3)), torch.empty((0, 3)), torch.empty((0,))
+    arr = vertices.columns()
 
     def _get_field(candidates: list[str]) -> Optional[np.ndarray]:
         for name in candidates:
-            if name in arr.dtype.names:
+            if name in arr:
                 return arr[name]
         return None
 
@@ -219,12 +178,3 @@ def _load_colmap_txt_points(path: Path) -> tuple[torch.Tensor, torch.Tensor, tor
         torch.tensor(colors, dtype=torch.float32),
         torch.tensor(tracks, dtype=torch.float32),
     )
-
-
-def _load_image_tensor(path: Path, height: int, width: int) -> torch.Tensor:
-    with Image.open(path) as handle:
-        img = handle.convert("RGB")
-        if img.size != (width, height):
-            img = img.resize((width, height), resample=Image.BILINEAR)
-        array = np.array(img, dtype=np.float32) / 255.0
-        return torch.from_numpy(array)
@@ -6,15 +6,21 @@ import json
 import math
 import os
 from pathlib import Path
+import threading
 from typing import Optional
 
 import numpy as np
 import torch
 import torch.nn.functional as F
 
+from nullsplats.backend.splat_compact import COMPACT_SUFFIX
+from nullsplats.backend.splat_io import SPLAT_FORMATS, write_splat_file
 from nullsplats.backend.splat_train_config import SplatTrainingConfig
+from nullsplats.util.logging import get_logger
 from nullsplats.util.tooling_paths import default_cuda_path
 
+_LOGGER = get_logger("backend.splat_train_ops")
+
 gsplat = None  # set after toolkit configuration
 rasterization = None  # set after toolkit configuration
 _SSIM_AVAILABLE = True
@@ -171,11 +177,17 @@ def identity_quats(count: int, device: torch.device) -> torch.Tensor:
     return quats
 
 
+def sample_frame_indices(
+    frame_count: int, batch_size: int, rng: Optional[np.random.RandomState] = None
+) -> np.ndarray:
+    """Frame indices for one batch, drawn from ``rng`` or NumPy's global RNG (seeded by ``set_random_seed``)."""
+    if batch_size >= frame_count:
+        return np.arange(frame_count)
+    return (rng or np.random).choice(frame_count, size=batch_size, replace=False)
+
+
 def sample_frames(frames: list, batch_size: int) -> list:
-    if batch_size >= len(frames):
-        return list(frames)
-    indices = np.random.choice(len(frames), size=batch_size, replace=False)
-    return [frames[int(i)] for i in indices]
+    return [frames[int(i)] for i in sample_frame_indices(len(frames), batch_size)]
 
 
 def append_log(log_path: Path, payload: dict) -> None:
@@ -184,27 +196,67 @@ def append_log(log_path: Path, payload: dict) -> None:
         handle.write(json.dumps(payload) + "\n")
 
 
-def export_splats(
-    splats_param: torch.nn.ParameterDict,
-    export_path: Path,
-    *,
-    max_points: int,
-    fmt: str,
-) -> Path:
-    get_rasterization()
-    fmt_clean = "splat" if fmt.lower().strip() == "splat" else "ply"
+SNAPSHOT_KEYS = ("means", "scales", "quats", "opacities", "sh0", "shN")
+
+
+def checkpoint_target(export_path: Path, fmt: str) -> tuple[Path, str]:
+    """Return the path ``export_splats`` writes for ``fmt`` and the normalized format."""
+    fmt_clean = fmt.lower().strip()
+    fmt_clean = fmt_clean if fmt_clean in SPLAT_FORMATS else "ply"
     target_path = (
         export_path
         if export_path.suffix.lower().lstrip(".") == fmt_clean
         else export_path.with_suffix(f".{fmt_clean}")
     )
+    return target_path, fmt_clean
+
+
+def snapshot_splats(splats_param: torch.nn.ParameterDict, *, pin_memory: bool = False) -> dict[str, torch.Tensor]:
+    """Copy the raw splat parameters to host memory.
+
+    With ``pin_memory`` the copies go into page-locked buffers with
+    ``non_blocking=True``; the caller must synchronize (e.g. on a CUDA event
+    recorded afterwards) before reading them.
+    """
+    snapshot: dict[str, torch.Tensor] = {}
+    for key in SNAPSHOT_KEYS:
+        source = splats_param[key].detach()
+        if pin_memory and source.is_cuda:
+            buffer = torch.empty(source.shape, dtype=source.dtype, pin_memory=True)
+            buffer.copy_(source, non_blocking=True)
+            snapshot[key] = buffer
+        else:
+            snapshot[key] = source.to("cpu", copy=True)
+    return snapshot
+
+
+def compact_sidecar_path(checkpoint: Path) -> Path:
+    """The ``.nsplat`` preview sidecar written next to a PLY checkpoint."""
+    return checkpoint.with_suffix(COMPACT_SUFFIX)
+
+
+def write_splats(
+    snapshot: dict[str, torch.Tensor],
+    export_path: Path,
+    *,
+    max_points: int,
+    fmt: str,
+    compact_sidecar: bool = False,
+) -> Path:
+    """Serialize a host snapshot to PLY or .splat, replacing the target atomically (no gsplat needed).
+
+    With ``compact_sidecar`` a PLY checkpoint also gets a quantized ``.nsplat``
+    copy for fast preview loads. The PLY stays the checkpoint of record; the
+    sidecar is renamed into place first, so a poller that sees the new PLY
+    also finds its sidecar. A failed sidecar is logged and skipped.
+    """
+    target_path, fmt_clean = checkpoint_target(export_path, fmt)
     target_path.parent.mkdir(parents=True, exist_ok=True)
-    scales_log = splats_param["scales"].detach().cpu()
-    opacities_logit = splats_param["opacities"].detach().cpu()
-    opacities = torch.sigmoid(opacities_logit)
-    means = splats_param["means"].detach().cpu()
-    colors = torch.cat([splats_param["sh0"], splats_param["shN"]], dim=1).detach().cpu()
-    quats_cpu = F.normalize(splats_param["quats"].detach().cpu(), dim=1)
+    scales_log = snapshot["scales"]
+    opacities = torch.sigmoid(snapshot["opacities"])
+    means = snapshot["means"]
+    colors = torch.cat([snapshot["sh0"], snapshot["shN"]], dim=1)
+    quats_cpu = F.normalize(snapshot["quats"], dim=1)
 
     if max_points > 0 and means.shape[0] > max_points:
         keep = torch.topk(opacities, max_points).indices
@@ -216,19 +268,43 @@ def export_splats(
 
     sh0 = colors[:, :1, :]
     shN = colors[:, 1:, :]
-    gsplat.export_splats(
-        means,
-        scales_log,
-        quats_cpu,
-        opacities,
-        sh0,
-        shN,
-        format=fmt_clean,
-        save_to=str(target_path),
-    )
+    staging = target_path.with_name(f".{target_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    sidecar = compact_sidecar_path(target_path) if compact_sidecar and fmt_clean == "ply" else None
+    sidecar_staging = sidecar.with_name(f".{sidecar.name}.{os.getpid()}.{threading.get_ident()}.tmp") if sidecar else None
+    try:
+        write_splat_file(staging, fmt_clean, means, scales_log, quats_cpu, opacities, sh0, shN)
+        if sidecar is not None and sidecar_staging is not None:
+            try:
+                write_splat_file(sidecar_staging, "nsplat", means, scales_log, quats_cpu, opacities, sh0, shN)
+                os.replace(sidecar_staging, sidecar)
+            except Exception:  # noqa: BLE001 - the PLY is the checkpoint; the sidecar is a cache
+                _LOGGER.warning("Could not write preview sidecar %s", sidecar, exc_info=True)
+                sidecar.unlink(missing_ok=True)
+        os.replace(staging, target_path)
+    finally:
+        staging.unlink(missing_ok=True)
+        if sidecar_staging is not None:
+            sidecar_staging.unlink(missing_ok=True)
     return target_path
 
 
+def export_splats(
+    splats_param: torch.nn.ParameterDict,
+    export_path: Path,
+    *,
+    max_points: int,
+    fmt: str,
+    compact_sidecar: bool = False,
+) -> Path:
+    return write_splats(
+        snapshot_splats(splats_param),
+        export_path,
+        max_points=max_points,
+        fmt=fmt,
+        compact_sidecar=compact_sidecar,
+    )
+
+
 def ssim_loss(img_a: torch.Tensor, img_b: torch.Tensor) -> torch.Tensor:
     """Compute SSIM using torchmetrics (expects NHWC input)."""
 
@@ -0,0 +1,81 @@
+"""Deferred training metrics.
+
+Reading a scalar such as ``loss.item()`` blocks the host until the device
+has finished the step, which stalls the training pipeline. ``DeferredMetrics``
+keeps running sums and the latest values as device tensors. ``flush`` copies
+them, plus any extra tensors to report, to the host in one transfer, so the
+training loop synchronizes only where it already reports something: log
+intervals, previews, checkpoints and throttled progress callbacks.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Mapping, Optional
+
+import torch
+
+
+_LOSS, _PSNR, _SSIM = range(3)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Host copy of the metrics since the previous flush."""
+
+    steps: int
+    loss: float  # latest step
+    psnr: float
+    ssim: Optional[float]
+    loss_mean: float  # mean over the flushed window
+    psnr_mean: float
+    ssim_mean: Optional[float]
+    extras: dict[str, float]
+
+
+class DeferredMetrics:
+    """On-device accumulator for per-step loss, PSNR and SSIM."""
+
+    def __init__(self, device: torch.device) -> None:
+        self.device = torch.device(device)
+        self._sums = torch.zeros(3, dtype=torch.float32, device=self.device)
+        self._latest = torch.zeros(3, dtype=torch.float32, device=self.device)
+        self._steps = 0
+        self._has_ssim = False
+
+    def add(self, loss: torch.Tensor, mse: torch.Tensor, ssim: Optional[torch.Tensor] = None) -> None:
+        """Record one step; nothing here waits on the device."""
+        with torch.no_grad():
+            psnr = -10.0 * torch.log10(mse.detach().float() + 1e-8)
+            ssim_value = ssim.detach().float() if ssim is not None else torch.zeros((), device=self.device)
+            self._latest = torch.stack([loss.detach().float(), psnr, ssim_value])
+            self._sums.add_(self._latest)
+        self._steps += 1
+        self._has_ssim = ssim is not None
+
+    def latest_loss(self) -> float:
+        """Latest loss without resetting the window (one device sync)."""
+        return float(self._latest[_LOSS].item())
+
+    def flush(self, extras: Optional[Mapping[str, torch.Tensor]] = None) -> MetricsSnapshot:
+        """Copy metrics and ``extras`` (scalar tensors) to the host and reset the window."""
+        names = list(extras or {})
+        values = [self._latest, self._sums / max(1, self._steps)]
+        values.extend(extras[name].detach().float().reshape(1).to(self.device) for name in names)
+        host = torch.cat(values).tolist()
+        snapshot = MetricsSnapshot(
+            steps=self._steps,
+            loss=host[_LOSS],
+            psnr=host[_PSNR],
+            ssim=host[_SSIM] if self._has_ssim else None,
+            loss_mean=host[3 + _LOSS],
+            psnr_mean=host[3 + _PSNR],
+            ssim_mean=host[3 + _SSIM] if self._has_ssim else None,
+            extras=dict(zip(names, host[6:])),
+        )
+        self._sums.zero_()
+        self._steps = 0
+        return snapshot
+
+
+__all__ = ["DeferredMetrics", "MetricsSnapshot"]
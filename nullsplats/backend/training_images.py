@@ -0,0 +1,165 @@
+"""Decode-once loading of training images.
+
+Training used to open, resize and float-convert every selected frame one
+after another on each run. ``load_training_images`` decodes frames on a
+thread pool and stores the resized pixels as one uint8 ``(N, H, W, 3)``
+array in ``<outputs>/train_cache/frames_ds<downscale>.npy``. A JSON manifest
+records each source frame's (name, mtime, size). Later runs memory-map the
+array when nothing changed and decode only the frames that did. Pixels stay
+uint8; consumers convert to float per batch.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+import json
+import os
+from pathlib import Path
+from typing import Optional, Sequence
+import uuid
+
+import numpy as np
+from PIL import Image
+
+from nullsplats.backend.frame_codecs import open_frame
+from nullsplats.util.logging import get_logger
+
+
+_LOGGER = get_logger("backend.training_images")
+_CACHE_VERSION = 1
+FrameEntry = tuple[str, int, int]
+
+
+def decode_training_image(path: Path, width: int, height: int) -> np.ndarray:
+    """Decode one frame to ``(height, width, 3)`` uint8, bilinear-resizing if needed."""
+    image = open_frame(path)
+    if image.size != (width, height):
+        image = image.resize((width, height), resample=Image.BILINEAR)
+    return np.asarray(image, dtype=np.uint8)
+
+
+def load_training_images(
+    image_paths: Sequence[Path],
+    size: tuple[int, int],
+    *,
+    downscale: int,
+    cache_dir: Optional[Path] = None,
+    workers: int = 0,
+) -> np.ndarray:
+    """Return every frame as one ``(N, H, W, 3)`` uint8 array.
+
+    With ``cache_dir`` the result is a copy-on-write memory map of the cached
+    array (writes never reach the file); without it, a plain in-memory array.
+    ``size`` is the shared ``(width, height)`` after downscaling.
+    """
+    width, height = size
+    entries = [_frame_entry(path) for path in image_paths]
+    if cache_dir is None:
+        images = np.empty((len(entries), height, width, 3), dtype=np.uint8)
+        _decode_rows(images, image_paths, range(len(entries)), width, height, workers)
+        return images
+
+    array_path = cache_dir / f"frames_ds{downscale}.npy"
+    manifest_path = array_path.with_suffix(".json")
+    manifest = _read_manifest(manifest_path)
+    matches_size = (
+        manifest is not None
+        and manifest.get("version") == _CACHE_VERSION
+        and manifest.get("width") == width
+        and manifest.get("height") == height
+        and array_path.exists()
+    )
+    previous = [tuple(entry) for entry in manifest["entries"]] if matches_size else []
+    if matches_size and previous == entries:
+        _LOGGER.info("Training image cache hit path=%s frames=%d", array_path, len(entries))
+        return np.load(array_path, mmap_mode="c")
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    staging = array_path.with_name(f".{array_path.name}.{uuid.uuid4().hex}.tmp")
+    images: Optional[np.ndarray] = None
+    old: Optional[np.ndarray] = None
+    try:
+        images = np.lib.format.open_memmap(
+            staging, mode="w+", dtype=np.uint8, shape=(len(entries), height, width, 3)
+        )
+        reusable = {entry: row for row, entry in enumerate(previous)}
+        old = np.load(array_path, mmap_mode="r") if reusable else None
+        missing: list[int] = []
+        for row, entry in enumerate(entries):
+            source_row = reusable.get(entry)
+            if old is not None and source_row is not None:
+                images[row] = old[source_row]
+            else:
+                missing.append(row)
+        _decode_rows(images, image_paths, missing, width, height, workers)
+        images.flush()
+    except BaseException:
+        # Release the mappings first so the staging file can be removed on every platform.
+        images = old = None
+        staging.unlink(missing_ok=True)
+        raise
+    del images, old
+    _LOGGER.info(
+        "Training image cache rebuilt path=%s frames=%d decoded=%d reused=%d",
+        array_path,
+        len(entries),
+        len(missing),
+        len(entries) - len(missing),
+    )
+    # Drop the manifest first so a crash can never pair it with a different array.
+    manifest_path.unlink(missing_ok=True)
+    try:
+        os.replace(staging, array_path)
+    except OSError:
+        # An older mapping of the array is still open (Windows); keep this run's pixels in memory.
+        _LOGGER.warning("Could not replace %s; training images kept in memory this run", array_path)
+        loaded = np.array(np.load(staging, mmap_mode="r"))
+        staging.unlink(missing_ok=True)
+        return loaded
+    _write_manifest(
+        manifest_path,
+        {
+            "version": _CACHE_VERSION,
+            "width": width,
+            "height": height,
+            "downscale": downscale,
+            "entries": [list(entry) for entry in entries],
+        },
+    )
+    return np.load(array_path, mmap_mode="c")
+
+
+def _frame_entry(path: Path) -> FrameEntry:
+    stat = path.stat()
+    return (path.name, stat.st_mtime_ns, stat.st_size)
+
+
+def _decode_rows(
+    images: np.ndarray, image_paths: Sequence[Path], rows: Sequence[int], width: int, height: int, workers: int
+) -> None:
+    if not rows:
+        return
+
+    def _decode(row: int) -> None:
+        images[row] = decode_training_image(image_paths[row], width, height)
+
+    worker_count = max(1, min(workers or os.cpu_count() or 4, len(rows)))
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="train_images") as executor:
+        # list() re-raises the first decode error here.
+        list(executor.map(_decode, rows))
+
+
+def _read_manifest(path: Path) -> Optional[dict]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(path: Path, payload: dict) -> None:
+    staging = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    staging.write_text(json.dumps(payload), encoding="utf-8")
+    os.replace(staging, path)
+
+
+__all__ = ["decode_training_image", "load_training_images"]
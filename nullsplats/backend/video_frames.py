@@ -8,18 +8,28 @@ consulted; callers must pass explicit parameters.
 
 from __future__ import annotations
 
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, replace
 from datetime import datetime
 from pathlib import Path
+import hashlib
 import json
-import subprocess
+import os
+import queue
 import shutil
+import subprocess
 import math
-from typing import Callable, Iterable, List, Optional, Sequence
+import threading
+import time
+from typing import Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 from PIL import Image
 
+from nullsplats.backend.blob_store import BlobStore
+from nullsplats.backend.frame_codecs import DEFAULT_CODEC, get_codec, list_frame_files
+from nullsplats.backend.frame_selection import get_scorer, get_strategy, parse_fingerprints, quality_scorer
 from nullsplats.backend.io_cache import ScenePaths, ensure_scene_dirs, load_metadata, save_metadata
 from nullsplats.util.logging import get_logger
 from nullsplats.util.scene_id import SceneId
@@ -27,6 +37,23 @@ from nullsplats.util.scene_id import SceneId
 
 logger = get_logger("video_frames")
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".bmp", ".webp"}
+EXTRACTION_MODES = ("decode", "seek")
+# ffmpeg swscale flags matching the PIL resample names used across the app.
+_FFMPEG_SCALE_FLAGS = {"lanczos": "lanczos", "bicubic": "bicubic", "bilinear": "bilinear", "nearest": "neighbor"}
+_PIL_RESAMPLE = {
+    "lanczos": Image.LANCZOS,
+    "bicubic": Image.BICUBIC,
+    "bilinear": Image.BILINEAR,
+    "nearest": Image.NEAREST,
+}
+# Pixels scored per vectorized call; larger stacks fall out of cache (see _batch_frame_quality_metrics).
+_SCORE_CHUNK_PIXELS = 1 << 21
+_SCORE_BATCH_MAX = 32
+# Bump whenever stored frame metrics change meaning (2: batched box-filter pHash replaced the
+# per-frame Lanczos hash); incremental runs recompute scores stored under another version.
+_FRAME_METRICS_VERSION = 2
+# width, height, fps (r_frame_rate), frame_count, rotation, constant frame rate.
+StreamProps = Tuple[int, int, float, Optional[int], int, bool]
 
 
 @dataclass(frozen=True)
@@ -38,6 +65,7 @@ class FrameScore:
     sharpness: Optional[float] = None
     variance: Optional[float] = None
     fingerprint: Optional[str] = None
+    source_index: Optional[int] = None  # frame index in the video / position in the sorted image list
 
 
 @dataclass(frozen=True)
@@ -64,6 +92,14 @@ def extract_frames(
     target_count: int = 40,
     cache_root: str | Path = "cache",
     progress_callback: Optional[Callable[[int, int], None]] = None,
+    extraction_mode: str = "decode",
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    selection_strategy: str = "diverse",
+    scorer: str = "quality",
+    incremental: bool = True,
+    frame_codec: str = DEFAULT_CODEC,
 ) -> ExtractionResult:
     """Extract frames from a video or image folder into the cache.
 
@@ -74,6 +110,30 @@ def extract_frames(
         candidate_count: Number of frames to extract and score.
         target_count: Number of frames to auto-select for frames_selected.
         cache_root: Root directory for cache storage.
+        extraction_mode: ``"decode"`` streams every frame through one ffmpeg
+            process; ``"seek"`` seeks to the sampled frames with parallel
+            ffmpeg workers. Ignored for image folders.
+        workers: Worker threads that score and PNG-encode frames while the
+            decoder keeps reading, and ffmpeg processes in ``"seek"`` mode
+            (defaults to CPU count).
+        scale_px: Downscale frames so the small side is at most this many
+            pixels while decoding (0 keeps the source resolution). Video frames
+            are scaled inside ffmpeg so full-size frames never reach Python.
+        resample: Resampling filter for ``scale_px`` (lanczos, bicubic,
+            bilinear, nearest).
+        selection_strategy: Auto-selection strategy name (``"diverse"`` or
+            ``"temporal"``; see ``frame_selection.list_strategies``).
+        scorer: Frame scorer feeding the strategy (``"quality"``,
+            ``"sharpness"`` or ``"variance"``; see
+            ``frame_selection.list_scorers``).
+        incremental: Reuse frames and scores from the previous extraction when
+            the source content hash, ``scale_px``, ``resample`` and the frame
+            metrics version match. Only sampled indices not already in
+            frames_all are decoded, so changing ``target_count`` alone just
+            re-runs selection.
+        frame_codec: On-disk format for frames_all/frames_selected (see
+            ``frame_codecs.list_codecs``); recorded in metadata so readers and
+            later incremental runs can tell.
 
     Returns:
         ExtractionResult describing available and selected frames.
@@ -85,43 +145,108 @@ def extract_frames(
     normalized_type = source_type.lower().strip()
     if normalized_type not in {"video", "images"}:
         raise ValueError('source_type must be either "video" or "images".')
-
-    _clear_directory(paths.source_dir)
-    _clear_directory(paths.frames_all_dir)
-    _clear_directory(paths.frames_selected_dir)
+    normalized_mode = extraction_mode.lower().strip()
+    if normalized_mode not in EXTRACTION_MODES:
+        raise ValueError(f"extraction_mode must be one of {EXTRACTION_MODES}.")
+    resample_mode = resample.lower().strip() or "lanczos"
+    if resample_mode not in _FFMPEG_SCALE_FLAGS:
+        raise ValueError(f"resample must be one of {tuple(_FFMPEG_SCALE_FLAGS)}.")
+    scale_px = max(0, int(scale_px))
+    # Fail fast before any extraction work.
+    get_strategy(selection_strategy)
+    get_scorer(scorer)
+    codec_name = get_codec(frame_codec).name
 
     source_path_obj = Path(source_path).expanduser()
     if not source_path_obj.exists():
         raise FileNotFoundError(f"Source path does not exist: {source_path_obj}")
 
     logger.info(
-        "Extraction start scene=%s source_type=%s source=%s candidates=%d target=%d",
+        "Extraction start scene=%s source_type=%s source=%s candidates=%d target=%d incremental=%s",
         normalized_scene,
         normalized_type,
         source_path_obj,
         candidate_count,
         target_count,
+        incremental,
     )
 
-    saved_source = _copy_source_to_cache(source_path_obj, paths.source_dir, normalized_type)
-    if normalized_type == "video":
-        frame_scores = _extract_from_video(
-            saved_source, paths.frames_all_dir, candidate_count, progress_callback=progress_callback
-        )
-    else:
-        frame_scores = _extract_from_image_folder(
-            saved_source, paths.frames_all_dir, candidate_count, progress_callback=progress_callback
+    previous = _load_previous_metadata(paths)
+    store = BlobStore(paths.cache_root)
+    # Blobs this scene links to now; whichever the new extraction no longer uses are released.
+    superseded = store.blobs_linked_from(paths.inputs_root)
+    _clear_directory(paths.frames_selected_dir)
+
+    saved_source, source_digest, source_stat = _copy_source_to_cache(
+        source_path_obj, paths.source_dir, normalized_type, store, previous=previous
+    )
+    extraction_key = {
+        "source_type": normalized_type,
+        "source_digest": source_digest,
+        "extraction_resolution_px": scale_px,
+        "extraction_resample": resample_mode,
+        "frame_codec": codec_name,
+        "frame_metrics_version": _FRAME_METRICS_VERSION,
+    }
+    frame_scores: Optional[List[FrameScore]] = None
+    reusable = _reusable_frame_scores(previous if incremental else {}, extraction_key, paths.frames_all_dir)
+    if reusable:
+        frame_scores = _extract_incremental(
+            saved_source,
+            paths.frames_all_dir,
+            candidate_count,
+            normalized_type,
+            reusable,
+            mode=normalized_mode,
+            workers=workers,
+            scale_px=scale_px,
+            resample=resample_mode,
+            codec=codec_name,
+            progress_callback=progress_callback,
         )
+    if frame_scores is None:
+        _clear_directory(paths.frames_all_dir)
+        if normalized_type == "video":
+            frame_scores = _extract_from_video(
+                saved_source,
+                paths.frames_all_dir,
+                candidate_count,
+                mode=normalized_mode,
+                workers=workers,
+                scale_px=scale_px,
+                resample=resample_mode,
+                codec=codec_name,
+                progress_callback=progress_callback,
+            )
+        else:
+            frame_scores = _extract_from_image_folder(
+                saved_source,
+                paths.frames_all_dir,
+                candidate_count,
+                workers=workers,
+                scale_px=scale_px,
+                resample=resample_mode,
+                codec=codec_name,
+                progress_callback=progress_callback,
+            )
 
-    selected_frames = auto_select_best(frame_scores, target_count)
-    _write_selected_frames(paths.frames_all_dir, paths.frames_selected_dir, selected_frames)
+    selected_frames = auto_select_best(frame_scores, target_count, strategy=selection_strategy, scorer=scorer)
+    _write_selected_frames(paths.frames_all_dir, paths.frames_selected_dir, selected_frames, store)
 
     metadata = {
         "scene_id": str(normalized_scene),
         "source_type": normalized_type,
         "source_path": str(saved_source),
+        "source_digest": source_digest,
+        "source_stat": source_stat,
         "candidate_count": candidate_count,
         "target_count": target_count,
+        "extraction_resolution_px": scale_px,
+        "extraction_resample": resample_mode,
+        "frame_codec": codec_name,
+        "frame_metrics_version": _FRAME_METRICS_VERSION,
+        "selection_strategy": selection_strategy.strip().lower(),
+        "selection_scorer": scorer.strip().lower(),
         "available_frames": [item.filename for item in frame_scores],
         "selected_frames": selected_frames,
         "frame_scores": [
@@ -131,12 +256,14 @@ def extract_frames(
                 "sharpness": item.sharpness,
                 "variance": item.variance,
                 "fingerprint": item.fingerprint,
+                "source_index": item.source_index,
             }
             for item in frame_scores
         ],
         "created_at": datetime.utcnow().isoformat() + "Z",
     }
     save_metadata(normalized_scene, metadata, cache_root=cache_root)
+    _release_blobs(store, superseded)
     logger.info(
         "Extraction complete scene=%s total_frames=%d selected=%d metadata=%s",
         normalized_scene,
@@ -172,6 +299,7 @@ def load_cached_frames(scene_id: str | SceneId, cache_root: str | Path = "cache"
             sharpness=float(item["sharpness"]) if "sharpness" in item and item["sharpness"] is not None else None,
             variance=float(item["variance"]) if "variance" in item and item["variance"] is not None else None,
             fingerprint=str(item["fingerprint"]) if "fingerprint" in item and item["fingerprint"] is not None else None,
+            source_index=int(item["source_index"]) if item.get("source_index") is not None else None,
         )
         for item in scores
         if "file" in item
@@ -180,11 +308,7 @@ def load_cached_frames(scene_id: str | SceneId, cache_root: str | Path = "cache"
     selected_frames = metadata.get("selected_frames", [])
     if not selected_frames:
         selected_frames = sorted(
-            [
-                path.name
-                for path in paths.frames_selected_dir.iterdir()
-                if path.suffix.lower() in IMAGE_EXTENSIONS
-            ]
+            [path.name for path in list_frame_files(paths.frames_selected_dir)]
         )
     candidate_count = int(metadata.get("candidate_count", len(available_frames)))
     target_count = int(metadata.get("target_count", len(selected_frames)))
@@ -230,10 +354,13 @@ def persist_selection(
     if missing:
         raise ValueError(f"Selected frames not present in frames_all: {missing}")
 
-    _write_selected_frames(paths.frames_all_dir, paths.frames_selected_dir, list(selected_frames))
+    store = BlobStore(paths.cache_root)
+    superseded = store.blobs_linked_from(paths.frames_selected_dir)
+    _write_selected_frames(paths.frames_all_dir, paths.frames_selected_dir, list(selected_frames), store)
 
     metadata["selected_frames"] = list(selected_frames)
     save_metadata(normalized_scene, metadata, cache_root=cache_root)
+    _release_blobs(store, superseded)
 
     scores = metadata.get("frame_scores", [])
     frame_scores = [
@@ -260,36 +387,25 @@ def persist_selection(
     )
 
 
-def auto_select_best(frame_scores: Sequence[FrameScore], target_count: int) -> List[str]:
-    """Return filenames of the best frames using focus, variance, and diversity."""
+def auto_select_best(
+    frame_scores: Sequence[FrameScore],
+    target_count: int,
+    *,
+    strategy: str = "diverse",
+    scorer: str = "quality",
+) -> List[str]:
+    """Return filenames of the best frames using focus, variance, and diversity.
+
+    ``scorer`` names a frame scorer and ``strategy`` a selection strategy from
+    ``nullsplats.backend.frame_selection`` (e.g. ``"temporal"`` for one frame
+    per equal time segment). ``frame_scores`` must be in temporal order.
+    """
     if target_count <= 0 or not frame_scores:
         return []
-    weighted = _score_with_quality(frame_scores)
-    sorted_scores = sorted(weighted, key=lambda item: item.score, reverse=True)
-    selected: List[str] = []
-    selected_fingerprints: List[str] = []
-    diversity_threshold = 8  # minimum Hamming distance to consider a frame unique enough
-
-    for item in sorted_scores:
-        if item.fingerprint and selected_fingerprints:
-            distances = [_fingerprint_distance(item.fingerprint, fp) for fp in selected_fingerprints]
-            if distances and min(distances) < diversity_threshold:
-                continue
-        selected.append(item.filename)
-        if item.fingerprint:
-            selected_fingerprints.append(item.fingerprint)
-        if len(selected) >= target_count:
-            break
-
-    if len(selected) < target_count:
-        for item in sorted_scores:
-            if item.filename in selected:
-                continue
-            selected.append(item.filename)
-            if len(selected) >= target_count:
-                break
-
-    return selected
+    quality = get_scorer(scorer)(frame_scores)
+    fingerprints, valid = parse_fingerprints([item.fingerprint for item in frame_scores])
+    chosen = get_strategy(strategy)(quality, fingerprints, valid, target_count)
+    return [frame_scores[idx].filename for idx in chosen]
 
 
 def _evenly_spaced_indices(total: int, count: int) -> List[int]:
@@ -301,35 +417,241 @@ def _evenly_spaced_indices(total: int, count: int) -> List[int]:
     return np.linspace(0, total - 1, num=count, dtype=int).tolist()
 
 
-def _copy_source_to_cache(source: Path, dest_dir: Path, source_type: str) -> Path:
+def _copy_source_to_cache(
+    source: Path, dest_dir: Path, source_type: str, store: BlobStore, *, previous: Optional[dict] = None
+) -> Tuple[Path, str, dict]:
+    """Link the user's source into ``dest_dir`` through the blob store.
+
+    Sources live outside the cache and may be edited in place, so they enter
+    the store by reflink or copy, never by hardlink. Returns the saved path, a
+    content digest of the whole source (the blob digest for a video, a digest
+    over file names and blob digests for an image folder) and the source stat
+    recorded in metadata. When ``previous`` metadata saw the same stat and the
+    links in ``dest_dir`` are intact, its digest is reused without re-hashing.
+    """
     dest_dir.mkdir(parents=True, exist_ok=True)
+    entries = _source_entries(source, source_type)
+    source_stat = _source_stat(source, entries)
+    saved = dest_dir / source.name if source_type == "video" else dest_dir
+    previous = previous or {}
+    cached_digest = previous.get("source_digest")
+    if (
+        cached_digest
+        and previous.get("source_type") == source_type
+        and previous.get("source_stat") == source_stat
+        and all((dest_dir / entry.name).is_file() for entry in entries)
+    ):
+        logger.info("Source unchanged since last extraction (%s); reusing sha256=%s", source, cached_digest)
+        return saved, str(cached_digest), source_stat
+    _clear_directory(dest_dir)
+    if source_type == "video":
+        digest = store.put(source, allow_hardlink=False)
+        method = store.materialize(digest, saved)
+        logger.info("Stored video source at %s via %s sha256=%s", saved, method, digest)
+        return saved, digest, source_stat
+    folder_digest = hashlib.sha256()
+    for entry in entries:
+        digest = store.put(entry, allow_hardlink=False)
+        store.materialize(digest, dest_dir / entry.name)
+        folder_digest.update(f"{entry.name}\0{digest}\n".encode("utf-8"))
+    logger.info("Stored %d images into %s", len(entries), dest_dir)
+    return saved, folder_digest.hexdigest(), source_stat
+
+
+def _source_entries(source: Path, source_type: str) -> List[Path]:
+    """Files making up the source: the video itself or the images in a folder."""
     if source_type == "video":
-        destination = dest_dir / source.name
-        shutil.copy2(source, destination)
-        logger.info("Copied video source to %s", destination)
-        return destination
+        return [source]
     if source.is_file():
         if source.suffix.lower() not in IMAGE_EXTENSIONS:
             raise ValueError(f"Expected an image file for source_type=images, got {source}")
-        destination = dest_dir
-        _clear_directory(destination)
-        target = destination / source.name
-        shutil.copy2(source, target)
-        logger.info("Copied image source to %s", target)
-        return destination
-    if not source.is_dir():
-        raise ValueError(f"Expected an image file or directory for source_type=images, got {source}")
-    destination = dest_dir
-    _clear_directory(destination)
-    copied = 0
-    for entry in sorted(source.iterdir()):
-        if entry.is_file() and entry.suffix.lower() in IMAGE_EXTENSIONS:
-            shutil.copy2(entry, destination / entry.name)
-            copied += 1
-    if copied == 0:
-        raise FileNotFoundError(f"No image files found under {source}")
-    logger.info("Copied %d images into %s", copied, destination)
-    return destination
+        return [source]
+    if source.is_dir():
+        entries = [
+            entry for entry in sorted(source.iterdir()) if entry.is_file() and entry.suffix.lower() in IMAGE_EXTENSIONS
+        ]
+        if not entries:
+            raise FileNotFoundError(f"No image files found under {source}")
+        return entries
+    raise ValueError(f"Expected an image file or directory for source_type=images, got {source}")
+
+
+def _source_stat(source: Path, entries: Sequence[Path]) -> dict:
+    """Path, total size, newest mtime_ns and a digest of per-file stats for ``entries``."""
+    stats = [(entry.name, entry.stat()) for entry in entries]
+    listing = hashlib.sha256()
+    for name, stat in stats:
+        listing.update(f"{name}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode("utf-8"))
+    return {
+        "path": str(source.resolve()),
+        "size": sum(stat.st_size for _, stat in stats),
+        "mtime_ns": max(stat.st_mtime_ns for _, stat in stats),
+        "entries": listing.hexdigest(),
+    }
+
+
+def _load_previous_metadata(paths: ScenePaths) -> dict:
+    try:
+        with paths.metadata_path.open("r", encoding="utf-8") as handle:
+            metadata = json.load(handle)
+    except (OSError, ValueError):
+        return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def _reusable_frame_scores(previous: dict, extraction_key: dict, frames_dir: Path) -> dict[int, FrameScore]:
+    """Map source index to the previous run's raw metrics for frames still on disk.
+
+    Returns an empty mapping unless the previous run saw the same source content
+    at the same extraction resolution and scored it with the current frame
+    metrics version; metadata written before per-frame source indices were
+    recorded is never reused.
+    """
+    if not previous or any(previous.get(key) != value for key, value in extraction_key.items()):
+        return {}
+    reusable: dict[int, FrameScore] = {}
+    for item in previous.get("frame_scores", []):
+        index = item.get("source_index")
+        filename = item.get("file")
+        if index is None or not filename or item.get("sharpness") is None or item.get("variance") is None:
+            continue
+        if not (frames_dir / filename).is_file():
+            continue
+        sharpness = float(item["sharpness"])
+        reusable[int(index)] = FrameScore(
+            filename=filename,
+            score=sharpness,
+            sharpness=sharpness,
+            variance=float(item["variance"]),
+            fingerprint=item.get("fingerprint"),
+            source_index=int(index),
+        )
+    return reusable
+
+
+def _extract_incremental(
+    source: Path,
+    output_dir: Path,
+    candidate_count: int,
+    source_type: str,
+    reusable: dict[int, FrameScore],
+    *,
+    mode: str = "decode",
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> Optional[List[FrameScore]]:
+    """Top up frames_all from a previous extraction of the same source.
+
+    Frames whose sampled index is already on disk are renamed into place and
+    keep their stored metrics; only the missing indices are decoded, with the
+    same numbering a full extraction in ``mode`` would use: one streaming pass
+    in ``"decode"`` mode (and for streams that are not constant frame rate),
+    parallel seeks in ``"seek"`` mode. Returns None
+    when nothing can be reused or the sample plan is unknown (video without a
+    frame count or fps), in which case the caller runs a full extraction.
+    """
+    stream_props = None
+    image_files: List[Path] = []
+    if source_type == "video":
+        stream_props = _ffprobe_stream_props(str(source))
+        _, _, fps, total, _, constant_rate = stream_props
+        if total is None or total <= 0 or fps <= 0:
+            return None
+        if mode == "seek" and not constant_rate:
+            logger.info("Incremental seek needs a constant frame rate; decoding missing frames of %s", source)
+            mode = "decode"
+    else:
+        image_files = _list_image_files(source)
+        total = len(image_files)
+    targets = _evenly_spaced_indices(total, min(candidate_count, total))
+    missing = [(position, index) for position, index in enumerate(targets) if index not in reusable]
+    reused = len(targets) - len(missing)
+    if reused == 0:
+        return None
+    logger.info(
+        "Incremental extraction: sampled=%d reused=%d decode=%d%s",
+        len(targets),
+        reused,
+        len(missing),
+        " (selection only)" if not missing else "",
+    )
+
+    # Park reused frames outside the frame namespace while stale ones are cleared.
+    staging = output_dir / ".reuse"
+    _clear_directory(staging)
+    staged: dict[int, Path] = {}
+    for index in targets:
+        item = reusable.get(index)
+        if item is not None:
+            parked = staging / f"{index}{Path(item.filename).suffix}"
+            (output_dir / item.filename).replace(parked)
+            staged[index] = parked
+    _clear_directory(output_dir)
+
+    by_position: dict[int, FrameScore] = {}
+    if missing:
+
+        def offset_progress(done: int, _total: int) -> None:
+            if progress_callback:
+                progress_callback(reused + done, len(targets))
+
+        position_of = {index: position for position, index in missing}
+        if stream_props is not None and mode == "seek":
+            by_position.update(
+                _seek_extract_targets(
+                    source,
+                    output_dir,
+                    missing,
+                    stream_props,
+                    workers=workers,
+                    scale_px=scale_px,
+                    resample=resample,
+                    codec=codec,
+                    progress_callback=offset_progress,
+                )
+            )
+        elif stream_props is not None:
+            reader = FFMPEGVideoReader(str(source), stream_props=stream_props, scale_px=scale_px, resample=resample)
+            sampled = _iter_sampled_frames(reader, [index for _, index in missing])
+            try:
+                for item in _run_extraction_pipeline(
+                    ((position_of[index], index, frame) for _, index, frame in sampled),
+                    output_dir,
+                    len(missing),
+                    workers=workers,
+                    codec=codec,
+                    progress_callback=offset_progress,
+                ):
+                    by_position[position_of[item.source_index]] = item
+            finally:
+                sampled.close()
+                reader.close()
+        else:
+            frames = (
+                (position, index, _load_image_to_array(image_files[index], scale_px=scale_px, resample=resample))
+                for position, index in missing
+            )
+            for item in _run_extraction_pipeline(
+                frames, output_dir, len(missing), workers=workers, codec=codec, progress_callback=offset_progress
+            ):
+                by_position[position_of[item.source_index]] = item
+    for position, index in enumerate(targets):
+        parked = staged.get(index)
+        if parked is None:
+            continue
+        filename = f"frame_{position:04d}{parked.suffix}"
+        parked.replace(output_dir / filename)
+        by_position[position] = replace(reusable[index], filename=filename)
+    staging.rmdir()
+    if progress_callback and not missing:
+        progress_callback(len(targets), len(targets))
+
+    scores = _score_with_quality(_compact_frame_names(output_dir, by_position))
+    _log_extraction_summary(scores)
+    return scores
 
 
 def _extract_from_video(
@@ -337,9 +659,49 @@ def _extract_from_video(
     output_dir: Path,
     candidate_count: int,
     *,
+    mode: str = "decode",
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[FrameScore]:
+    if mode == "seek":
+        return _extract_from_video_seek(
+            source_file,
+            output_dir,
+            candidate_count,
+            workers=workers,
+            scale_px=scale_px,
+            resample=resample,
+            codec=codec,
+            progress_callback=progress_callback,
+        )
+    return _extract_from_video_decode(
+        source_file,
+        output_dir,
+        candidate_count,
+        workers=workers,
+        scale_px=scale_px,
+        resample=resample,
+        codec=codec,
+        progress_callback=progress_callback,
+    )
+
+
+def _extract_from_video_decode(
+    source_file: Path,
+    output_dir: Path,
+    candidate_count: int,
+    *,
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
     progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> List[FrameScore]:
-    reader = FFMPEGVideoReader(str(source_file))
+    """Decode the whole stream with one reader and keep the sampled frames."""
+    reader = FFMPEGVideoReader(str(source_file), scale_px=scale_px, resample=resample)
     logger.info(
         "Video reader init path=%s stream=%dx%d rotation=%d output=%dx%d fps=%.3f frames=%s",
         source_file,
@@ -364,7 +726,190 @@ def _extract_from_video(
         sample_count,
         reader.frame_count is not None,
     )
+    scores = _run_extraction_pipeline(
+        _iter_sampled_frames(reader, target_indices),
+        output_dir,
+        sample_count,
+        workers=workers,
+        codec=codec,
+        progress_callback=progress_callback,
+    )
+    scores = _score_with_quality(scores)
+    _log_extraction_summary(scores)
+    logger.info("Video extraction stop, wrote %d frames", len(scores))
+    return scores
+
+
+def _extract_from_video_seek(
+    source_file: Path,
+    output_dir: Path,
+    candidate_count: int,
+    *,
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[FrameScore]:
+    """Seek straight to the sampled frames with parallel ffmpeg workers.
+
+    Sampled indices are grouped into runs that share a keyframe; each run is
+    decoded by one short-lived ffmpeg process seeking to its first frame, so
+    frames between distant samples are never decoded. Seek targets are computed
+    as ``index / fps``, so this falls back to full decode when the frame count
+    or fps is unknown or the stream is not constant frame rate.
+    """
+    stream_props = _ffprobe_stream_props(str(source_file))
+    _, _, fps, frame_count, _, constant_rate = stream_props
+    if frame_count is None or frame_count <= 0 or fps <= 0 or not constant_rate:
+        logger.info(
+            "Seek extraction needs frame_count, fps and a constant frame rate "
+            "(frame_count=%s fps=%.3f constant_rate=%s); falling back to full decode for %s",
+            frame_count,
+            fps,
+            constant_rate,
+            source_file,
+        )
+        return _extract_from_video_decode(
+            source_file,
+            output_dir,
+            candidate_count,
+            workers=workers,
+            scale_px=scale_px,
+            resample=resample,
+            codec=codec,
+            progress_callback=progress_callback,
+        )
+    sample_count = min(candidate_count, frame_count)
+    target_indices = _evenly_spaced_indices(frame_count, sample_count)
+    by_position = _seek_extract_targets(
+        source_file,
+        output_dir,
+        list(enumerate(target_indices)),
+        stream_props,
+        workers=workers,
+        scale_px=scale_px,
+        resample=resample,
+        codec=codec,
+        progress_callback=progress_callback,
+    )
+    scores = _score_with_quality(_compact_frame_names(output_dir, by_position))
+    _log_extraction_summary(scores)
+    logger.info("Video seek extraction stop, wrote %d frames", len(scores))
+    return scores
+
+
+def _seek_extract_targets(
+    source_file: Path,
+    output_dir: Path,
+    targets: Sequence[Tuple[int, int]],
+    stream_props: StreamProps,
+    *,
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> dict[int, FrameScore]:
+    """Decode ``(position, frame_index)`` targets with parallel seeking readers.
+
+    Each frame is written as ``frame_{position:04d}`` with the codec's
+    extension; the returned mapping is keyed by position and may have gaps
+    when the stream ends early.
+    """
+    fps = stream_props[2]
+    keyframes = _ffprobe_keyframe_indices(str(source_file), fps)
+    runs = _plan_seek_runs(targets, keyframes, max_gap=max(1, int(round(fps))))
+    worker_count = max(1, min(workers or os.cpu_count() or 4, len(runs)))
+    logger.info(
+        "Video seek extraction start: total_frames=%s sample_count=%d runs=%d workers=%d keyframes=%s",
+        stream_props[3],
+        len(targets),
+        len(runs),
+        worker_count,
+        len(keyframes) if keyframes is not None else "unknown",
+    )
+
+    results: queue.Queue = queue.Queue()
+
+    def _decode_run(run: List[Tuple[int, int]]) -> None:
+        first_index = run[0][1]
+        wanted = {frame_index - first_index: (position, frame_index) for position, frame_index in run}
+        # Seek half a frame early so timestamp rounding never skips the first target.
+        reader = FFMPEGVideoReader(
+            str(source_file),
+            start_time=max(0.0, (first_index - 0.5) / fps),
+            max_frames=run[-1][1] - first_index + 1,
+            stream_props=stream_props,
+            scale_px=scale_px,
+            resample=resample,
+        )
+        batch: List[Tuple[int, int, np.ndarray]] = []
+
+        def _flush() -> None:
+            scores = _save_and_score_frames(
+                [frame for _, _, frame in batch],
+                output_dir,
+                [_frame_filename(position, codec) for position, _, _ in batch],
+                codec,
+            )
+            for (position, frame_index, _), score in zip(batch, scores):
+                results.put((position, replace(score, source_index=frame_index)))
+            batch.clear()
+
+        try:
+            for offset, frame in enumerate(reader):
+                target = wanted.get(offset)
+                if target is not None:
+                    batch.append((*target, frame))
+                    if len(batch) >= _score_batch_size(frame):
+                        _flush()
+            if batch:
+                _flush()
+        finally:
+            reader.close()
+
+    by_position: dict[int, FrameScore] = {}
+    with ThreadPoolExecutor(max_workers=worker_count, thread_name_prefix="seek_extract") as executor:
+        futures = [executor.submit(_decode_run, run) for run in runs]
+        while True:
+            try:
+                position, score = results.get(timeout=0.1)
+            except queue.Empty:
+                if all(future.done() for future in futures) and results.empty():
+                    break
+                continue
+            by_position[position] = score
+            if progress_callback:
+                progress_callback(len(by_position), len(targets))
+        for future in futures:
+            # Propagate worker exceptions to the caller.
+            future.result()
+    return by_position
+
+
+def _compact_frame_names(output_dir: Path, by_position: dict[int, FrameScore]) -> List[FrameScore]:
+    """Renumber frames in position order so names stay contiguous across gaps.
+
+    Over-reported frame counts can leave gaps; renumbering keeps names identical
+    to what a full decode would produce.
+    """
     scores: List[FrameScore] = []
+    for position in sorted(by_position):
+        item = by_position[position]
+        filename = f"frame_{len(scores):04d}{Path(item.filename).suffix}"
+        if item.filename != filename:
+            (output_dir / item.filename).replace(output_dir / filename)
+            item = replace(item, filename=filename)
+        scores.append(item)
+    return scores
+
+
+def _iter_sampled_frames(
+    reader: "FFMPEGVideoReader", target_indices: Sequence[int]
+) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """Yield ``(position, frame_index, frame)`` for each sampled index while streaming every frame."""
+    written = 0
     next_target_idx = 0
     next_target = target_indices[next_target_idx] if target_indices else None
     try:
@@ -380,41 +925,38 @@ def _extract_from_video(
                     next_target = target_indices[next_target_idx] if next_target_idx < len(target_indices) else None
                 if next_target is None or idx != next_target:
                     continue
-            filename = f"frame_{len(scores):04d}.png"
-            destination = output_dir / filename
-            _save_frame_image(frame, destination)
-            sharpness, variance, fingerprint = _frame_quality_metrics(frame)
-            scores.append(
-                FrameScore(
-                    filename=filename,
-                    score=sharpness,
-                    sharpness=sharpness,
-                    variance=variance,
-                    fingerprint=fingerprint,
-                )
-            )
-            if progress_callback:
-                progress_callback(len(scores), sample_count)
+            yield written, idx, frame
+            written += 1
             next_target_idx += 1
             next_target = target_indices[next_target_idx] if next_target_idx < len(target_indices) else None
     finally:
         reader.close()
-    scores = _score_with_quality(scores)
-    if scores:
-        mean_score = float(np.mean([item.score for item in scores]))
-        min_score = min(item.score for item in scores)
-        max_score = max(item.score for item in scores)
-        logger.info(
-            "Extraction summary wrote=%d mean=%.4f min=%.4f max=%.4f first=%s last=%s",
-            len(scores),
-            mean_score,
-            min_score,
-            max_score,
-            scores[0].filename,
-            scores[-1].filename,
-        )
-    logger.info("Video extraction stop, wrote %d frames", len(scores))
-    return scores
+
+
+def _plan_seek_runs(
+    targets: Sequence[Tuple[int, int]], keyframes: Optional[Sequence[int]], *, max_gap: int
+) -> List[List[Tuple[int, int]]]:
+    """Group ``(position, frame_index)`` targets into runs decoded by one seek each.
+
+    Consecutive targets stay in the same run when no keyframe separates them,
+    since seeking would restart decoding from the same keyframe anyway. Without
+    keyframe information targets closer than ``max_gap`` frames are merged.
+    """
+    runs: List[List[Tuple[int, int]]] = []
+    current_key: Optional[int] = None
+    for position, frame_index in targets:
+        if keyframes:
+            key_pos = bisect_right(keyframes, frame_index) - 1
+            key = keyframes[key_pos] if key_pos >= 0 else 0
+            contiguous = bool(runs) and key == current_key
+            current_key = key
+        else:
+            contiguous = bool(runs) and frame_index - runs[-1][-1][1] <= max_gap
+        if contiguous:
+            runs[-1].append((position, frame_index))
+        else:
+            runs.append([(position, frame_index)])
+    return runs
 
 
 def _extract_from_image_folder(
@@ -422,13 +964,13 @@ def _extract_from_image_folder(
     output_dir: Path,
     candidate_count: int,
     *,
+    workers: Optional[int] = None,
+    scale_px: int = 0,
+    resample: str = "lanczos",
+    codec: str = DEFAULT_CODEC,
     progress_callback: Optional[Callable[[int, int], None]] = None,
 ) -> List[FrameScore]:
-    image_files = [
-        path for path in sorted(source_dir.iterdir()) if path.suffix.lower() in IMAGE_EXTENSIONS
-    ]
-    if not image_files:
-        raise FileNotFoundError(f"No images to process in {source_dir}")
+    image_files = _list_image_files(source_dir)
     use_count = min(candidate_count, len(image_files))
     indices = _evenly_spaced_indices(len(image_files), use_count)
     logger.info(
@@ -437,143 +979,344 @@ def _extract_from_image_folder(
         use_count,
         len(indices) == use_count and use_count < len(image_files),
     )
-    scores: List[FrameScore] = []
-    for idx, image_list_index in enumerate(indices):
-        image_path = image_files[image_list_index]
-        frame = _load_image_to_array(image_path)
-        filename = f"frame_{idx:04d}.png"
-        destination = output_dir / filename
-        _save_frame_image(frame, destination)
-        sharpness, variance, fingerprint = _frame_quality_metrics(frame)
-        scores.append(
-            FrameScore(
-                filename=filename,
-                score=sharpness,
-                sharpness=sharpness,
-                variance=variance,
-                fingerprint=fingerprint,
-            )
-        )
-        if progress_callback:
-            progress_callback(idx + 1, use_count)
+    frames = (
+        (idx, image_list_index, _load_image_to_array(image_files[image_list_index], scale_px=scale_px, resample=resample))
+        for idx, image_list_index in enumerate(indices)
+    )
+    scores = _run_extraction_pipeline(
+        frames, output_dir, use_count, workers=workers, codec=codec, progress_callback=progress_callback
+    )
     scores = _score_with_quality(scores)
-    if scores:
-        mean_score = float(np.mean([item.score for item in scores]))
-        min_score = min(item.score for item in scores)
-        max_score = max(item.score for item in scores)
-        logger.info(
-            "Extraction summary wrote=%d mean=%.4f min=%.4f max=%.4f first=%s last=%s",
-            len(scores),
-            mean_score,
-            min_score,
-            max_score,
-            scores[0].filename,
-            scores[-1].filename,
-        )
+    _log_extraction_summary(scores)
     logger.info("Image extraction stop, wrote %d frames", len(scores))
     return scores
 
 
-def _write_selected_frames(frames_dir: Path, selected_dir: Path, selected_filenames: Sequence[str]) -> None:
+def _list_image_files(source_dir: Path) -> List[Path]:
+    image_files = [path for path in sorted(source_dir.iterdir()) if path.suffix.lower() in IMAGE_EXTENSIONS]
+    if not image_files:
+        raise FileNotFoundError(f"No images to process in {source_dir}")
+    return image_files
+
+
+@dataclass
+class _PipelineStats:
+    """Busy time per extraction stage; encode/score are summed across workers."""
+
+    frames: int = 0
+    decode_s: float = 0.0
+    encode_s: float = 0.0
+    score_s: float = 0.0
+
+
+def _run_extraction_pipeline(
+    frames: Iterable[Tuple[int, int, np.ndarray]],
+    output_dir: Path,
+    total: int,
+    *,
+    workers: Optional[int] = None,
+    codec: str = DEFAULT_CODEC,
+    progress_callback: Optional[Callable[[int, int], None]] = None,
+) -> List[FrameScore]:
+    """Decode on one thread while a worker pool encodes and scores frames.
+
+    ``frames`` yields ``(position, source_index, frame)`` and is consumed on a dedicated
+    decoder thread that groups same-sized frames into stacks of
+    ``_score_batch_size`` frames, so each worker scores a whole stack in one
+    vectorized pass. The stacks feed a bounded queue, so at most
+    ``2 * workers`` stacks are held in memory. Files are named from
+    ``position`` and results are returned in position order regardless of
+    completion order.
+    ``progress_callback`` is invoked on the calling thread with a monotonically
+    increasing count, exactly as in the sequential path.
+    """
+    worker_count = max(1, workers or os.cpu_count() or 4)
+    pending: queue.Queue = queue.Queue(maxsize=worker_count * 2)
+    done: queue.Queue = queue.Queue()
+    stop = threading.Event()
+    stats = _PipelineStats()
+    stats_lock = threading.Lock()
+
+    def _put(item: object) -> bool:
+        while not stop.is_set():
+            try:
+                pending.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _decode() -> None:
+        iterator = iter(frames)
+        batch: List[Tuple[int, int, np.ndarray]] = []
+        try:
+            while not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    break
+                stats.decode_s += time.perf_counter() - start
+                if batch and item[2].shape != batch[0][2].shape:
+                    if not _put(batch):
+                        break
+                    batch = []
+                batch.append(item)
+                if len(batch) >= _score_batch_size(item[2]):
+                    if not _put(batch):
+                        break
+                    batch = []
+            if batch:
+                _put(batch)
+        except Exception as exc:  # noqa: BLE001 - surfaced on the calling thread
+            stop.set()
+            done.put(exc)
+        finally:
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                close()
+            for _ in range(worker_count):
+                _put(None)
+
+    def _work() -> None:
+        while True:
+            try:
+                batch = pending.get(timeout=0.1)
+            except queue.Empty:
+                if stop.is_set():
+                    return
+                continue
+            if batch is None:
+                return
+            try:
+                start = time.perf_counter()
+                filenames = [_frame_filename(position, codec) for position, _, _ in batch]
+                for (_, _, frame), filename in zip(batch, filenames):
+                    _save_frame_image(frame, output_dir / filename, codec)
+                encoded = time.perf_counter()
+                scores = _score_frame_stack([frame for _, _, frame in batch], filenames)
+                scored = time.perf_counter()
+            except Exception as exc:  # noqa: BLE001 - surfaced on the calling thread
+                stop.set()
+                done.put(exc)
+                return
+            with stats_lock:
+                stats.encode_s += encoded - start
+                stats.score_s += scored - encoded
+            for (position, source_index, _), score in zip(batch, scores):
+                done.put((position, replace(score, source_index=source_index)))
+
+    wall_start = time.perf_counter()
+    threads = [threading.Thread(target=_decode, name="extract_decode", daemon=True)]
+    threads.extend(
+        threading.Thread(target=_work, name=f"extract_worker_{idx}", daemon=True) for idx in range(worker_count)
+    )
+    for thread in threads:
+        thread.start()
+
+    by_position: dict[int, FrameScore] = {}
+    error: Optional[Exception] = None
+    while True:
+        try:
+            result = done.get(timeout=0.1)
+        except queue.Empty:
+            if not any(thread.is_alive() for thread in threads) and done.empty():
+                break
+            continue
+        if isinstance(result, Exception):
+            error = error or result
+            continue
+        position, score = result
+        by_position[position] = score
+        if progress_callback and error is None:
+            progress_callback(len(by_position), total)
+    for thread in threads:
+        thread.join()
+    if error is not None:
+        raise error
+
+    stats.frames = len(by_position)
+    wall = time.perf_counter() - wall_start
+    logger.info(
+        "Extraction pipeline frames=%d workers=%d wall=%.2fs overall=%.1f fps "
+        "decode=%.1f fps encode=%.1f fps/worker score=%.1f fps/worker",
+        stats.frames,
+        worker_count,
+        wall,
+        _throughput(stats.frames, wall),
+        _throughput(stats.frames, stats.decode_s),
+        _throughput(stats.frames, stats.encode_s),
+        _throughput(stats.frames, stats.score_s),
+    )
+    return [by_position[position] for position in sorted(by_position)]
+
+
+def _throughput(count: int, seconds: float) -> float:
+    return count / seconds if seconds > 0 else 0.0
+
+
+def _score_batch_size(frame: np.ndarray) -> int:
+    """Frames of this size to stack per scoring call (one chunk of ``_batch_frame_quality_metrics``)."""
+    pixels = max(1, frame.shape[0] * frame.shape[1])
+    return max(1, min(_SCORE_BATCH_MAX, _SCORE_CHUNK_PIXELS // pixels))
+
+
+def _score_frame_stack(frames: Sequence[np.ndarray], filenames: Sequence[str]) -> List[FrameScore]:
+    """Score same-sized frames in one vectorized pass and return their raw metrics."""
+    sharpness, variance, fingerprints = _batch_frame_quality_metrics(
+        np.stack(frames), chunk_pixels=_SCORE_CHUNK_PIXELS
+    )
+    return [
+        FrameScore(
+            filename=filename,
+            score=float(sharp),
+            sharpness=float(sharp),
+            variance=float(var),
+            fingerprint=fingerprint,
+        )
+        for filename, sharp, var, fingerprint in zip(filenames, sharpness, variance, fingerprints)
+    ]
+
+
+def _save_and_score_frames(
+    frames: Sequence[np.ndarray], output_dir: Path, filenames: Sequence[str], codec: str = DEFAULT_CODEC
+) -> List[FrameScore]:
+    """Write same-sized frames into ``output_dir`` and score them as one stack."""
+    for frame, filename in zip(frames, filenames):
+        _save_frame_image(frame, output_dir / filename, codec)
+    return _score_frame_stack(frames, filenames)
+
+
+def _log_extraction_summary(scores: Sequence[FrameScore]) -> None:
+    if not scores:
+        return
+    mean_score = float(np.mean([item.score for item in scores]))
+    min_score = min(item.score for item in scores)
+    max_score = max(item.score for item in scores)
+    logger.info(
+        "Extraction summary wrote=%d mean=%.4f min=%.4f max=%.4f first=%s last=%s",
+        len(scores),
+        mean_score,
+        min_score,
+        max_score,
+        scores[0].filename,
+        scores[-1].filename,
+    )
+
+
+def _write_selected_frames(
+    frames_dir: Path, selected_dir: Path, selected_filenames: Sequence[str], store: BlobStore
+) -> None:
     selected_dir.mkdir(parents=True, exist_ok=True)
     _clear_directory(selected_dir)
+    methods: dict[str, int] = {}
     for name in selected_filenames:
         source_file = frames_dir / name
         destination = selected_dir / name
         if not source_file.exists():
             raise FileNotFoundError(f"Selected frame missing: {source_file}")
-        shutil.copy2(source_file, destination)
-    logger.info("Wrote %d selected frames into %s", len(selected_filenames), selected_dir)
+        method = store.link_file(source_file, destination)
+        methods[method] = methods.get(method, 0) + 1
+    logger.info("Wrote %d selected frames into %s links=%s", len(selected_filenames), selected_dir, methods)
+
+
+def _release_blobs(store: BlobStore, digests: Iterable[str]) -> None:
+    """Drop blobs the scene no longer links to; a failed cleanup never fails the caller."""
+    try:
+        store.release(digests)
+    except OSError:
+        logger.warning("Blob store cleanup failed under %s", store.root, exc_info=True)
 
 
 def _clear_directory(path: Path) -> None:
     path.mkdir(parents=True, exist_ok=True)
     for item in path.iterdir():
-        if item.is_file():
+        if item.is_file() or item.is_symlink():
             item.unlink()
 
 
-def _frame_quality_metrics(frame: np.ndarray) -> tuple[float, float, str]:
-    """Return sharpness, variance, and a small perceptual fingerprint for a frame."""
-    grayscale = _to_grayscale(frame)
-    sharpness = _sharpness_from_grayscale(grayscale)
-    variance = _variance_score(grayscale)
-    fingerprint = _fingerprint_from_grayscale(grayscale)
-    return sharpness, variance, fingerprint
+def _batch_frame_quality_metrics(
+    frames: np.ndarray, *, hash_size: int = 8, chunk_pixels: int = _SCORE_CHUNK_PIXELS
+) -> tuple[np.ndarray, np.ndarray, List[str]]:
+    """Score a (B, H, W[, 3]) uint8 stack in one vectorized pass.
 
+    Returns sharpness and variance arrays of shape (B,) and one hex
+    fingerprint per frame. Sharpness is the mean absolute wrap-around
+    Laplacian. The perceptual hash uses box-filter (area mean) downsampling
+    instead of PIL's Lanczos resize, so a few bits can differ from the
+    per-frame reference kept in ``bench.py score``.
 
-def _sharpness_from_grayscale(grayscale: np.ndarray) -> float:
-    laplacian = (
-        -4 * grayscale
-        + np.roll(grayscale, 1, axis=0)
-        + np.roll(grayscale, -1, axis=0)
-        + np.roll(grayscale, 1, axis=1)
-        + np.roll(grayscale, -1, axis=1)
-    )
-    return float(np.mean(np.abs(laplacian)))
+    Frames are processed in chunks of about ``chunk_pixels`` pixels: small
+    frames are stacked to amortize per-call overhead, while large frames go
+    one at a time because the kernels are memory-bound and a multi-frame
+    float32 working set falls out of cache.
+    """
+    if frames.ndim == 3 and frames.shape[-1] != 3:
+        frames = frames[..., None]
+    count = frames.shape[0]
+    chunk_size = max(1, chunk_pixels // max(1, frames.shape[1] * frames.shape[2]))
+    sharpness = np.empty(count, dtype=np.float64)
+    variance = np.empty(count, dtype=np.float64)
+    bits = np.empty((count, hash_size * hash_size), dtype=bool)
+    for start in range(0, count, chunk_size):
+        stop = min(count, start + chunk_size)
+        gray = _batch_grayscale(frames[start:stop])
+        sharpness[start:stop] = _batch_laplacian_energy(gray)
+        variance[start:stop] = gray.var(axis=(1, 2))
+        small = _box_downsample(np.clip(gray, 0, 255, out=gray), hash_size)
+        bits[start:stop] = (small > small.mean(axis=(1, 2), keepdims=True)).reshape(stop - start, -1)
+    # packbits is MSB-first, so the first pixel is the most significant hex digit.
+    packed = np.packbits(bits, axis=1)
+    fingerprints = [row.tobytes().hex() for row in packed]
+    return sharpness, variance, fingerprints
+
+
+def _batch_grayscale(frames: np.ndarray) -> np.ndarray:
+    """BT.601 luma of a (B, H, W, C) stack as float32."""
+    if frames.shape[-1] == 1:
+        return frames[..., 0].astype(np.float32)
+    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
+    return np.tensordot(frames[..., :3].astype(np.float32), weights, axes=([3], [0]))
 
 
-def _variance_score(grayscale: np.ndarray) -> float:
-    return float(np.var(grayscale))
+def _batch_laplacian_energy(gray: np.ndarray) -> np.ndarray:
+    """Mean |4-neighbour Laplacian| per frame with wrap-around borders."""
+    lap = np.roll(gray, 1, axis=1)
+    lap += np.roll(gray, -1, axis=1)
+    lap += np.roll(gray, 1, axis=2)
+    lap += np.roll(gray, -1, axis=2)
+    lap -= np.float32(4.0) * gray
+    np.abs(lap, out=lap)
+    return lap.mean(axis=(1, 2)).astype(np.float64)
 
 
-def _fingerprint_from_grayscale(grayscale: np.ndarray, hash_size: int = 8) -> str:
-    """Compact perceptual hash used to penalize visually similar frames."""
-    image = Image.fromarray(np.clip(grayscale, 0, 255).astype(np.uint8))
-    small = image.resize((hash_size, hash_size), Image.LANCZOS)
-    arr = np.array(small, dtype=np.float32)
-    mean_val = float(arr.mean()) if arr.size else 0.0
-    bits = (arr.flatten() > mean_val).astype(np.uint8)
-    value = 0
-    for bit in bits:
-        value = (value << 1) | int(bit)
-    # 64 bits -> 16 hex characters for the default hash_size.
-    width = max(1, hash_size * hash_size // 4)
-    return f"{value:0{width}x}"
+def _box_downsample(gray: np.ndarray, size: int) -> np.ndarray:
+    """Area-average a (B, H, W) stack down to (B, size, size) with uneven bins allowed."""
+    _, height, width = gray.shape
+    row_edges = np.linspace(0, height, size + 1).astype(np.intp)
+    col_edges = np.linspace(0, width, size + 1).astype(np.intp)
+    if height % size == 0 and width % size == 0:
+        return gray.reshape(gray.shape[0], size, height // size, size, width // size).mean(axis=(2, 4))
+    rows = np.add.reduceat(gray, row_edges[:-1], axis=1)
+    cells = np.add.reduceat(rows, col_edges[:-1], axis=2)
+    areas = np.outer(np.diff(row_edges), np.diff(col_edges)).astype(np.float32)
+    return cells / np.maximum(areas, 1.0)
 
 
 def _score_with_quality(frame_scores: Sequence[FrameScore]) -> List[FrameScore]:
     """Combine sharpness and variance into a single quality score."""
     if not frame_scores:
         return []
-    sharp_values = [fs.sharpness for fs in frame_scores if fs.sharpness is not None]
-    var_values = [fs.variance for fs in frame_scores if fs.variance is not None]
-    if not sharp_values or not var_values:
-        return list(frame_scores)
-    sharp_min, sharp_max = min(sharp_values), max(sharp_values)
-    var_min, var_max = min(var_values), max(var_values)
-    sharp_range = sharp_max - sharp_min if sharp_max != sharp_min else 1e-6
-    var_range = var_max - var_min if var_max != var_min else 1e-6
-    weighted: List[FrameScore] = []
-    for item in frame_scores:
-        sharp_norm = (item.sharpness - sharp_min) / sharp_range if item.sharpness is not None else 0.0
-        var_norm = (item.variance - var_min) / var_range if item.variance is not None else 0.0
-        combined = 0.7 * sharp_norm + 0.3 * var_norm
-        weighted.append(replace(item, score=combined))
-    return weighted
-
-
-def _fingerprint_distance(a: str, b: str) -> int:
-    """Hamming distance between two perceptual hashes encoded as hex strings."""
-    try:
-        a_int = int(a, 16)
-        b_int = int(b, 16)
-    except Exception:
-        return 64
-    return int(bin(a_int ^ b_int).count("1"))
+    combined = quality_scorer(frame_scores)
+    return [replace(item, score=float(value)) for item, value in zip(frame_scores, combined)]
 
 
-def _to_grayscale(frame: np.ndarray) -> np.ndarray:
-    if frame.ndim == 2:
-        return frame.astype(np.float32)
-    channels = frame[..., :3].astype(np.float32)
-    weights = np.array([0.299, 0.587, 0.114], dtype=np.float32)
-    return np.tensordot(channels, weights, axes=([2], [0]))
+def _frame_filename(position: int, codec: str = DEFAULT_CODEC) -> str:
+    return f"frame_{position:04d}{get_codec(codec).extension}"
 
 
-def _save_frame_image(frame: np.ndarray, destination: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
-    Image.fromarray(frame.astype(np.uint8)).save(destination, format="PNG")
+def _save_frame_image(frame: np.ndarray, destination: Path, codec: str = DEFAULT_CODEC) -> None:
+    get_codec(codec).encode(frame, destination)
 
 
 def _rotate_frame(frame: np.ndarray, rotation: int) -> np.ndarray:
@@ -588,13 +1331,42 @@ def _rotate_frame(frame: np.ndarray, rotation: int) -> np.ndarray:
     return frame
 
 
-def _load_image_to_array(path: Path) -> np.ndarray:
+def _load_image_to_array(path: Path, *, scale_px: int = 0, resample: str = "lanczos") -> np.ndarray:
     with Image.open(path) as img:
-        return np.array(img.convert("RGB"), dtype=np.uint8)
+        img = img.convert("RGB")
+        new_size = _scaled_size(img.width, img.height, scale_px)
+        if new_size != img.size:
+            img = img.resize(new_size, _PIL_RESAMPLE.get(resample, Image.LANCZOS))
+        return np.array(img, dtype=np.uint8)
+
+
+def _scaled_size(width: int, height: int, scale_px: int) -> tuple[int, int]:
+    """Return (width, height) downscaled so the small side is ``scale_px`` (never upscales)."""
+    small_side = min(width, height)
+    if scale_px <= 0 or small_side <= scale_px:
+        return width, height
+    scale = scale_px / float(small_side)
+    return max(1, int(round(width * scale))), max(1, int(round(height * scale)))
+
+
+def _ffmpeg_executable() -> str:
+    """``ffmpeg`` from PATH, else the binary bundled with imageio-ffmpeg when installed."""
+    if shutil.which("ffmpeg") is not None:
+        return "ffmpeg"
+    try:
+        import imageio_ffmpeg
+    except ImportError:
+        return "ffmpeg"
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
 
+def _ffprobe_stream_props(video_path: str) -> StreamProps:
+    """Return width/height/fps/frame_count/rotation/constant_rate for the primary video stream.
 
-def _ffprobe_stream_props(video_path: str) -> tuple[int, int, float, int | None, int]:
-    """Return width/height/fps/frame_count/rotation for the primary video stream."""
+    ``constant_rate`` is False when ``avg_frame_rate`` or ``nb_frames / duration``
+    disagrees with ``r_frame_rate``; frame indices derived from ``fps`` are only
+    trustworthy as seek targets when it is True.
+    """
     cmd = [
         "ffprobe",
         "-v",
@@ -619,24 +1391,114 @@ def _ffprobe_stream_props(video_path: str) -> tuple[int, int, float, int | None,
     height = int(stream.get("height", 0))
     if width <= 0 or height <= 0:
         raise ValueError(f"Invalid video dimensions reported by ffprobe for {video_path}: {width}x{height}")
-    rate = stream.get("r_frame_rate", "0/1")
-    num, den = map(int, rate.split("/")) if "/" in rate else (0, 1)
-    fps = num / den if den else 0.0
+    fps = _parse_rate(stream.get("r_frame_rate"))
+    avg_fps = _parse_rate(stream.get("avg_frame_rate"))
     nb = str(stream.get("nb_frames", "") or "")
     frame_count = int(nb) if nb.isdigit() else None
+    duration = _parse_seconds(stream.get("duration"))
+    if duration <= 0:
+        duration = _parse_seconds(info.get("format", {}).get("duration"))
+    constant_rate = _is_constant_frame_rate(fps, avg_fps, frame_count, duration)
     rotation = _extract_rotation(stream)
     logger.info(
-        "ffprobe parsed path=%s width=%d height=%d fps=%.3f frame_count=%s rotation=%d side_data=%s tags=%s",
+        "ffprobe parsed path=%s width=%d height=%d fps=%.3f avg_fps=%.3f duration=%.3f frame_count=%s "
+        "constant_rate=%s rotation=%d side_data=%s tags=%s",
         video_path,
         width,
         height,
         fps,
+        avg_fps,
+        duration,
         frame_count if frame_count is not None else "unknown",
+        constant_rate,
         rotation,
         stream.get("side_data_list", []),
         stream.get("tags", {}),
     )
-    return width, height, fps, frame_count, rotation
+    return width, height, fps, frame_count, rotation, constant_rate
+
+
+def _parse_rate(rate: object) -> float:
+    """Parse an ffprobe ``num/den`` rate; unknown rates (``0/0``) are 0."""
+    text = str(rate or "")
+    try:
+        if "/" in text:
+            num, den = (float(part) for part in text.split("/", 1))
+            return num / den if den else 0.0
+        return float(text) if text else 0.0
+    except ValueError:
+        return 0.0
+
+
+def _parse_seconds(value: object) -> float:
+    try:
+        seconds = float(value) if value not in (None, "", "N/A") else 0.0
+    except (TypeError, ValueError):
+        return 0.0
+    return seconds if math.isfinite(seconds) else 0.0
+
+
+def _is_constant_frame_rate(
+    fps: float, avg_fps: float, frame_count: Optional[int], duration: float, *, tolerance: float = 0.01
+) -> bool:
+    """Whether frame ``i`` can be assumed to start at ``i / fps``.
+
+    ``r_frame_rate`` is the stream's base rate, not a promise: variable-rate
+    phone footage reports a nominal rate there while ``avg_frame_rate`` and
+    ``nb_frames / duration`` show the real cadence. Checks that cannot be made
+    (missing average rate, frame count or duration) are skipped.
+    """
+    if fps <= 0:
+        return False
+    if avg_fps > 0 and abs(avg_fps - fps) > tolerance * fps:
+        return False
+    if frame_count is not None and frame_count > 0 and duration > 0:
+        # Allow a couple of frames of slack for containers whose duration stops at the last pts.
+        expected = fps * duration
+        if abs(frame_count - expected) > max(2.0, tolerance * frame_count):
+            return False
+    return True
+
+
+def _ffprobe_keyframe_indices(video_path: str, fps: float) -> Optional[List[int]]:
+    """Return sorted frame indices of keyframes from packet flags, or None if unavailable.
+
+    Only packets are demuxed (nothing is decoded), so this is cheap even for long videos.
+    """
+    cmd = [
+        "ffprobe",
+        "-v",
+        "error",
+        "-select_streams",
+        "v:0",
+        "-show_entries",
+        "packet=pts_time,flags",
+        "-of",
+        "csv=p=0",
+        video_path,
+    ]
+    try:
+        out = subprocess.run(cmd, stdout=subprocess.PIPE, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError) as exc:
+        logger.warning("ffprobe keyframe scan failed for %s: %s", video_path, exc)
+        return None
+    pts_values: List[float] = []
+    key_pts: List[float] = []
+    for line in out.splitlines():
+        parts = line.strip().split(",")
+        if len(parts) < 2:
+            continue
+        try:
+            pts = float(parts[0])
+        except ValueError:
+            continue
+        pts_values.append(pts)
+        if "K" in parts[1]:
+            key_pts.append(pts)
+    if not key_pts:
+        return None
+    origin = min(pts_values)
+    return sorted({int(round((pts - origin) * fps)) for pts in key_pts})
 
 
 def _extract_rotation(stream_info: dict) -> int:
@@ -685,14 +1547,42 @@ def _rotation_from_displaymatrix(matrix_str: str) -> Optional[int]:
 class FFMPEGVideoReader:
     """Stream raw RGB frames from a video using ffmpeg."""
 
-    def __init__(self, video_path: str, *, pix_fmt: str = "rgb24") -> None:
+    def __init__(
+        self,
+        video_path: str,
+        *,
+        pix_fmt: str = "rgb24",
+        start_time: Optional[float] = None,
+        max_frames: Optional[int] = None,
+        stream_props: Optional[StreamProps] = None,
+        scale_px: int = 0,
+        resample: str = "lanczos",
+    ) -> None:
+        """Open ``video_path`` for streaming.
+
+        ``start_time`` (seconds) seeks before decoding and ``max_frames`` stops
+        after that many frames. ``stream_props`` reuses a previous
+        ``_ffprobe_stream_props`` result to skip probing again. ``scale_px``
+        downscales inside ffmpeg so the small side of each frame is at most
+        that many pixels; ``output_width``/``output_height`` report the scaled
+        size.
+        """
         self.video_path = video_path
-        self.width, self.height, self.fps, self.frame_count, self.rotation = _ffprobe_stream_props(video_path)
+        (
+            self.width,
+            self.height,
+            self.fps,
+            self.frame_count,
+            self.rotation,
+            self.constant_rate,
+        ) = stream_props if stream_props is not None else _ffprobe_stream_props(video_path)
         # Trust ffmpeg autorotate; swap expected dimensions for 90/270.
         if self.rotation in {90, 270}:
             self.output_width, self.output_height = self.height, self.width
         else:
             self.output_width, self.output_height = self.width, self.height
+        rotated_size = (self.output_width, self.output_height)
+        self.output_width, self.output_height = _scaled_size(self.output_width, self.output_height, scale_px)
         self.frame_size = self.output_width * self.output_height * 3
         logger.debug(
             "FFMPEGVideoReader setup path=%s width=%d height=%d rotation=%d output_w=%d output_h=%d fps=%.3f frame_count=%s frame_size=%d",
@@ -706,18 +1596,18 @@ class FFMPEGVideoReader:
             self.frame_count if self.frame_count is not None else "unknown",
             self.frame_size,
         )
-        cmd = [
-            "ffmpeg",
-            "-loglevel",
-            "error",
-            "-i",
-            video_path,
-            "-f",
-            "rawvideo",
-            "-pix_fmt",
-            pix_fmt,
-            "-",
-        ]
+        cmd = [_ffmpeg_executable(), "-loglevel", "error"]
+        if start_time is not None and start_time > 0:
+            # Input seeking jumps to the preceding keyframe and decodes forward accurately.
+            cmd.extend(["-ss", f"{start_time:.6f}"])
+        cmd.extend(["-i", video_path])
+        if max_frames is not None:
+            cmd.extend(["-frames:v", str(int(max_frames))])
+        if (self.output_width, self.output_height) != rotated_size:
+            # Autorotation runs before -vf, so the target size is in display orientation.
+            flags = _FFMPEG_SCALE_FLAGS.get(resample, "lanczos")
+            cmd.extend(["-vf", f"scale={self.output_width}:{self.output_height}:flags={flags}"])
+        cmd.extend(["-f", "rawvideo", "-pix_fmt", pix_fmt, "-"])
         self.proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
         self.idx = 0
 
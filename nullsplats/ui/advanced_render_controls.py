@@ -7,6 +7,8 @@ import tkinter as tk
 from tkinter import ttk
 from typing import Callable, Optional
 
+from nullsplats.backend.splat_cull import DEFAULT_MIN_RADIUS_PX
+from nullsplats.backend.splat_lod import DEFAULT_LOD_PIXEL_THRESHOLD
 from nullsplats.ui.gl_canvas import CameraView
 
 
@@ -20,6 +22,11 @@ class AdvancedRenderSettingsPanel(ttk.LabelFrame):
         self.sort_mode_var = tk.StringVar(value="back")
         self.debug_mode_var = tk.BooleanVar(value=False)
         self.flat_color_var = tk.BooleanVar(value=False)
+        self.lod_enabled_var = tk.BooleanVar(value=True)
+        self._lod_threshold_var = tk.DoubleVar(value=DEFAULT_LOD_PIXEL_THRESHOLD)
+        self.culling_var = tk.BooleanVar(value=True)
+        self._min_radius_var = tk.DoubleVar(value=DEFAULT_MIN_RADIUS_PX)
+        self._stats_var = tk.StringVar(value="Visible: -")
         self._yaw_var = tk.DoubleVar(value=0.0)
         self._pitch_var = tk.DoubleVar(value=10.0)
         self._distance_var = tk.DoubleVar(value=3.0)
@@ -62,6 +69,45 @@ class AdvancedRenderSettingsPanel(ttk.LabelFrame):
             command=self._apply_flat_color_mode,
         ).pack(anchor="w")
 
+        lod_frame = ttk.Frame(self)
+        lod_frame.pack(fill="x", padx=4, pady=(0, 2))
+        ttk.Checkbutton(
+            lod_frame,
+            text="Level of detail (large scenes)",
+            variable=self.lod_enabled_var,
+            command=self._apply_lod_enabled,
+        ).pack(side="left")
+        ttk.Label(lod_frame, text="px").pack(side="right")
+        ttk.Spinbox(
+            lod_frame,
+            from_=0.0,
+            to=32.0,
+            increment=0.5,
+            textvariable=self._lod_threshold_var,
+            width=5,
+            command=self._apply_lod_threshold,
+        ).pack(side="right", padx=(4, 2))
+
+        cull_frame = ttk.Frame(self)
+        cull_frame.pack(fill="x", padx=4, pady=(0, 2))
+        ttk.Checkbutton(
+            cull_frame,
+            text="Cull off-screen/tiny splats",
+            variable=self.culling_var,
+            command=self._apply_culling,
+        ).pack(side="left")
+        ttk.Label(cull_frame, text="min px").pack(side="right")
+        ttk.Spinbox(
+            cull_frame,
+            from_=0.0,
+            to=8.0,
+            increment=0.25,
+            textvariable=self._min_radius_var,
+            width=5,
+            command=self._apply_min_radius,
+        ).pack(side="right", padx=(4, 2))
+        ttk.Label(self, textvariable=self._stats_var, foreground="#444").pack(anchor="w", padx=6, pady=(0, 2))
+
         camera_frame = ttk.LabelFrame(self, text="Camera control (degrees/meters)")
         camera_frame.pack(fill="x", padx=4, pady=(0, 4))
         ttk.Label(camera_frame, text="Yaw").grid(row=0, column=0, sticky="w")
@@ -83,6 +129,7 @@ class AdvancedRenderSettingsPanel(ttk.LabelFrame):
 
         self._listener_registered = False
         self.after(10, self._register_camera_listener)
+        self.after(500, self._refresh_stats)
 
         scale_frame = ttk.LabelFrame(self, text="Scale adjustments (log space)")
         scale_frame.pack(fill="x", padx=4, pady=(0, 4))
@@ -147,6 +194,62 @@ class AdvancedRenderSettingsPanel(ttk.LabelFrame):
         except Exception:
             pass
 
+    def _apply_lod_enabled(self):
+        viewer = self._get_viewer()
+        if viewer is None:
+            return
+        try:
+            viewer.set_lod_enabled(self.lod_enabled_var.get())
+        except Exception:
+            pass
+
+    def _apply_lod_threshold(self):
+        viewer = self._get_viewer()
+        if viewer is None:
+            return
+        try:
+            viewer.set_lod_pixel_threshold(self._lod_threshold_var.get())
+        except Exception:
+            pass
+
+    def _apply_culling(self):
+        viewer = self._get_viewer()
+        if viewer is None:
+            return
+        try:
+            viewer.set_culling_enabled(self.culling_var.get())
+        except Exception:
+            pass
+
+    def _apply_min_radius(self):
+        viewer = self._get_viewer()
+        if viewer is None:
+            return
+        try:
+            viewer.set_min_splat_radius(self._min_radius_var.get())
+        except Exception:
+            pass
+
+    def _refresh_stats(self):
+        if not self.winfo_exists():
+            return
+        viewer = self._get_viewer()
+        stats = {}
+        if viewer is not None:
+            try:
+                stats = viewer.get_render_stats()
+            except Exception:
+                stats = {}
+        if stats:
+            lod = f" (LOD cut {stats['candidates']:,})" if stats["candidates"] != stats["gaussians"] else ""
+            self._stats_var.set(
+                f"Visible {stats['visible']:,} / {stats['gaussians']:,}{lod} | lod {stats['lod_ms']:.1f} ms"
+                f" cull {stats['cull_ms']:.1f} ms sort {stats['sort_ms']:.1f} ms upload {stats['upload_ms']:.1f} ms"
+            )
+        else:
+            self._stats_var.set("Visible: -")
+        self.after(500, self._refresh_stats)
+
     def _apply_scale_bias(self):
         viewer = self._get_viewer()
         if viewer is None:
@@ -11,6 +11,8 @@ import numpy as np
 import tkinter as tk
 from tkinter import ttk
 
+from nullsplats.backend.camera_poses import camera_to_world
+from nullsplats.backend.colmap_io import ColmapData, load_colmap_data
 from nullsplats.backend.io_cache import ScenePaths
 from nullsplats.util.logging import get_logger
 from nullsplats.util.scene_id import SceneId
@@ -95,13 +97,14 @@ class ColmapCameraPanel(ttk.LabelFrame):
             self._status_var.set("Select a scene before loading cameras.")
             return
         paths = self.paths_getter(str(scene_id))
-        images_file = self._find_images_file(paths.sfm_dir)
-        if images_file is None:
-            self._status_var.set("COLMAP images.txt not found for this scene.")
+        try:
+            colmap = load_colmap_data(paths)
+        except FileNotFoundError:
+            self._status_var.set("COLMAP model not found for this scene.")
             self._tree.delete(*self._tree.get_children())
             return
 
-        self._poses = _parse_images_file(images_file)
+        self._poses = _poses_from_colmap(colmap)
         self._tree.delete(*self._tree.get_children())
         center = self._scene_center()
         for idx, pose in enumerate(self._poses):
@@ -127,17 +130,6 @@ class ColmapCameraPanel(ttk.LabelFrame):
         if self._current_pose_idx is not None:
             self._apply_pose(self._current_pose_idx)
 
-    def _find_images_file(self, sfm_dir: Path) -> Optional[Path]:
-        candidates = [
-            sfm_dir / "sparse" / "text" / "images.txt",
-            sfm_dir / "sparse" / "0" / "images.txt",
-            sfm_dir / "sparse" / "images.txt",
-        ]
-        for path in candidates:
-            if path.exists():
-                return path
-        return None
-
     def _apply_selected_pose(self) -> None:
         if self._current_pose_idx is None:
             self._status_var.set("Load cameras before applying a pose.")
@@ -274,35 +266,22 @@ class ColmapCameraPanel(ttk.LabelFrame):
         self._load_cameras()
 
 
-def _parse_images_file(images_file: Path) -> List[ColmapCameraPose]:
+def _poses_from_colmap(colmap: ColmapData) -> List[ColmapCameraPose]:
+    table = colmap.image_table
+    camtoworlds = camera_to_world(table.qvecs, table.tvecs)
+    positions = camtoworlds[:, :3, 3].astype(np.float32)
+    rotations = camtoworlds[:, :3, :3].swapaxes(1, 2).astype(np.float32)  # world-to-camera
     poses: List[ColmapCameraPose] = []
-    with images_file.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line or line.startswith("#"):
-                continue
-            parts = line.strip().split()
-            if len(parts) < 10:
-                continue
-            try:
-                image_id = int(parts[0])
-            except ValueError:
-                continue
-            qw, qx, qy, qz = map(float, parts[1:5])
-            tx, ty, tz = map(float, parts[5:8])
-            camera_id = int(parts[8])
-            name = parts[9]
-            rot_world_to_camera = _quat_to_rotation_matrix(np.array([qw, qx, qy, qz], dtype=np.float64))
-            translation = np.array([tx, ty, tz], dtype=np.float64)
-            position = -rot_world_to_camera.T @ translation
-            poses.append(
-                ColmapCameraPose(
-                    image_id=image_id,
-                    camera_id=camera_id,
-                    name=name,
-                    position=position.astype(np.float32),
-                    rotation=rot_world_to_camera.astype(np.float32),
-                )
+    for row in range(len(table)):
+        poses.append(
+            ColmapCameraPose(
+                image_id=int(table.image_ids[row]),
+                camera_id=int(table.camera_ids[row]),
+                name=table.names[row],
+                position=positions[row],
+                rotation=rotations[row],
             )
+        )
     poses.sort(key=_frame_sort_key)
     return poses
 
@@ -314,15 +293,3 @@ def _frame_sort_key(pose: ColmapCameraPose) -> tuple:
     if matches:
         return (0, int(matches[-1]), name)
     return (1, name, pose.image_id)
-
-
-def _quat_to_rotation_matrix(quat: np.ndarray) -> np.ndarray:
-    qw, qx, qy, qz = quat
-    return np.array(
-        [
-            [1 - 2 * qy * qy - 2 * qz * qz, 2 * qx * qy - 2 * qz * qw, 2 * qx * qz + 2 * qy * qw],
-            [2 * qx * qy + 2 * qz * qw, 1 - 2 * qx * qx - 2 * qz * qz, 2 * qy * qz - 2 * qx * qw],
-            [2 * qx * qz - 2 * qy * qw, 2 * qy * qz + 2 * qx * qw, 1 - 2 * qx * qx - 2 * qy * qy],
-        ],
-        dtype=np.float64,
-    )
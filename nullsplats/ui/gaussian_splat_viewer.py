@@ -29,8 +29,16 @@ else:
 
 logger = logging.getLogger(__name__)
 
+from nullsplats.backend.splat_cull import DEFAULT_MIN_RADIUS_PX, cull_splats
+from nullsplats.backend.splat_lod import DEFAULT_LOD_PIXEL_THRESHOLD, SplatLod
 from nullsplats.ui.gaussian_splat_camera import Camera
 
+# Vertical field of view shared by the projection matrix and the LOD pixel-size estimate.
+FIELD_OF_VIEW_DEGREES = 45.0
+# CPU culling keeps centers out to this NDC limit, past the shader's 1.3, so splats
+# entering the view while sorts are throttled are already in the uploaded buffer.
+CULL_GUARD_NDC = 1.6
+
 class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
     """OpenGL-based Gaussian Splatting viewer for 3D visualization.
     
@@ -56,6 +64,7 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
         self.opacities = None       # (N, 1) - Logit opacities
         self.sh_dc = None           # (N, 3) - DC band of spherical harmonics
         self.num_gaussians = 0
+        self.num_instances = 0      # Instances in the GPU buffer (the LOD cut when one is active)
         
         # Scene bounds for auto-centering
         self.scene_center = np.array([0.0, 0.0, 0.0], dtype=np.float32)
@@ -97,6 +106,18 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
         self._needs_depth_sort = True
         self._frame_count = 0
         self._sort_back_to_front = False
+
+        # Level of detail: proxy hierarchy built by the loader, cut on every depth sort
+        self._lod: Optional[SplatLod] = None
+        self.lod_enabled = True
+        self.lod_pixel_threshold = DEFAULT_LOD_PIXEL_THRESHOLD
+
+        # Frustum and screen-size culling before sort/upload, plus per-sort stats for the debug readout
+        self.culling_enabled = True
+        self.min_splat_radius_px = DEFAULT_MIN_RADIUS_PX
+        self.cull_ndc_limit = CULL_GUARD_NDC
+        self._sorted_viewport = None
+        self.render_stats = {}
         
         if not OPENGL_AVAILABLE:
             super().__init__(parent)
@@ -295,7 +316,8 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
     
     def set_gaussians(self, means: np.ndarray, scales: np.ndarray,
                      rotations: np.ndarray, opacities: np.ndarray,
-                     sh_dc: np.ndarray, *, preserve_camera: bool = False):
+                     sh_dc: np.ndarray, *, preserve_camera: bool = False,
+                     lod: Optional[SplatLod] = None):
         """Set Gaussian data for rendering.
         
         Args:
@@ -304,6 +326,7 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             rotations: (N, 4) - Quaternions (x, y, z, w)
             opacities: (N,) or (N, 1) - Logit opacities
             sh_dc: (N, 3) - DC band of spherical harmonics (RGB)
+            lod: Optional proxy hierarchy over the same Gaussians (see build_splat_lod)
         """
         if not OPENGL_AVAILABLE:
             return
@@ -312,6 +335,9 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
         n = means.shape[0]
         if scales.shape[0] != n or rotations.shape[0] != n:
             raise ValueError("All Gaussian parameters must have same count")
+        if lod is not None and lod.count != n:
+            logger.warning("Ignoring LOD hierarchy built for %d Gaussians (got %d)", lod.count, n)
+            lod = None
         
         # Ensure correct shapes
         means = np.ascontiguousarray(means, dtype=np.float32)
@@ -367,7 +393,8 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             'scales': scales,
             'rotations': rotations,
             'opacities': opacities,
-            'sh_dc': sh_dc
+            'sh_dc': sh_dc,
+            'lod': lod,
         }
         self._needs_data_upload = True
         self._needs_depth_sort = True
@@ -406,12 +433,21 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             glBindBuffer(GL_ARRAY_BUFFER, 0)
             
             self.num_gaussians = n
+            self.num_instances = n
             self._warned_no_gaussians = False
             self.means = means
             self.scales = scales
             self.rotations = rotations
             self.opacities = opacities
             self.sh_dc = sh_dc
+            self._lod = self._pending_gaussians.get('lod')
+            if self._lod is not None:
+                logger.info(
+                    "LOD hierarchy active: depth=%d proxies=%d threshold=%.2fpx",
+                    self._lod.depth,
+                    self._lod.proxy_count,
+                    self.lod_pixel_threshold,
+                )
             
             self._pending_gaussians = None
             
@@ -474,11 +510,16 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
 
         return sorted_indices.cpu().numpy().astype(np.int32)
     
-    def _depth_sort_gaussians(self, view_matrix: Optional[np.ndarray] = None):
+    def _depth_sort_gaussians(self, view_matrix: Optional[np.ndarray] = None,
+                              projection: Optional[np.ndarray] = None):
         """Sort Gaussians by depth for proper alpha blending.
         
         Uses GPU-accelerated sorting via PyTorch when available (CUDA),
-        falls back to CPU NumPy sorting otherwise.
+        falls back to CPU NumPy sorting otherwise. With an LOD hierarchy the
+        rows are first cut to the proxies/Gaussians that fit the pixel
+        threshold from the current camera. With culling enabled, splats outside
+        the frustum or below min_splat_radius_px are dropped before the sort,
+        and only the visible instances are uploaded.
         """
         if self.means is None or not self._needs_depth_sort:
             return
@@ -489,26 +530,66 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             if view_matrix is None:
                 view_matrix = self.camera.get_view_matrix()
             
+            # Pick the rows to draw: everything, or the LOD cut for this camera
+            # (original rows below lod.count, proxy rows above it)
+            source = (self.means, self.scales, self.rotations, self.opacities, self.sh_dc)
+            lod = self._lod if self.lod_enabled else None
+            rows = None
+            lod_time = 0.0
+            if lod is not None:
+                lod_start = time.perf_counter()
+                rows = lod.select(self.camera.position, self._focal_length_px(), pixel_threshold=self.lod_pixel_threshold)
+                candidates = lod.take(rows, *source[:2])
+                lod_time = time.perf_counter() - lod_start
+            else:
+                candidates = source[:2]
+            means = candidates[0]
+
+            # Drop what cannot reach the screen; the culled depths feed the sort directly
+            visible = None
+            cull_time = 0.0
+            if self.culling_enabled and TORCH_AVAILABLE:
+                if projection is None:
+                    projection = self._projection_matrix()
+                cull_start = time.perf_counter()
+                visible, depths = cull_splats(
+                    means,
+                    candidates[1],
+                    view_matrix,
+                    projection,
+                    max(1, int(self.height)),
+                    ndc_limit=self.cull_ndc_limit,
+                    min_radius_px=self.min_splat_radius_px,
+                    scale_bias=self.scale_bias,
+                    scale_multiplier=self._splat_scale_multiplier(),
+                    device=TORCH_DEVICE,
+                )
+                cull_time = time.perf_counter() - cull_start
+
             # Choose sorting method based on availability
             sort_method = "CPU NumPy"
             start_time = time.perf_counter()
             
-            if TORCH_AVAILABLE and CUDA_AVAILABLE:
+            if visible is not None:
+                sort_method = "GPU PyTorch (CUDA)" if CUDA_AVAILABLE else "CPU PyTorch"
+                order = torch.argsort(depths, descending=not self._sort_back_to_front)
+                sorted_indices = visible[order].cpu().numpy()
+            elif TORCH_AVAILABLE and CUDA_AVAILABLE:
                 # GPU-accelerated sorting using PyTorch CUDA
                 sort_method = "GPU PyTorch (CUDA)"
-                sorted_indices = self._sort_gaussians_gpu(self.means, view_matrix)
+                sorted_indices = self._sort_gaussians_gpu(means, view_matrix)
             elif TORCH_AVAILABLE:
                 # PyTorch available but no CUDA - still use PyTorch on CPU
                 # (may be faster than NumPy for large arrays due to optimizations)
                 sort_method = "CPU PyTorch"
-                sorted_indices = self._sort_gaussians_gpu(self.means, view_matrix)
+                sorted_indices = self._sort_gaussians_gpu(means, view_matrix)
             else:
                 # Fallback to NumPy CPU sorting
                 # Compute distances from camera (simpler than full transform)
                 # This is approximate but much faster than full matrix multiply
                 rot = view_matrix[:3, :3]
                 trans = view_matrix[:3, 3]
-                cam_coords = self.means @ rot.T + trans
+                cam_coords = means @ rot.T + trans
                 depths = cam_coords[:, 2]
                 sorted_indices = np.argsort(depths)
                 if not self._sort_back_to_front:
@@ -516,27 +597,62 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
                 sorted_indices = sorted_indices.astype(np.int32)
             
             sort_time = time.perf_counter() - start_time
+            if rows is not None:
+                sorted_indices = rows[sorted_indices]
             
             # Re-upload data in sorted order
+            upload_start = time.perf_counter()
             if self._pending_gaussians is None:
                 # Create sorted data
-                sorted_data = np.empty((self.num_gaussians, 14), dtype=np.float32)
-                sorted_data[:, 0:3] = self.means[sorted_indices]
-                sorted_data[:, 3:6] = self.scales[sorted_indices]
-                sorted_data[:, 6:10] = self.rotations[sorted_indices]
-                sorted_data[:, 10:11] = self.opacities[sorted_indices].reshape(-1, 1)
-                sorted_data[:, 11:14] = self.sh_dc[sorted_indices]
+                if lod is not None:
+                    gathered = lod.take(sorted_indices, *source)
+                else:
+                    gathered = tuple(values[sorted_indices] for values in source)
+                sorted_data = np.empty((sorted_indices.shape[0], 14), dtype=np.float32)
+                sorted_data[:, 0:3] = gathered[0]
+                sorted_data[:, 3:6] = gathered[1]
+                sorted_data[:, 6:10] = gathered[2]
+                sorted_data[:, 10:11] = gathered[3].reshape(-1, 1)
+                sorted_data[:, 11:14] = gathered[4]
                 
                 # Upload to GPU
                 data_flat = sorted_data.flatten()
                 glBindBuffer(GL_ARRAY_BUFFER, self.instance_vbo)
                 glBufferData(GL_ARRAY_BUFFER, data_flat.nbytes, data_flat, GL_DYNAMIC_DRAW)
                 glBindBuffer(GL_ARRAY_BUFFER, 0)
+                self.num_instances = sorted_data.shape[0]
+            upload_time = time.perf_counter() - upload_start
             
             self._needs_depth_sort = False
+            self._sorted_viewport = (self.width, self.height)
+            self.render_stats = {
+                "gaussians": self.num_gaussians,
+                "candidates": int(means.shape[0]),
+                "visible": int(sorted_indices.shape[0]),
+                "lod_ms": lod_time * 1000,
+                "cull_ms": cull_time * 1000,
+                "sort_ms": sort_time * 1000,
+                "upload_ms": upload_time * 1000,
+            }
             
             # Log performance information
-            logger.debug(f"Sorted {self.num_gaussians:,} Gaussians using {sort_method} in {sort_time*1000:.2f}ms ({1/sort_time:.1f} sorts/sec)")
+            logger.debug(f"Sorted {sorted_indices.shape[0]:,} Gaussians using {sort_method} in {sort_time*1000:.2f}ms ({1/max(sort_time, 1e-9):.1f} sorts/sec)")
+            if visible is not None:
+                logger.debug(
+                    "Culled %d of %d candidates in %.2fms (min radius %.2fpx)",
+                    means.shape[0] - sorted_indices.shape[0],
+                    means.shape[0],
+                    cull_time * 1000,
+                    self.min_splat_radius_px,
+                )
+            if rows is not None:
+                logger.debug(
+                    "LOD cut %d of %d Gaussians (%d proxies available) in %.2fms",
+                    rows.shape[0],
+                    self.num_gaussians,
+                    lod.proxy_count,
+                    lod_time * 1000,
+                )
             
             # Log first-time sorting method
             if not hasattr(self, '_sort_method_logged'):
@@ -584,26 +700,30 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             # Validate widget dimensions before sorting (needed for projection)
             if self.width <= 0 or self.height <= 0:
                 return
-            widget_aspect = self.width / self.height
-            near_plane = max(self.scene_size * 0.01, 0.01)
-            far_plane = max(self.scene_size * 10.0, near_plane * 10.0)
-            projection = self._perspective(45.0, widget_aspect, near_plane, far_plane)
+            near_plane, far_plane = self._clip_planes()
+            projection = self._projection_matrix()
             view = self.camera.get_view_matrix()
+            if self.culling_enabled and self._sorted_viewport != (self.width, self.height):
+                # The visible set depends on the projection; refresh it after a resize
+                self._needs_depth_sort = True
 
             # Depth sort (always for first few frames, then throttle)
             self._frame_count += 1
             if self._frame_count <= 30:
                 if self._needs_depth_sort:
-                    self._depth_sort_gaussians(view)
+                    self._depth_sort_gaussians(view, projection)
             else:
-                if self._needs_depth_sort:
-                    if not hasattr(self, '_frames_since_sort'):
-                        self._frames_since_sort = 0
+                if not hasattr(self, '_frames_since_sort'):
+                    self._frames_since_sort = 0
+                # A culled set hides whatever the old view could not see, so with culling
+                # idle frames count too: the first camera change after a pause re-culls at
+                # once, and only continuous motion waits for the throttle.
+                if self._needs_depth_sort or self.culling_enabled:
                     self._frames_since_sort += 1
 
-                    if self._frames_since_sort >= 10:
-                        self._depth_sort_gaussians(view)
-                        self._frames_since_sort = 0
+                if self._needs_depth_sort and self._frames_since_sort >= 10:
+                    self._depth_sort_gaussians(view, projection)
+                    self._frames_since_sort = 0
 
             # DEBUG: Log first render
             if not hasattr(self, '_debug_logged'):
@@ -681,8 +801,7 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
                 )
                 self._uniform_bias_logged = True
             # Apply debug scale multiplier if in debug mode
-            debug_scale = self.point_scale * (5.0 if self.debug_mode else 1.0)
-            glUniform1f(point_scale_loc, debug_scale)
+            glUniform1f(point_scale_loc, self._splat_scale_multiplier())
             if scale_bias_loc != -1:
                 glUniform3fv(scale_bias_loc, 1, self.scale_bias)
             if opacity_bias_loc != -1:
@@ -701,10 +820,10 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
                 logger.info(f"Depth test enabled: {glIsEnabled(GL_DEPTH_TEST)}")
                 logger.info(f"Blend enabled: {glIsEnabled(GL_BLEND)}")
                 logger.info(f"VAO bound: {self.quad_vao}")
-                logger.info(f"Drawing {self.num_gaussians:,} instances")
+                logger.info(f"Drawing {self.num_instances:,} instances")
             
             # Draw instanced quads
-            glDrawArraysInstanced(GL_TRIANGLES, 0, 6, self.num_gaussians)
+            glDrawArraysInstanced(GL_TRIANGLES, 0, 6, self.num_instances)
             glBindVertexArray(0)
             
             # Unbind program
@@ -722,6 +841,26 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
         except Exception as e:
             logger.exception("Error during Gaussian splat rendering")
     
+    def _clip_planes(self) -> tuple:
+        """Near and far planes scaled to the scene size."""
+        near_plane = max(self.scene_size * 0.01, 0.01)
+        far_plane = max(self.scene_size * 10.0, near_plane * 10.0)
+        return near_plane, far_plane
+
+    def _projection_matrix(self) -> np.ndarray:
+        """Projection for the current viewport (what redraw uploads)."""
+        near_plane, far_plane = self._clip_planes()
+        aspect = max(1, int(self.width)) / max(1, int(self.height))
+        return self._perspective(FIELD_OF_VIEW_DEGREES, aspect, near_plane, far_plane)
+
+    def _splat_scale_multiplier(self) -> float:
+        """The shader's point_scale uniform: global scale, 5x in debug mode."""
+        return self.point_scale * (5.0 if self.debug_mode else 1.0)
+
+    def _focal_length_px(self) -> float:
+        """Vertical focal length in pixels for the current viewport."""
+        return max(1.0, float(self.height)) / (2.0 * math.tan(math.radians(FIELD_OF_VIEW_DEGREES) / 2.0))
+
     def _perspective(self, fov: float, aspect: float, near: float, far: float) -> np.ndarray:
         """Create perspective projection matrix."""
         f = 1.0 / math.tan(math.radians(fov) / 2.0)
@@ -832,6 +971,7 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
         if not OPENGL_AVAILABLE:
             return
         self.point_scale = max(0.1, min(10.0, scale))
+        self._needs_depth_sort = True
 
     def set_scale_bias(self, bias):
         """Apply per-axis log-scale bias before exponentiation."""
@@ -863,11 +1003,44 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
             return
         self._needs_depth_sort = True
     
+    def set_lod_enabled(self, enabled: bool):
+        """Draw the LOD cut (True) or every Gaussian (False) when a hierarchy is loaded."""
+        if not OPENGL_AVAILABLE:
+            return
+        self.lod_enabled = bool(enabled)
+        self._needs_depth_sort = True
+
+    def set_lod_pixel_threshold(self, pixels: float):
+        """Projected size (pixels) below which a cell is drawn as its merged proxy."""
+        if not OPENGL_AVAILABLE:
+            return
+        self.lod_pixel_threshold = max(0.0, float(pixels))
+        self._needs_depth_sort = True
+    
+    def set_culling_enabled(self, enabled: bool):
+        """Cull against the frustum and minimum splat radius before sorting/uploading."""
+        if not OPENGL_AVAILABLE:
+            return
+        self.culling_enabled = bool(enabled)
+        self._needs_depth_sort = True
+
+    def set_min_splat_radius(self, pixels: float):
+        """Drop splats whose 3-sigma radius projects below this many pixels (0 keeps all)."""
+        if not OPENGL_AVAILABLE:
+            return
+        self.min_splat_radius_px = max(0.0, float(pixels))
+        self._needs_depth_sort = True
+
+    def get_render_stats(self) -> dict:
+        """Counts and timings (ms) from the most recent cull/sort/upload."""
+        return dict(self.render_stats)
+    
     def set_debug_mode(self, enabled: bool):
         """Enable debug rendering mode (larger splats for visibility)."""
         if not OPENGL_AVAILABLE:
             return
         self.debug_mode = enabled
+        self._needs_depth_sort = True
         logger.info(f"Debug mode: {'ENABLED' if enabled else 'DISABLED'}")
         if enabled:
             logger.info("Debug mode increases splat size by 5x for visibility")
@@ -1037,5 +1210,8 @@ class GaussianSplatViewer(OpenGLFrame if OPENGL_AVAILABLE else tk.Frame):
                 self._needs_data_upload = False
                 self._needs_depth_sort = False
                 self.num_gaussians = 0
+                self.num_instances = 0
+                self._lod = None
+                self.render_stats = {}
             except Exception as e:
                 logger.warning(f"Error during Gaussian splat cleanup: {e}")
@@ -13,15 +13,18 @@ from pathlib import Path
 import threading
 import tkinter as tk
 from tkinter import ttk
-from typing import Callable, Iterable, List, Optional, Tuple
+from typing import Callable, Optional, Tuple
 import time
 
 import numpy as np
 from PIL import Image
 import torch
-import torch.nn.functional as F
 
+from nullsplats.backend.camera_poses import camera_to_world
+from nullsplats.backend.colmap_io import load_colmap_data
 from nullsplats.backend.io_cache import ScenePaths
+from nullsplats.backend.splat_io import load_gaussian_buffers
+from nullsplats.backend.splat_lod import LOD_MIN_GAUSSIANS, SplatLod, build_splat_lod
 from nullsplats.backend.splat_train import PreviewPayload
 from nullsplats.util.logging import get_logger
 
@@ -58,14 +61,25 @@ class SplatData:
     center: torch.Tensor
     radius: float
     path: Path
+    # Host float32 arrays for GaussianSplatViewer.set_gaussians, filled while loading.
+    viewer_arrays: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]] = None
+    # Proxy hierarchy over viewer_arrays, built off the Tk thread for large checkpoints.
+    viewer_lod: Optional[SplatLod] = None
 
 
 class SplatRenderer:
-    """Load and render Gaussian splat checkpoints."""
+    """Load and render Gaussian splat checkpoints.
 
-    def __init__(self, device: str | torch.device = "cuda:0") -> None:
+    With ``build_lod`` large checkpoints get a viewer LOD hierarchy, cached for
+    the last checkpoint by (path, mtime, size) so reloading an unchanged file
+    skips the build.
+    """
+
+    def __init__(self, device: str | torch.device = "cuda:0", *, build_lod: bool = True) -> None:
         self.device = torch.device(device) if isinstance(device, str) else device
         self.data: Optional[SplatData] = None
+        self.build_lod = build_lod
+        self._lod_cache: Optional[Tuple[Tuple[str, int, int], SplatLod]] = None
 
     def load(self, path: Path) -> SplatData:
         started = time.perf_counter()
@@ -80,24 +94,19 @@ class SplatRenderer:
         )
         if not cuda_ok:
             raise RuntimeError("CUDA required for splat preview; install a CUDA build of PyTorch.")
+        lod_key: Optional[Tuple[str, int, int]] = None
         try:
-            size = path.stat().st_size
+            stat = path.stat()
+            size = stat.st_size
+            lod_key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
         except Exception:  # noqa: BLE001
             size = -1
         logger.info("Renderer loading splats from %s size_bytes=%s", path, size)
         parse_start = time.perf_counter()
-        raw = _load_ply_properties(path)
-        logger.info("Renderer PLY parsed path=%s parse_ms=%.2f", path, (time.perf_counter() - parse_start) * 1000.0)
-        means = _stack_props(raw, ("x", "y", "z"))
-        dc = _stack_props(raw, ("f_dc_0", "f_dc_1", "f_dc_2")).reshape(-1, 1, 3)
-        rest_props = _collect_rest_props(raw)
-        if rest_props:
-            if len(rest_props) % 3 != 0:
-                raise ValueError("f_rest properties must be divisible by 3 for SH coefficients.")
-            sh_rest = _stack_props(raw, rest_props).reshape(-1, len(rest_props) // 3, 3)
-        else:
-            sh_rest = torch.zeros((means.shape[0], 0, 3), dtype=torch.float32)
-        sh_channels = dc.shape[1] + sh_rest.shape[1]
+        buffers = load_gaussian_buffers(path, self.device)
+        logger.info("Renderer PLY streamed path=%s load_ms=%.2f", path, (time.perf_counter() - parse_start) * 1000.0)
+        means = buffers.means
+        sh_channels = buffers.colors.shape[1]
         sh_degree = max(0, int(round(math.sqrt(sh_channels) - 1)))
         logger.info(
             "PLY stats path=%s verts=%d sh_channels=%d sh_degree=%d rest_props=%d",
@@ -105,29 +114,55 @@ class SplatRenderer:
             means.shape[0],
             sh_channels,
             sh_degree,
-            len(rest_props),
+            (sh_channels - 1) * 3,
         )
 
-        scales_log = _stack_props(raw, ("scale_0", "scale_1", "scale_2"))
-        opacities = _normalize_opacities(torch.tensor(raw["opacity"], dtype=torch.float32), path)
-        quats_wxyz = _stack_props(raw, ("rot_0", "rot_1", "rot_2", "rot_3"))
-        quats_wxyz = F.normalize(quats_wxyz, dim=1)
+        opacities = _normalize_opacities(buffers.opacities, path)
         logger.info("Renderer tensors prepared path=%s", path)
 
-        center = means.mean(dim=0)
-        radius = float(torch.linalg.norm(means - center, dim=1).max().item())
+        host_means = torch.from_numpy(buffers.viewer_means)
+        center = host_means.mean(dim=0)
+        radius = float(torch.linalg.norm(host_means - center, dim=1).max().item())
         radius = radius if radius > 1e-5 else 1.0
 
+        viewer_opacities = opacities.detach().cpu().numpy()
+        viewer_lod: Optional[SplatLod] = None
+        if self.build_lod and means.shape[0] >= LOD_MIN_GAUSSIANS:
+            cached = self._lod_cache
+            if cached is not None and lod_key is not None and cached[0] == lod_key and cached[1].count == means.shape[0]:
+                viewer_lod = cached[1]
+                logger.info("Renderer LOD cache hit path=%s", path)
+            else:
+                try:
+                    viewer_lod = build_splat_lod(
+                        buffers.viewer_means,
+                        buffers.viewer_scales,
+                        buffers.viewer_rotations,
+                        viewer_opacities,
+                        buffers.viewer_sh_dc,
+                    )
+                except Exception:  # noqa: BLE001
+                    logger.exception("Renderer LOD build failed path=%s; the viewer will draw every Gaussian", path)
+                self._lod_cache = (lod_key, viewer_lod) if viewer_lod is not None and lod_key is not None else None
+
         self.data = SplatData(
-            means=means.to(self.device),
-            scales_log=scales_log.to(self.device),
-            quats=quats_wxyz.to(self.device),
-            opacities=opacities.to(self.device),
-            colors=torch.cat([dc, sh_rest], dim=1).to(self.device),
+            means=means,
+            scales_log=buffers.scales_log,
+            quats=buffers.quats,
+            opacities=opacities,
+            colors=buffers.colors,
             sh_degree=sh_degree,
             center=center.to(self.device),
             radius=radius,
             path=path,
+            viewer_arrays=(
+                buffers.viewer_means,
+                buffers.viewer_scales,
+                buffers.viewer_rotations,
+                viewer_opacities,
+                buffers.viewer_sh_dc,
+            ),
+            viewer_lod=viewer_lod,
         )
         elapsed = time.perf_counter() - started
         logger.info(
@@ -197,9 +232,17 @@ class SplatRenderer:
 class GLCanvas(ttk.Frame):
     """Tkinter widget that uses an OpenGL Gaussian viewer."""
 
-    def __init__(self, master: tk.Misc, *, device: str | torch.device = "cuda:0", width: int = 640, height: int = 480) -> None:
+    def __init__(
+        self,
+        master: tk.Misc,
+        *,
+        device: str | torch.device = "cuda:0",
+        width: int = 640,
+        height: int = 480,
+        build_lod: bool = True,
+    ) -> None:
         super().__init__(master)
-        self.renderer = SplatRenderer(device=device)
+        self.renderer = SplatRenderer(device=device, build_lod=build_lod)
         self._viewer: Optional["GaussianSplatViewer"] = None
         self.canvas: Optional[tk.Widget] = None
         self._last_path: Optional[Path] = None
@@ -426,6 +469,39 @@ class GLCanvas(ttk.Frame):
             except Exception:  # noqa: BLE001
                 logger.exception("Failed to set opacity bias")
 
+    def set_lod_enabled(self, enabled: bool) -> None:
+        if self._viewer is not None and hasattr(self._viewer, "set_lod_enabled"):
+            try:
+                self._viewer.set_lod_enabled(enabled)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to toggle level of detail")
+
+    def set_lod_pixel_threshold(self, pixels: float) -> None:
+        if self._viewer is not None and hasattr(self._viewer, "set_lod_pixel_threshold"):
+            try:
+                self._viewer.set_lod_pixel_threshold(pixels)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to set LOD pixel threshold")
+
+    def set_culling_enabled(self, enabled: bool) -> None:
+        if self._viewer is not None and hasattr(self._viewer, "set_culling_enabled"):
+            try:
+                self._viewer.set_culling_enabled(enabled)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to toggle culling")
+
+    def set_min_splat_radius(self, pixels: float) -> None:
+        if self._viewer is not None and hasattr(self._viewer, "set_min_splat_radius"):
+            try:
+                self._viewer.set_min_splat_radius(pixels)
+            except Exception:  # noqa: BLE001
+                logger.exception("Failed to set minimum splat radius")
+
+    def get_render_stats(self) -> dict:
+        if self._viewer is not None and hasattr(self._viewer, "get_render_stats"):
+            return self._viewer.get_render_stats()
+        return {}
+
     def request_depth_sort(self) -> None:
         if self._viewer is not None and hasattr(self._viewer, "request_depth_sort"):
             try:
@@ -721,14 +797,16 @@ class GLCanvas(ttk.Frame):
             self._current_view = None
         view: Optional[CameraView] = self._current_view
         try:
-            means = data.means.detach().cpu().numpy()
-            scales = data.scales_log.detach().cpu().numpy()
-            quats_wxyz = data.quats.detach().cpu().numpy()
-            quats = np.ascontiguousarray(quats_wxyz[:, [1, 2, 3, 0]])
-            opacities = data.opacities.detach().cpu().numpy()
-            colors = data.colors.detach().cpu().numpy()
-            sh_dc = colors[:, 0, :]
-            self._viewer.set_gaussians(means, scales, quats, opacities, sh_dc)
+            if data.viewer_arrays is not None:
+                means, scales, quats, opacities, sh_dc = data.viewer_arrays
+            else:
+                means = data.means.detach().cpu().numpy()
+                scales = data.scales_log.detach().cpu().numpy()
+                quats_wxyz = data.quats.detach().cpu().numpy()
+                quats = np.ascontiguousarray(quats_wxyz[:, [1, 2, 3, 0]])
+                opacities = data.opacities.detach().cpu().numpy()
+                sh_dc = data.colors[:, 0, :].detach().cpu().numpy()
+            self._viewer.set_gaussians(means, scales, quats, opacities, sh_dc, lod=data.viewer_lod)
             # Preserve user camera if they orbited since the last load.
             captured_view = self._capture_viewer_camera()
             if captured_view is not None:
@@ -807,114 +885,6 @@ class GLCanvas(ttk.Frame):
             logger.exception("Failed to update OpenGL viewer camera")
 
 
-def _load_ply_properties(path: Path) -> np.ndarray:
-    start_read = time.perf_counter()
-    logger.info("PLY parse start path=%s", path)
-    type_map = {
-        "float": "<f4",
-        "float32": "<f4",
-        "double": "<f8",
-        "uchar": "u1",
-        "uint8": "u1",
-        "uint": "<u4",
-        "int": "<i4",
-    }
-    with path.open("rb") as handle:
-        header_lines: List[str] = []
-        while True:
-            line_bytes = handle.readline()
-            if not line_bytes:
-                raise ValueError("Invalid PLY: missing end_header.")
-            line = line_bytes.decode("ascii", errors="ignore").strip()
-            header_lines.append(line)
-            if line == "end_header":
-                break
-        data = handle.read()
-
-    fmt = next((l for l in header_lines if l.startswith("format ")), "")
-    ascii_format = "ascii" in fmt
-    binary_format = "binary_little_endian" in fmt
-    if not (ascii_format or binary_format):
-        raise ValueError(f"Unsupported PLY format: {fmt or '<missing>'}")
-
-    vertex_count = 0
-    props: List[Tuple[str, str]] = []
-    current_element = None
-    for line in header_lines:
-        if line.startswith("element"):
-            parts = line.split()
-            current_element = parts[1] if len(parts) > 1 else None
-            if current_element == "vertex" and len(parts) > 2:
-                vertex_count = int(parts[2])
-            continue
-        if line.startswith("property") and current_element == "vertex":
-            parts = line.split()
-            if len(parts) < 3:
-                continue
-            prop_type, name = parts[1], parts[2]
-            mapped = type_map.get(prop_type)
-            if mapped:
-                props.append((name, mapped))
-
-    if vertex_count == 0:
-        raise ValueError("No vertices found in PLY header.")
-    dtype = np.dtype([(name, typ) for name, typ in props])
-    if ascii_format:
-        text = data.decode("ascii", errors="ignore").strip().splitlines()
-        rows: List[tuple] = []
-        for line in text:
-            if not line.strip():
-                continue
-            parts = line.strip().split()
-            if len(parts) < len(props):
-                continue
-            parsed = []
-            for value, (_, typ) in zip(parts, props):
-                if np.issubdtype(np.dtype(typ), np.floating):
-                    parsed.append(float(value))
-                else:
-                    parsed.append(int(float(value)))
-            rows.append(tuple(parsed))
-            if len(rows) >= vertex_count:
-                break
-        arr = np.array(rows, dtype=dtype)
-        if arr.size != vertex_count:
-            raise ValueError(f"Expected {vertex_count} vertices, parsed {arr.size}.")
-    else:
-        arr = np.frombuffer(data, dtype=dtype, count=vertex_count)
-        if arr.size != vertex_count:
-            raise ValueError(f"Expected {vertex_count} vertices, parsed {arr.size}.")
-    elapsed = time.perf_counter() - start_read
-    logger.info(
-        "PLY parse done path=%s verts=%d props=%d elapsed=%.3fs dtype=%s",
-        path,
-        vertex_count,
-        len(props),
-        elapsed,
-        arr.dtype,
-    )
-    return arr
-
-
-def _stack_props(arr: np.ndarray, names: Iterable[str]) -> torch.Tensor:
-    columns: List[np.ndarray] = []
-    for name in names:
-        if name not in arr.dtype.names:
-            raise KeyError(f"Property {name} missing from splat file.")
-        columns.append(arr[name].astype(np.float32))
-    stacked = np.stack(columns, axis=1)
-    return torch.from_numpy(stacked)
-
-
-def _collect_rest_props(arr: np.ndarray) -> List[str]:
-    props = []
-    for name in arr.dtype.names:
-        if name.startswith("f_rest_"):
-            props.append(name)
-    props.sort(key=lambda n: int(n.split("_")[-1]))
-    return props
-
-
 def _normalize_opacities(opacities: torch.Tensor, path: Path) -> torch.Tensor:
     """Ensure opacities are in linear [0, 1] space for rendering."""
     if opacities.numel() == 0:
@@ -1060,27 +1030,17 @@ def _vector_to_angles(vec: torch.Tensor) -> tuple[float, float]:
 def _colmap_default_view(scene_id: str, data: SplatData) -> Optional[CameraView]:
     """Load a base camera from COLMAP (first image) to seed the viewer."""
     try:
-        paths = ScenePaths(scene_id)
-        candidates = [
-            (paths.sfm_dir / "sparse" / "text" / "cameras.txt", paths.sfm_dir / "sparse" / "text" / "images.txt"),
-            (paths.sfm_dir / "sparse" / "0" / "cameras.txt", paths.sfm_dir / "sparse" / "0" / "images.txt"),
-            (paths.sfm_dir / "sparse" / "cameras.txt", paths.sfm_dir / "sparse" / "images.txt"),
-        ]
-        cameras_txt = images_txt = None
-        for cams, imgs in candidates:
-            if cams.exists() and imgs.exists():
-                cameras_txt, images_txt = cams, imgs
-                break
-        if cameras_txt is None or images_txt is None:
-            return None
-        cameras = _parse_cameras_min(cameras_txt)
-        image_entry = _parse_first_image(images_txt)
-        if image_entry is None:
+        try:
+            colmap = load_colmap_data(ScenePaths(scene_id))
+        except FileNotFoundError:
             return None
-        cam = cameras.get(image_entry["camera_id"])
-        if cam is None:
+        table = colmap.image_table
+        if len(table) == 0 or int(table.camera_ids[0]) not in colmap.cameras:
             return None
-        c2w = _cam_to_world_from_qt(image_entry["qvec"], image_entry["tvec"], device=data.center.device)
+        c2w = camera_to_world(
+            torch.tensor(table.qvecs[0], dtype=torch.float64, device=data.center.device),
+            torch.tensor(table.tvecs[0], dtype=torch.float64, device=data.center.device),
+        ).float()
         cam_pos = c2w[:3, 3]
         direction = (data.center - cam_pos)
         yaw, pitch = _vector_to_angles(direction)
@@ -1093,77 +1053,6 @@ def _colmap_default_view(scene_id: str, data: SplatData) -> Optional[CameraView]
         return None
 
 
-def _parse_cameras_min(path: Path) -> dict[int, dict]:
-    cams: dict[int, dict] = {}
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line or line.startswith("#"):
-                continue
-            parts = line.strip().split()
-            if len(parts) < 8:
-                continue
-            cam_id = int(parts[0])
-            model = parts[1]
-            width = int(parts[2])
-            height = int(parts[3])
-            params = list(map(float, parts[4:]))
-            if model == "PINHOLE":
-                fx, fy, cx, cy = params[:4]
-            else:
-                fx = fy = params[0]
-                cx = params[1]
-                cy = params[2] if len(params) > 2 else params[1]
-            cams[cam_id] = {"width": width, "height": height, "params": (fx, fy, cx, cy)}
-    return cams
-
-
-def _parse_first_image(path: Path) -> Optional[dict]:
-    with path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            if not line or line.startswith("#"):
-                continue
-            parts = line.strip().split()
-            if len(parts) < 10:
-                continue
-            image_id = int(parts[0])
-            qw, qx, qy, qz = map(float, parts[1:5])
-            tx, ty, tz = map(float, parts[5:8])
-            camera_id = int(parts[8])
-            name = parts[9]
-            return {
-                "image_id": image_id,
-                "qvec": (qw, qx, qy, qz),
-                "tvec": (tx, ty, tz),
-                "camera_id": camera_id,
-                "name": name,
-            }
-    return None
-
-
-def _cam_to_world_from_qt(qvec: tuple[float, float, float, float], tvec: tuple[float, float, float], device: torch.device) -> torch.Tensor:
-    qw, qx, qy, qz = qvec
-    q = torch.tensor([qw, qx, qy, qz], dtype=torch.float64, device=device)
-    R = _qvec_to_rotmat(q)
-    t = torch.tensor(tvec, dtype=torch.float64, device=device)
-    c2w = torch.eye(4, dtype=torch.float64, device=device)
-    c2w[:3, :3] = R.T
-    c2w[:3, 3] = -R.T @ t
-    return c2w.float()
-
-
-def _qvec_to_rotmat(qvec: torch.Tensor) -> torch.Tensor:
-    qw, qx, qy, qz = qvec
-    return torch.tensor(
-        [
-            [1 - 2 * qy * qy - 2 * qz * qz, 2 * qx * qy - 2 * qz * qw, 2 * qx * qz + 2 * qy * qw],
-            [2 * qx * qy + 2 * qz * qw, 1 - 2 * qx * qx - 2 * qz * qz, 2 * qy * qz - 2 * qx * qw],
-            [2 * qx * qz - 2 * qy * qw, 2 * qy * qz + 2 * qx * qw, 1 - 2 * qx * qx - 2 * qy * qy],
-        ],
-        dtype=torch.float64,
-        device=qvec.device,
-    )
-
-
 def _fallback_view(data: SplatData, current: Optional[CameraView]) -> CameraView:
     """Pick a stable fallback view if no camera is set."""
     if current is not None:
@@ -31,6 +31,7 @@ class ColmapTab:
         self.matcher_var = tk.StringVar(value="exhaustive")
         self.camera_model_var = tk.StringVar(value="PINHOLE")
         self.force_sfm_var = tk.BooleanVar(value=False)
+        self.export_text_var = tk.BooleanVar(value=False)
         self.progress_var = tk.DoubleVar(value=0.0)
 
         self.scene_label: Optional[ttk.Label] = None
@@ -151,6 +152,11 @@ class ColmapTab:
             state="readonly",
             width=14,
         ).pack(side="left", padx=(4, 0))
+        ttk.Checkbutton(
+            cfg_card,
+            text="Also export a text model (sparse/text) for external tools",
+            variable=self.export_text_var,
+        ).pack(anchor="w", padx=6, pady=(0, 4))
         ttk.Label(
             cfg_card,
             text=(
@@ -250,6 +256,7 @@ class ColmapTab:
             colmap_path=self.colmap_path_var.get().strip() or "colmap",
             matcher=self.matcher_var.get().strip() or "exhaustive",
             camera_model=self.camera_model_var.get().strip() or "PINHOLE",
+            export_text_model=bool(self.export_text_var.get()),
         )
         self._working = True
         self._set_status("Running COLMAP...")
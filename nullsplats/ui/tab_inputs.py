@@ -4,12 +4,12 @@ from __future__ import annotations
 
 import tkinter as tk
 from pathlib import Path
-import shutil
 from tkinter import messagebox, ttk
 from typing import Callable, Dict, List, Optional
 import time
 
 from nullsplats.app_state import AppState
+from nullsplats.backend.frame_selection import list_scorers, list_strategies
 from nullsplats.backend.scene_manager import SceneManager
 from nullsplats.backend.video_frames import ExtractionResult, extract_frames
 from nullsplats.ui.tab_inputs_grid import InputsTabGridMixin
@@ -62,6 +62,8 @@ class InputsTab(InputsTabScenesMixin, InputsTabGridMixin, InputsTabWizardMixin):
         self.input_type_var = tk.StringVar(value=INPUT_TYPE_VIDEO)
         self.candidate_var = tk.IntVar(value=100)
         self.target_var = tk.IntVar(value=50)
+        self.selection_strategy_var = tk.StringVar(value="diverse")
+        self.scorer_var = tk.StringVar(value="quality")
         self.training_resolution_var = tk.IntVar(value=getattr(app_state, "training_image_target_px", 1080))
         self.training_resample_var = tk.StringVar(value=getattr(app_state, "training_image_resample", "lanczos").lower())
         self.scene_entry: Optional[ttk.Entry] = None
@@ -183,6 +185,26 @@ class InputsTab(InputsTabScenesMixin, InputsTabGridMixin, InputsTabWizardMixin):
         ttk.Spinbox(self._advanced_extract_frame, from_=1, to=10000, textvariable=self.target_var, width=7).grid(
             row=0, column=3, sticky="w", padx=(4, 0)
         )
+        ttk.Label(self._advanced_extract_frame, text="Strategy").grid(row=1, column=0, sticky="w", pady=(4, 0))
+        strategy_combo = ttk.Combobox(
+            self._advanced_extract_frame,
+            textvariable=self.selection_strategy_var,
+            values=list_strategies(),
+            width=10,
+            state="readonly",
+        )
+        strategy_combo.grid(row=1, column=1, sticky="w", padx=(4, 8), pady=(4, 0))
+        ttk.Label(self._advanced_extract_frame, text="Scorer").grid(row=1, column=2, sticky="w", pady=(4, 0))
+        scorer_combo = ttk.Combobox(
+            self._advanced_extract_frame,
+            textvariable=self.scorer_var,
+            values=list_scorers(),
+            width=10,
+            state="readonly",
+        )
+        scorer_combo.grid(row=1, column=3, sticky="w", padx=(4, 0), pady=(4, 0))
+        self._register_control(strategy_combo)
+        self._register_control(scorer_combo)
 
         actions = ttk.Frame(source_card)
         actions.pack(fill="x", padx=6, pady=(4, 6))
@@ -480,6 +502,8 @@ class InputsTab(InputsTabScenesMixin, InputsTabGridMixin, InputsTabWizardMixin):
             target_count=target_count,
             cache_root=self.app_state.config.cache_root,
             progress_callback=self._update_progress,
+            selection_strategy=self.selection_strategy_var.get(),
+            scorer=self.scorer_var.get(),
             tk_root=self.frame.winfo_toplevel(),
             on_success=self._handle_extraction_success,
             on_error=self._handle_error,
@@ -576,11 +600,12 @@ class InputsTab(InputsTabScenesMixin, InputsTabGridMixin, InputsTabWizardMixin):
             suffix += 1
         target.mkdir(parents=True, exist_ok=True)
         copied = 0
+        store = self.app_state.scene_manager.blob_store
         for item in files:
             src = Path(item)
             if not src.is_file():
                 continue
-            shutil.copy2(src, target / src.name)
+            store.link_file(src, target / src.name, allow_hardlink=False)
             copied += 1
         if copied == 0:
             return ""
@@ -397,7 +397,12 @@ class InputsTabGridMixin:
             return
         target_count = int(self.target_var.get())
         frame_score_objects = [FrameScore(filename=name, score=score) for name, score in self.frame_scores.items()]
-        chosen = auto_select_best(frame_score_objects, target_count)
+        chosen = auto_select_best(
+            frame_score_objects,
+            target_count,
+            strategy=self.selection_strategy_var.get(),
+            scorer=self.scorer_var.get(),
+        )
         for name in list(self.selection_state.keys()):
             self.selection_state[name] = name in chosen
         self._dirty_selection = True
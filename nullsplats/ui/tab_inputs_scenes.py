@@ -12,6 +12,7 @@ from typing import List, Optional
 from PIL import Image, ImageTk
 
 from nullsplats.app_state import SceneStatus
+from nullsplats.backend.frame_codecs import open_frame
 from nullsplats.backend.video_frames import ExtractionResult
 from nullsplats.backend.io_cache import load_metadata
 from nullsplats.util.threading import run_in_background
@@ -308,12 +309,11 @@ class InputsTabScenesMixin:
             return data
         # fallback to raw file
         try:
-            with Image.open(scene.paths.frames_all_dir / filename) as img:
-                img = img.convert("RGB")
-                img.thumbnail((96, 96), Image.LANCZOS)
-                buf = io.BytesIO()
-                img.save(buf, format="PNG")
-                return buf.getvalue()
+            img = open_frame(scene.paths.frames_all_dir / filename)
+            img.thumbnail((96, 96), Image.LANCZOS)
+            buf = io.BytesIO()
+            img.save(buf, format="PNG")
+            return buf.getvalue()
         except Exception:
             return None
 
@@ -12,6 +12,7 @@ import sys
 from tkinter import scrolledtext, ttk
 from typing import Any, Optional
 from nullsplats.app_state import AppState
+from nullsplats.backend.colmap_io import find_text_model
 from nullsplats.backend.splat_backends.dispatch import train_with_trainer
 from nullsplats.backend.splat_backends.registry import get_trainer, list_trainers
 from nullsplats.backend.splat_backends.types import TrainingOutput
@@ -667,12 +668,11 @@ print(json.dumps({{"render_time_ms": float(info.get("render_time_ms", 0.0))}}))
 
     def _has_sfm_outputs(self, scene_id: str) -> bool:
         paths = self.app_state.scene_manager.get(scene_id).paths
-        candidates = [
-            paths.sfm_dir / "sparse" / "text" / "images.txt",
-            paths.sfm_dir / "sparse" / "0" / "images.txt",
-            paths.sfm_dir / "sparse" / "images.txt",
-        ]
-        return any(path.exists() for path in candidates)
+        try:
+            find_text_model(paths)
+        except FileNotFoundError:
+            return False
+        return True
 
     def _attach_log_handler(self) -> None:
         if self.log_view is None:
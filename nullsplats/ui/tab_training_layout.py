@@ -77,7 +77,10 @@ class TrainingTabLayoutMixin:
         ).pack(side="right", padx=(0, 8))
         preview_inner = ttk.Frame(preview_frame)
         preview_inner.pack(fill="both", expand=True, padx=6, pady=(6, 4))
-        self.preview_canvas = GLCanvas(preview_inner, device=self.device_var.get(), width=1200, height=720)
+        # Checkpoints reload here every few seconds during training; skip the LOD build for them.
+        self.preview_canvas = GLCanvas(
+            preview_inner, device=self.device_var.get(), width=1200, height=720, build_lod=False
+        )
         self.preview_canvas.pack(fill="both", expand=True)
 
         notebook = ttk.Notebook(preview_frame)
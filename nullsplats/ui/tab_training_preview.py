@@ -7,6 +7,7 @@ import time
 from typing import Optional
 
 from nullsplats.backend.splat_train import PreviewPayload
+from nullsplats.backend.splat_train_ops import compact_sidecar_path
 
 
 class TrainingTabPreviewMixin:
@@ -166,14 +167,22 @@ class TrainingTabPreviewMixin:
         candidates = [p for p in splat_dir.iterdir() if p.suffix.lower() in {".ply", ".splat"}]
         if not candidates:
             return None
-        return max(candidates, key=lambda p: p.stat().st_mtime)
+        latest = max(candidates, key=lambda p: p.stat().st_mtime)
+        # PLY checkpoints carry a quantized .nsplat sidecar that loads faster; use it unless it is stale.
+        sidecar = compact_sidecar_path(latest)
+        try:
+            if latest.suffix.lower() == ".ply" and sidecar.stat().st_mtime >= latest.stat().st_mtime:
+                return sidecar
+        except OSError:
+            pass
+        return latest
 
     def _load_preview(self, checkpoint_path: Path, *, allow_when_disabled: bool = False) -> None:
         if self.preview_canvas is None:
             self.logger.info("Preview load skipped: no preview canvas for %s", checkpoint_path)
             return
-        if checkpoint_path.suffix.lower() != ".ply":
-            warn = f"Preview supports .ply checkpoints; found {checkpoint_path.name}"
+        if checkpoint_path.suffix.lower() not in {".ply", ".nsplat"}:
+            warn = f"Preview supports .ply and .nsplat checkpoints; found {checkpoint_path.name}"
             self.logger.warning(warn)
             self._set_status(warn, is_error=True)
             self.preview_status_var.set(warn)
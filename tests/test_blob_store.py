@@ -0,0 +1,67 @@
+"""Blob store cleanup when a scene is re-extracted or its selection changes."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from nullsplats.backend.blob_store import BlobStore
+from nullsplats.backend.video_frames import extract_frames, persist_selection
+
+
+def _write_images(folder: Path, seed: int, count: int = 6) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    for stale in folder.iterdir():
+        stale.unlink()
+    rng = np.random.default_rng(seed)
+    for index in range(count):
+        pixels = rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(folder / f"img_{index:03d}.png")
+    return folder
+
+
+def _extract(source: Path, cache_root: Path):
+    return extract_frames(
+        "scene",
+        source,
+        source_type="images",
+        candidate_count=6,
+        target_count=3,
+        cache_root=cache_root,
+        workers=1,
+    )
+
+
+def test_reextract_releases_superseded_blobs(tmp_path: Path) -> None:
+    cache_root = tmp_path / "cache"
+    store = BlobStore(cache_root)
+
+    _extract(_write_images(tmp_path / "a", seed=1), cache_root)
+    first = store.dedup_report()
+    assert first.blob_count > 0
+    assert first.orphan_blobs == 0
+
+    _extract(_write_images(tmp_path / "b", seed=2), cache_root)
+    second = store.dedup_report()
+    assert second.blob_count == first.blob_count
+    assert second.orphan_blobs == 0
+
+    _extract(_write_images(tmp_path / "a", seed=1), cache_root)
+    third = store.dedup_report()
+    assert third.blob_count == first.blob_count
+    assert third.physical_bytes == first.physical_bytes
+    assert third.orphan_blobs == 0
+
+
+def test_persist_selection_keeps_store_clean(tmp_path: Path) -> None:
+    cache_root = tmp_path / "cache"
+    store = BlobStore(cache_root)
+    result = _extract(_write_images(tmp_path / "a", seed=3), cache_root)
+    before = store.dedup_report()
+
+    persist_selection("scene", result.available_frames[:2], cache_root=cache_root)
+    after = store.dedup_report()
+    assert after.blob_count <= before.blob_count
+    assert after.orphan_blobs == 0
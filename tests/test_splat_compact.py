@@ -0,0 +1,57 @@
+"""Round trips of the quantized .nsplat format for inputs with no usable rows."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+import torch
+
+from nullsplats.backend.splat_compact import convert_ply_to_compact, load_compact_viewer_arrays, open_compact, write_compact
+from nullsplats.backend.splat_io import write_ply
+from nullsplats.backend.splat_train_ops import compact_sidecar_path, write_splats
+
+SH_REST = 15
+
+
+def _gaussians(count: int, fill: float) -> tuple[np.ndarray, ...]:
+    means = np.full((count, 3), fill, dtype=np.float32)
+    scales = np.full((count, 3), -3.0, dtype=np.float32)
+    quats = np.tile(np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32), (count, 1))
+    opacities = np.full((count,), 0.5, dtype=np.float32)
+    sh0 = np.zeros((count, 1, 3), dtype=np.float32)
+    shN = np.zeros((count, SH_REST, 3), dtype=np.float32)
+    return means, scales, quats, opacities, sh0, shN
+
+
+def _assert_empty(path: Path) -> None:
+    splats = open_compact(path)
+    assert splats.count == 0
+    assert splats.sh_rest == SH_REST
+    decoded = splats.decode()
+    assert decoded.means.shape == (0, 3)
+    assert decoded.sh_rest is not None and decoded.sh_rest.shape == (0, SH_REST, 3)
+    means, scales, rotations, opacities, sh_dc = load_compact_viewer_arrays(path)
+    assert means.shape == (0, 3) and rotations.shape == (0, 4) and opacities.shape == (0,)
+
+
+@pytest.mark.parametrize("count, fill", [(0, 0.0), (5, np.nan), (5, np.inf)], ids=["empty", "nan", "inf"])
+def test_write_compact_without_finite_rows(tmp_path: Path, count: int, fill: float) -> None:
+    path = tmp_path / "scene.nsplat"
+    assert write_compact(path, *_gaussians(count, fill)) == 0
+    _assert_empty(path)
+
+
+def test_convert_ply_without_finite_rows(tmp_path: Path) -> None:
+    ply = tmp_path / "diverged.ply"
+    write_ply(ply, *_gaussians(4, np.nan))
+    _assert_empty(convert_ply_to_compact(ply))
+
+
+def test_write_splats_sidecar_for_diverged_checkpoint(tmp_path: Path) -> None:
+    means, scales, quats, opacities, sh0, shN = (torch.from_numpy(values) for values in _gaussians(4, np.nan))
+    snapshot = {"means": means, "scales": scales, "quats": quats, "opacities": opacities, "sh0": sh0, "shN": shN}
+    target = write_splats(snapshot, tmp_path / "iter_000100.ply", max_points=0, fmt="ply", compact_sidecar=True)
+    assert target.exists()
+    _assert_empty(compact_sidecar_path(target))
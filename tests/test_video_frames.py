@@ -0,0 +1,61 @@
+"""Incremental extraction reuse of stored frame metrics."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+
+from nullsplats.backend.video_frames import extract_frames
+
+STALE_FINGERPRINT = "0" * 16
+
+
+def _write_images(folder: Path, count: int = 6) -> Path:
+    folder.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(0)
+    for index in range(count):
+        pixels = rng.integers(0, 256, size=(48, 64, 3), dtype=np.uint8)
+        Image.fromarray(pixels).save(folder / f"img_{index:03d}.png")
+    return folder
+
+
+def _extract(source: Path, cache_root: Path):
+    return extract_frames(
+        "scene", source, source_type="images", candidate_count=6, target_count=3, cache_root=cache_root, workers=1
+    )
+
+
+def _stale_fingerprints(cache_root: Path, *, drop_version: bool) -> None:
+    """Overwrite stored fingerprints; ``drop_version`` mimics metadata from before versioning."""
+    path = cache_root / "inputs" / "scene" / "metadata.json"
+    metadata = json.loads(path.read_text(encoding="utf-8"))
+    if drop_version:
+        del metadata["frame_metrics_version"]
+    for item in metadata["frame_scores"]:
+        item["fingerprint"] = STALE_FINGERPRINT
+    path.write_text(json.dumps(metadata), encoding="utf-8")
+
+
+def test_incremental_reuses_scores_from_the_same_metrics_version(tmp_path: Path) -> None:
+    source = _write_images(tmp_path / "images")
+    cache_root = tmp_path / "cache"
+    first = _extract(source, cache_root)
+    _stale_fingerprints(cache_root, drop_version=False)
+
+    second = _extract(source, cache_root)
+    assert [item.filename for item in second.frame_scores] == [item.filename for item in first.frame_scores]
+    assert all(item.fingerprint == STALE_FINGERPRINT for item in second.frame_scores)
+
+
+def test_incremental_recomputes_scores_from_older_metrics(tmp_path: Path) -> None:
+    source = _write_images(tmp_path / "images")
+    cache_root = tmp_path / "cache"
+    first = _extract(source, cache_root)
+    _stale_fingerprints(cache_root, drop_version=True)
+
+    second = _extract(source, cache_root)
+    assert [item.fingerprint for item in second.frame_scores] == [item.fingerprint for item in first.frame_scores]
+    assert all(item.fingerprint != STALE_FINGERPRINT for item in second.frame_scores)